@@ -4,19 +4,17 @@ Compatible Streamlit Cloud - Utilise canapematplot.py
 """
 
 import streamlit as st
-import matplotlib.pyplot as plt
 from io import BytesIO
 from PIL import Image
 
 # Import des modules personnalisés
-from pricing import calculer_prix_total
+from devis_incremental import DevisIncremental
 from pdf_generator import generer_pdf_devis
+from validation import valider
 
 # Import des fonctions de génération de schémas depuis canapematplot
 from canapematplot import (
-    render_LNF, render_LF_variant, render_U2f_variant,
-    render_U, render_U1F_v1, render_U1F_v2, render_U1F_v3, render_U1F_v4,
-    render_Simple1
+    rendre_figure, plan_alternatives
 )
 
 # Configuration de la page
@@ -32,114 +30,19 @@ def generer_schema_canape(type_canape, tx, ty, tz, profondeur,
                           meridienne_side, meridienne_len, coussins="auto"):
     """
     Génère le schéma du canapé en utilisant les fonctions de canapematplot.py
-    et retourne une figure matplotlib
+    et retourne (figure matplotlib, disposition des coussins).
+    La figure (Agg, hors registre pyplot) appartient à l'appelant : fermer_figure(fig).
     """
-    fig = plt.figure(figsize=(12, 8))
-    
+    config = {
+        'type_canape': type_canape, 'tx': tx, 'ty': ty, 'tz': tz, 'profondeur': profondeur,
+        'acc_left': acc_left, 'acc_right': acc_right, 'acc_bas': acc_bas,
+        'dossier_left': dossier_left, 'dossier_bas': dossier_bas, 'dossier_right': dossier_right,
+        'meridienne_side': meridienne_side, 'meridienne_len': meridienne_len,
+        'coussins': coussins
+    }
     try:
-        if "Simple" in type_canape:
-            render_Simple1(
-                tx=tx,
-                profondeur=profondeur,
-                dossier=dossier_bas,
-                acc_left=acc_left,
-                acc_right=acc_right,
-                meridienne_side=meridienne_side,
-                meridienne_len=meridienne_len,
-                coussins=coussins,
-                window_title="Canapé Simple"
-            )
-            
-        elif "L - Sans Angle" in type_canape:
-            render_LNF(
-                tx=tx,
-                ty=ty,
-                profondeur=profondeur,
-                dossier_left=dossier_left,
-                dossier_bas=dossier_bas,
-                acc_left=acc_left,
-                acc_bas=acc_bas,
-                meridienne_side=meridienne_side,
-                meridienne_len=meridienne_len,
-                coussins=coussins,
-                variant="auto",
-                window_title="Canapé L - Sans Angle"
-            )
-            
-        elif "L - Avec Angle" in type_canape:
-            render_LF_variant(
-                tx=tx,
-                ty=ty,
-                profondeur=profondeur,
-                dossier_left=dossier_left,
-                dossier_bas=dossier_bas,
-                acc_left=acc_left,
-                acc_bas=acc_bas,
-                meridienne_side=meridienne_side,
-                meridienne_len=meridienne_len,
-                coussins=coussins,
-                window_title="Canapé L - Avec Angle"
-            )
-            
-        elif "U - Sans Angle" in type_canape:
-            render_U(
-                tx=tx,
-                ty_left=ty,
-                tz_right=tz,
-                profondeur=profondeur,
-                dossier_left=dossier_left,
-                dossier_bas=dossier_bas,
-                dossier_right=dossier_right,
-                acc_left=acc_left,
-                acc_bas=acc_bas,
-                acc_right=acc_right,
-                coussins=coussins,
-                variant="auto",
-                window_title="Canapé U - Sans Angle"
-            )
-            
-        elif "U - 1 Angle" in type_canape:
-            # Par défaut utiliser v1, mais vous pouvez ajouter un sélecteur
-            render_U1F_v1(
-                tx=tx,
-                ty=ty,
-                tz=tz,
-                profondeur=profondeur,
-                dossier_left=dossier_left,
-                dossier_bas=dossier_bas,
-                dossier_right=dossier_right,
-                acc_left=acc_left,
-                acc_right=acc_right,
-                meridienne_side=meridienne_side,
-                meridienne_len=meridienne_len,
-                coussins=coussins,
-                window_title="Canapé U - 1 Angle"
-            )
-            
-        elif "U - 2 Angles" in type_canape:
-            render_U2f_variant(
-                tx=tx,
-                ty_left=ty,
-                tz_right=tz,
-                profondeur=profondeur,
-                dossier_left=dossier_left,
-                dossier_bas=dossier_bas,
-                dossier_right=dossier_right,
-                acc_left=acc_left,
-                acc_bas=acc_bas,
-                acc_right=acc_right,
-                meridienne_side=meridienne_side,
-                meridienne_len=meridienne_len,
-                coussins=coussins,
-                window_title="Canapé U - 2 Angles"
-            )
-        
-        # Récupérer la figure actuelle créée par matplotlib
-        fig = plt.gcf()
-        return fig
-        
+        return rendre_figure(config, window_title=f"Canapé {type_canape.split(' (')[0]}")
     except Exception as e:
-        plt.close()
         raise Exception(f"Erreur lors de la génération du schéma : {str(e)}")
 
 # Titre principal
@@ -232,54 +135,56 @@ with col1:
     nom_client = st.text_input("Nom du client")
     email_client = st.text_input("Email (optionnel)")
 
+# Configuration courante : le moteur incrémental ne refait que ce que les paramètres modifiés touchent
+config_devis = {
+    'type_canape': type_canape, 'tx': tx, 'ty': ty, 'tz': tz, 'profondeur': profondeur,
+    'acc_left': acc_left, 'acc_right': acc_right, 'acc_bas': acc_bas,
+    'dossier_left': dossier_left, 'dossier_bas': dossier_bas, 'dossier_right': dossier_right,
+    'meridienne_side': meridienne_side, 'meridienne_len': meridienne_len,
+    'type_coussins': type_coussins, 'type_mousse': type_mousse, 'epaisseur': epaisseur,
+    'nb_coussins_deco': nb_coussins_deco, 'nb_traversins_supp': nb_traversins_supp,
+    'has_surmatelas': has_surmatelas, 'has_meridienne': has_meridienne
+}
+if 'devis' not in st.session_state:
+    st.session_state['devis'] = DevisIncremental(generer_schema_canape)
+moteur = st.session_state['devis']
+
+# Contrôles des constructeurs par simple calcul (dizaines de µs, mémoïsés) : rien n'est dessiné si la configuration est infaisable
+erreurs_config = valider(config_devis)
+
 # COLONNE DROITE - APERÇU
 with col2:
     st.header("👁️ Aperçu du Canapé")
     
+    for erreur in erreurs_config:
+        st.warning(f"⚠️ {erreur.message}")
+    
     # Bouton de génération
-    if st.button("🎨 Générer l'Aperçu", type="primary", use_container_width=True):
+    if st.button("🎨 Générer l'Aperçu", type="primary", use_container_width=True,
+                 disabled=bool(erreurs_config)):
         with st.spinner("Génération du schéma en cours..."):
             try:
-                # Générer le schéma
-                fig = generer_schema_canape(
-                    type_canape=type_canape,
-                    tx=tx, ty=ty, tz=tz,
-                    profondeur=profondeur,
-                    acc_left=acc_left,
-                    acc_right=acc_right,
-                    acc_bas=acc_bas,
-                    dossier_left=dossier_left,
-                    dossier_bas=dossier_bas,
-                    dossier_right=dossier_right,
-                    meridienne_side=meridienne_side,
-                    meridienne_len=meridienne_len,
-                    coussins=type_coussins
-                )
+                # Générer le schéma (seulement si une cote / option de forme a changé) et le devis
+                res = moteur.mettre_a_jour(config_devis)
+                fig, layout, prix_details = res['fig'], res['layout'], res['prix']
                 
+                # figure gardée par le moteur (réaffichée si le schéma n'a pas changé)
                 st.pyplot(fig)
-                plt.close()
                 
                 st.success("✅ Schéma généré avec succès !")
                 
-                # Calcul du prix
-                prix_details = calculer_prix_total(
-                    type_canape=type_canape,
-                    tx=tx, ty=ty, tz=tz,
-                    profondeur=profondeur,
-                    type_coussins=type_coussins,
-                    type_mousse=type_mousse,
-                    epaisseur=epaisseur,
-                    acc_left=acc_left,
-                    acc_right=acc_right,
-                    acc_bas=acc_bas,
-                    dossier_left=dossier_left,
-                    dossier_bas=dossier_bas,
-                    dossier_right=dossier_right,
-                    nb_coussins_deco=nb_coussins_deco,
-                    nb_traversins_supp=nb_traversins_supp,
-                    has_surmatelas=has_surmatelas,
-                    has_meridienne=has_meridienne
-                )
+                # Plans de coussins alternatifs (un seul balayage, sans nouveau rendu)
+                if layout is not None and layout.lengths:
+                    top, pareto = plan_alternatives(dict(layout.lengths), type_coussins, k=3)
+                    with st.expander("🔁 Plans de coussins alternatifs"):
+                        st.markdown("**Meilleurs plans :**")
+                        for sizes, meta in top:
+                            tailles = ", ".join(f"{cote} {taille} cm" for cote, taille in sizes.items())
+                            st.write(f"{meta['rank']}. {tailles} — {meta['count']} coussins, chute {meta['waste']} cm, Δ {meta['delta']}")
+                        st.markdown("**Compromis chute / nombre de coussins (Pareto) :**")
+                        for sizes, meta in pareto:
+                            tailles = ", ".join(f"{cote} {taille} cm" for cote, taille in sizes.items())
+                            st.write(f"• {tailles} — {meta['count']} coussins, chute {meta['waste']} cm, Δ {meta['delta']}")
                 
                 # Affichage des prix
                 st.markdown("### 📊 Détails du Devis")
@@ -327,19 +232,14 @@ with col2:
                             'type_mousse': type_mousse,
                             'epaisseur': epaisseur
                         },
-                        'client': {'nom': nom_client, 'email': email_client}
+                        'client': {'nom': nom_client, 'email': email_client},
+                        'coussins': None
                     }
-                    
-                    prix_details = calculer_prix_total(
-                        type_canape=type_canape, tx=tx, ty=ty, tz=tz,
-                        profondeur=profondeur, type_coussins=type_coussins,
-                        type_mousse=type_mousse, epaisseur=epaisseur,
-                        acc_left=acc_left, acc_right=acc_right, acc_bas=acc_bas,
-                        dossier_left=dossier_left, dossier_bas=dossier_bas,
-                        dossier_right=dossier_right, nb_coussins_deco=nb_coussins_deco,
-                        nb_traversins_supp=nb_traversins_supp,
-                        has_surmatelas=has_surmatelas, has_meridienne=has_meridienne
-                    )
+                    # Disposition des coussins : celle de l'aperçu si à jour, sinon géométrie pure (sans figure)
+                    res = moteur.mettre_a_jour(config_devis, schema=False)
+                    if res['layout'] is not None:
+                        config['coussins'] = res['layout'].summary()
+                    prix_details = res['prix']
                     
                     pdf_buffer = generer_pdf_devis(config, prix_details)
                     
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+# bench_formes.py
+# Banc de mesure headless du planificateur de coussins, toutes formes :
+# Simple S1, LNF v1/v2, LF, U v1..v4, U1F v1..v4, U2F, sur une grille de dimensions
+# réglable et tous les modes coussins (auto, taille fixe, valise, p, g, s, p:s, g:s).
+#
+# Pour chaque cas : géométrie (compute_points / build_polys) hors chrono, puis
+# chrono du seul planificateur (_cushion_layout_*) -> p50 / p95 / p99 par forme et mode.
+# Le cache LRU partagé est désactivé pendant la mesure (latence "à froid") sauf --chaud ;
+# la table précalculée (plan_table) est utilisée si elle existe (noté dans le JSON).
+#
+# Équivalence canape_geometrie / canapefullv14, là où les règles coïncident :
+#   - géométrie : mêmes points (clés communes) pour les mêmes dimensions (noyau commun)
+#   - taille fixe : même nombre de coussins (orientation max (nb, -chute) des deux côtés)
+#   - Simple S1 en auto : même taille (choix 65/80/90 identique)
+# Les autres modes (valise, p, g, s, auto L/U...) suivent des règles différentes
+# dans les deux modules : seules les latences sont mesurées.
+#
+# Usage : python bench_formes.py [--pas 50] [--formes S1,U_v1,...] [--modes auto,80,...]
+#                                [--chaud] [--sortie bench_formes.json] [--reference ancien.json]
+
+import argparse
+import itertools
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+import canape_geometrie as geo
+import canapefullv14 as cf
+import plan_table
+from plan_cache import PLAN_CACHE
+
+MODES = ("auto", "65", "80", "valise", "p", "g", "s", "p:s", "g:s")
+VARIANTES = ("v1", "v2", "v3", "v4")
+FORMES = (("S1", "LNF_v1", "LNF_v2", "LF")
+          + tuple(f"U_{v}" for v in VARIANTES)
+          + tuple(f"U1F_{v}" for v in VARIANTES)
+          + ("U2F",))
+
+# Options testées pour chaque jeu de dimensions : tout coché, puis sans accoudoirs
+OPTIONS = ({"dossiers": True, "acc": True}, {"dossiers": True, "acc": False})
+PROFONDEURS = (60, 70)
+EXEMPLES_MAX = 5
+
+
+# ---------------------------------------------------------------------------
+# Cas par forme : (pts matplot, pts v14, planificateur, nb de référence v14)
+# ---------------------------------------------------------------------------
+def _nb_max_orientation(longueurs, size):
+    """Règle commune taille fixe : orientation max (nb, -chute) ; longueurs = une ligne par décalage."""
+    return max((sum(int(L // size) for L in Ls), -sum(L % size for L in Ls)) for Ls in longueurs)[0]
+
+def _cas_S1(tx, ty, tz, prof, o):
+    args = (tx, prof, o["dossiers"], o["acc"], o["acc"], None, 0)
+    pts = geo.compute_points_simple_S1(*args)
+    polys = geo.build_polys_simple_S1(pts, o["dossiers"], o["acc"], o["acc"], None, 0)
+    geo._assert_banquettes_max_250(polys)
+    pts14 = cf.compute_points_simple_S1(*args)
+    x0, x1 = pts14["B0"][0], pts14["Bx"][0]
+
+    def ref(mode):
+        if mode == "auto":
+            return {"bas": cf._choose_cushion_size_auto_simple_S1(x0, x1)}
+        if mode.isdigit():
+            s = int(mode)
+            off = cf.CUSHION_DEPTH if (x1 - x0 - cf.CUSHION_DEPTH) // s > (x1 - x0) // s else 0
+            return int(max(0, x1 - x0 - off) // s)
+        return None
+    return pts, pts14, lambda c: geo._cushion_layout_S1(pts, c), ref
+
+def _cas_L(nom, tx, ty, tz, prof, o):
+    args = (tx, ty, prof, o["dossiers"], o["dossiers"], o["acc"], o["acc"], None, 0)
+    pts = getattr(geo, f"compute_points_{nom}")(*args)
+    geo._assert_banquettes_max_250(getattr(geo, f"build_polys_{nom}")(pts, *args))
+    pts14 = getattr(cf, f"compute_points_{nom}")(*args)
+    if nom == "LF_variant":
+        plan = lambda c: geo._cushion_layout_LF(pts, tx, ty, c, None, 0)
+        kx, ky = "Bx", "By"
+    else:
+        plan = lambda c: geo._cushion_layout_L(pts, c)
+        kx = "Bx_mer" if "Bx_mer" in pts14 else "Bx"
+        ky = "By_mer" if "By_mer" in pts14 else "By"
+
+    def ref(mode):
+        if mode.isdigit():
+            return _nb_max_orientation([cf._lengths_L_like(pts14, sh, kx, ky) for sh in cf._SHIFTS_BAS], int(mode))
+        return None
+    return pts, pts14, plan, ref
+
+def _cas_U(v, tx, ty, tz, prof, o):
+    args = (tx, ty, tz, prof, o["dossiers"], o["dossiers"], o["dossiers"], o["acc"], o["acc"], o["acc"])
+    pts = getattr(geo, f"compute_points_U_{v}")(*args)
+    polys, drawn = getattr(geo, f"build_polys_U_{v}")(pts, *args)
+    geo._assert_banquettes_max_250(polys)
+    pts14 = getattr(cf, f"compute_points_U_{v}")(*args)
+
+    def ref(mode):
+        if mode.isdigit():
+            return cf._best_orientation_score_U(v, pts14, drawn, int(mode))[0][0]
+        return None
+    return pts, pts14, lambda c: geo._cushion_layout_U(v, pts, drawn, c), ref
+
+def _cas_U1F(v, tx, ty, tz, prof, o):
+    args = (tx, ty, tz, prof, o["dossiers"], o["dossiers"], o["dossiers"], o["acc"], o["acc"])
+    pts = getattr(geo, f"compute_points_U1F_{v}")(*args, None, 0)
+    geo._assert_banquettes_max_250(getattr(geo, f"build_polys_U1F_{v}")(pts, *args))
+    pts14 = getattr(cf, f"compute_points_U1F_{v}")(*args, None, 0)
+
+    def ref(mode):
+        if mode.isdigit():
+            return _nb_max_orientation([cf._lengths_U1F(pts14, sl, sr) for sl, sr in cf._SHIFTS_LR], int(mode))
+        return None
+    return pts, pts14, lambda c: geo._cushion_layout_U1F(pts, c), ref
+
+def _cas_U2F(tx, ty, tz, prof, o):
+    args = (tx, ty, tz, prof, o["dossiers"], o["dossiers"], o["dossiers"], o["acc"], o["acc"], o["acc"])
+    pts = geo.compute_points_U2f(*args, None, 0)
+    pts14 = cf.compute_points_U2f(*args, None, 0)
+    geo._assert_banquettes_max_250(geo.build_polys_U2f(pts, *args))
+
+    def ref(mode):
+        if mode.isdigit():
+            return _nb_max_orientation([cf._lengths_U2f(pts14, sl, sr) for sl, sr in cf._SHIFTS_LR], int(mode))
+        return None
+    return pts, pts14, lambda c: geo._cushion_layout_U2f(pts, c), ref
+
+def _preparer(forme, tx, ty, tz, prof, o):
+    if forme == "S1":
+        return _cas_S1(tx, ty, tz, prof, o)
+    if forme in ("LNF_v1", "LNF_v2"):
+        return _cas_L(forme, tx, ty, tz, prof, o)
+    if forme == "LF":
+        return _cas_L("LF_variant", tx, ty, tz, prof, o)
+    if forme == "U2F":
+        return _cas_U2F(tx, ty, tz, prof, o)
+    famille, v = forme.split("_")
+    return (_cas_U if famille == "U" else _cas_U1F)(v, tx, ty, tz, prof, o)
+
+
+# ---------------------------------------------------------------------------
+# Grille, mesure, équivalence
+# ---------------------------------------------------------------------------
+def _grille(forme, pas, lo=200, hi=600, lo_y=150, hi_y=400):
+    """Dimensions (tx, ty, tz) : tz seulement pour les U, ty ignoré pour S1."""
+    txs = range(lo, hi + 1, pas)
+    tys = range(lo_y, hi_y + 1, pas)
+    if forme == "S1":
+        return [(tx, 0, 0) for tx in txs]
+    if forme in ("LNF_v1", "LNF_v2", "LF"):
+        return [(tx, ty, 0) for tx, ty in itertools.product(txs, tys)]
+    return [(tx, ty, tz) for tx, ty, tz in itertools.product(txs, tys, tys)]
+
+def _percentiles(lat_ns):
+    a = np.asarray(lat_ns, dtype=np.float64) / 1e3
+    p50, p95, p99 = np.percentile(a, (50, 95, 99))
+    return {"n": len(a), "p50_us": round(p50, 2), "p95_us": round(p95, 2),
+            "p99_us": round(p99, 2), "max_us": round(a.max(), 2)}
+
+def _egalite_points(pts, pts14):
+    communs = [k for k in pts if not k.startswith("_") and k in pts14]
+    return [k for k in communs if tuple(pts[k]) != tuple(pts14[k])]
+
+def _ajouter_ecart(eq, forme, controle, detail):
+    e = eq.setdefault(forme, {}).setdefault(controle, {"n": 0, "ecarts": 0, "exemples": []})
+    e["ecarts"] += 1
+    if len(e["exemples"]) < EXEMPLES_MAX:
+        e["exemples"].append(detail)
+
+def _compter(eq, forme, controle):
+    eq.setdefault(forme, {}).setdefault(controle, {"n": 0, "ecarts": 0, "exemples": []})["n"] += 1
+
+def mesurer(formes=FORMES, modes=MODES, pas=50, chaud=False):
+    lat = {f: {m: [] for m in modes} for f in formes}
+    eq = {}
+    ignores = {f: 0 for f in formes}
+    taille_cache = PLAN_CACHE.maxsize
+    if not chaud:
+        PLAN_CACHE.resize(0)
+    try:
+        for forme in formes:
+            for (tx, ty, tz), prof, o in itertools.product(_grille(forme, pas), PROFONDEURS, OPTIONS):
+                try:
+                    pts, pts14, plan, ref = _preparer(forme, tx, ty, tz, prof, o)
+                except ValueError:
+                    ignores[forme] += 1          # configuration invalide (banquette > 250, etc.)
+                    continue
+                cas = {"tx": tx, "ty": ty, "tz": tz, "profondeur": prof, **o}
+
+                _compter(eq, forme, "geometrie")
+                diff = _egalite_points(pts, pts14)
+                if diff:
+                    _ajouter_ecart(eq, forme, "geometrie", {**cas, "points": diff})
+
+                for mode in modes:
+                    t0 = time.perf_counter_ns()
+                    layout = plan(mode)
+                    lat[forme][mode].append(time.perf_counter_ns() - t0)
+
+                    attendu = ref(mode)
+                    if attendu is None:
+                        continue
+                    controle = "taille_auto" if mode == "auto" else "nb_taille_fixe"
+                    obtenu = dict(layout.sizes) if mode == "auto" else layout.count
+                    _compter(eq, forme, controle)
+                    if obtenu != attendu:
+                        _ajouter_ecart(eq, forme, controle,
+                                       {**cas, "mode": mode, "matplot": obtenu, "v14": attendu})
+    finally:
+        PLAN_CACHE.resize(taille_cache)
+
+    latences = {f: {m: _percentiles(v) for m, v in d.items() if v} for f, d in lat.items()}
+    return latences, eq, ignores
+
+def comparer(latences, reference, seuil=1.25):
+    """Couples (forme, mode) dont le p95 dépasse seuil × celui du JSON de référence."""
+    regressions = []
+    for forme, d in latences.items():
+        for mode, stats in d.items():
+            ref = reference.get("latences", {}).get(forme, {}).get(mode)
+            if ref and ref["p95_us"] > 0 and stats["p95_us"] > seuil * ref["p95_us"]:
+                regressions.append((forme, mode, ref["p95_us"], stats["p95_us"]))
+    return regressions
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Banc planificateur de coussins (toutes formes, tous modes)")
+    ap.add_argument("--pas", type=int, default=50, help="pas de la grille de dimensions (cm)")
+    ap.add_argument("--formes", default=",".join(FORMES))
+    ap.add_argument("--modes", default=",".join(MODES))
+    ap.add_argument("--chaud", action="store_true", help="garder le cache LRU actif pendant la mesure")
+    ap.add_argument("--sortie", default="bench_formes.json")
+    ap.add_argument("--reference", help="JSON d'une mesure précédente (détection de régression p95)")
+    ap.add_argument("--seuil", type=float, default=1.25)
+    a = ap.parse_args(argv)
+
+    formes = tuple(f for f in a.formes.split(",") if f)
+    modes = tuple(m for m in a.modes.split(",") if m)
+    inconnues = set(formes) - set(FORMES)
+    if inconnues:
+        raise ValueError(f"Formes inconnues : {sorted(inconnues)} (choix : {', '.join(FORMES)})")
+
+    t0 = time.perf_counter()
+    latences, eq, ignores = mesurer(formes, modes, a.pas, a.chaud)
+    duree = time.perf_counter() - t0
+
+    for forme in formes:
+        print(f"== {forme} ({ignores[forme]} config. invalides ignorées)")
+        for mode, s in latences[forme].items():
+            print(f"   {mode:>7} : n={s['n']:6d}  p50={s['p50_us']:8.1f} µs  p95={s['p95_us']:8.1f} µs  p99={s['p99_us']:8.1f} µs")
+        for controle, e in eq.get(forme, {}).items():
+            print(f"   équivalence {controle:<15}: {e['n'] - e['ecarts']}/{e['n']}")
+
+    ecarts = sum(e["ecarts"] for d in eq.values() for e in d.values())
+    resultat = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(), "numpy": np.__version__,
+            "machine": platform.machine(),
+            "pas": a.pas, "profondeurs": PROFONDEURS, "options": OPTIONS,
+            "cache": "chaud" if a.chaud else "désactivé",
+            "table_precalculee": plan_table.load() is not None,
+            "duree_s": round(duree, 2),
+        },
+        "latences": latences,
+        "equivalence": eq,
+        "invalides": ignores,
+    }
+    with open(a.sortie, "w", encoding="utf-8") as f:
+        json.dump(resultat, f, ensure_ascii=False, indent=2)
+    print(f"Résultats : {a.sortie} ({duree:.1f} s) — écarts d'équivalence : {ecarts}")
+
+    code = 1 if ecarts else 0
+    if a.reference:
+        with open(a.reference, encoding="utf-8") as f:
+            regressions = comparer(latences, json.load(f), a.seuil)
+        for forme, mode, avant, apres in regressions:
+            print(f"Régression p95 {forme} / {mode} : {avant:.1f} -> {apres:.1f} µs")
+        code = code or (2 if regressions else 0)
+    return code
+
+if __name__ == "__main__":
+    sys.exit(main())
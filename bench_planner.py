@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# bench_planner.py
+# Micro-benchmark du planificateur de coussins (canape_geometrie._plan_sizes_for_branches)
+# Grille complète 100..600 cm (pas 10) sur 1, 2 et 3 côtés, modes valise / p / g.
+# Compare la version tabulée (NumPy) à la version de référence en boucles Python
+# et vérifie au passage que les deux renvoient exactement les mêmes (sizes, meta).
+# Vérifie aussi que le 1er des plans alternatifs (_plan_sizes_top_k, liste « Meilleurs plans »
+# de l'appli) est le plan dessiné, pour valise / p / g avec et sans same.
+# Mesure enfin l'appel public (cache LRU partagé, plan_cache, table précalculée écartée) :
+# 1er passage + passage chaud, puis la table précalculée (plan_table) si elle a été construite.
+#
+# Usage : python bench_planner.py [pas_cm]
+
+import sys
+import time
+import itertools
+
+import canape_geometrie as geo
+from plan_cache import PLAN_CACHE
+import plan_table
+
+MODES = ("valise", "p", "g")
+SIDES = ("bas", "gauche", "droite")
+
+def _grille(step=10, lo=100, hi=600):
+    vals = range(lo, hi + 1, step)
+    cas = []
+    for n in (1, 2, 3):
+        for combo in itertools.product(vals, repeat=n):
+            cas.append(dict(zip(SIDES, combo)))
+    return cas
+
+def _chrono(fn, cas):
+    t0 = time.perf_counter()
+    for mode in MODES:
+        for lengths in cas:
+            fn(lengths, mode)
+    return time.perf_counter() - t0
+
+def main(step=10):
+    cas = _grille(step)
+    n_appels = len(cas) * len(MODES)
+
+    ecarts = 0
+    for mode in MODES:
+        for lengths in cas:
+            if geo._plan_sizes_for_branches_table(lengths, mode) != geo._plan_sizes_for_branches_loop(lengths, mode):
+                ecarts += 1
+    print(f"Équivalence : {n_appels - ecarts}/{n_appels} plans identiques")
+
+    ecarts_top = 0
+    for mode, same in itertools.product(MODES, (False, True)):
+        for lengths in cas:
+            top, _ = geo._plan_sizes_top_k(lengths, mode, k=3, same=same)
+            if top[0][0] != geo._plan_sizes_for_branches_table(lengths, mode, same=same)[0]:
+                ecarts_top += 1
+    print(f"Alternatives   : {2 * n_appels - ecarts_top}/{2 * n_appels} rangs 1 = plan dessiné")
+    ecarts += ecarts_top
+
+    t_ref = _chrono(geo._plan_sizes_for_branches_loop, cas)
+    t_np  = _chrono(geo._plan_sizes_for_branches_table, cas)
+    print(f"Boucles Python : {t_ref:8.3f} s  ({1e6 * t_ref / n_appels:7.1f} µs/plan)")
+    print(f"Table NumPy    : {t_np:8.3f} s  ({1e6 * t_np / n_appels:7.1f} µs/plan)")
+    print(f"Gain           : x{t_ref / t_np:.1f}")
+
+    # Table mmap écartée le temps de la mesure : elle répondrait avant le cache LRU
+    # (0 hit / 0 miss) et l'on chronométrerait plan_table.lookup
+    table, plan_table._TABLE = plan_table.load(), None
+    PLAN_CACHE.clear()
+    PLAN_CACHE.resize(max(PLAN_CACHE.maxsize, n_appels))
+    try:
+        t_froid = _chrono(geo._plan_sizes_for_branches, cas)
+        t_chaud = _chrono(geo._plan_sizes_for_branches, cas)
+    finally:
+        plan_table._TABLE = table
+    print(f"Cache (froid)  : {t_froid:8.3f} s  ({1e6 * t_froid / n_appels:7.1f} µs/plan)")
+    print(f"Cache (chaud)  : {t_chaud:8.3f} s  ({1e6 * t_chaud / n_appels:7.1f} µs/plan)")
+    print(f"Stats cache    : {PLAN_CACHE.stats()}")
+
+    if plan_table.load() is not None:
+        t_tab = _chrono(plan_table.lookup, cas)
+        print(f"Table mmap     : {t_tab:8.3f} s  ({1e6 * t_tab / n_appels:7.1f} µs/plan)")
+    else:
+        print("Table mmap     : absente (python plan_table.py build)")
+    return 1 if ecarts else 0
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# bench_valise.py
+# Vérification + micro-benchmark des optimiseurs "valise" de canapefullv14
+# (L-like LF / LNF v1 v2, U no-fromage v1..v4, U2f, U1F v1..v4) : solveur vectorisé (fenêtres Δ ≤ 5) vs boucles de référence.
+# Les deux doivent renvoyer exactement le même dict (score, tailles, décalages).
+#
+# Usage : python bench_valise.py [pas_cm]   (défaut 200 : la référence est lente)
+
+import sys
+import time
+import itertools
+
+import canapefullv14 as cf
+from plan_cache import PLAN_CACHE
+
+RANGES = ((60, 100, False), (60, 74, False), (76, 100, False), (60, 100, True))
+TRAVERSINS = (set(), {"g"}, {"d"}, {"g", "d"})
+TRAVERSINS_L = (set(), {"g"}, {"b"}, {"g", "b"})
+
+def _cas(step=200, lo=200, hi=600):
+    """(nom, fn_rapide, fn_reference, args) sur une grille tx × ty × tz."""
+    dims = range(lo, hi + 1, step)
+    cas = []
+    for tx, ty in itertools.product(dims, repeat=2):
+        for trv in TRAVERSINS_L:
+            for name in ("LF_variant", "LNF_v1", "LNF_v2"):
+                comp = getattr(cf, f"compute_points_{name}")
+                try:
+                    pts = comp(tx, ty, 70, True, True, True, True, None, 0)
+                    cas.append((name, cf._optimize_valise_L_like, cf._optimize_valise_L_like_loop, (pts,), trv))
+                except ValueError:
+                    pass
+    for tx, ty, tz in itertools.product(dims, repeat=3):
+        for trv in TRAVERSINS:
+            try:
+                pts = cf.compute_points_U2f(tx, ty, tz, 70, True, True, True, True, True, True, None, 0)
+                cas.append(("U2f", cf._optimize_valise_U2f, cf._optimize_valise_U2f_loop, (pts,), trv))
+            except ValueError:
+                pass
+            for v in ("v1", "v2", "v3", "v4"):
+                comp = getattr(cf, f"compute_points_U1F_{v}")
+                try:
+                    pts = comp(tx, ty, tz, 70, True, True, True, True, True, None, 0)
+                    cas.append((f"U1F {v}", cf._optimize_valise_U1F, cf._optimize_valise_U1F_loop, (pts,), trv))
+                except ValueError:
+                    pass
+                comp = getattr(cf, f"compute_points_U_{v}")
+                build = getattr(cf, f"build_polys_U_{v}")
+                try:
+                    pts = comp(tx, ty, tz, 70, True, True, True, True, True, True)
+                    _, drawn = build(pts, tx, ty, tz, 70, True, True, True, True, True, True)
+                    cas.append((f"U {v}", cf._optimize_valise_U, cf._optimize_valise_U_loop, (v, pts, drawn), trv))
+                except ValueError:
+                    pass
+    return cas
+
+def _chrono(cas, idx):
+    t0 = time.perf_counter(); n = 0
+    for c in cas:
+        for r0, r1, same in RANGES:
+            c[idx](*c[3], (r0, r1), same, traversins=c[4]); n += 1
+    return time.perf_counter() - t0, n
+
+def main(step=200):
+    PLAN_CACHE.resize(0)  # on mesure le solveur lui-même, pas le cache LRU
+    cas = _cas(step)
+    ecarts = 0; total = 0
+    for name, fast, ref, args, trv in cas:
+        for r0, r1, same in RANGES:
+            total += 1
+            a = fast(*args, (r0, r1), same, traversins=trv)
+            b = ref(*args, (r0, r1), same, traversins=trv)
+            if a != b:
+                ecarts += 1
+                if ecarts <= 5:
+                    print("ÉCART", name, args[-1] if name.startswith("U ") else "", (r0, r1, same), trv, a, b)
+    print(f"Équivalence : {total - ecarts}/{total} résultats identiques")
+
+    t_ref, n = _chrono(cas, 2)
+    t_new, _ = _chrono(cas, 1)
+    print(f"Boucles (réf.): {1e3 * t_ref / n:8.3f} ms/appel")
+    print(f"Vectorisé     : {1e3 * t_new / n:8.3f} ms/appel")
+    print(f"Gain          : x{t_ref / t_new:.0f}")
+    return 1 if ecarts else 0
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
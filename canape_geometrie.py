@@ -0,0 +1,2602 @@
+# -*- coding: utf-8 -*-
+"""
+Noyau géométrie + planification commun aux deux rendus (turtle : canapefullv14,
+matplotlib : canapematplot) et à la couche sofa_layout (devis, PDF, lots).
+
+Aucun import graphique : cotes entières, points nommés, polygones par catégorie,
+contrôles (méridienne, banquette > 250 cm), choix de variante auto et planificateur
+de coussins (CushionLayout). Les rendus ne font que dessiner ce qui sort d'ici.
+
+Mémoïsation unique : geometrie(forme, variante, *cotes) passe par GEOM_CACHE
+(plan_cache.PlanCache, infaisables compris) ; les plans de coussins par PLAN_CACHE.
+Une géométrie calculée pour un aperçu turtle est donc reprise telle quelle par le
+rendu matplotlib ou le PDF du même processus.
+Taille max via CANAPE_GEOM_CACHE_SIZE (0 = désactivé).
+"""
+
+import heapq
+import itertools
+import os
+import threading
+from collections import namedtuple
+from collections.abc import Mapping
+from contextlib import contextmanager
+from types import MappingProxyType
+
+import numpy as np
+
+from plan_cache import PLAN_CACHE, PlanCache, plan_key
+import plan_table
+
+# =========================
+# Réglages / constantes
+# =========================
+WIN_W, WIN_H       = 900, 700
+PAD_PX             = 60
+ZOOM               = 0.85
+
+DEPTH_STD          = 70
+ACCOUDOIR_THICK    = 15
+DOSSIER_THICK      = 10
+CUSHION_DEPTH      = 15
+
+# *** Seuil strict de scission ***
+MAX_BANQUETTE      = 250
+SPLIT_THRESHOLD    = 250  # scission dès que longueur > 250 (aucune tolérance)
+
+# =========================
+# Helpers géométrie / écran
+# =========================
+class WorldToScreen:
+    def __init__(self, tx_cm, ty_cm, win_w=WIN_W, win_h=WIN_H, pad_px=PAD_PX, zoom=ZOOM):
+        sx = (win_w - 2*pad_px) / float(tx_cm or 1)
+        sy = (win_h - 2*pad_px) / float(ty_cm or 1)
+        self.scale = min(sx, sy) * zoom
+        used_w = tx_cm * self.scale
+        used_h = ty_cm * self.scale
+        self.left_px   = -used_w / 2.0
+        self.bottom_px = -used_h / 2.0
+    def pt(self, x_cm, y_cm):
+        return (self.left_px + x_cm*self.scale, self.bottom_px + y_cm*self.scale)
+    def pts(self, xy_cm):
+        """Tableau (N, 2) de points en cm -> pixels, en une seule opération affine."""
+        return np.asarray(xy_cm) * self.scale + (self.left_px, self.bottom_px)
+
+def centroid(poly):
+    return (sum(x for x,y in poly)/len(poly), sum(y for x,y in poly)/len(poly))
+
+def banquette_dims(poly):
+    xs=[p[0] for p in poly]; ys=[p[1] for p in poly]
+    L=max(max(xs)-min(xs), max(ys)-min(ys)); P=min(max(xs)-min(xs), max(ys)-min(ys))
+    return L, P
+
+# Cœur géométrique entier : toutes les cotes sont des cm entiers (entrées, épaisseurs
+# 10/15/20, profondeur, scissions au cm inférieur) -> points et polygones exacts,
+# sans tolérance flottante ; conversion en pixels uniquement dans WorldToScreen.
+def _cm_ints(*values):
+    """Cotes d'entrée en cm entiers (70.0 accepté ; 70.5 refusé)."""
+    out = []
+    for v in values:
+        if isinstance(v, np.ndarray):   # lot de cotes entières (sofa_layout.geometrie_lot)
+            out.append(v)
+            continue
+        iv = int(v or 0)
+        if iv != (v or 0):
+            raise ValueError(f"Cote {v} cm : les dimensions doivent être des cm entiers.")
+        out.append(iv)
+    return out[0] if len(out) == 1 else tuple(out)
+
+def _split_mid_int(a, b):
+    delta = b - a; L = abs(delta); left = L // 2
+    return a + (left if delta >= 0 else -left)
+
+def _rectU(x0, y0, x1, y1):
+    return [(x0,y0),(x1,y0),(x1,y1),(x0,y1),(x0,y0)]
+
+def _poly_has_area(p):
+    if not p or len(p) < 4: return False
+    xs=[x for x,y in p]; ys=[y for x,y in p]
+    return (max(xs)-min(xs) > 0) and (max(ys)-min(ys) > 0)
+
+def _assert_banquettes_max_250(polys, store=None):
+    # Passages à blanc (sans PolyStore) : quelques banquettes, la boucle coûte moins
+    # que la construction du tableau ; au rendu, réduction sur le tableau déjà construit.
+    if store is None:
+        for poly in polys.get("banquettes", []):
+            L, P = banquette_dims(poly)
+            if L > MAX_BANQUETTE:
+                raise ValueError(f"Banquette de {L}×{P} cm > {MAX_BANQUETTE} cm — scission supplémentaire nécessaire.")
+        return
+    dims = store.dims()[store.indices("banquettes")]
+    trop = np.flatnonzero(dims[:, 0] > MAX_BANQUETTE)
+    if trop.size:
+        L, P = dims[trop[0]].tolist()
+        raise ValueError(f"Banquette de {L}×{P} cm > {MAX_BANQUETTE} cm — scission supplémentaire nécessaire.")
+
+POLY_CATEGORIES = ("dossiers", "banquettes", "accoudoirs", "angle", "angles")
+
+class PolyStore(namedtuple("PolyStore", "verts offsets cats names")):
+    """
+    Tous les polygones d'une géométrie dans un seul tableau de sommets :
+      - verts   : (N, 2) sommets en cm (entiers), polygone i = verts[offsets[i]:offsets[i+1]]
+      - offsets : (n+1,) début de chaque polygone
+      - cats    : (n,) code de catégorie, names[code] = "banquettes", "dossiers"...
+    Les grandeurs par polygone (boîte, dimensions, centre, aire) sont des réductions
+    sur tout le tableau ; les polygones vides sont ignorés (jamais dessinés).
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_polys(cls, polys, categories=POLY_CATEGORIES):
+        """Depuis le dict polys des build_polys_* (catégories présentes, dans l'ordre donné)."""
+        names = tuple(c for c in categories if c in polys)
+        return cls.from_lists([polys[c] for c in names], names)
+
+    @classmethod
+    def from_lists(cls, lists, names):
+        verts, sizes, cats = [], [], []
+        for code, lst in enumerate(lists):
+            for poly in lst:
+                if poly:
+                    verts.extend(poly); sizes.append(len(poly)); cats.append(code)
+        offsets = np.zeros(len(sizes) + 1, dtype=np.intp)
+        np.cumsum(sizes, out=offsets[1:])
+        verts = np.array(verts).reshape(-1, 2)
+        return cls(verts, offsets, np.array(cats, dtype=np.uint8), tuple(names))
+
+    def indices(self, cat):
+        if cat not in self.names:
+            return np.zeros(0, dtype=np.intp)
+        return np.flatnonzero(self.cats == self.names.index(cat))
+
+    def poly(self, i):
+        return self.verts[self.offsets[i]:self.offsets[i + 1]]
+
+    def counts(self):
+        return np.diff(self.offsets)
+
+    def bbox(self):
+        """(mins, maxs) : (n, 2) chacun."""
+        if not len(self.cats):
+            return np.zeros((0, 2), self.verts.dtype), np.zeros((0, 2), self.verts.dtype)
+        starts = self.offsets[:-1]
+        return np.minimum.reduceat(self.verts, starts), np.maximum.reduceat(self.verts, starts)
+
+    def extents(self):
+        """(n, 2) largeur et hauteur de la boîte englobante."""
+        mins, maxs = self.bbox()
+        return maxs - mins
+
+    def dims(self):
+        """(n, 2) (L, P) comme banquette_dims : plus grand / plus petit côté de la boîte."""
+        ext = self.extents()
+        return np.stack([ext.max(axis=1), ext.min(axis=1)], axis=1)
+
+    def centroids(self):
+        """(n, 2) moyenne des sommets, comme centroid (sommet de fermeture compris)."""
+        if not len(self.cats):
+            return np.zeros((0, 2))
+        return np.add.reduceat(self.verts, self.offsets[:-1]) / self.counts()[:, None]
+
+    def has_area(self):
+        """(n,) comme _poly_has_area."""
+        ext = self.extents()
+        return (self.counts() >= 4) & (ext[:, 0] > 0) & (ext[:, 1] > 0)
+
+
+class Points(Mapping):
+    """
+    Points nommés d'une forme (cm) : un attribut à __slots__ par nom de la famille
+    (_NOMS), absent si la variante / les options ne le créent pas. Lecture type dict
+    conservée (pts.F0, get, in, items) ; les constructeurs lisent les attributs.
+    _REPLIS : extrémités à variante (méridienne, retour d'accoudoir...) résolues une fois
+    par completer(), en fin de compute_points_* : attribut -> noms candidats, le premier
+    présent l'emporte (pts.By_fin au lieu de pts.get("By_mer", pts["By"])).
+    Partagé via GEOM_CACHE : à lire, jamais à modifier une fois complété.
+    """
+    __slots__ = ()
+    _NOMS = ()
+    _REPLIS = {}
+
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        cls._CLES = frozenset(cls._NOMS)
+
+    def completer(self):
+        for attr, noms in self._REPLIS.items():
+            for nom in noms:
+                if hasattr(self, nom):
+                    setattr(self, attr, getattr(self, nom))
+                    break
+        return self
+
+    def __getitem__(self, nom):
+        if nom in self._CLES:
+            try:
+                return getattr(self, nom)
+            except AttributeError:
+                pass
+        raise KeyError(nom)
+
+    def __contains__(self, nom):
+        return nom in self._CLES and hasattr(self, nom)
+
+    def get(self, nom, default=None):
+        return getattr(self, nom, default) if nom in self._CLES else default
+
+    def __iter__(self):
+        return (nom for nom in self._NOMS if hasattr(self, nom))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class PointsS1(Points):
+    _NOMS = ("Ay", "Ay2", "Ax", "Ax2", "B0", "By", "Bx", "Bx2", "D0", "Dx",
+             "D0_m", "B0_m", "Dx_m", "Bx_m", "_tx", "_prof")
+    _REPLIS = {"B0_fin": ("B0_m", "B0"), "Bx_fin": ("Bx_m", "Bx")}
+    __slots__ = _NOMS + tuple(_REPLIS)
+
+class PointsLF(Points):
+    _NOMS = ("F0", "Fy", "Fx", "Fy2", "Fx2", "By", "By2", "D0", "D0x", "D0y", "Dy", "Dy2",
+             "Ay", "Ay2", "Ay_", "Dx", "Dx2", "Bx", "Bx2", "Ax", "Ax2", "Ax_", "Bx_", "By_")
+    _REPLIS = {"Bx_fin": ("Bx_", "Bx"), "By_fin": ("By_", "By")}
+    __slots__ = _NOMS + tuple(_REPLIS)
+
+class PointsLNF(Points):
+    _NOMS = ("F0", "Fx", "Fx2", "Fy", "D0", "D0x", "D0y", "Dy", "Dy2", "Dx", "DxR",
+             "By", "By2", "Bx", "Bx2", "Ay", "Ay2", "Ay_par", "Ax", "Ax2", "Ax_par",
+             "By_mer", "By2_mer", "Bx_mer", "Bx2_mer", "Dx_mer", "DxR_mer", "_tx", "_ty")
+    _REPLIS = {"By_fin": ("By_mer", "By"), "By2_fin": ("By2_mer", "By2"),
+               "Bx_fin": ("Bx_mer", "Bx"), "Dx_fin": ("Dx_mer", "Dx"), "DxR_fin": ("DxR_mer", "DxR")}
+    __slots__ = _NOMS + tuple(_REPLIS)
+
+class PointsU(Points):
+    _NOMS = ("F0", "F02", "Fx", "Fx2", "Fy", "Fy2", "Fy3", "D0", "D0x", "D0y", "D02", "D02x", "D02y",
+             "Dx", "Dx2", "Dy", "Dy2", "Dy3", "Bx", "Bx2", "By", "By2", "By3", "By4",
+             "Ay", "Ay2", "Ay_", "Ax", "Ax2", "Ax_par", "_ty_canvas")
+    _REPLIS = {"By_fin": ("By",), "By4_fin": ("By4",)}
+    __slots__ = _NOMS + tuple(_REPLIS)
+
+class PointsU1F(Points):
+    _NOMS = PointsU._NOMS + ("Dy2R", "Dy4", "Fy4", "By_dL", "By4_d", "By_cush", "By4_cush",
+                             "_A", "_draw", "_acc")
+    _REPLIS = PointsU._REPLIS
+    __slots__ = _NOMS + tuple(_REPLIS)
+
+class PointsU2F(Points):
+    _NOMS = ("F0", "F02", "Fx", "Fx2", "Fy", "Fy2", "Fy3", "Fy4", "D0", "D0x", "D0y", "D02", "D02y",
+             "Dx", "Dx2", "Dy", "Dy2", "Dy_r", "Dy2_r", "Bx", "Bx2", "By", "By2", "By3", "By4",
+             "Ay", "Ay2", "Ay_", "Ax", "Ax2", "Ax_par", "By_", "By2_", "By4_", "_ty_canvas")
+    _REPLIS = {"By_fin": ("By_", "By"), "By4_fin": ("By4_", "By4")}
+    __slots__ = _NOMS + tuple(_REPLIS)
+
+
+# ============================================================
+# ===============  PLANIFICATEUR DE COUSSINS  =================
+# ============================================================
+def _norm_coussins_spec(c):
+    """
+    Normalise l'argument `coussins` en (mode, same, size_fixed, tag),
+    où :
+      - mode in {"auto", "p", "g", "valise", "fixed", "s"}
+      - same: bool (force même taille partout)
+      - size_fixed: int | None (si taille unique imposée)
+      - tag: str pour affichage console ("valise" / "std" / None)
+    Règles de parsing :
+      - int ou str-int : -> ("fixed", True, value, None)
+      - "auto" -> ("auto", True, None, None)
+      - "p", "g", "valise", "s" -> mode correspondant
+      - "valise:p", "valise:g", "valise:s" etc. -> mode = p/g/s, tag="valise"
+      - "std:*" -> équivalent mais tag="std"
+    """
+    tag=None
+    if isinstance(c, (int, float)):
+        v=int(c); return ("fixed", True, v, tag)
+    if c is None:
+        return ("auto", True, None, tag)
+    s=str(c).strip().lower()
+    if s.isdigit():
+        return ("fixed", True, int(s), tag)
+
+    # labels + options
+    parts=[p for p in s.replace(" ", "").split(":") if p]
+    # labels ignorés dans la logique, gardés pour console
+    labels=[p for p in parts if p in ("valise","std")]
+    if labels: tag=labels[0]  # premier label conservé
+    opts=[p for p in parts if p in ("auto","p","g","s")]
+    if not opts:
+        # "valise" seul => valise libre
+        return ("valise", False, None, tag or "valise")
+    # si plusieurs opts, on prend la dernière (ex: "valise:p:s" -> s prime)
+    opt=opts[-1]
+    if opt=="auto":  return ("auto", True, None, tag)
+    if opt=="p":     return ("p", False, None, tag)
+    if opt=="g":     return ("g", False, None, tag)
+    if opt=="s":     return ("s", True, None, tag or "valise")  # same partout
+    # fallback
+    return ("valise", False, None, tag)
+
+def _allowed_interval_for_mode(mode):
+    """Retourne (lo, hi) inclus selon le mode."""
+    if mode=="p":        return 60, 74
+    if mode=="g":        return 76, 100    # 'plus de 75' -> 76..100
+    if mode in ("valise","s","fixed","auto"):
+        return 60, 100
+    return 60, 100
+
+def _score_pref_key(mode, total_waste, total_count, sizes, is_uniform_choice):
+    """
+    Clé de tri : minimise la chute, puis selon la préférence :
+      - p : plus de coussins => MAX total_count
+      - g : moins de coussins => MIN total_count
+      - valise/s/auto/fixed : neutre → on préfère Δ min puis taille médiane plus grande
+    """
+    delta = max(sizes)-min(sizes) if sizes else 0
+    med = sorted(sizes)[len(sizes)//2] if sizes else 0
+    if mode=="p":
+        return (total_waste, -total_count, delta, -med, not is_uniform_choice)
+    if mode=="g":
+        return (total_waste, total_count, delta, -med, not is_uniform_choice)
+    # valise/s/auto/fixed
+    return (total_waste, delta, -med, not is_uniform_choice)
+
+def _choose_uniform_size_from_set(lengths, candidate_set):
+    """Choisit s unique dans candidate_set minimisant la chute totale (puis s plus grand)."""
+    best=None; best_score=(1e18, -1)
+    for s in sorted(candidate_set):
+        waste = sum(L % s if L>0 else 0 for L in lengths)
+        score = (waste, -s)
+        if score < best_score:
+            best_score=score; best=s
+    return best
+
+# --- Tables précalculées (longueur × taille) : chute et nombre de coussins ---
+# Lignes = longueur L en cm (0.._PLAN_L_MAX), colonnes = taille s (COUSSIN_MIN..COUSSIN_MAX).
+# On en dérive, pour chaque intervalle de mode, le meilleur s local par (L, ancre).
+# Au-delà de _PLAN_L_MAX, les lignes sont calculées à la volée (même résultat).
+COUSSIN_MIN, COUSSIN_MAX = 60, 100
+
+_PLAN_L_MAX = 1200
+
+def _plan_tables(lengths):
+    """(chute, nb) pour chaque longueur × taille 60..100."""
+    Ls = np.asarray(lengths, dtype=np.int64)[:, None]
+    sizes = np.arange(COUSSIN_MIN, COUSSIN_MAX + 1, dtype=np.int64)[None, :]
+    return Ls % sizes, Ls // sizes
+
+def _plan_anchor_tables(waste, count, lo, hi):
+    """
+    Pour chaque ancre a ∈ [lo..hi] : meilleur s ∈ [a-2..a+2]∩[lo..hi] (min chute, puis s plus grand).
+    Retourne (taille, chute, nb) de forme (longueurs, ancres).
+    """
+    anchors = np.arange(lo, hi + 1)
+    win = np.clip(anchors[:, None] + np.arange(-2, 3)[None, :], lo, hi) - COUSSIN_MIN
+    # clé locale entière : chute*64 + rang décroissant de s -> min unique
+    key = waste * 64 + (COUSSIN_MAX - COUSSIN_MIN - np.arange(waste.shape[1]))[None, :]
+    col = (COUSSIN_MAX - COUSSIN_MIN) - key[:, win].min(axis=2) % 64
+    return (col + COUSSIN_MIN,
+            np.take_along_axis(waste, col, axis=1),
+            np.take_along_axis(count, col, axis=1))
+
+_PLAN_WASTE, _PLAN_COUNT = _plan_tables(range(_PLAN_L_MAX + 1))
+
+_PLAN_ANCHORS = {iv: _plan_anchor_tables(_PLAN_WASTE, _PLAN_COUNT, *iv)
+                 for iv in ((60, 74), (76, 100), (60, 100))}
+
+def _plan_rows(Ls, lo, hi):
+    """(taille, chute, nb) par côté × ancre pour les longueurs Ls."""
+    arr = np.asarray(Ls, dtype=np.int64)
+    tables = _PLAN_ANCHORS.get((lo, hi))
+    if tables is not None and arr.max() <= _PLAN_L_MAX:
+        return tuple(t[arr] for t in tables)
+    return _plan_anchor_tables(*_plan_tables(arr), lo, hi)
+
+def _plan_anchor_scores(sizes, waste, count, mode):
+    """
+    sizes/waste/count : tableaux (côtés, ..., ancres).
+    Retourne (score, delta) de forme (..., ancres) : _score_pref_key(..., is_uniform_choice=False)
+    replié en un seul entier (chute, [±nb], Δ, -médiane) ; argmin -> 1re ancre en cas d'égalité.
+    Ancres hors écart global (Δ > 5) : score = max int64.
+    """
+    waste = waste.sum(axis=0); count = count.sum(axis=0)
+    delta = sizes.max(axis=0) - sizes.min(axis=0)
+    med = np.sort(sizes, axis=0)[len(sizes) // 2]
+    if mode=="p":
+        score = waste * 4096 - count
+    elif mode=="g":
+        score = waste * 4096 + count
+    else:
+        score = waste
+    score = (score * 8 + delta) * 128 + (127 - med)
+    score = np.where(delta <= 5, score, np.iinfo(np.int64).max)  # respect écart global
+    return score, delta
+
+def _plan_sizes_for_branches(lengths_by_side, mode, same=False, size_fixed=None):
+    """
+    Comme _plan_sizes_for_branches_table, en consultant d'abord la table précalculée
+    (plan_table, mmap, O(1)) puis le cache LRU partagé (plan_cache.PLAN_CACHE).
+    Clé du cache : longueurs par côté, mode, same, taille fixe (mode fixed).
+    """
+    hit = plan_table.lookup(lengths_by_side, mode, same)
+    if hit is not None:
+        return hit
+    sizes, meta = PLAN_CACHE.get_or_compute(
+        plan_key(lengths_by_side.items(), mode, same, size_fixed=size_fixed),
+        lambda: _plan_sizes_for_branches_table(lengths_by_side, mode, same=same, size_fixed=size_fixed))
+    return dict(sizes), dict(meta)
+
+def _plan_sizes_for_branches_table(lengths_by_side, mode, same=False, size_fixed=None):
+    """
+    lengths_by_side : dict {"bas":L_b, "gauche":L_g, "droite":L_d} (certaines clés peuvent manquer)
+    mode : "auto" | "p" | "g" | "valise" | "fixed"
+    same : True => impose même taille sur toutes les branches
+    size_fixed : taille imposée en mode "fixed" (bornes vérifiées par l'appelant)
+
+    Retourne : dict sizes_by_side (mêmes clés que lengths_by_side)
+               et meta (delta_global, mode_used, uniform, chosen_set_info)
+    """
+    sides = list(lengths_by_side.keys())
+    Ls = [max(0, int(round(lengths_by_side[s])) ) for s in sides]
+
+    if not sides:
+        return {}, {"delta":0, "mode":mode, "uniform":True, "set":"-"}
+
+    # AUTO = set standard (65,80,90), uniforme
+    if mode=="auto":
+        s = _choose_uniform_size_from_set(Ls, {65,80,90})
+        return {k:s for k in sides}, {"delta":0, "mode":"auto", "uniform":True, "set":"{65,80,90}"}
+
+    # FIXED = uniforme
+    if mode=="fixed":
+        # 'fixed' ici veut dire qu'on a déjà filtré la taille; la vérif min/max se fait ailleurs
+        # On s'attend à ce que same=True aussi ; on garde uniforme
+        s = int(size_fixed)
+        return {k:s for k in sides}, {"delta":0, "mode":"fixed", "uniform":True, "set":str(s)}
+
+    lo, hi = _allowed_interval_for_mode(mode)
+
+    # SAME = uniforme mais plages selon mode (valise:s -> 60..100 ; p:s -> 60..74 ; g:s -> 76..100)
+    if same:
+        candidate_set = range(lo, hi+1)
+        s = _choose_uniform_size_from_set(Ls, candidate_set)
+        return {k:s for k in sides}, {"delta":0, "mode":(mode+":s" if mode!="s" else "s"), "uniform":True, "set":f"[{lo}..{hi}]"}
+
+    # valise/p/g : une seule taille par côté, écart global <= 5
+    # stratégie : on balaie un "ancrage" a ∈ [lo..hi], puis on choisit pour chaque côté s_i ∈ [a-2..a+2]∩[lo..hi]
+    # qui minimise la chute sur ce côté ; on garde la meilleure combinaison globale (chute totale min),
+    # tie-break selon _score_pref_key(mode, ...)
+    # Version tabulée : toutes les ancres sont évaluées d'un coup (tableaux côtés × ancres).
+    sizes, waste, count = _plan_rows(Ls, lo, hi)
+    score, delta = _plan_anchor_scores(sizes, waste, count, mode)
+    j = int(score.argmin())
+    if delta[j] <= 5:
+        best_sizes = {side:int(s) for side,s in zip(sides, sizes[:, j])}
+        best_meta  = {"delta":int(delta[j]), "mode":mode, "uniform":False, "set":f"[{lo}..{hi}] anchor={lo + j}"}
+        return best_sizes, best_meta
+
+    # si rien trouvé (cas pathologique minuscule), fallback : uniforme lo..hi
+    s = _choose_uniform_size_from_set(Ls, range(lo,hi+1))
+    best_sizes = {k:s for k in sides}
+    best_meta  = {"delta":0, "mode":mode+" (fallback uniform)", "uniform":True, "set":f"[{lo}..{hi}]"}
+    return best_sizes, best_meta
+
+def _plan_sizes_for_branches_loop(lengths_by_side, mode, same=False, size_fixed=None):
+    """Version de référence (boucles Python) de _plan_sizes_for_branches — sert aux vérifs / benchmarks."""
+    sides = list(lengths_by_side.keys())
+    Ls = [max(0, int(round(lengths_by_side[s])) ) for s in sides]
+    if not sides or mode in ("auto", "fixed") or same:
+        return _plan_sizes_for_branches(lengths_by_side, mode, same=same, size_fixed=size_fixed)
+    lo, hi = _allowed_interval_for_mode(mode)
+    best_sizes=None; best_key=None; best_meta=None
+    for a in range(lo, hi+1):
+        # plage commune autorisée
+        a_lo = max(lo, a-2); a_hi = min(hi, a+2)
+        if a_lo > a_hi: continue
+        sizes=[]
+        for L in Ls:
+            # meilleur s local dans [a_lo..a_hi] (min chute)
+            best_s=None; best_w=(1e18, -1)
+            for s in range(a_lo, a_hi+1):
+                w = (L % s if L>0 else 0, -s)  # min chute, puis s plus grand
+                if w < best_w:
+                    best_w=w; best_s=s
+            sizes.append(best_s)
+        if not sizes: continue
+        delta = max(sizes)-min(sizes)
+        if delta > 5:  # respect écart global
+            continue
+        # score global
+        waste = sum(L % s if L>0 else 0 for L,s in zip(Ls, sizes))
+        count = sum((L // s) for L,s in zip(Ls, sizes))
+        key = _score_pref_key(mode, waste, count, sizes, is_uniform_choice=False)
+        if (best_key is None) or (key < best_key):
+            best_key=key
+            best_sizes={side:s for side,s in zip(sides, sizes)}
+            best_meta={"delta":delta, "mode":mode, "uniform":False, "set":f"[{lo}..{hi}] anchor={a}"}
+    if best_sizes is None:
+        s = _choose_uniform_size_from_set(Ls, range(lo,hi+1))
+        best_sizes = {k:s for k in sides}
+        best_meta  = {"delta":0, "mode":mode+" (fallback uniform)", "uniform":True, "set":f"[{lo}..{hi}]"}
+    return best_sizes, best_meta
+
+# --- Alternatives : K meilleurs plans + front de Pareto, dans l'espace du planificateur ---
+def _plan_sizes_top_k(lengths_by_side, mode, k=3, same=False, size_fixed=None):
+    """
+    Alternatives sur l'espace de recherche de _plan_sizes_for_branches_table, avec sa clé de tri :
+      - valise/p/g : un plan par ancre (tailles de _plan_rows, score entier de _plan_anchor_scores,
+        ancre la plus basse en cas d'égalité) ; repli uniforme si aucune ancre ne tient Δ ≤ 5
+      - same / auto / fixed : tailles uniformes, clé (chute, -s) de _choose_uniform_size_from_set
+    top : les k meilleurs plans distincts (heapq.nsmallest) — le 1er est toujours le plan dessiné ;
+    pareto : plans non dominés sur (chute, nb, Δ) ; nb maximisé en mode p, minimisé sinon.
+    Chaque plan = (sizes_by_side, meta) ; meta du planificateur + waste/count (+ rank pour top),
+    chute et nb calculés sur les longueurs nominales (avant décalages d'angle).
+    """
+    sides = list(lengths_by_side.keys())
+    Ls = [max(0, int(round(lengths_by_side[s]))) for s in sides]
+    if not sides:
+        return [], []
+    lo, hi = _allowed_interval_for_mode(mode)
+    arr = np.asarray(Ls, dtype=np.int64)[:, None]
+
+    def uniformes(cands, meta):
+        cands = np.asarray(cands, dtype=np.int64)
+        waste = (arr % cands).sum(axis=0)
+        # clé (chute, -s) repliée en un entier (s ≤ 100 < 128)
+        return (np.repeat(cands[:, None], len(sides), axis=1), waste * 128 + (127 - cands),
+                waste, (arr // cands).sum(axis=0), np.zeros(len(cands), dtype=np.int64),
+                lambda i: dict(meta, delta=0, uniform=True))
+
+    if mode=="auto":
+        plans = uniformes((65, 80, 90), {"mode":"auto", "set":"{65,80,90}"})
+    elif mode=="fixed":
+        s = int(size_fixed)
+        plans = uniformes((s,), {"mode":"fixed", "set":str(s)})
+    elif same:
+        plans = uniformes(range(lo, hi+1), {"mode":(mode+":s" if mode!="s" else "s"), "set":f"[{lo}..{hi}]"})
+    else:
+        sizes, waste, count = _plan_rows(Ls, lo, hi)
+        score, delta = _plan_anchor_scores(sizes, waste, count, mode)
+        valid = np.flatnonzero(delta <= 5)
+        # une ancre par plan : le score ne dépend que des tailles, la 1re ancre a la clé du planificateur
+        code = (sizes[:, valid] << (7 * np.arange(len(sides)))[:, None]).sum(axis=0)   # tailles < 128
+        _, first = np.unique(code, return_index=True)
+        cols = valid[np.sort(first)]
+        plans = (sizes[:, cols].T, score[cols], waste.sum(axis=0)[cols], count.sum(axis=0)[cols], delta[cols],
+                 lambda i, d=delta[cols]: {"delta":int(d[i]), "mode":mode, "uniform":False,
+                                           "set":f"[{lo}..{hi}] anchor={lo + int(cols[i])}"})
+        if not cols.size:
+            plans = uniformes(range(lo, hi+1), {"mode":mode+" (fallback uniform)", "set":f"[{lo}..{hi}]"})
+    tailles, cle, waste, count, delta, meta = plans
+    tailles = tailles.tolist(); cle = cle.tolist()
+
+    def plan(i, **extra):
+        return dict(zip(sides, tailles[i])), dict(meta(i), waste=int(waste[i]), count=int(count[i]), **extra)
+
+    top = [plan(i, rank=r+1) for r, i in enumerate(heapq.nsmallest(k, range(len(cle)), key=cle.__getitem__))]
+    # Pareto sur (chute, ±nb, Δ) ; à objectifs égaux, le mieux classé représente le point
+    objs = np.stack([waste, -count if mode=="p" else count, delta], axis=1)
+    le = (objs[:, None, :] <= objs[None, :, :]).all(axis=2)       # le[i, j] : i ≤ j partout
+    rang = np.argsort(cle, kind="stable")
+    avant = np.empty_like(rang); avant[rang] = np.arange(len(rang))
+    domine = (le & ~le.T).any(axis=0) | (le & le.T & (avant[:, None] < avant[None, :])).any(axis=0)
+    garde = np.flatnonzero(~domine)
+    garde = garde[np.lexsort(objs[garde].T[::-1])]                 # ordre (chute, ±nb, Δ)
+    return top, [plan(i) for i in garde.tolist()]
+
+def plan_alternatives(lengths_by_side, coussins="valise", k=3):
+    """
+    Alternatives de plans pour l'appli (même syntaxe `coussins` que les render_*) : (top, pareto).
+    Résultat mémorisé dans le cache LRU partagé (copies renvoyées).
+    """
+    mode, same, size_fixed, tag = _norm_coussins_spec(coussins)
+    size_fixed = int(size_fixed) if mode=="fixed" else None
+    Ls = tuple((s, max(0, int(round(L)))) for s, L in lengths_by_side.items())
+    top, pareto = PLAN_CACHE.get_or_compute(
+        plan_key(Ls, ("top", k, mode), same, size_fixed=size_fixed),
+        lambda: _plan_sizes_top_k(dict(Ls), mode, k=k, same=same, size_fixed=size_fixed))
+    return ([(dict(a), dict(b)) for a, b in top],
+            [(dict(a), dict(b)) for a, b in pareto])
+
+# --- Re-planification incrémentale : les côtés de longueur inchangée gardent leur taille ---
+_PLAN_CONTEXT = threading.local()   # un précédent par thread (sessions Streamlit)
+
+@contextmanager
+def plan_precedent(layout, coussins):
+    """
+    Pendant le bloc, les plans valise/p/g de même spec `coussins` conservent la taille des côtés
+    dont la longueur nominale n'a pas changé depuis `layout` (CushionLayout précédente ou None).
+    """
+    saved = getattr(_PLAN_CONTEXT, "precedent", None)
+    if layout is not None and layout.lengths:
+        _PLAN_CONTEXT.precedent = (dict(layout.lengths), dict(layout.sizes), coussins)
+    else:
+        _PLAN_CONTEXT.precedent = None
+    try:
+        yield
+    finally:
+        _PLAN_CONTEXT.precedent = saved
+
+def _plan_sizes_sticky(lengths_by_side, mode, prev_lengths, prev_sizes):
+    """
+    Plan valise/p/g gardant la taille des côtés inchangés ; les côtés modifiés sont choisis dans
+    [max(gardés)-5 .. min(gardés)+5]∩[lo..hi] (écart global ≤ 5) selon _score_pref_key.
+    None si aucun côté n'est conservable (-> plan complet).
+    """
+    sides = list(lengths_by_side.keys())
+    if set(sides) != set(prev_sizes):
+        return None
+    lo, hi = _allowed_interval_for_mode(mode)
+    Ls = {s: max(0, int(round(lengths_by_side[s]))) for s in sides}
+    kept = {s: prev_sizes[s] for s in sides
+            if s in prev_lengths and Ls[s] == max(0, int(round(prev_lengths[s]))) and lo <= prev_sizes[s] <= hi}
+    if not kept or max(kept.values()) - min(kept.values()) > 5:
+        return None
+    free = [s for s in sides if s not in kept]
+    win = range(max(lo, max(kept.values()) - 5), min(hi, min(kept.values()) + 5) + 1)
+    best_key = best = None
+    for combo in itertools.product(win, repeat=len(free)):
+        sizes = dict(kept); sizes.update(zip(free, combo))
+        vec = [sizes[s] for s in sides]
+        if max(vec) - min(vec) > 5:
+            continue
+        waste = sum(Ls[s] % sizes[s] if Ls[s]>0 else 0 for s in sides)
+        count = sum(Ls[s] // sizes[s] for s in sides)
+        key = _score_pref_key(mode, waste, count, vec, is_uniform_choice=False)
+        if best_key is None or key < best_key:
+            best_key, best = key, vec
+    delta = max(best) - min(best)
+    return (dict(zip(sides, best)),
+            {"delta":delta, "mode":mode, "uniform":delta==0,
+             "set":f"[{lo}..{hi}] conservés={','.join(kept)}"})
+
+
+# ============================================================
+# ============  Disposition des coussins (figée)  ============
+# ============================================================
+Cushion = namedtuple("Cushion", "side poly size")
+
+class CushionLayout(namedtuple("CushionLayout", "cushions sizes meta shifts lengths", defaults=(None,))):
+    """
+    Disposition des coussins calculée une seule fois par le planificateur.
+      - cushions : tuple de Cushion(side, poly, size) dans l'ordre de dessin
+      - sizes    : taille retenue par côté
+      - meta     : infos du plan (mode, Δ, uniform, set)
+      - shifts   : décalages retenus (shift_left/shift_right, orientation, offset)
+      - lengths  : longueurs nominales par côté ayant servi au plan (alternatives : plan_alternatives)
+    Les rendus ne font que l'itérer ; chiffrage et PDF lisent les comptes.
+    """
+    __slots__ = ()
+
+    @property
+    def count(self):
+        return len(self.cushions)
+
+    def count_by_side(self):
+        counts = {side: 0 for side in self.sizes}
+        for c in self.cushions:
+            counts[c.side] = counts.get(c.side, 0) + 1
+        return counts
+
+    def summary(self):
+        """Résumé sérialisable (session, devis PDF)."""
+        return {"total": self.count, "par_cote": self.count_by_side(),
+                "tailles": dict(self.sizes), "mode": self.meta.get("mode")}
+
+def _make_layout(cushions, sizes, meta, shifts, lengths=None):
+    return CushionLayout(tuple(cushions), MappingProxyType(dict(sizes)),
+                         MappingProxyType(dict(meta)), MappingProxyType(dict(shifts)),
+                         MappingProxyType(dict(lengths)) if lengths is not None else None)
+
+def _with_lengths(layout, lengths):
+    return layout._replace(lengths=MappingProxyType(dict(lengths)))
+
+def _cushion_run(side, size, a, a_end, rect):
+    """Coussins de taille `size` posés de a à a_end ; rect(a0, a1) -> polygone."""
+    out = []
+    while a + size <= a_end:
+        out.append(Cushion(side, tuple(rect(a, a + size)), size))
+        a += size
+    return out
+
+def _plan_sizes_from_spec(lengths, coussins):
+    mode, same, size_fixed, tag = _norm_coussins_spec(coussins)
+    if mode=="fixed":
+        size_fixed=int(size_fixed)
+        if not (60 <= size_fixed <= 100): raise ValueError("Taille coussins fixe hors bornes [60..100].")
+    prec = getattr(_PLAN_CONTEXT, "precedent", None)
+    if prec is not None and prec[2] == coussins and mode in ("valise", "p", "g") and not same:
+        sticky = _plan_sizes_sticky(lengths, mode, prec[0], prec[1])
+        if sticky is not None:
+            return sticky
+    return _plan_sizes_for_branches(lengths, mode, same=same, size_fixed=size_fixed)
+
+def _layout_L_like(F0x, F0y, x_end, y_end, sizes, meta):
+    """L (LF / LNF) : orientation A (bas collé, gauche décalé) ou B (bas décalé, gauche collé)."""
+    sb, sg = sizes["bas"], sizes["gauche"]
+    def cnt(orient):
+        xs = F0x + (0 if orient=="A" else CUSHION_DEPTH)
+        ys = F0y + (CUSHION_DEPTH if orient=="A" else 0)
+        n = int(max(0, x_end - xs) // sb) + int(max(0, y_end - ys) // sg)
+        waste = (x_end - xs) % sb + (y_end - ys) % sg
+        return (n, -waste, orient)
+    _, _, orient = max([cnt("A"), cnt("B")], key=lambda k:(k[0], k[1]))
+
+    y = F0y; x = F0x
+    cushions  = _cushion_run("bas", sb, F0x + (0 if orient=="A" else CUSHION_DEPTH), x_end,
+                             lambda a, b: _rectU(a, y, b, y+CUSHION_DEPTH))
+    cushions += _cushion_run("gauche", sg, F0y + (CUSHION_DEPTH if orient=="A" else 0), y_end,
+                             lambda a, b: _rectU(x, a, x+CUSHION_DEPTH, b))
+    return _make_layout(cushions, sizes, meta, {"orientation": orient})
+
+def _layout_U_like(F0x, F0y, x_end, y_end_L, y_end_R, sizes, meta,
+                   corner_left=True, corner_right=True, empty_waste=0):
+    """
+    U / U1F / U2f : bas entre F0x et x_end, gauche en x=F0x, droite contre x_end.
+    shift_left/right = le bas laisse le coin au côté (gauche/droite collé en F0y).
+    corner_* = False : côté compté comme collé pour le choix des décalages (U sans dossier) ;
+                       le placement, lui, suit toujours les décalages retenus (comme avant).
+    empty_waste : chute comptée pour une longueur nulle (U2f : 1e9).
+    """
+    sb=sizes["bas"]; sl=sizes["gauche"]; sr=sizes["droite"]
+    def starts(shL, shR, cl=True, cr=True):
+        xs = F0x + (CUSHION_DEPTH if shL else 0)
+        xe = x_end - (CUSHION_DEPTH if shR else 0)
+        yL0 = F0y + (0 if (not cl or shL) else CUSHION_DEPTH)
+        yR0 = F0y + (0 if (not cr or shR) else CUSHION_DEPTH)
+        return xs, xe, yL0, yR0
+    def cnt(shL, shR):
+        xs, xe, yL0, yR0 = starts(shL, shR, corner_left, corner_right)
+        n = 0; waste = 0
+        for L, s in ((xe - xs, sb), (y_end_L - yL0, sl), (y_end_R - yR0, sr)):
+            n += int(max(0, L) // s)
+            waste += (L % s) if L > 0 else empty_waste
+        return (n, -waste, shL, shR)
+    best = max([cnt(False,False), cnt(True,False), cnt(False,True), cnt(True,True)], key=lambda k:(k[0], k[1]))
+    _, _, shL, shR = best
+
+    xs, xe, yL0, yR0 = starts(shL, shR)
+    cushions  = _cushion_run("bas", sb, xs, xe,
+                             lambda a, b: _rectU(a, F0y, b, F0y+CUSHION_DEPTH))
+    cushions += _cushion_run("gauche", sl, yL0, y_end_L,
+                             lambda a, b: _rectU(F0x, a, F0x+CUSHION_DEPTH, b))
+    cushions += _cushion_run("droite", sr, yR0, y_end_R,
+                             lambda a, b: _rectU(x_end-CUSHION_DEPTH, a, x_end, b))
+    return _make_layout(cushions, sizes, meta, {"shift_left": shL, "shift_right": shR})
+
+
+# ============================================================
+# ==================  LF (L avec angle fromage)  =============
+# ============================================================
+def compute_points_LF_variant(tx, ty, profondeur=DEPTH_STD,
+                              dossier_left=True, dossier_bas=True,
+                              acc_left=True, acc_bas=True,
+                              meridienne_side=None, meridienne_len=0):
+    tx, ty, profondeur, meridienne_len = _cm_ints(tx, ty, profondeur, meridienne_len)
+    A = profondeur + 20
+    prof = profondeur
+    pts = PointsLF()
+    if dossier_left and dossier_bas:
+        F0x, F0y = 10, 10
+    elif (not dossier_left) and dossier_bas:
+        F0x, F0y = 0, 10
+    elif dossier_left and (not dossier_bas):
+        F0x, F0y = 10, 0
+    else:
+        F0x, F0y = 0, 0
+
+    pts.F0  = (F0x, F0y)
+    pts.Fy  = (F0x, F0y + A)
+    pts.Fx  = (F0x + A, F0y)
+    pts.Fy2 = (F0x + prof, F0y + A)
+    pts.Fx2 = (F0x + A, F0y + prof)
+
+    top_y = ty - (ACCOUDOIR_THICK if acc_left else 0)
+    pts.By  = (F0x, top_y)
+    pts.By2 = (F0x + prof, top_y)
+
+    pts.D0  = (0, 0)
+    pts.D0x = (F0x, 0)
+    pts.D0y = (0, F0y)
+    pts.Dy  = (0, F0y + A)
+    pts.Dy2 = (0, top_y)
+
+    pts.Ay  = (0, ty)
+    pts.Ay2 = (F0x + prof, ty)
+    pts.Ay_ = (F0x, ty)
+
+    banq_stop_x = tx - (ACCOUDOIR_THICK if acc_bas else 0)
+    pts.Dx  = (F0x + A, 0)
+    pts.Dx2 = (banq_stop_x, 0)
+    pts.Bx  = (banq_stop_x, F0y)
+    pts.Bx2 = (banq_stop_x, F0y + prof)
+
+    pts.Ax  = (tx, 0)
+    pts.Ax2 = (tx, F0y + prof)
+    pts.Ax_ = (tx, F0y)
+
+    if meridienne_side == 'b' and meridienne_len > 0:
+        dx2_stop = min(banq_stop_x, tx - meridienne_len)
+        pts.Dx2 = (dx2_stop, 0)
+        pts.Bx_ = (tx - meridienne_len, F0y)
+
+    if meridienne_side == 'g' and meridienne_len > 0:
+        mer_y = max(F0y + A, top_y - meridienne_len); mer_y = min(mer_y, top_y)
+        pts.By_ = (F0x, mer_y)
+        pts.Dy2 = (0, min(top_y, mer_y))
+
+    if dossier_left and not dossier_bas:
+        pts.D0y = (0, 0)
+    if dossier_bas and not dossier_left:
+        pts.D0x = (0, 0)
+
+    return pts.completer()
+
+def _choose_cushion_size_auto_LF_lengths(pts, tx, ty, meridienne_side=None, meridienne_len=0):
+    """Longueurs utiles nominales (sans décider des décalages) pour LF."""
+    xF, yF = pts.F0
+    x_end = pts.Bx_fin[0]
+    if meridienne_side == 'b' and meridienne_len > 0:
+        x_end = min(x_end, tx - meridienne_len)
+    usable_h = max(0, x_end - xF)
+
+    y_end = pts.By_fin[1]
+    usable_v = max(0, y_end - yF)
+    return {"bas": usable_h, "gauche": usable_v}
+
+def _cushion_layout_LF(pts, tx, ty, coussins, meridienne_side=None, meridienne_len=0):
+    """
+    *** LF ***
+    Modes valise/p/g/s/auto/fixed : tailles par côté (bas/gauche), écart global ≤ 5 (sauf same),
+    puis orientation A/B optimale (A = bas collé + gauche décalé, B = l'inverse).
+    """
+    lengths = _choose_cushion_size_auto_LF_lengths(pts, tx, ty, meridienne_side, meridienne_len)
+    sizes, meta = _plan_sizes_from_spec(lengths, coussins)
+    F0x, F0y = pts.F0
+    x_end = pts.Bx_fin[0]
+    y_end = pts.By_fin[1]
+    return _with_lengths(_layout_L_like(F0x, F0y, x_end, y_end, sizes, meta), lengths)
+
+def _chosen_size_L(sizes):
+    # ancienne API : taille bas si uniforme, sinon la moyenne arrondie
+    return sizes["bas"] if sizes.get("bas")==sizes.get("gauche") else int(round(sum(sizes.values())/len(sizes)))
+
+def build_polys_LF_variant(pts, tx, ty, profondeur=DEPTH_STD,
+                           dossier_left=True, dossier_bas=True,
+                           acc_left=True, acc_bas=True,
+                           meridienne_side=None, meridienne_len=0):
+    tx, ty, profondeur, meridienne_len = _cm_ints(tx, ty, profondeur, meridienne_len)
+    polys={"angle":[],"banquettes":[],"dossiers":[],"accoudoirs":[]}
+
+    angle=[pts.F0,pts.Fx,pts.Fx2,pts.Fy2,pts.Fy,pts.F0]
+    polys["angle"].append(angle)
+
+    ban_g=[pts.Fy,pts.Fy2,pts.By2,pts.By,pts.Fy]
+    Lg=abs(pts.By[1]-pts.Fy[1])
+    split_g = False
+    if Lg>SPLIT_THRESHOLD:
+        split_g = True
+        mid_y=_split_mid_int(pts.Fy[1],pts.By[1])
+        Fy_mid=(pts.Fy[0],mid_y); Fy2_mid=(pts.Fy2[0],mid_y)
+        polys["banquettes"]+=[
+            [pts.Fy,pts.Fy2,Fy2_mid,Fy_mid,pts.Fy],
+            [Fy_mid,Fy2_mid,pts.By2,pts.By,Fy_mid]
+        ]
+    else:
+        polys["banquettes"].append(ban_g)
+
+    ban_b=[pts.Fx,pts.Fx2,pts.Bx2,pts.Bx,pts.Fx]
+    Lb=abs(pts.Bx[0]-pts.Fx[0])
+    split_b = False
+    if Lb>SPLIT_THRESHOLD:
+        split_b = True
+        mid_x=_split_mid_int(pts.Fx[0],pts.Bx[0])
+        Fx_mid=(mid_x,pts.Fx[1]); Fx2_mid=(mid_x,pts.Fx2[1])
+        polys["banquettes"]+=[
+            [pts.Fx,pts.Fx2,Fx2_mid,Fx_mid,pts.Fx],
+            [Fx_mid,Fx2_mid,pts.Bx2,pts.Bx,Fx_mid]
+        ]
+    else:
+        polys["banquettes"].append(ban_b)
+
+    if dossier_left:
+        dos_g_from=[pts.D0,pts.D0x,pts.F0,pts.Fy,pts.Dy,pts.D0] if dossier_bas \
+            else [pts.D0y,pts.F0,pts.Fy,pts.Dy,pts.D0y]
+        dos_g_banc=[pts.Dy,pts.Dy2,pts.By_fin,pts.Fy,pts.Dy]
+        polys["dossiers"]+=[dos_g_from,dos_g_banc]
+    if dossier_bas:
+        dos_b_from=[pts.D0x,pts.Dx,pts.Fx,pts.F0,pts.D0x] if dossier_left \
+            else [pts.D0x,pts.F0,pts.Fx,pts.Dx,pts.D0x]
+        dos_b_banc=[pts.Dx,pts.Dx2,pts.Bx_fin,pts.Fx,pts.Dx]
+        polys["dossiers"]+=[dos_b_from,dos_b_banc]
+
+    if acc_left:
+        acc_g=[pts.Dy2,pts.Ay,pts.Ay2,pts.By2,pts.Dy2] if dossier_left \
+            else [pts.By,pts.Ay_,pts.Ay2,pts.By2,pts.By]
+        polys["accoudoirs"].append(acc_g)
+    if acc_bas:
+        acc_b=[pts.Dx2,pts.Ax,pts.Ax2,pts.Bx2,pts.Dx2] if dossier_bas \
+            else [pts.Bx,pts.Ax_,pts.Ax2,pts.Bx2,pts.Bx]
+        polys["accoudoirs"].append(acc_b)
+
+    polys["split_flags"]={"left":split_g,"bottom":split_b,"right":False}
+    return polys
+
+
+# ============================================================
+# ==================  U2f (2 angles fromage)  =================
+# ============================================================
+def compute_points_U2f(tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                       dossier_left=True, dossier_bas=True, dossier_right=True,
+                       acc_left=True, acc_bas=True, acc_right=True,
+                       meridienne_side=None, meridienne_len=0):
+    tx, ty_left, tz_right, profondeur, meridienne_len = _cm_ints(tx, ty_left, tz_right, profondeur, meridienne_len)
+    A = profondeur + 20
+    pts = PointsU2F()
+    pts.D0=(0,0); pts.D0x=(10,0); pts.D0y=(0,10)
+    pts.F0=(10,10); pts.Fy=(10,10+A); pts.Fy2=(10+profondeur, 10+A)
+    pts.Fx=(10+A,10); pts.Fx2=(10+A,10+profondeur)
+
+    top_y_L = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
+    pts.Dy=(0,10+A); pts.Dy2=(0, top_y_L)
+    pts.By=(10, top_y_L); pts.By2=(10+profondeur, top_y_L)
+    pts.Ay=(0, ty_left); pts.Ay2=(10+profondeur, ty_left); pts.Ay_=(10, ty_left)
+
+    BxL = tx - A - 10
+    pts.Dx=(10+A,0); pts.Dx2=(BxL,0)
+    pts.Bx=(BxL,10); pts.Bx2=(BxL,10+profondeur)
+
+    F02x = tx - 10
+    pts.F02=(F02x,10); pts.Fy4=(F02x,10+A); pts.Fy3=(F02x - profondeur, 10+A)
+    top_y_R = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
+    pts.By3=(pts.Fy3[0], top_y_R); pts.By4=(F02x, top_y_R)
+    pts.D02=(tx,0); pts.D02y=(tx,10); pts.Dy_r=(tx,10+A); pts.Dy2_r=(tx, top_y_R)
+    pts.Ax=(pts.By3[0], tz_right); pts.Ax2=(tx, tz_right); pts.Ax_par=(tx - 10, tz_right)
+
+    if meridienne_side == 'g' and meridienne_len > 0:
+        mer_y_L = max(10 + A, ty_left - meridienne_len); mer_y_L = min(mer_y_L, top_y_L)
+        pts.By_=(pts.By[0], mer_y_L); pts.By2_=(pts.By2[0], mer_y_L)
+        pts.Dy2=(0, mer_y_L)
+    if meridienne_side == 'd' and meridienne_len > 0:
+        mer_y_R = max(10 + A, tz_right - meridienne_len); mer_y_R = min(mer_y_R, top_y_R)
+        pts.By4_=(pts.By4[0], mer_y_R); pts.Dy2_r=(tx, mer_y_R)
+
+    pts._ty_canvas = max(ty_left, tz_right)
+    return pts.completer()
+
+def build_polys_U2f(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                    dossier_left=True, dossier_bas=True, dossier_right=True,
+                    acc_left=True, acc_bas=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    polys = {"angles": [], "banquettes": [], "dossiers": [], "accoudoirs": []}
+
+    angle_L = [pts.F0, pts.Fx, pts.Fx2, pts.Fy2, pts.Fy, pts.F0]
+    polys["angles"].append(angle_L)
+    angle_R = [pts.Bx2, pts.Bx, pts.F02, pts.Fy4, pts.Fy3, pts.Bx2]
+    polys["angles"].append(angle_R)
+
+    # G
+    ban_g = [pts.Fy, pts.Fy2, pts.By2, pts.By, pts.Fy]
+    Lg = abs(pts.By[1] - pts.Fy[1])
+    split_g = False
+    if Lg > SPLIT_THRESHOLD:
+        split_g = True
+        mid_y = _split_mid_int(pts.Fy[1], pts.By[1])
+        Fy_mid  = (pts.Fy[0],  mid_y); Fy2_mid = (pts.Fy2[0], mid_y)
+        polys["banquettes"] += [[pts.Fy,pts.Fy2,Fy2_mid,Fy_mid,pts.Fy],
+                                [Fy_mid,Fy2_mid,pts.By2,pts.By,Fy_mid]]
+    else:
+        polys["banquettes"].append(ban_g)
+
+    # Bas
+    ban_b = [pts.Fx, pts.Fx2, pts.Bx2, pts.Bx, pts.Fx]
+    Lb = abs(pts.Bx[0] - pts.Fx[0])
+    split_b = False
+    if Lb > SPLIT_THRESHOLD:
+        split_b = True
+        mid_x = _split_mid_int(pts.Fx[0], pts.Bx[0])
+        Fx_mid  = (mid_x, pts.Fx[1]); Fx2_mid = (mid_x, pts.Fx2[1])
+        polys["banquettes"] += [[pts.Fx,pts.Fx2,Fx2_mid,Fx_mid,pts.Fx],
+                                [Fx_mid,Fx2_mid,pts.Bx2,pts.Bx,Fx_mid]]
+    else:
+        polys["banquettes"].append(ban_b)
+
+    # Droite
+    ban_r = [pts.Fy3, pts.By3, pts.By4, pts.Fy4, pts.Fy3]
+    Lr = abs(pts.By4[1] - pts.Fy4[1])
+    split_r = False
+    if Lr > SPLIT_THRESHOLD:
+        split_r = True
+        mid_y = _split_mid_int(pts.Fy4[1], pts.By4[1])
+        Fy3_mid = (pts.Fy3[0], mid_y); Fy4_mid = (pts.Fy4[0], mid_y)
+        polys["banquettes"] += [[pts.Fy3,Fy3_mid,Fy4_mid,pts.Fy4,pts.Fy3],
+                                [Fy3_mid,pts.By3,pts.By4,Fy4_mid,Fy3_mid]]
+    else:
+        polys["banquettes"].append(ban_r)
+
+    if dossier_left:
+        polys["dossiers"].append([pts.D0, pts.D0x, pts.F0, pts.Fy, pts.Dy, pts.D0])
+        polys["dossiers"].append([pts.Dy, pts.Dy2, pts.By_fin, pts.Fy, pts.Dy])
+    if dossier_bas:
+        polys["dossiers"].append([pts.D0x, pts.Dx, pts.Fx, pts.F0, pts.D0x])
+        polys["dossiers"].append([pts.Dx, pts.Dx2, pts.Bx, pts.Fx, pts.Dx])
+        polys["dossiers"].append([pts.Dx2, pts.Bx, pts.D02y, pts.D02, pts.Dx2])
+    if dossier_right:
+        polys["dossiers"].append([pts.D02y, pts.F02, pts.Fy4, pts.Dy_r, pts.D02y])
+        polys["dossiers"].append([pts.Dy_r, pts.Fy4, pts.By4_fin, pts.Dy2_r, pts.Dy_r])
+
+    if acc_left and dossier_left:
+        polys["accoudoirs"].append([pts.Dy2, pts.Ay, pts.Ay2, pts.By2, pts.Dy2])
+    elif acc_left and not dossier_left:
+        polys["accoudoirs"].append([pts.By, pts.Ay_, pts.Ay2, pts.By2, pts.By])
+
+    if acc_right and dossier_right:
+        polys["accoudoirs"].append([pts.By3, pts.Ax, pts.Ax2, pts.Dy2_r, pts.By3])
+    elif acc_right and not dossier_right:
+        polys["accoudoirs"].append([pts.By3, pts.Ax, pts.Ax_par, pts.By4, pts.By3])
+
+    polys["split_flags"]={"left":split_g,"bottom":split_b,"right":split_r}
+    return polys
+
+def _u2f_nominal_lengths(pts):
+    F0x, F0y = pts.F0
+    F02x = pts.F02[0]
+    y_end_L = pts.By_fin[1]
+    y_end_R = pts.By4_fin[1]
+    Lb = max(0, F02x - F0x)
+    Lg = max(0, y_end_L - F0y)
+    Ld = max(0, y_end_R - F0y)
+    return {"bas":Lb, "gauche":Lg, "droite":Ld}
+
+def _layout_U2f_with_sizes(pts, sizes, meta=None):
+    """U2F : tailles par côté et décalages optimisés (chute 1e9 pour un côté vide)."""
+    F0x, F0y = pts.F0
+    y_end_L = pts.By_fin[1]
+    y_end_R = pts.By4_fin[1]
+    return _layout_U_like(F0x, F0y, pts.F02[0], y_end_L, y_end_R, sizes, meta or {},
+                          empty_waste=1e9)
+
+def _cushion_layout_U2f(pts, coussins):
+    lengths = _u2f_nominal_lengths(pts)
+    sizes, meta = _plan_sizes_from_spec(lengths, coussins)
+    return _with_lengths(_layout_U2f_with_sizes(pts, sizes, meta), lengths)
+
+def _choose_cushions_U2f_plan(pts, coussins):
+    return _plan_sizes_from_spec(_u2f_nominal_lengths(pts), coussins)
+
+
+# ============================================================
+# ===================  U1F (1 angle fromage)  =================
+# ============================================================
+# --- utilitaires spécifiques U1F ---
+def _split_banquette_if_needed_U1F(poly):
+    xs=[p[0] for p in poly]; ys=[p[1] for p in poly]
+    x0,x1=min(xs),max(xs); y0,y1=min(ys),max(ys)
+    w=x1-x0; h=y1-y0
+    if w<=SPLIT_THRESHOLD and h<=SPLIT_THRESHOLD:
+        return [poly], False
+    res=[]
+    split=True
+    if w>=h and w>SPLIT_THRESHOLD:
+        mx=_split_mid_int(x0,x1)
+        left = [(x0,y0),(mx,y0),(mx,y1),(x0,y1),(x0,y0)]
+        right=[(mx,y0),(x1,y0),(x1,y1),(mx,y1),(mx,y0)]
+        res += [left,right]
+    else:
+        my=_split_mid_int(y0,y1)
+        low =[(x0,y0),(x1,y0),(x1,my),(x0,my),(x0,y0)]
+        high=[(x0,my),(x1,my),(x1,y1),(x0,y1),(x0,my)]
+        res += [low,high]
+    return res, split
+
+def _common_offsets_u1f(profondeur, dossier_left, dossier_bas, dossier_right):
+    A = profondeur + 20
+    F0x = 10 if dossier_left else 0
+    F0y = 10 if dossier_bas  else 0
+    return A, F0x, F0y
+
+# --- NOUVELLES FONCTIONS : longueurs et dessin U1F (valise) ---
+def _u1f_nominal_lengths(pts):
+    F0x, F0y = pts.F0; F02x = pts.F02[0]
+    x_len = max(0, F02x - F0x)
+    y_end_L = pts.By_cush[1]
+    y_end_R = pts.By4_cush[1]
+    yL = max(0, y_end_L - F0y)
+    yR = max(0, y_end_R - F0y)
+    return {"bas":x_len, "gauche":yL, "droite":yR}
+
+def _layout_U1F_with_sizes(pts, sizes, meta=None):
+    F0x, F0y = pts.F0
+    return _layout_U_like(F0x, F0y, pts.F02[0], pts.By_cush[1], pts.By4_cush[1],
+                          sizes, meta or {})
+
+def _cushion_layout_U1F(pts, coussins):
+    lengths = _u1f_nominal_lengths(pts)
+    sizes, meta = _plan_sizes_from_spec(lengths, coussins)
+    return _with_lengths(_layout_U1F_with_sizes(pts, sizes, meta), lengths)
+
+# ---------------- v1 ----------------
+def compute_points_U1F_v1(tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                          dossier_left=True, dossier_bas=True, dossier_right=True,
+                          acc_left=True, acc_right=True,
+                          meridienne_side=None, meridienne_len=0):
+    tx, ty_left, tz_right, profondeur, meridienne_len = _cm_ints(tx, ty_left, tz_right, profondeur, meridienne_len)
+    if meridienne_side == 'g' and acc_left:  raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
+    if meridienne_side == 'd' and acc_right: raise ValueError("Méridienne droite interdite avec accoudoir droit.")
+
+    A, F0x, F0y = _common_offsets_u1f(profondeur, dossier_left, dossier_bas, dossier_right)
+    pts = PointsU1F()
+    pts.D0=(0,0); pts.D0x=(F0x,0); pts.D0y=(0,F0y); pts.F0=(F0x,F0y)
+
+    # Gauche
+    pts.Fy  = (F0x, F0y + A); pts.Fy2=(F0x+profondeur, F0y + A)
+    pts.Fx  = (F0x + A, F0y); pts.Fx2=(F0x + A, F0y + profondeur); pts.Dx=(F0x + A, 0)
+
+    top_y_L_full = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
+    top_y_L_dos  = (max(F0y + A, top_y_L_full - meridienne_len) if meridienne_side=='g' else top_y_L_full)
+    pts.By=(F0x, top_y_L_full); pts.By2=(F0x+profondeur, top_y_L_full)
+    pts.Dy=(0, F0y + A); pts.Dy2=(0, top_y_L_dos)
+    pts.By_dL=(F0x, top_y_L_dos)   # stop dossier G avec méridienne G
+    pts.Ay=(0, ty_left); pts.Ay2=(F0x+profondeur, ty_left); pts.Ay_=(F0x, ty_left)
+
+    # Bas/droite
+    D02x_x = tx - (10 if (dossier_right or dossier_bas) else 0)
+    pts.D02x=(D02x_x,0); pts.F02=(D02x_x, F0y)
+    Dx2_x = D02x_x - profondeur
+    pts.Dx2=(Dx2_x,0); pts.Bx=(Dx2_x, F0y); pts.Bx2=(Dx2_x, F0y + profondeur)
+    top_y_R_full = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
+    top_y_R_dos  = (max(F0y + A, top_y_R_full - meridienne_len) if meridienne_side=='d' else top_y_R_full)
+    pts.By3=(Dx2_x, top_y_R_full); pts.By4=(D02x_x, top_y_R_full); pts.By4_d=(D02x_x, top_y_R_dos)
+    pts.D02=(tx,0); pts.D02y=(tx, F0y); pts.Dy3=(tx, top_y_R_dos)
+    pts.Ax=(Dx2_x, tz_right); pts.Ax2=(tx, tz_right); pts.Ax_par=(D02x_x, tz_right)
+
+    if not dossier_bas:
+        pts.D0y=(0,0); pts.D02y=(tx,0)
+
+    pts.By_cush=(pts.By[0], min(pts.By[1], pts.Dy2[1]))
+    pts.By4_cush=(pts.By4[0], min(pts.By4[1], pts.By4_d[1]))
+
+    pts._A=A; pts._ty_canvas=max(ty_left, tz_right)
+    pts._draw={
+        "D1": bool(dossier_left), "D2": bool(dossier_left),
+        "D3": bool(dossier_bas),  "D4": bool(dossier_bas), "D5": bool(dossier_bas),
+        "D6": bool(dossier_right),
+    }
+    pts._acc={"L":acc_left, "R":acc_right}
+    return pts.completer()
+
+def build_polys_U1F_v1(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                       dossier_left=True, dossier_bas=True, dossier_right=True,
+                       acc_left=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    polys={"angle": [], "banquettes": [], "dossiers": [], "accoudoirs": []}
+    d={"D1":dossier_left,"D2":dossier_left,"D3":dossier_bas,"D4":dossier_bas,"D5":dossier_bas,"D6":dossier_right}
+
+    polys["angle"].append([pts.F0, pts.Fx, pts.Fx2, pts.Fy2, pts.Fy, pts.F0])
+
+    split_any=False
+    for ban in (
+        [pts.Fy, pts.Fy2, pts.By2, pts.By, pts.Fy],
+        [pts.Fx2, pts.Fx, pts.Bx, pts.Bx2, pts.Fx2],
+        [pts.Bx, pts.F02, pts.By4, pts.By3, pts.Bx],
+    ):
+        pieces, split = _split_banquette_if_needed_U1F(ban)
+        polys["banquettes"] += pieces
+        split_any = split_any or split
+
+    if d["D1"]: polys["dossiers"].append([pts.Dy, pts.Dy2, pts.By_dL, pts.Fy, pts.Dy])
+    if d["D2"]: polys["dossiers"].append([pts.D0x, pts.D0, pts.Dy, pts.Fy, pts.D0x])
+    if d["D3"]: polys["dossiers"].append([pts.D0x, pts.Dx, pts.Fx, pts.F0, pts.D0x])
+    if d["D4"]: polys["dossiers"].append([pts.Dx, pts.Dx2, pts.Bx, pts.Fx, pts.Dx])
+    if d["D5"]: polys["dossiers"].append([pts.Dx2, pts.D02x, pts.F02, pts.Bx, pts.Dx2])
+    if d["D6"]: polys["dossiers"].append([pts.Dy3, pts.By4_d, pts.D02x, pts.D02, pts.Dy3])
+
+    if acc_left:
+        if d["D1"]:
+            polys["accoudoirs"].append([pts.Ay, pts.Ay2, pts.By2, pts.Dy2, pts.Ay])
+        else:
+            polys["accoudoirs"].append([pts.Ay_, pts.Ay2, pts.By2, pts.By, pts.Ay_])
+    if acc_right:
+        if d["D6"]:
+            dy_top = pts.Dy3
+            polys["accoudoirs"].append([pts.By3, pts.Ax, pts.Ax2, dy_top, pts.By3])
+        else:
+            polys["accoudoirs"].append([pts.By3, pts.Ax, pts.Ax_par, pts.By4, pts.By3])
+
+    polys["split_flags"]={"any":split_any}
+    return polys
+
+# ---------------- v2 ----------------
+def compute_points_U1F_v2(tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                          dossier_left=True, dossier_bas=True, dossier_right=True,
+                          acc_left=True, acc_right=True,
+                          meridienne_side=None, meridienne_len=0):
+    tx, ty_left, tz_right, profondeur, meridienne_len = _cm_ints(tx, ty_left, tz_right, profondeur, meridienne_len)
+    if meridienne_side == 'g' and acc_left:  raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
+    if meridienne_side == 'd' and acc_right: raise ValueError("Méridienne droite interdite avec accoudoir droit.")
+
+    A, F0x, F0y = _common_offsets_u1f(profondeur, dossier_left, dossier_bas, dossier_right)
+    pts = PointsU1F()
+    pts.D0=(0,0); pts.D0x=(F0x,0); pts.D0y=(0,F0y); pts.F0=(F0x,F0y)
+
+    # Gauche
+    pts.Fy=(F0x, F0y + A); pts.Fy2=(F0x+profondeur, F0y + A)
+    pts.Fx=(F0x + A, F0y); pts.Fx2=(F0x + A, F0y + profondeur); pts.Dx=(F0x + A, 0)
+
+    top_y_L_full = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
+    top_y_L_dos  = (max(F0y + A, top_y_L_full - meridienne_len) if meridienne_side=='g' else top_y_L_full)
+    pts.By=(F0x, top_y_L_full); pts.By2=(F0x+profondeur, top_y_L_full)
+    pts.Dy=(0, F0y + A); pts.Dy2=(0, top_y_L_dos)
+    pts.By_dL=(F0x, top_y_L_dos)
+    pts.Ay=(0, ty_left); pts.Ay2=(F0x+profondeur, ty_left); pts.Ay_=(F0x, ty_left)
+
+    # Droite interne F02 (dep. dossier_right)
+    F02x = tx - (10 if dossier_right else 0)
+    pts.F02=(F02x, F0y)
+
+    # Bas v2
+    pts.Dx2=(F02x, 0); pts.Bx2=(F02x, F0y + profondeur)
+
+    # Colonne droite (x = F02x - profondeur)
+    col_x = F02x - profondeur
+    pts.Fy3=(col_x, F0y + profondeur); pts.By3=(col_x, tz_right - (ACCOUDOIR_THICK if acc_right else 0))
+
+    # Extrémité droite
+    top_y_R_full = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
+    top_y_R_dos  = (max(F0y + A, top_y_R_full - meridienne_len) if meridienne_side=='d' else top_y_R_full)
+    pts.By4=(F02x, top_y_R_full); pts.By4_d=(F02x, top_y_R_dos)
+    pts.D02=(tx,0); pts.D02y=(tx, F0y); pts.Dy3=(tx, F0y + profondeur); pts.Dy4=(tx, top_y_R_dos)
+    pts.Ax=(col_x, tz_right); pts.Ax2=(tx, tz_right); pts.Ax_par=(F02x, tz_right)
+
+    if not dossier_bas:
+        pts.D0y=(0,0); pts.D02y=(tx,0)
+
+    pts.By_cush=(pts.By[0], min(pts.By[1], pts.Dy2[1]))
+    pts.By4_cush=(pts.By4[0], min(pts.By4[1], pts.By4_d[1]))
+
+    pts._A=A; pts._ty_canvas=max(ty_left, tz_right)
+    pts._draw={
+        "D1": bool(dossier_left), "D2": bool(dossier_left),
+        "D3": bool(dossier_bas),  "D4": bool(dossier_bas), "D5": bool(dossier_bas),
+        "D6": bool(dossier_right),
+    }
+    pts._acc={"L":acc_left, "R":acc_right}
+    return pts.completer()
+
+def build_polys_U1F_v2(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                       dossier_left=True, dossier_bas=True, dossier_right=True,
+                       acc_left=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    polys={"angle": [], "banquettes": [], "dossiers": [], "accoudoirs": []}
+    d={"D1":dossier_left,"D2":dossier_left,"D3":dossier_bas,"D4":dossier_bas,"D5":dossier_bas,"D6":dossier_right}
+
+    polys["angle"].append([pts.F0, pts.Fx, pts.Fx2, pts.Fy2, pts.Fy, pts.F0])
+
+    split_any=False
+    for ban in (
+        [pts.Fy, pts.Fy2, pts.By2, pts.By, pts.Fy],
+        [pts.Fx2, pts.Fx, pts.F02, pts.Bx2, pts.Fx2],
+        [pts.By3, pts.Fy3, pts.Bx2, pts.By4, pts.By3],
+    ):
+        pieces, split = _split_banquette_if_needed_U1F(ban)
+        polys["banquettes"] += pieces
+        split_any = split_any or split
+
+    # D1 avec By_dL
+    if d["D1"]: polys["dossiers"].append([pts.Dy, pts.Dy2, pts.By_dL, pts.Fy, pts.Dy])
+    if d["D2"]: polys["dossiers"].append([pts.D0x, pts.D0, pts.Dy, pts.Fy, pts.D0x])
+    if d["D3"]: polys["dossiers"].append([pts.D0x, pts.Dx, pts.Fx, pts.F0, pts.D0x])
+    if d["D4"]: polys["dossiers"].append([pts.Dx, pts.Dx2, pts.F02, pts.Fx, pts.Dx])
+    if d["D5"]: polys["dossiers"].append([pts.Dx2, pts.D02, pts.Dy3, pts.Bx2, pts.Dx2])
+    if d["D6"]: polys["dossiers"].append([pts.Dy3, pts.Bx2, pts.By4_d, pts.Dy4, pts.Dy3])
+
+    if acc_left:
+        if d["D1"]:
+            polys["accoudoirs"].append([pts.Ay, pts.Ay2, pts.By2, pts.Dy2, pts.Ay])
+        else:
+            polys["accoudoirs"].append([pts.Ay_, pts.Ay2, pts.By2, pts.By, pts.Ay_])
+    if acc_right:
+        if d["D6"]:
+            dy_top = pts.Dy4
+            polys["accoudoirs"].append([pts.By3, pts.Ax, pts.Ax2, dy_top, pts.By3])
+        else:
+            polys["accoudoirs"].append([pts.By3, pts.Ax, pts.Ax_par, pts.By4, pts.By3])
+
+    polys["split_flags"]={"any":split_any}
+    return polys
+
+# ---------------- v3 ----------------
+def compute_points_U1F_v3(tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                          dossier_left=True, dossier_bas=True, dossier_right=True,
+                          acc_left=True, acc_right=True,
+                          meridienne_side=None, meridienne_len=0):
+    tx, ty_left, tz_right, profondeur, meridienne_len = _cm_ints(tx, ty_left, tz_right, profondeur, meridienne_len)
+    if meridienne_side == 'g' and acc_left:
+        raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
+    if meridienne_side == 'd' and acc_right:
+        raise ValueError("Méridienne droite interdite avec accoudoir droit.")
+
+    A = profondeur + 20
+    F0x = 10 if dossier_left else 0
+    F0y = 10 if dossier_bas  else 0
+
+    pts = PointsU1F()
+    pts.D0=(0,0); pts.D0x=(F0x,0); pts.D0y=(0,F0y); pts.F0=(F0x, F0y)
+
+    # Gauche
+    pts.Fx  = (F0x + profondeur, F0y)
+    pts.Fx2 = (F0x + profondeur, F0y + profondeur)
+    pts.Dx  = (F0x + profondeur, 0)
+
+    top_y_L_full = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
+    top_y_L_dos  = (max(F0y + A, top_y_L_full - meridienne_len) if meridienne_side == 'g' else top_y_L_full)
+    pts.By=(F0x, top_y_L_full); pts.By2=(F0x + profondeur, top_y_L_full)
+    pts.Dy=(0, F0y + A); pts.Dy2=(0, top_y_L_dos); pts.By_dL=(F0x, top_y_L_dos)
+    pts.Ay=(0, ty_left); pts.Ay2=(F0x + profondeur, ty_left); pts.Ay_=(F0x, ty_left)
+
+    # Droite globale
+    F02x = tx - (10 if dossier_right else 0)
+    pts.F02=(F02x, F0y)
+    pts.D02x=(F02x, 0)
+
+    # Assise bas (côté angle)
+    bx_x = F02x - (profondeur + 20)
+    pts.Bx=(bx_x, F0y); pts.Bx2=(bx_x, F0y + profondeur); pts.Dx2=(bx_x, 0)
+
+    # Colonne droite et hauteurs
+    col_x = F02x - profondeur
+    top_y_R_full = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
+    top_y_R_dos  = (max(F0y + A, top_y_R_full - meridienne_len) if meridienne_side == 'd' else top_y_R_full)
+    pts.Fy  = (col_x, F0y + A)
+    pts.Fy2 = (F02x,  F0y + A)
+    pts.By3 = (col_x, top_y_R_full)
+    pts.By4 = (F02x,  top_y_R_full)
+    pts.By4_d=(F02x,  top_y_R_dos)
+    pts.D02  = (tx, 0)
+    pts.D02y = (tx, F0y)
+    pts.Dy3  = (tx, top_y_R_dos)
+    pts.Dy2R = (tx, F0y + A)  # pour D5/D6
+
+    pts.Ax=(col_x, tz_right); pts.Ax2=(tx, tz_right); pts.Ax_par=(F02x, tz_right)
+
+    if not dossier_bas:
+        pts.D0y=(0, 0); pts.D02y=(tx, 0)
+
+    # Bornes coussins (arrêt si méridienne)
+    pts.By_cush  = (pts.By[0],  min(pts.By[1],  pts.Dy2[1]))
+    pts.By4_cush = (pts.By4[0], min(pts.By4[1], pts.By4_d[1]))
+
+    pts._A=A; pts._ty_canvas=max(ty_left, tz_right)
+    pts._draw = {"D1":bool(dossier_left), "D2":bool(dossier_bas), "D3":bool(dossier_bas),
+                    "D4":bool(dossier_bas), "D5":bool(dossier_right), "D6":bool(dossier_right)}
+    pts._acc={"L":bool(acc_left), "R":bool(acc_right)}
+    return pts.completer()
+
+def build_polys_U1F_v3(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                       dossier_left=True, dossier_bas=True, dossier_right=True,
+                       acc_left=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    polys={"angle": [], "banquettes": [], "dossiers": [], "accoudoirs": []}
+    d={"D1":dossier_left,"D2":dossier_bas,"D3":dossier_bas,"D4":dossier_bas,"D5":dossier_right,"D6":dossier_right}
+
+    # Banquettes
+    split_any=False
+    ban_g = [pts.F0, pts.By, pts.By2, pts.Fx,  pts.F0]
+    ban_b = [pts.Fx, pts.Bx, pts.Bx2, pts.Fx2, pts.Fx]
+    ban_d = [pts.Fy, pts.By3, pts.By4, pts.Fy2, pts.Fy]
+    for ban in (ban_g, ban_b, ban_d):
+        pieces, split = _split_banquette_if_needed_U1F(ban)
+        polys["banquettes"] += pieces
+        split_any = split_any or split
+
+    # Angle fromage gauche
+    polys["angle"].append([pts.Bx, pts.F02, pts.Fy2, pts.Fy, pts.Bx2, pts.Bx])
+
+    # Dossiers
+    if d["D1"]:
+        polys["dossiers"].append([pts.D0x, pts.By_dL, pts.Dy2, pts.D0,  pts.D0x])
+    if d["D2"]:
+        polys["dossiers"].append([pts.D0x, pts.Dx,   pts.Fx,  pts.F0,  pts.D0x])
+    if d["D3"]:
+        polys["dossiers"].append([pts.Dx,  pts.Dx2,  pts.Bx,  pts.Fx,  pts.Dx])
+    if d["D4"]:
+        polys["dossiers"].append([pts.Dx2, (pts.F02[0],0), pts.F02, pts.Bx, pts.Dx2])
+    if d["D5"]:
+        polys["dossiers"].append([pts.D02x, pts.Fy2, pts.Dy2R, pts.D02, pts.D02x])
+    if d["D6"]:
+        polys["dossiers"].append([pts.Dy2R, pts.Fy2, pts.By4_d, pts.Dy3, pts.Dy2R])
+
+    # Accoudoirs
+    if acc_left:
+        if d["D1"]:
+            polys["accoudoirs"].append([pts.Ay,  pts.Ay2,  pts.By2,  pts.Dy2,  pts.Ay])
+        else:
+            polys["accoudoirs"].append([pts.Ay_, pts.Ay2,  pts.By2,  pts.By,   pts.Ay_])
+    if acc_right:
+        if d["D5"] or d["D6"]:
+            dy_top = pts.Dy3
+            polys["accoudoirs"].append([pts.By3, pts.Ax, pts.Ax2, dy_top, pts.By3])
+        else:
+            polys["accoudoirs"].append([pts.By3, pts.Ax, pts.Ax_par, pts.By4, pts.By3])
+
+    polys["split_flags"]={"any":split_any}
+    return polys
+
+# ---------------- v4 ----------------
+def compute_points_U1F_v4(tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                          dossier_left=True, dossier_bas=True, dossier_right=True,
+                          acc_left=True, acc_right=True,
+                          meridienne_side=None, meridienne_len=0):
+    tx, ty_left, tz_right, profondeur, meridienne_len = _cm_ints(tx, ty_left, tz_right, profondeur, meridienne_len)
+    if meridienne_side == 'g' and acc_left:
+        raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
+    if meridienne_side == 'd' and acc_right:
+        raise ValueError("Méridienne droite interdite avec accoudoir droit.")
+
+    A, F0x, F0y = _common_offsets_u1f(profondeur, dossier_left, dossier_bas, dossier_right)
+    F02x = tx - (10 if dossier_right else 0)
+
+    pts = PointsU1F()
+    pts.D0=(0,0); pts.D0x=(F0x,0); pts.D0y=(0,F0y); pts.F0=(F0x,F0y)
+
+    # GAUCHE
+    pts.Dy=(0, F0y+profondeur)
+    top_y_L_full = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
+    top_y_L_dos  = top_y_L_full if meridienne_side!='g' else max(F0y+profondeur, top_y_L_full - meridienne_len)
+
+    pts.Fy=(F0x, F0y+profondeur); pts.Fy2=(F0x+profondeur, F0y+profondeur)
+    pts.By=(F0x, top_y_L_full);   pts.By2=(F0x+profondeur, top_y_L_full)
+    pts.Dy2=(0, top_y_L_dos)
+    pts.By_dL=(F0x, top_y_L_dos)
+    pts.Ay=(0, ty_left); pts.Ay2=(F0x+profondeur, ty_left); pts.Ay_=(F0x, ty_left)
+
+    # BAS + angle droite
+    pts.Fx=(F0x+profondeur, F0y); pts.Fx2=(F0x+profondeur, F0y+profondeur)
+    bx_x = F02x - (profondeur+20)
+    pts.Bx=(bx_x, F0y); pts.Bx2=(bx_x, F0y+profondeur); pts.Dx=(bx_x, 0)
+
+    # DROITE
+    col_x = F02x - profondeur
+    top_y_R_full = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
+    top_y_R_dos  = top_y_R_full if meridienne_side!='d' else max(F0y + (profondeur+20), top_y_R_full - meridienne_len)
+
+    pts.Fy3=(col_x, F0y + (profondeur+20)); pts.Fy4=(F02x, F0y + (profondeur+20))
+    pts.By3=(col_x, top_y_R_full); pts.By4=(F02x, top_y_R_full); pts.By4_d=(F02x, top_y_R_dos)
+    pts.Ax=(col_x, tz_right); pts.Ax2=(tx, tz_right); pts.Ax_par=(F02x, tz_right)
+
+    pts.D02x=(F02x, 0); pts.F02=(F02x, F0y)
+    pts.D02=(tx, 0); pts.D02y=(tx, F0y)
+    pts.Dy3=(tx, F0y + (profondeur+20)); pts.Dy4=(tx, top_y_R_dos)
+
+    if not dossier_bas:
+        pts.D0y=(0,0); pts.D02y=(tx,0)
+
+    pts.By_cush  = (pts.By[0],  min(pts.By[1],  top_y_L_dos))
+    pts.By4_cush = (pts.By4[0], min(pts.By4[1], top_y_R_dos))
+
+    pts._A=profondeur+20; pts._ty_canvas=max(ty_left, tz_right)
+    pts._draw={
+        "D1": bool(dossier_left), "D2": bool(dossier_left),
+        "D3": bool(dossier_bas),  "D4": bool(dossier_bas),
+        "D5": bool(dossier_right),"D6": bool(dossier_right),
+    }
+    pts._acc={"L":acc_left, "R":acc_right}
+    return pts.completer()
+
+def build_polys_U1F_v4(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                       dossier_left=True, dossier_bas=True, dossier_right=True,
+                       acc_left=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    polys={"angle": [], "banquettes": [], "dossiers": [], "accoudoirs": []}
+    d=pts._draw
+
+    split_any=False
+    for ban in (
+        [pts.Fy, pts.By, pts.By2, pts.Fy2, pts.Fy],
+        [pts.F0, pts.Bx, pts.Bx2, pts.Fy,  pts.F0],
+        [pts.Fy4, pts.By4, pts.By3, pts.Fy3, pts.Fy4],
+    ):
+        pieces, split = _split_banquette_if_needed_U1F(ban)
+        polys["banquettes"] += pieces
+        split_any = split_any or split
+
+    polys["angle"].append([pts.Bx, pts.F02, pts.Fy4, pts.Fy3, pts.Bx2, pts.Bx])
+
+    if d["D1"]:
+        polys["dossiers"].append([pts.Dy, pts.Dy2, pts.By_dL, pts.Fy, pts.Dy])
+    if d["D2"]:
+        polys["dossiers"].append([pts.D0x, pts.D0, pts.Dy, pts.Fy, pts.D0x])
+    if d["D3"]:
+        polys["dossiers"].append([pts.F0, pts.Bx, pts.Dx, pts.D0x, pts.F0])  # rectangle confirmé
+    if d["D4"]:
+        polys["dossiers"].append([pts.Dx, pts.D02x, pts.F02, pts.Bx, pts.Dx])
+    if d["D5"]:
+        polys["dossiers"].append([pts.D02x, pts.Fy4, pts.Dy3, pts.D02, pts.D02x])
+    if d["D6"]:
+        polys["dossiers"].append([pts.Dy3, pts.Fy4, pts.By4_d, pts.Dy4, pts.Dy3])
+
+    if acc_left:
+        if d["D1"]:
+            polys["accoudoirs"].append([pts.Ay, pts.Ay2, pts.By2, pts.Dy2, pts.Ay])
+        else:
+            polys["accoudoirs"].append([pts.Ay_, pts.Ay2, pts.By2, pts.By, pts.Ay_])
+
+    if acc_right:
+        has_right = (d["D5"] or d["D6"])
+        if has_right:
+            dy_top = pts.Dy4
+            polys["accoudoirs"].append([pts.By3, pts.Ax, pts.Ax2, dy_top, pts.By3])
+        else:
+            polys["accoudoirs"].append([pts.By3, pts.Ax, pts.Ax_par, pts.By4, pts.By3])
+
+    polys["split_flags"]={"any":split_any}
+    return polys
+
+# --- variantes U1F ---
+_COMPUTE_U1F = {"v1":compute_points_U1F_v1, "v2":compute_points_U1F_v2,
+                "v3":compute_points_U1F_v3, "v4":compute_points_U1F_v4}
+
+_BUILD_U1F   = {"v1":build_polys_U1F_v1,   "v2":build_polys_U1F_v2,
+                "v3":build_polys_U1F_v3,   "v4":build_polys_U1F_v4}
+
+# ---------- AUTO sélection U1F ----------
+def _metrics_U1F(pts, polys, coussins):
+    """(nb banquettes, scissions, chute coussins en cm, disposition des coussins)."""
+    nb = len(polys["banquettes"])
+    layout = _cushion_layout_U1F(pts, coussins)
+    chute = sum(layout.lengths.values()) - sum(c.size for c in layout.cushions)
+    return nb, nb - 3, chute, layout  # U1F = 3 banquettes hors angle
+
+def _choose_variant_U1F(tx, ty, tz, profondeur=DEPTH_STD,
+                        dossier_left=True, dossier_bas=True, dossier_right=True,
+                        acc_left=True, acc_right=True,
+                        meridienne_side=None, meridienne_len=0,
+                        coussins="auto"):
+    """
+    Sélection auto sur les géométries mémoïsées (infaisables compris) : moins de banquettes,
+    puis moins de scissions, puis moins de chute de coussins ; égalité -> v1, v2, v3, v4.
+    Renvoie (variante, (pts, polys), disposition).
+    ValueError (message de v1) si aucune variante n'est faisable.
+    """
+    args = (tx, ty, tz, profondeur, dossier_left, dossier_bas, dossier_right,
+            acc_left, acc_right, meridienne_side, meridienne_len)
+    essais = {v: _essai_geometrie("U1F", v, args) for v in ("v1", "v2", "v3", "v4")}
+    best = None
+    for v, geom in essais.items():
+        if isinstance(geom, str):
+            continue
+        nb, scissions, chute, layout = _metrics_U1F(geom[0], geom[1], coussins)
+        if best is None or (nb, scissions, chute) < best[0]:
+            best = ((nb, scissions, chute), v, geom[:2], layout)
+    if best is None:
+        raise ValueError(essais["v1"])
+    return best[1], best[2], best[3]
+
+def _choose_variant_U1F_cfg(cfg):
+    try:
+        return _choose_variant_U1F(**cfg)[0]
+    except ValueError:
+        return None
+
+def choose_variants_U1F(configs, max_workers=None, chunksize=64):
+    """
+    Variante auto pour un lot de configurations (catalogue, tarifs) : dicts aux
+    paramètres de render_U1F (sans variant ni window_title). Les configurations sont
+    réparties par paquets sur plusieurs processus ; None pour une configuration infaisable.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_choose_variant_U1F_cfg, [dict(c) for c in configs], chunksize=chunksize))
+
+
+# ============================================================
+# ==================  L (no fromage) v1 + v2  =================
+# ============================================================
+# ---- v2 (pivot bas) ----
+def compute_points_LNF_v2(tx, ty, profondeur=DEPTH_STD,
+                          dossier_left=True, dossier_bas=True,
+                          acc_left=True, acc_bas=True,
+                          meridienne_side=None, meridienne_len=0):
+    tx, ty, profondeur, meridienne_len = _cm_ints(tx, ty, profondeur, meridienne_len)
+    prof = profondeur; pts = PointsLNF()
+    if dossier_left and dossier_bas:         F0x, F0y = 10, 10; D0x0=(10,0); D0y0=(0,10)
+    elif (not dossier_left) and dossier_bas: F0x, F0y = 0, 10;  D0x0=(0,0);  D0y0=(0,10)
+    elif dossier_left and (not dossier_bas): F0x, F0y = 10, 0;  D0x0=(10,0); D0y0=(0,0)
+    else:                                    F0x, F0y = 0, 0;   D0x0=(0,0);  D0y0=(0,0)
+
+    pts.D0=(0,0); pts.D0x=D0x0; pts.D0y=D0y0; pts.F0=(F0x,F0y)
+
+    top_y = ty - (ACCOUDOIR_THICK if acc_left else 0)
+    pts.Dy  =(0, F0y+prof); pts.Dy2=(0, top_y); pts.Ay=(0, ty)
+    pts.Fy  =(F0x, F0y+prof); pts.By=(F0x, top_y)
+    pts.Ay2 =(F0x+prof, ty); pts.By2=(F0x+prof, top_y); pts.Ay_par=(F0x, ty)
+
+    stop_x = tx - (ACCOUDOIR_THICK if acc_bas else 0)
+    pts.Dx=(stop_x,0); pts.Bx=(stop_x,F0y); pts.Bx2=(stop_x,F0y+prof)
+    pts.Ax=(tx,0); pts.Ax2=(tx,F0y+prof); pts.Ax_par=(tx,F0y)
+
+    if meridienne_side=='g' and meridienne_len>0:
+        mer_y=max(pts.Fy[1], top_y - meridienne_len); mer_y=min(mer_y, top_y)
+        pts.By_mer=(pts.By[0],mer_y); pts.By2_mer=(pts.By2[0],mer_y); pts.Dy2=(0,mer_y)
+    if meridienne_side=='b' and meridienne_len>0:
+        mer_x=min(stop_x, tx - meridienne_len)
+        pts.Bx_mer=(mer_x, pts.Bx[1]); pts.Bx2_mer=(mer_x, pts.Bx2[1]); pts.Dx_mer=(mer_x,0)
+
+    pts._tx, pts._ty = tx, ty
+    return pts.completer()
+
+def build_polys_LNF_v2(pts, tx, ty, profondeur=DEPTH_STD,
+                       dossier_left=True, dossier_bas=True,
+                       acc_left=True, acc_bas=True,
+                       meridienne_side=None, meridienne_len=0):
+    tx, ty, profondeur, meridienne_len = _cm_ints(tx, ty, profondeur, meridienne_len)
+    polys={"banquettes":[],"dossiers":[],"accoudoirs":[]}
+
+    Fy=(pts.Fy[0], pts.Fy[1]); Fy2=(pts.Fy[0]+profondeur, pts.Fy[1])
+    By=pts.By; By2=pts.By2
+    ban_g=[Fy, By, By2, Fy2, Fy]
+    split_left=False; mid_y_left=None
+    Lg = abs(By2[1] - Fy2[1])
+    if Lg > SPLIT_THRESHOLD:
+        split_left=True; mid_y_left=_split_mid_int(Fy2[1], By2[1])
+        low  = [(Fy[0],Fy[1]),(Fy2[0],Fy2[1]),(Fy2[0],mid_y_left),(Fy[0],mid_y_left),(Fy[0],Fy[1])]
+        high = [(Fy[0],mid_y_left),(Fy2[0],mid_y_left),(By2[0],By2[1]),(By[0],By[1]),(Fy[0],mid_y_left)]
+        polys["banquettes"] += [low, high]
+    else:
+        polys["banquettes"].append(ban_g)
+
+    F0=pts.F0; Bx=pts.Bx; Bx2=pts.Bx2
+    ban_b=[F0, Bx, Bx2, pts.Fy, F0]
+    split_bas=False; mid_x_bas=None
+    Lb = abs(Bx2[0] - pts.Fy[0])
+    if Lb > SPLIT_THRESHOLD:
+        split_bas=True; mid_x_bas=_split_mid_int(pts.Fy[0], Bx2[0])
+        left  = [(F0[0],F0[1]),(mid_x_bas,F0[1]),(mid_x_bas,pts.Fy[1]),(pts.Fy[0],pts.Fy[1]),(F0[0],F0[1])]
+        right = [(mid_x_bas,F0[1]),(Bx[0],Bx[1]),(Bx2[0],Bx2[1]),(mid_x_bas,pts.Fy[1]),(mid_x_bas,F0[1])]
+        polys["banquettes"] += [left, right]
+    else:
+        polys["banquettes"].append(ban_b)
+
+    if dossier_left:
+        if split_left:
+            F0x=pts.F0[0]; y0=pts.Dy[1]; yTop=pts.By_fin[1]
+            d1b=[(0,y0),(F0x,y0),(F0x,mid_y_left),(0,mid_y_left),(0,y0)]
+            d1h=[(0,mid_y_left),(F0x,mid_y_left),(F0x,yTop),(0,yTop),(0,mid_y_left)]
+            polys["dossiers"] += [d1b, d1h]
+        else:
+            By_use = pts.By_fin
+            polys["dossiers"].append([pts.Dy2, By_use, pts.Fy, pts.Dy, pts.Dy2])
+    if dossier_left:
+        polys["dossiers"].append([pts.D0x, pts.D0, pts.Dy, pts.Fy, pts.D0x])
+    if dossier_bas:
+        Bx_use = pts.Bx_fin; Dx_use = pts.Dx_fin
+        if split_bas:
+            yTop=pts.F0[1]
+            d3g=[(mid_x_bas,0),(pts.D0x[0],0),(pts.D0x[0],yTop),(mid_x_bas,yTop),(mid_x_bas,0)]
+            d3d=[(Dx_use[0],0),(mid_x_bas,0),(mid_x_bas,yTop),(Bx_use[0],yTop),(Dx_use[0],0)]
+            polys["dossiers"] += [d3g, d3d]
+        else:
+            polys["dossiers"].append([Dx_use, pts.D0x, pts.F0, Bx_use, Dx_use])
+
+    if acc_left:
+        if dossier_left:
+            polys["accoudoirs"].append([pts.Ay, pts.Ay2, pts.By2, pts.Dy2, pts.Ay])
+        else:
+            polys["accoudoirs"].append([pts.By, pts.Ay_par, pts.Ay2, pts.By2, pts.By])
+    if acc_bas:
+        if dossier_bas:
+            polys["accoudoirs"].append([pts.Dx, pts.Ax, pts.Ax2, pts.Bx2, pts.Dx])
+        else:
+            polys["accoudoirs"].append([pts.Bx, pts.Ax_par, pts.Ax2, pts.Bx2, pts.Bx])
+
+    polys["split_flags"]={"left":split_left,"bottom":split_bas}
+    return polys
+
+# ---- v1 (pivot gauche) ----
+def compute_points_LNF_v1(tx, ty, profondeur=DEPTH_STD,
+                          dossier_left=True, dossier_bas=True,
+                          acc_left=True, acc_bas=True,
+                          meridienne_side=None, meridienne_len=0):
+    tx, ty, profondeur, meridienne_len = _cm_ints(tx, ty, profondeur, meridienne_len)
+    prof=profondeur; pts = PointsLNF()
+    if dossier_left and dossier_bas:         F0x,F0y=10,10; D0x0=(10,0); D0y0=(0,10)
+    elif (not dossier_left) and dossier_bas: F0x,F0y=0,10;  D0x0=(0,0);  D0y0=(0,10)
+    elif dossier_left and (not dossier_bas): F0x,F0y=10,0;  D0x0=(10,0); D0y0=(0,0)
+    else:                                    F0x,F0y=0,0;   D0x0=(0,0);  D0y0=(0,0)
+
+    pts.D0=(0,0); pts.D0x=D0x0; pts.D0y=D0y0; pts.F0=(F0x,F0y)
+    top_y = ty - (ACCOUDOIR_THICK if acc_left else 0)
+    pts.Dy2=(0, top_y); pts.Ay =(0, ty); pts.By =(F0x, top_y)
+    pts.Ay2=(F0x+prof, ty); pts.By2=(F0x+prof, top_y)
+
+    stop_x = tx - (ACCOUDOIR_THICK if acc_bas else 0)
+    pts.Dy =(0, F0y+prof)
+    pts.Fx =(F0x+prof, F0y); pts.Fx2=(F0x+prof, F0y+prof)
+    pts.Bx =(stop_x, F0y);   pts.Bx2=(stop_x, F0y+prof)
+    pts.Dx =(F0x+prof, 0);   pts.DxR=(stop_x, 0)
+    pts.Ax =(tx, 0); pts.Ax2=(tx, F0y+prof)
+    pts.Ay_par=(F0x, ty); pts.Ax_par=(tx, F0y)
+
+    if meridienne_side=='g' and meridienne_len>0:
+        mer_y=max(F0y, top_y - meridienne_len); mer_y=min(mer_y, top_y)
+        pts.By_mer=(pts.By[0],mer_y); pts.By2_mer=(pts.By2[0],mer_y); pts.Dy2=(0,mer_y)
+    if meridienne_side=='b' and meridienne_len>0:
+        mer_x=min(stop_x, tx - meridienne_len)
+        pts.Bx_mer=(mer_x, pts.Bx[1]); pts.Bx2_mer=(mer_x, pts.Bx2[1]); pts.DxR_mer=(mer_x,0)
+    pts._tx, pts._ty=tx,ty
+    return pts.completer()
+
+def build_polys_LNF_v1(pts, tx, ty, profondeur=DEPTH_STD,
+                       dossier_left=True, dossier_bas=True,
+                       acc_left=True, acc_bas=True,
+                       meridienne_side=None, meridienne_len=0):
+    tx, ty, profondeur, meridienne_len = _cm_ints(tx, ty, profondeur, meridienne_len)
+    polys={"banquettes":[], "dossiers":[], "accoudoirs":[]}
+
+    F0=pts.F0; Fx=pts.Fx; By=pts.By; By2=pts.By2
+    ban_g=[F0, By, By2, Fx, F0]
+    split_left=False; mid_y_left=None
+    top_y = pts.By2_fin[1]; base_y = F0[1]
+    Lg = abs(top_y - base_y)
+    if Lg > SPLIT_THRESHOLD:
+        split_left=True; mid_y_left=_split_mid_int(base_y, top_y)
+        lower=[(F0[0],base_y),(Fx[0],base_y),(Fx[0],mid_y_left),(F0[0],mid_y_left),(F0[0],base_y)]
+        upper=[(F0[0],mid_y_left),(Fx[0],mid_y_left),(By2[0],top_y),(By[0],top_y),(F0[0],mid_y_left)]
+        polys["banquettes"] += [lower, upper]
+    else:
+        polys["banquettes"].append(ban_g)
+
+    Bx=pts.Bx; Bx2=pts.Bx2; Fx2=pts.Fx2
+    ban_b=[pts.Fx, Bx, Bx2, Fx2, pts.Fx]
+    split_bas=False; mid_x_bas=None
+    Lb = abs(Bx2[0] - pts.Fx[0])
+    if Lb > SPLIT_THRESHOLD:
+        split_bas=True; mid_x_bas=_split_mid_int(pts.Fx[0], Bx2[0])
+        left =[ (pts.Fx[0], pts.Fx[1]), (mid_x_bas, pts.Fx[1]),
+                (mid_x_bas, Fx2[1]), (Fx2[0], Fx2[1]), (pts.Fx[0], pts.Fx[1]) ]
+        right=[ (mid_x_bas, pts.Fx[1]), (Bx[0],Bx[1]), (Bx2[0],Bx2[1]),
+                (mid_x_bas, Fx2[1]), (mid_x_bas, pts.Fx[1]) ]
+        polys["banquettes"] += [left, right]
+    else:
+        polys["banquettes"].append(ban_b)
+
+    if dossier_left:
+        By_use = pts.By_fin
+        if split_left:
+            x0=0; x1=pts.D0x[0]; y_base=0; y_top=By_use[1]; y_mid=mid_y_left
+            d1_bas=[(x0,y_base),(x1,y_base),(x1,y_mid),(x0,y_mid),(x0,y_base)]
+            d1_haut=[(x0,y_mid),(x1,y_mid),(x1,y_top),(x0,y_top),(x0,y_mid)]
+            polys["dossiers"] += [d1_bas, d1_haut]
+        else:
+            polys["dossiers"].append([pts.D0, pts.Dy2, By_use, pts.D0x, pts.D0])
+    if dossier_left:
+        polys["dossiers"].append([pts.D0x, pts.Dx, pts.Fx, pts.F0, pts.D0x])
+    if dossier_bas:
+        DxR_use = pts.DxR_fin; Bx_use = pts.Bx_fin
+        if split_bas:
+            yTop=pts.F0[1]
+            d3_g=[(mid_x_bas,0),(pts.Dx[0],0),(pts.Dx[0],yTop),(mid_x_bas,yTop),(mid_x_bas,0)]
+            d3_d=[(DxR_use[0],0),(mid_x_bas,0),(mid_x_bas,yTop),(Bx_use[0],yTop),(DxR_use[0],0)]
+            polys["dossiers"] += [d3_g, d3_d]
+        else:
+            polys["dossiers"].append([pts.Dx, DxR_use, Bx_use, pts.Fx, pts.Dx])
+
+    if acc_left:
+        if dossier_left:
+            polys["accoudoirs"].append([pts.Ay, pts.Ay2, pts.By2, pts.Dy2, pts.Ay])
+        else:
+            polys["accoudoirs"].append([pts.Ay_par, pts.Ay2, pts.By2, pts.By, pts.Ay_par])
+    if acc_bas:
+        if dossier_bas:
+            polys["accoudoirs"].append([pts.DxR, pts.Ax, pts.Ax2, pts.Bx2, pts.DxR])
+        else:
+            polys["accoudoirs"].append([pts.Bx, pts.Ax_par, pts.Ax2, pts.Bx2, pts.Bx])
+
+    polys["split_flags"]={"left":split_left,"bottom":split_bas}
+    return polys
+
+# ---- L : coussins (valise) ----
+def _lengths_L(pts, tx, ty):
+    F0x,F0y = pts.F0
+    x_end = pts.Bx_fin[0]
+    y_end = pts.By_fin[1]
+    return {"bas": max(0, x_end - F0x), "gauche": max(0, y_end - F0y)}
+
+def _cushion_layout_L(pts, coussins):
+    lengths = _lengths_L(pts, pts._tx, pts._ty)
+    sizes, meta = _plan_sizes_from_spec(lengths, coussins)
+    # Choix orientation A/B (comme avant)
+    F0x, F0y = pts.F0
+    x_end = pts.Bx_fin[0]
+    y_end = pts.By_fin[1]
+    return _with_lengths(_layout_L_like(F0x, F0y, x_end, y_end, sizes, meta), lengths)
+
+def _dry_polys_for_variant(tx, ty, profondeur,
+                           dossier_left, dossier_bas,
+                           acc_left, acc_bas,
+                           meridienne_side, meridienne_len,
+                           variant):
+    if meridienne_side == 'g':
+        if acc_left:        raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
+        if not dossier_left:raise ValueError("Méridienne gauche impossible sans dossier gauche.")
+    if meridienne_side == 'b':
+        if acc_bas:         raise ValueError("Méridienne bas interdite avec accoudoir bas.")
+        if not dossier_bas: raise ValueError("Méridienne bas impossible sans dossier bas.")
+
+    if variant == "v1":
+        pts = compute_points_LNF_v1(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas, meridienne_side, meridienne_len)
+        polys = build_polys_LNF_v1(pts, tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas, meridienne_side, meridienne_len)
+    else:
+        pts = compute_points_LNF_v2(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas, meridienne_side, meridienne_len)
+        polys = build_polys_LNF_v2(pts, tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas, meridienne_side, meridienne_len)
+    return pts, polys
+
+def _splits_LNF(tx, ty, profondeur,
+                dossier_left, dossier_bas,
+                acc_left, acc_bas,
+                meridienne_side, meridienne_len):
+    """
+    Scissions (v1, v2) depuis les seules cotes, sans points ni polygones :
+    longueurs gauche / bas testées par build_polys_LNF_v1 / v2 (banquettes = 2 + scissions).
+    """
+    tx, ty, prof, meridienne_len = _cm_ints(tx, ty, profondeur, meridienne_len)
+    F0x = 10 if dossier_left else 0
+    F0y = 10 if dossier_bas  else 0
+    top_y  = ty - (ACCOUDOIR_THICK if acc_left else 0)
+    stop_x = tx - (ACCOUDOIR_THICK if acc_bas else 0)
+    top_v1 = top_y   # v1 : la méridienne gauche raccourcit la banquette gauche
+    if meridienne_side == 'g' and meridienne_len > 0:
+        top_v1 = min(max(F0y, top_y - meridienne_len), top_y)
+    v1 = (abs(top_v1 - F0y) > SPLIT_THRESHOLD) + (abs(stop_x - F0x - prof) > SPLIT_THRESHOLD)
+    v2 = (abs(top_y - F0y - prof) > SPLIT_THRESHOLD) + (abs(stop_x - F0x) > SPLIT_THRESHOLD)
+    return v1, v2
+
+def _predict_variant_LNF(tx, ty, profondeur,
+                         dossier_left, dossier_bas,
+                         acc_left, acc_bas,
+                         meridienne_side, meridienne_len):
+    """Variante auto (moins de banquettes, égalité -> v1 si tx >= ty) par comparaison d'entiers."""
+    s1, s2 = _splits_LNF(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas,
+                         meridienne_side, meridienne_len)
+    if s1 != s2:
+        return "v1" if s1 < s2 else "v2"
+    return "v1" if tx >= ty else "v2"
+
+# ============================================================
+# =================  U (no fromage) — v1..v4  =================
+# ============================================================
+def compute_points_U_v1(tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                        dossier_left=True, dossier_bas=True, dossier_right=True,
+                        acc_left=True, acc_bas=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    prof = profondeur; pts = PointsU()
+    F0x = 10 if dossier_left else 0
+    F0y = 10 if dossier_bas  else 0
+    pts.D0=(0,0); pts.D0x=(F0x,0); pts.D0y=(0,F0y); pts.F0=(F0x,F0y)
+
+    # gauche
+    pts.Dy  = (0, F0y+prof)
+    top_y_L = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
+    pts.Dy2 = (0, top_y_L)
+    pts.Ay  = (0, ty_left); pts.Ay2 = (F0x+prof, ty_left); pts.Ay_=(F0x, ty_left)
+
+    pts.Fy  = (F0x,      F0y+prof)
+    pts.Fy2 = (F0x+prof, F0y+prof)
+    pts.By  = (F0x,      top_y_L)
+    pts.By2 = (F0x+prof, top_y_L)
+
+    # droite (branche au-dessus du bas)
+    D02x_x = tx - (10 if (dossier_right or dossier_bas) else 0)
+    pts.Dx  = (F0x+prof, 0)
+    pts.Bx  = (D02x_x, F0y); pts.Bx2=(D02x_x, F0y+prof)
+
+    top_y_R   = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
+    x_left_R  = D02x_x - prof
+    pts.Fy3 = (x_left_R, F0y+prof); pts.By3=(x_left_R, top_y_R); pts.By4=(D02x_x, top_y_R)
+
+    pts.D02x=(D02x_x,0); pts.D02=(tx,0); pts.D02y=(tx,F0y); pts.Dy3=(tx, top_y_R)
+    pts.Ax=(x_left_R, tz_right); pts.Ax2=(tx, tz_right); pts.Ax_par=(D02x_x, tz_right)
+
+    pts._ty_canvas=max(ty_left, tz_right)
+    return pts.completer()
+
+def build_polys_U_v1(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                     dossier_left=True, dossier_bas=True, dossier_right=True,
+                     acc_left=True, acc_bas=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    polys={"banquettes":[],"dossiers":[],"accoudoirs":[]}
+
+    draw = {
+        "D1": bool(dossier_left),
+        "D2": bool(dossier_left or dossier_bas),
+        "D3": bool(dossier_bas),
+        "D4": bool(dossier_right),              # v1 : uniquement dossier_droit
+        "D5": bool(dossier_right),
+    }
+
+    F0=pts.F0; Fy=pts.Fy; Fy2=pts.Fy2; By=pts.By; By2=pts.By2
+    Bx=pts.Bx; Bx2=pts.Bx2; Fy3=pts.Fy3; By3=pts.By3; By4=pts.By4
+
+    # banquettes
+    split_left=split_bottom=split_right=False
+    ban_g=[Fy,By,By2,Fy2,Fy]
+    Lg=abs(By[1]-Fy[1])
+    if Lg>SPLIT_THRESHOLD:
+        split_left=True
+        mid_y=_split_mid_int(Fy[1],By[1])
+        g_low=[(Fy[0],Fy[1]),(Fy2[0],Fy[1]),(Fy2[0],mid_y),(Fy[0],mid_y),(Fy[0],Fy[1])]
+        g_up=[(Fy[0],mid_y),(By[0],By[1]),(By2[0],By2[1]),(Fy2[0],mid_y),(Fy[0],mid_y)]
+        polys["banquettes"]+=[g_low,g_up]
+    else:
+        polys["banquettes"].append(ban_g)
+
+    ban_b=[F0,Bx,Bx2,Fy,F0]
+    Lb=abs(Bx[0]-F0[0])
+    if Lb>SPLIT_THRESHOLD:
+        split_bottom=True
+        mid_x=_split_mid_int(F0[0],Bx[0])
+        b_left=[(F0[0],F0[1]),(mid_x,F0[1]),(mid_x,Fy[1]),(Fy[0],Fy[1]),(F0[0],F0[1])]
+        b_right=[(mid_x,F0[1]),(Bx[0],Bx[1]),(Bx2[0],Bx2[1]),(mid_x,Fy[1]),(mid_x,F0[1])]
+        polys["banquettes"]+=[b_left,b_right]
+    else:
+        polys["banquettes"].append(ban_b)
+
+    ban_r=[By3,By4,Bx2,Fy3,By3]
+    Lr=abs(By4[1]-Fy3[1])
+    if Lr>SPLIT_THRESHOLD:
+        split_right=True
+        mid_y=_split_mid_int(Fy3[1],By4[1])
+        r_low=[(Fy3[0],Fy3[1]),(Bx2[0],Fy3[1]),(Bx2[0],mid_y),(Fy3[0],mid_y),(Fy3[0],Fy3[1])]
+        r_up=[(Fy3[0],mid_y),(By3[0],By3[1]),(By4[0],By4[1]),(Bx2[0],mid_y),(Fy3[0],mid_y)]
+        polys["banquettes"]+=[r_low,r_up]
+    else:
+        polys["banquettes"].append(ban_r)
+
+    # dossiers (groupes par côtés)
+    groups = _dossiers_groups_U("v1", pts, tx, profondeur, draw)
+    _append_groups_to_polys_U(polys, groups)
+    polys["split_flags"]={"left":split_left,"bottom":split_bottom,"right":split_right}
+    return polys, draw
+
+def compute_points_U_v2(tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                        dossier_left=True, dossier_bas=True, dossier_right=True,
+                        acc_left=True, acc_bas=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    prof = profondeur; pts = PointsU()
+    F0x = 10 if dossier_left else 0
+    F0y = 10 if dossier_bas  else 0
+    pts.D0=(0,0); pts.D0x=(F0x,0); pts.D0y=(0,F0y); pts.F0=(F0x,F0y)
+
+    # gauche (Fy au ras du bas)
+    top_y_L = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
+    pts.Dy2=(0, top_y_L)
+    pts.Ay=(0, ty_left); pts.Ay2=(F0x+prof, ty_left); pts.Ay_=(F0x, ty_left)
+    pts.Fy=(F0x, F0y); pts.Fy2=(F0x+prof, F0y)
+    pts.Fx=(F0x+prof, F0y); pts.Fx2=(F0x+prof, F0y+prof)
+    pts.By=(F0x, top_y_L); pts.By2=(F0x+prof, top_y_L)
+
+    # bas jusqu'à Dx2
+    D02x_x = tx - (10 if (dossier_right or dossier_bas) else 0)
+    Dx2_x  = D02x_x - prof
+    pts.Dx=(F0x+prof,0); pts.Dx2=(Dx2_x,0)
+    pts.Bx=(Dx2_x, F0y); pts.Bx2=(Dx2_x, F0y+prof)
+
+    # droite (à DROITE du bas)
+    top_y_R = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
+    pts.F02=(D02x_x, F0y); pts.By4=(D02x_x, top_y_R); pts.By3=(Dx2_x,   top_y_R)
+    pts.D02x=(D02x_x,0); pts.D02=(tx,0); pts.D02y=(tx,F0y); pts.Dy3=(tx,top_y_R)
+    pts.Ax=(Dx2_x, tz_right); pts.Ax2=(tx,tz_right); pts.Ax_par=(D02x_x,tz_right)
+
+    pts._ty_canvas=max(ty_left, tz_right)
+    return pts.completer()
+
+def build_polys_U_v2(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                     dossier_left=True, dossier_bas=True, dossier_right=True,
+                     acc_left=True, acc_bas=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    polys={"banquettes":[],"dossiers":[],"accoudoirs":[]}
+
+    draw = {
+        "D1": bool(dossier_left),
+        "D2": bool(dossier_left or dossier_bas),
+        "D3": bool(dossier_bas),
+        "D4": bool(dossier_right or dossier_bas),
+        "D5": bool(dossier_right),
+    }
+
+    F0=pts.F0; Fy=pts.Fy; Fx=pts.Fx; Fx2=pts.Fx2; By=pts.By; By2=pts.By2
+    Bx=pts.Bx; Bx2=pts.Bx2; By3=pts.By3; By4=pts.By4; F02=pts.F02
+
+    split_left=split_bottom=split_right=False
+
+    # banquettes
+    ban_g=[F0,By,By2,Fx,F0]
+    Lg=abs(By[1]-F0[1])
+    if Lg>SPLIT_THRESHOLD:
+        split_left=True
+        mid_y=_split_mid_int(F0[1],By[1])
+        g_low=[(F0[0],F0[1]),(Fx[0],F0[1]),(Fx[0],mid_y),(F0[0],mid_y),(F0[0],F0[1])]
+        g_up=[(F0[0],mid_y),(By[0],By[1]),(By2[0],By2[1]),(Fx[0],mid_y),(F0[0],mid_y)]
+        polys["banquettes"]+=[g_low,g_up]
+    else:
+        polys["banquettes"].append(ban_g)
+
+    ban_b=[Fx,Bx,Bx2,Fx2,Fx]
+    Lb=abs(Bx2[0]-Fx2[0])
+    if Lb>SPLIT_THRESHOLD:
+        split_bottom=True
+        mid_x=_split_mid_int(Fx2[0],Bx2[0])
+        b_left=[(Fx[0],Fx[1]),(mid_x,Fx[1]),(mid_x,Fx2[1]),(Fx2[0],Fx2[1]),(Fx[0],Fx[1])]
+        b_right=[(mid_x,Fx[1]),(Bx[0],Bx[1]),(Bx2[0],Bx2[1]),(mid_x,Fx2[1]),(mid_x,Fx[1])]
+        polys["banquettes"]+=[b_left,b_right]
+    else:
+        polys["banquettes"].append(ban_b)
+
+    ban_r=[F02,By4,By3,Bx,F02]
+    Lr=abs(By3[1]-F02[1])
+    if Lr>SPLIT_THRESHOLD:
+        split_right=True
+        mid_y=_split_mid_int(F02[1],By3[1])
+        r_low=[(Bx[0],mid_y),(Bx[0],F02[1]),(F02[0],F02[1]),(F02[0],mid_y),(Bx[0],mid_y)]
+        r_up=[(Bx[0],mid_y),(By3[0],By3[1]),(By4[0],By4[1]),(F02[0],mid_y),(Bx[0],mid_y)]
+        polys["banquettes"]+=[r_low,r_up]
+    else:
+        polys["banquettes"].append(ban_r)
+
+    # dossiers
+    groups = _dossiers_groups_U("v2", pts, tx, profondeur, draw)
+    _append_groups_to_polys_U(polys, groups)
+    polys["split_flags"]={"left":split_left,"bottom":split_bottom,"right":split_right}
+    return polys, draw
+
+def compute_points_U_v3(tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                        dossier_left=True, dossier_bas=True, dossier_right=True,
+                        acc_left=True, acc_bas=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    prof = profondeur; pts = PointsU()
+    F0x = 10 if dossier_left else 0
+    F0y = 10 if dossier_bas  else 0
+    pts.D0=(0,0); pts.D0x=(F0x,0); pts.D0y=(0,F0y); pts.F0=(F0x,F0y)
+
+    # gauche (comme v1)
+    pts.Dy=(0, F0y+prof)
+    top_y_L=ty_left-(ACCOUDOIR_THICK if acc_left else 0)
+    pts.Dy2=(0, top_y_L)
+    pts.Ay=(0, ty_left); pts.Ay2=(F0x+prof, ty_left); pts.Ay_=(F0x, ty_left)
+    pts.Fy=(F0x, F0y+prof); pts.Fy2=(F0x+prof, F0y+prof)
+    pts.By=(F0x, top_y_L); pts.By2=(F0x+prof, top_y_L)
+
+    # bas jusqu'à Bx (= D02x - prof)
+    D02x_x = tx - (10 if (dossier_right or dossier_bas) else 0)
+    Bx_x   = D02x_x - prof
+    pts.Dx=(F0x+prof,0)
+    pts.Bx=(Bx_x, F0y); pts.Bx2=(Bx_x, F0y+prof)
+
+    # droite (à DROITE du bas)
+    top_y_R=tz_right-(ACCOUDOIR_THICK if acc_right else 0)
+    pts.By3=(Bx_x,   top_y_R); pts.F02=(D02x_x, F0y); pts.By4=(D02x_x, top_y_R)
+    pts.D02x=(D02x_x,0); pts.D02=(tx,0); pts.D02y=(tx,F0y); pts.Dy3=(tx, top_y_R)
+    pts.Ax=(Bx_x, tz_right); pts.Ax2=(tx, tz_right); pts.Ax_par=(D02x_x, tz_right)
+
+    pts._ty_canvas=max(ty_left,tz_right)
+    return pts.completer()
+
+def build_polys_U_v3(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                     dossier_left=True, dossier_bas=True, dossier_right=True,
+                     acc_left=True, acc_bas=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    polys={"banquettes":[],"dossiers":[],"accoudoirs":[]}
+
+    draw = {
+        "D1": bool(dossier_left),
+        "D2": bool(dossier_left or dossier_bas),
+        "D3": bool(dossier_bas),
+        "D4": bool(dossier_right or dossier_bas),
+        "D5": bool(dossier_right),
+    }
+
+    F0=pts.F0; Fy=pts.Fy; Fy2=pts.Fy2; By=pts.By; By2=pts.By2
+    Bx=pts.Bx; Bx2=pts.Bx2; By3=pts.By3; By4=pts.By4; F02=pts.F02
+
+    split_left=split_bottom=split_right=False
+    # banquettes
+    ban_g=[Fy,By,By2,Fy2,Fy]
+    Lg=abs(By[1]-Fy[1])
+    if Lg>SPLIT_THRESHOLD:
+        split_left=True
+        mid_y=_split_mid_int(Fy[1],By[1])
+        g_low=[(Fy[0],Fy[1]),(Fy2[0],Fy[1]),(Fy2[0],mid_y),(Fy[0],mid_y),(Fy[0],Fy[1])]
+        g_up=[(Fy[0],mid_y),(By[0],By[1]),(By2[0],By2[1]),(Fy2[0],mid_y),(Fy[0],mid_y)]
+        polys["banquettes"]+=[g_low,g_up]
+    else:
+        polys["banquettes"].append(ban_g)
+
+    ban_b=[F0,Bx,Bx2,Fy,F0]
+    Lb=abs(Bx[0]-F0[0])
+    if Lb>SPLIT_THRESHOLD:
+        split_bottom=True
+        mid_x=_split_mid_int(F0[0],Bx[0])
+        b_left=[(F0[0],F0[1]),(mid_x,F0[1]),(mid_x,Fy[1]),(Fy[0],Fy[1]),(F0[0],F0[1])]
+        b_right=[(mid_x,F0[1]),(Bx[0],Bx[1]),(Bx2[0],Bx2[1]),(mid_x,Fy[1]),(mid_x,F0[1])]
+        polys["banquettes"]+=[b_left,b_right]
+    else:
+        polys["banquettes"].append(ban_b)
+
+    # droite : By3 - By4 - F02 - Bx - By3
+    ban_r=[By3,By4,F02,Bx,By3]
+    Lr=abs(By3[1]-F02[1])
+    if Lr>SPLIT_THRESHOLD:
+        split_right=True
+        mid_y=_split_mid_int(F02[1],By3[1])
+        r_low=[(Bx[0],F02[1]),(F02[0],F02[1]),(F02[0],mid_y),(Bx[0],mid_y),(Bx[0],F02[1])]
+        r_up=[(Bx[0],mid_y),(By3[0],By3[1]),(By4[0],By4[1]),(F02[0],mid_y),(Bx[0],mid_y)]
+        polys["banquettes"]+=[r_low,r_up]
+    else:
+        polys["banquettes"].append(ban_r)
+
+    # dossiers
+    groups = _dossiers_groups_U("v3", pts, tx, profondeur, draw)
+    _append_groups_to_polys_U(polys, groups)
+    polys["split_flags"]={"left":split_left,"bottom":split_bottom,"right":split_right}
+    return polys, draw
+
+def compute_points_U_v4(tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                        dossier_left=True, dossier_bas=True, dossier_right=True,
+                        acc_left=True, acc_bas=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    prof = profondeur; pts = PointsU()
+    F0x = 10 if dossier_left else 0
+    F0y = 10 if dossier_bas  else 0
+    pts.D0  = (0, 0); pts.D0x = (F0x, 0); pts.D0y = (0, F0y); pts.F0  = (F0x, F0y)
+
+    # Montant gauche
+    top_y_L = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
+    pts.By  = (F0x, top_y_L); pts.Fx=(F0x+profondeur, F0y); pts.Fx2=(F0x+profondeur, F0y+prof); pts.By2=(F0x+profondeur, top_y_L)
+    pts.Dy2 = (0, top_y_L);  pts.Ay=(0, ty_left); pts.Ay2=(F0x+profondeur, ty_left); pts.Ay_=(F0x, ty_left)
+
+    # Limite droite
+    D02x_x = tx - (10 if (dossier_right or dossier_bas) else 0)
+    pts.Dx=(F0x+profondeur,0); pts.Bx=(D02x_x, F0y); pts.Bx2=(D02x_x, F0y+prof)
+
+    # Branche droite (au-dessus)
+    top_y_R   = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
+    x_left_R  = D02x_x - prof
+    pts.Fy3=(x_left_R, F0y+prof); pts.By3=(x_left_R, top_y_R); pts.By4=(D02x_x, top_y_R)
+
+    pts.D02x=(D02x_x, 0); pts.D02=(tx, 0); pts.D02y=(tx, F0y); pts.Dy3=(tx, top_y_R)
+    pts.Ax=(x_left_R, tz_right); pts.Ax2=(tx, tz_right); pts.Ax_par=(D02x_x, tz_right)
+
+    pts._ty_canvas=max(ty_left, tz_right)
+    return pts.completer()
+
+def build_polys_U_v4(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
+                     dossier_left=True, dossier_bas=True, dossier_right=True,
+                     acc_left=True, acc_bas=True, acc_right=True):
+    tx, ty_left, tz_right, profondeur = _cm_ints(tx, ty_left, tz_right, profondeur)
+    polys = {"banquettes": [], "dossiers": [], "accoudoirs": []}
+
+    draw = {
+        "D1": bool(dossier_left),
+        "D2": bool(dossier_left or dossier_bas),
+        "D3": bool(dossier_bas),
+        "D4": bool(dossier_right or dossier_bas),
+        "D5": bool(dossier_right),
+    }
+
+    F0=pts.F0; Fx=pts.Fx; Fx2=pts.Fx2; By=pts.By; By2=pts.By2
+    Bx=pts.Bx; Bx2=pts.Bx2; Fy3=pts.Fy3; By3=pts.By3; By4=pts.By4
+
+    split_left=split_bottom=split_right=False
+
+    # banquettes
+    ban_g = [F0, By, By2, Fx, F0]
+    Lg = abs(By[1] - F0[1])
+    if Lg > SPLIT_THRESHOLD:
+        split_left=True
+        mid_y = _split_mid_int(F0[1], By[1])
+        g_low  = [(F0[0],F0[1]), (Fx[0],F0[1]), (Fx[0],mid_y), (F0[0],mid_y), (F0[0],F0[1])]
+        g_high = [(F0[0],mid_y), (By[0],By[1]), (By2[0],By2[1]), (Fx[0],mid_y), (F0[0],mid_y)]
+        polys["banquettes"] += [g_low, g_high]
+    else:
+        polys["banquettes"].append(ban_g)
+
+    ban_b = [Fx, Bx, Bx2, Fx2, Fx]
+    Lb = abs(Bx2[0] - Fx2[0])
+    if Lb > SPLIT_THRESHOLD:
+        split_bottom=True
+        mid_x = _split_mid_int(Fx2[0], Bx2[0])
+        b_left  = [(Fx[0],Fx[1]), (mid_x,Fx[1]), (mid_x,Fx2[1]), (Fx2[0],Fx2[1]), (Fx[0],Fx[1])]
+        b_right = [(mid_x,Fx[1]), (Bx[0],Bx[1]), (Bx2[0],Bx2[1]), (mid_x,Fx2[1]), (mid_x,Fx[1])]
+        polys["banquettes"] += [b_left, b_right]
+    else:
+        polys["banquettes"].append(ban_b)
+
+    ban_r = [Fy3, By3, By4, Bx2, Fy3]
+    Lr = abs(By3[1] - Fy3[1])
+    if Lr > SPLIT_THRESHOLD:
+        split_right=True
+        mid_y = _split_mid_int(Fy3[1], By3[1])
+        r_low  = [(Fy3[0],Fy3[1]), (Bx2[0],Fy3[1]), (Bx2[0],mid_y), (Fy3[0],mid_y), (Fy3[0],Fy3[1])]
+        r_high = [(Fy3[0],mid_y), (By3[0],By3[1]), (By4[0],By4[1]), (Bx2[0],mid_y), (Fy3[0],mid_y)]
+        polys["banquettes"] += [r_low, r_high]
+    else:
+        polys["banquettes"].append(ban_r)
+
+    # dossiers
+    groups = _dossiers_groups_U("v4", pts, tx, profondeur, draw)
+    _append_groups_to_polys_U(polys, groups)
+    polys["split_flags"]={"left":split_left,"bottom":split_bottom,"right":split_right}
+    return polys, draw
+
+# ---------- Dossiers par côtés (U) ----------
+def _dossiers_groups_U(variant, pts, tx, profondeur, draw):
+    groups = {"left": {"D1":[], "D2":[]},
+              "bottom":{"D3":[]},
+              "right":{"D4":[], "D5":[]}}
+    F0x, F0y = pts.F0
+
+    if variant == "v1":
+        if draw["D1"]:
+            groups["left"]["D1"].append([pts.Dy2, pts.By, pts.Fy, pts.Dy, pts.Dy2])
+        if draw["D2"]:
+            groups["left"]["D2"].append([pts.D0x, pts.D0, pts.Dy, pts.Fy, pts.D0x])
+        if draw["D3"]:
+            groups["bottom"]["D3"].append([pts.D02x, pts.D0x, pts.F0, pts.Bx, pts.D02x])
+        if draw["D4"]:
+            groups["right"]["D4"].append([pts.D02x, pts.D02, pts.Dy3, pts.Bx2, pts.D02x])
+        if draw["D5"]:
+            x0 = pts.D02x[0]; y1 = F0y + profondeur; y_top = pts.By4[1]
+            groups["right"]["D5"].append(_rectU(x0, y1, tx, y_top))
+
+    elif variant == "v2":
+        if draw["D1"]:
+            groups["left"]["D1"].append([pts.D0x, pts.By, pts.Dy2, pts.D0, pts.D0x])
+        if draw["D2"]:
+            groups["left"]["D2"].append([pts.D0x, pts.Dx, pts.Fx, pts.F0, pts.D0x])
+        if draw["D3"]:
+            groups["bottom"]["D3"].append([pts.Dx, pts.Dx2, pts.Bx, pts.Fx, pts.Dx])
+        if draw["D4"]:
+            groups["right"]["D4"].append([pts.Dx2, pts.D02x, pts.F02, pts.Bx, pts.Dx2])
+        if draw["D5"]:
+            groups["right"]["D5"].append([pts.D02x, pts.D02, pts.Dy3, pts.By4, pts.D02x])
+
+    elif variant == "v3":
+        if draw["D1"]:
+            groups["left"]["D1"].append([pts.Dy, pts.Fy, pts.By, pts.Dy2, pts.Dy])
+        if draw["D2"]:
+            groups["left"]["D2"].append([pts.D0x, pts.D0, pts.Dy, pts.Fy, pts.D0x])
+        if draw["D3"]:
+            xL = F0x; xR = pts.Bx[0]; y0 = 0; y1 = F0y
+            groups["bottom"]["D3"].append(_rectU(xL, y0, xR, y1))
+        if draw["D4"]:
+            bx0 = pts.Bx[0]
+            groups["right"]["D4"].append([
+                pts.Dx, pts.D02x, pts.F02, pts.Bx, (bx0, 0), pts.Dx
+            ])
+        if draw["D5"]:
+            groups["right"]["D5"].append([pts.Dy3, pts.By4, pts.D02x, pts.D02, pts.Dy3])
+
+    else:  # v4
+        if draw["D1"]:
+            groups["left"]["D1"].append([pts.D0x, pts.By, pts.Dy2, pts.D0, pts.D0x])
+        if draw["D2"]:
+            groups["left"]["D2"].append([pts.D0x, pts.Dx, pts.Fx, pts.F0, pts.D0x])
+        if draw["D3"]:
+            groups["bottom"]["D3"].append([pts.Dx, pts.D02x, pts.Bx, pts.Fx, pts.Dx])
+        F02x = pts.D02x[0]; y0 = F0y; y1 = y0 + profondeur
+        if draw["D4"]:
+            groups["right"]["D4"] += [
+                _rectU(F02x, 0,  tx, y0),
+                _rectU(F02x, y0, tx, y1),
+            ]
+        if draw["D5"]:
+            y_top = pts.By4[1]
+            groups["right"]["D5"].append(_rectU(F02x, y1, tx, y_top))
+    return groups
+
+def _append_groups_to_polys_U(polys, groups):
+    order = {"left":["D1","D2"], "bottom":["D3"], "right":["D4","D5"]}
+    for side in ("left","bottom","right"):
+        for d in order[side]:
+            for poly in groups[side].get(d, []):
+                polys["dossiers"].append(poly)
+    polys["dossiers_by_side"] = groups  # info
+
+# --- NOUVEAU : longueurs nominales et dessin par tailles (U no-fromage) ---
+def _u_nominal_lengths(variant, pts):
+    F0x, F0y = pts.F0
+    if variant in ("v1","v3","v4"):
+        x_end = pts.Bx[0]
+    else: # v2
+        x_end = pts.F02[0]
+    y_end_L = pts.By[1]
+    y_end_R = pts.By4[1]
+    return {"bas": max(0, x_end - F0x), "gauche": max(0, y_end_L - F0y), "droite": max(0, y_end_R - F0y)}
+
+def _layout_U_with_sizes(variant, pts, sizes, drawn, meta=None):
+    F0x, F0y = pts.F0
+    x_end = pts.Bx[0] if variant in ("v1","v4") else pts.F02[0]
+    return _layout_U_like(F0x, F0y, x_end, pts.By[1], pts.By4[1], sizes, meta or {},
+                          corner_left=drawn.get("D1", False),
+                          corner_right=drawn.get("D4", False) or drawn.get("D5", False))
+
+def _cushion_layout_U(variant, pts, drawn, coussins):
+    mode, same, size_fixed, tag = _norm_coussins_spec(coussins)
+    lengths = _u_nominal_lengths(variant, pts)
+    # Spécifique : si "auto" on garde l'algorithme existant (s unique 65/80/90)
+    if mode=="auto":
+        size = _choose_cushion_size_auto_U(variant, pts, drawn)
+        sizes = {k:size for k in lengths.keys()}
+        meta = {"mode":"auto", "delta":0, "uniform":True, "set":"{65,80,90}"}
+    else:
+        sizes, meta = _plan_sizes_from_spec(lengths, coussins)
+    return _with_lengths(_layout_U_with_sizes(variant, pts, sizes, drawn, meta), lengths)
+
+def _choose_cushion_size_auto_U(variant, pts, drawn):
+    # conservé pour compat (utilisé si coussins="auto")
+    F0x, F0y = pts.F0
+    x_end = pts.Bx[0] if variant in ("v1","v4") else pts.F02[0]
+    y_end_L = pts.By[1]; y_end_R = pts.By4[1]
+    best, best_score = 65, (1e9, -1)
+    for s in (65, 80, 90):
+        Lb = max(0, x_end - F0x)
+        yL0 = F0y + (CUSHION_DEPTH if drawn.get("D1", False) else 0)
+        yR0 = F0y + (CUSHION_DEPTH if (drawn.get("D4", False) or drawn.get("D5", False)) else 0)
+        Lg = max(0, y_end_L - yL0); Ld = max(0, y_end_R - yR0)
+        waste = max(Lb % s if Lb>0 else 0, Lg % s if Lg>0 else 0, Ld % s if Ld>0 else 0)
+        score = (waste, -s)
+        if score < best_score: best_score, best = score, s
+    return best
+
+# ---------- AUTO sélection U ----------
+_COMPUTE_U = {"v1":compute_points_U_v1, "v2":compute_points_U_v2,
+              "v3":compute_points_U_v3, "v4":compute_points_U_v4}
+
+_BUILD_U   = {"v1":build_polys_U_v1,   "v2":build_polys_U_v2,
+              "v3":build_polys_U_v3,   "v4":build_polys_U_v4}
+
+# Longueur de chaque côté (gauche, bas, droite) telle que testée par build_polys_U_vN :
+# (point de départ, point d'arrivée, axe)
+_U_SIDES = {
+    "v1": (("Fy","By",1),  ("F0","Bx",0),   ("Fy3","By4",1)),
+    "v2": (("F0","By",1),  ("Fx2","Bx2",0), ("F02","By3",1)),
+    "v3": (("Fy","By",1),  ("F0","Bx",0),   ("F02","By3",1)),
+    "v4": (("F0","By",1),  ("Fx2","Bx2",0), ("Fy3","By3",1)),
+}
+
+def _metrics_U_pts(variant, pts):
+    """(nb banquettes, scissions) depuis les seuls points : aucun polygone ni groupe de dossiers."""
+    scissions = sum(abs(getattr(pts, b)[ax] - getattr(pts, a)[ax]) > SPLIT_THRESHOLD for a, b, ax in _U_SIDES[variant])
+    return 3 + scissions, scissions  # U = 3 groupes (G,B,D)
+
+def _splits_U(tx, ty_left, tz_right, profondeur,
+              dossier_left, dossier_bas, dossier_right,
+              acc_left, acc_bas, acc_right):
+    """
+    Scissions {variante: n} depuis les seules cotes : mêmes longueurs que _U_SIDES
+    (gauche / bas / droite, court = au-dessus du bas, long = depuis F0), en entiers.
+    """
+    tx, ty_left, tz_right, prof = _cm_ints(tx, ty_left, tz_right, profondeur)
+    F0x = 10 if dossier_left else 0
+    F0y = 10 if dossier_bas  else 0
+    D02x_x = tx - (10 if (dossier_right or dossier_bas) else 0)
+    yL = ty_left  - (ACCOUDOIR_THICK if acc_left  else 0) - F0y
+    yR = tz_right - (ACCOUDOIR_THICK if acc_right else 0) - F0y
+    T = SPLIT_THRESHOLD
+    g_court, g_long = abs(yL - prof) > T, abs(yL) > T
+    d_court, d_long = abs(yR - prof) > T, abs(yR) > T
+    return {"v1": g_court + (abs(D02x_x - F0x) > T)            + d_court,
+            "v2": g_long  + (abs(D02x_x - 2*prof - F0x) > T)   + d_long,
+            "v3": g_court + (abs(D02x_x - prof - F0x) > T)     + d_long,
+            "v4": g_long  + (abs(D02x_x - prof - F0x) > T)     + d_court}
+
+def _metrics_U(variant, tx, ty_left, tz_right, profondeur,
+               dossier_left, dossier_bas, dossier_right,
+               acc_left, acc_bas, acc_right):
+    scissions = _splits_U(tx, ty_left, tz_right, profondeur,
+                          dossier_left, dossier_bas, dossier_right,
+                          acc_left, acc_bas, acc_right)[variant]
+    return 3 + scissions, scissions
+
+def _predict_variant_U(tx, ty_left, tz_right, profondeur,
+                       dossier_left, dossier_bas, dossier_right,
+                       acc_left, acc_bas, acc_right):
+    """Variante auto : moins de banquettes (= moins de scissions), égalité -> v2, v1, v3, v4."""
+    splits = _splits_U(tx, ty_left, tz_right, profondeur,
+                       dossier_left, dossier_bas, dossier_right,
+                       acc_left, acc_bas, acc_right)
+    return min(("v2","v1","v3","v4"), key=splits.__getitem__)
+
+
+# ============================================================
+# ===================  SIMPLE droit (S1)  ====================
+# ============================================================
+def compute_points_simple_S1(tx, profondeur=DEPTH_STD,
+                             dossier=True,
+                             acc_left=True, acc_right=True,
+                             meridienne_side=None, meridienne_len=0):
+    tx, profondeur, meridienne_len = _cm_ints(tx, profondeur, meridienne_len)
+    if meridienne_side == 'g' and acc_left:
+        raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
+    if meridienne_side == 'd' and acc_right:
+        raise ValueError("Méridienne droite interdite avec accoudoir droit.")
+
+    xL_in = ACCOUDOIR_THICK if acc_left  else 0
+    xR_in = tx - (ACCOUDOIR_THICK if acc_right else 0)
+    y_base = DOSSIER_THICK if dossier else 0
+
+    pts = PointsS1()
+    pts.Ay  = (0, 0);          pts.Ay2 = (0, profondeur)
+    pts.Ax  = (tx, 0);         pts.Ax2 = (tx, profondeur)
+    pts.B0  = (xL_in, y_base); pts.By  = (xL_in, profondeur)
+    pts.Bx  = (xR_in, y_base); pts.Bx2 = (xR_in, profondeur)
+    pts.D0  = (xL_in, 0);      pts.Dx  = (xR_in, 0)
+
+    if meridienne_side == 'g' and meridienne_len > 0:
+        start_x = min(max(xL_in + meridienne_len, xL_in), xR_in)
+        pts.D0_m = (start_x, 0); pts.B0_m = (start_x, y_base)
+    if meridienne_side == 'd' and meridienne_len > 0:
+        end_x = max(min(xR_in - meridienne_len, xR_in), xL_in)
+        pts.Dx_m = (end_x, 0); pts.Bx_m = (end_x, y_base)
+
+    pts._tx = tx; pts._prof = profondeur
+    return pts.completer()
+
+def build_polys_simple_S1(pts, dossier=True, acc_left=True, acc_right=True,
+                          meridienne_side=None, meridienne_len=0):
+    meridienne_len = _cm_ints(meridienne_len)
+    polys = {"banquettes": [], "dossiers": [], "accoudoirs": []}
+
+    ban = [pts.By, pts.B0, pts.Bx, pts.Bx2, pts.By]
+    L = abs(pts.Bx[0] - pts.B0[0])
+    split = False
+    if L > SPLIT_THRESHOLD:
+        split = True
+        mid_x = _split_mid_int(pts.B0[0], pts.Bx[0])
+        left  = [pts.By, pts.B0, (mid_x, pts.B0[1]), (mid_x, pts.By[1]), pts.By]
+        right = [(mid_x, pts.By[1]), (mid_x, pts.B0[1]), pts.Bx, pts.Bx2, (mid_x, pts.By[1])]
+        polys["banquettes"] += [left, right]
+    else:
+        polys["banquettes"].append(ban)
+
+    if dossier:
+        x0, x1 = pts.D0[0], pts.Dx[0]
+        if meridienne_side == 'g' and meridienne_len > 0: x0 = pts.D0_m[0]
+        if meridienne_side == 'd' and meridienne_len > 0: x1 = pts.Dx_m[0]
+        if x1 > x0:
+            polys["dossiers"].append([(x0,0),(x1,0),(x1,DOSSIER_THICK),(x0,DOSSIER_THICK),(x0,0)])
+
+    if acc_left:
+        if dossier:
+            polys["accoudoirs"].append([pts.Ay, pts.Ay2, pts.By, pts.D0, pts.Ay])
+        else:
+            polys["accoudoirs"].append([pts.Ay, pts.Ay2, pts.By, pts.B0, pts.Ay])
+    if acc_right:
+        if dossier:
+            polys["accoudoirs"].append([pts.Bx2, pts.Dx, pts.Ax, pts.Ax2, pts.Bx2])
+        else:
+            polys["accoudoirs"].append([pts.Bx2, pts.Ax2, pts.Ax, pts.Bx, pts.Bx2])
+
+    polys["split_flags"]={"center":split}
+    return polys
+
+def _choose_cushion_size_auto_simple_S1(x0, x1):
+    usable = max(0, x1 - x0)
+    best, best_score = 65, (1e9, -1)
+    for s in (65, 80, 90):
+        waste = usable % s if usable > 0 else 0
+        score = (waste, -s)
+        if score < best_score:
+            best_score, best = score, s
+    return best
+
+def _layout_simple_S1(pts, size, meridienne_side=None, meridienne_len=0, meta=None):
+    x0 = pts.B0[0]; x1 = pts.Bx[0]
+    if meridienne_side == 'g' and meridienne_len > 0:
+        x0 = max(x0, pts.B0_fin[0])
+    if meridienne_side == 'd' and meridienne_len > 0:
+        x1 = min(x1, pts.Bx_fin[0])
+
+    def count(off):
+        xs = x0 + off; xe = x1
+        return int(max(0, xe - xs) // size)
+    off = CUSHION_DEPTH if count(CUSHION_DEPTH) > count(0) else 0
+
+    y = pts.B0[1]
+    cushions = _cushion_run("bas", size, x0 + off, x1,
+                            lambda a, b: _rectU(a, y, b, y+CUSHION_DEPTH))
+    return _make_layout(cushions, {"bas": size}, meta or {}, {"offset": off})
+
+def _cushion_layout_S1(pts, coussins, meridienne_side=None, meridienne_len=0):
+    mode, same, size_fixed, tag = _norm_coussins_spec(coussins)
+    x0 = pts.B0_fin[0] if meridienne_side == 'g' else pts.B0[0]
+    x1 = pts.Bx_fin[0] if meridienne_side == 'd' else pts.Bx[0]
+    L = max(0, x1 - x0)
+
+    if mode=="fixed":
+        v=int(size_fixed)
+        if not (60 <= v <= 100): raise ValueError("Taille coussins fixe hors bornes [60..100].")
+        size = v
+    elif mode=="auto":
+        size = _choose_cushion_size_auto_simple_S1(x0, x1)
+    else:
+        # une seule branche ⇒ l'écart global ≤ 5 est trivial ; choisir le meilleur s dans [lo..hi]
+        lo, hi = _allowed_interval_for_mode(mode)
+        size = _choose_uniform_size_from_set([L], range(lo,hi+1))
+    meta = {"mode":mode, "same":same}
+    return _with_lengths(_layout_simple_S1(pts, size, meridienne_side, meridienne_len, meta), {"bas": L})
+
+
+# ============================================================
+# =========  GÉOMÉTRIE MÉMOÏSÉE (turtle, matplotlib, PDF)  ===
+# ============================================================
+# Cotes positionnelles par forme (ordre des compute_points_*) :
+#   S1       : tx, profondeur, dossier, acc_left, acc_right, meridienne_side, meridienne_len
+#   LNF / LF : tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas,
+#              meridienne_side, meridienne_len
+#   U        : tx, ty, tz, profondeur, dossier_left, dossier_bas, dossier_right,
+#              acc_left, acc_bas, acc_right
+#   U1F      : tx, ty, tz, profondeur, dossier_left, dossier_bas, dossier_right,
+#              acc_left, acc_right, meridienne_side, meridienne_len
+#   U2F      : tx, ty, tz, profondeur, dossier_left, dossier_bas, dossier_right,
+#              acc_left, acc_bas, acc_right, meridienne_side, meridienne_len
+GEOM_CACHE = PlanCache(int(os.environ.get("CANAPE_GEOM_CACHE_SIZE", 1024)))
+
+def _construire_geometrie(forme, variant, args, controle_250=True):
+    """(pts, polys, drawn) d'une variante explicite : contrôles des render_*, sans cache."""
+    drawn = {}
+    if forme == "S1":
+        pts = compute_points_simple_S1(*args)
+        polys = build_polys_simple_S1(pts, *args[2:])
+    elif forme == "LNF":
+        pts, polys = _dry_polys_for_variant(*args, variant)
+    elif forme == "LF":
+        meridienne_side, acc_left, acc_bas = args[7], args[5], args[6]
+        if meridienne_side == 'g' and acc_left:
+            raise ValueError("Erreur: une méridienne gauche ne peut pas coexister avec un accoudoir gauche.")
+        if meridienne_side == 'b' and acc_bas:
+            raise ValueError("Erreur: une méridienne bas ne peut pas coexister avec un accoudoir bas.")
+        pts = compute_points_LF_variant(*args)
+        polys = build_polys_LF_variant(pts, *args)
+    elif forme == "U":
+        pts = _COMPUTE_U[variant](*args)
+        polys, drawn = _BUILD_U[variant](pts, *args)
+    elif forme == "U1F":
+        pts = _COMPUTE_U1F[variant](*args)
+        polys = _BUILD_U1F[variant](pts, *args[:9])
+    elif forme == "U2F":
+        meridienne_side, acc_left, acc_right = args[10], args[7], args[9]
+        if meridienne_side == 'g' and acc_left:
+            raise ValueError("Erreur: une méridienne gauche ne peut pas coexister avec un accoudoir gauche.")
+        if meridienne_side == 'd' and acc_right:
+            raise ValueError("Erreur: une méridienne droite ne peut pas coexister avec un accoudoir droit.")
+        pts = compute_points_U2f(*args)
+        polys = build_polys_U2f(pts, *args[:10])
+    else:
+        raise ValueError(f"Forme inconnue : {forme}")
+    if controle_250:
+        _assert_banquettes_max_250(polys)
+    return pts, polys, drawn
+
+def _essai_geometrie(forme, variant, args):
+    """Passage à blanc mémoïsé : (pts, polys, drawn), ou le message de la ValueError (str)."""
+    def essai():
+        try:
+            return _construire_geometrie(forme, variant, args)
+        except ValueError as e:
+            return str(e)
+    return GEOM_CACHE.get_or_compute((forme, variant, tuple(args)), essai)
+
+def geometrie(forme, variant, *args):
+    """
+    (pts, polys, drawn) d'une variante explicite (None pour S1 / LF / U2F), mémoïsés pour
+    tous les rendus du processus ; ValueError si infaisable (mémorisé aussi).
+    Résultat partagé : à lire, jamais à modifier.
+    """
+    geom = _essai_geometrie(forme, variant, args)
+    if isinstance(geom, str):
+        raise ValueError(geom)
+    return geom
@@ -10,13 +10,29 @@
 #   - Correctifs nommage 'coussins_count' -> 'cushions_count'
 
 import turtle, math, unicodedata
+import numpy as np
+
+from plan_cache import PLAN_CACHE, plan_key
+# Géométrie (points, polygones, contrôles, choix de variante) : noyau commun avec canapematplot.
+# Les constructeurs publics restent importables d'ici (API historique du module).
+from canape_geometrie import (
+    WIN_W, WIN_H, PAD_PX, ZOOM,
+    DEPTH_STD, ACCOUDOIR_THICK, DOSSIER_THICK, CUSHION_DEPTH, MAX_BANQUETTE, SPLIT_THRESHOLD,
+    WorldToScreen, centroid, banquette_dims, _split_mid_int, _poly_has_area,
+    geometrie, _predict_variant_LNF, _predict_variant_U,
+    compute_points_LF_variant, build_polys_LF_variant,
+    compute_points_U2f, build_polys_U2f,
+    compute_points_U1F_v1, build_polys_U1F_v1, compute_points_U1F_v2, build_polys_U1F_v2,
+    compute_points_U1F_v3, build_polys_U1F_v3, compute_points_U1F_v4, build_polys_U1F_v4,
+    compute_points_LNF_v1, build_polys_LNF_v1, compute_points_LNF_v2, build_polys_LNF_v2,
+    compute_points_U_v1, build_polys_U_v1, compute_points_U_v2, build_polys_U_v2,
+    compute_points_U_v3, build_polys_U_v3, compute_points_U_v4, build_polys_U_v4,
+    compute_points_simple_S1, build_polys_simple_S1,
+)
 
 # =========================
 # Réglages / constantes
 # =========================
-WIN_W, WIN_H       = 900, 700
-PAD_PX             = 60
-ZOOM               = 0.85
 LINE_WIDTH         = 2
 
 # ========= PALETTE / THÈME =========
@@ -40,15 +56,6 @@ COLOR_GRID_MAJOR   = "#dcdcdc"
 AXIS_LABEL_STEP    = 50
 AXIS_LABEL_MAX     = 800
 
-DEPTH_STD          = 70
-ACCOUDOIR_THICK    = 15
-DOSSIER_THICK      = 10
-CUSHION_DEPTH      = 15
-
-# *** Seuil strict de scission ***
-MAX_BANQUETTE      = 250
-SPLIT_THRESHOLD    = 250  # scission dès que longueur > 250 (aucune tolérance)
-
 # --- Coins arrondis coussins ---
 CUSHION_ROUND_R_CM = 3.0  # rayon ~3 cm, léger
 
@@ -270,18 +277,6 @@ def _resolve_and_apply_colors(couleurs):
 # =========================
 # Transform cm → px (isométrique & centré)
 # =========================
-class WorldToScreen:
-    def __init__(self, tx_cm, ty_cm, win_w=WIN_W, win_h=WIN_H, pad_px=PAD_PX, zoom=ZOOM):
-        sx = (win_w - 2*pad_px) / float(tx_cm or 1)
-        sy = (win_h - 2*pad_px) / float(ty_cm or 1)
-        self.scale = min(sx, sy) * zoom
-        used_w = tx_cm * self.scale
-        used_h = ty_cm * self.scale
-        self.left_px   = -used_w / 2.0
-        self.bottom_px = -used_h / 2.0
-    def pt(self, x_cm, y_cm):
-        return (self.left_px + x_cm*self.scale, self.bottom_px + y_cm*self.scale)
-
 # =========================
 # Outils dessin
 # =========================
@@ -380,9 +375,6 @@ def draw_double_arrow_horizontal_cm(t, tr, y_cm, x0_cm, x1_cm, label):
     draw_double_arrow_px(t, tr.pt(x0_cm, y_cm), tr.pt(x1_cm, y_cm), text=label,
                          text_perp_offset_px=-12, text_tang_shift_px=20)
 
-def centroid(poly):
-    return (sum(x for x,y in poly)/len(poly), sum(y for x,y in poly)/len(poly))
-
 def label_poly(t, tr, poly, text, font=FONT_LABEL):
     cx, cy = centroid(poly); pen_up_to(t, *tr.pt(cx, cy))
     t.write(text, align="center", font=font)
@@ -391,29 +383,6 @@ def label_poly_offset_cm(t, tr, poly, text, dx_cm=0.0, dy_cm=0.0, font=FONT_LABE
     cx, cy = centroid(poly); x, y = tr.pt(cx + dx_cm, cy + dy_cm)
     pen_up_to(t, x, y); t.write(text, align="center", font=font)
 
-def banquette_dims(poly):
-    xs=[p[0] for p in poly]; ys=[p[1] for p in poly]
-    L=max(max(xs)-min(xs), max(ys)-min(ys)); P=min(max(xs)-min(xs), max(ys)-min(ys))
-    return int(round(L)), int(round(P))
-
-def _split_mid_int(a, b):
-    delta = b - a; L = abs(delta); left = L // 2
-    return a + (left if delta >= 0 else -left)
-
-def _rectU(x0, y0, x1, y1):
-    return [(x0,y0),(x1,y0),(x1,y1),(x0,y1),(x0,y0)]
-
-def _poly_has_area(p):
-    if not p or len(p) < 4: return False
-    xs=[x for x,y in p]; ys=[y for x,y in p]
-    return (max(xs)-min(xs) > 1e-9) and (max(ys)-min(ys) > 1e-9)
-
-def _assert_banquettes_max_250(polys):
-    for poly in polys.get("banquettes", []):
-        L, P = banquette_dims(poly)
-        if L > MAX_BANQUETTE:
-            raise ValueError(f"Banquette de {L}×{P} cm > {MAX_BANQUETTE} cm — scission supplémentaire nécessaire.")
-
 # =====================================================================
 # ================  Outils légende & titres (lisibilité)  =============
 # =====================================================================
@@ -501,16 +470,12 @@ def draw_legend(t, tr, tx_cm, ty_cm, items=None, pos="top-right"):
 # =====================================================================
 
 def _lim_x(pts, key):
-    """Récupère x d’extrémité pour dessin coussins : supporte <key>, <key>_mer et <key>_."""
-    if f"{key}_mer" in pts: return pts[f"{key}_mer"][0]
-    if f"{key}_"   in pts: return pts[f"{key}_"][0]
-    return pts[key][0]
+    """x d’extrémité pour dessin coussins : <key>_mer / <key>_ déjà résolus à la construction (<key>_fin)."""
+    return getattr(pts, key + "_fin")[0]
 
 def _lim_y(pts, key):
-    """Récupère y d’extrémité pour dessin coussins : supporte <key>, <key>_mer et <key>_."""
-    if f"{key}_mer" in pts: return pts[f"{key}_mer"][1]
-    if f"{key}_"   in pts: return pts[f"{key}_"][1]
-    return pts[key][1]
+    """y d’extrémité pour dessin coussins : <key>_mer / <key>_ déjà résolus à la construction (<key>_fin)."""
+    return getattr(pts, key + "_fin")[1]
 
 # =====================================================================
 # ================  COUSSINS — moteur "valise" (utilitaires)  =========
@@ -595,16 +560,16 @@ def _draw_traversins_simple_S1(t, tr, pts, profondeur, dossier, traversins):
 
     n = 0
     if "g" in traversins:
-        x0 = pts["B0"][0]; x1 = x0 + TRAVERSIN_THK
+        x0 = pts.B0[0]; x1 = x0 + TRAVERSIN_THK
         _draw_traversin_block(t, tr, x0, y0, x1, y1); n += 1
     if "d" in traversins:
-        x1 = pts["Bx"][0]; x0 = x1 - TRAVERSIN_THK
+        x1 = pts.Bx[0]; x0 = x1 - TRAVERSIN_THK
         _draw_traversin_block(t, tr, x0, y0, x1, y1); n += 1
     return n
 
 def _draw_traversins_L_like(t, tr, pts, profondeur, traversins):
     if not traversins: return 0
-    F0x, F0y = pts["F0"]
+    F0x, F0y = pts.F0
     depth_len = min(TRAVERSIN_LEN, max(0.0, profondeur))
 
     n = 0
@@ -621,11 +586,11 @@ def _draw_traversins_L_like(t, tr, pts, profondeur, traversins):
     return n
 
 def _u_right_col_x(variant, pts):
-    return pts["Bx"][0] if variant in ("v1","v4") else pts["F02"][0]
+    return pts.Bx[0] if variant in ("v1","v4") else pts.F02[0]
 
 def _draw_traversins_U_common(t, tr, variant, pts, profondeur, traversins):
     if not traversins: return 0
-    F0x, F0y = pts["F0"]
+    F0x, F0y = pts.F0
     depth_len = min(TRAVERSIN_LEN, max(0.0, profondeur))
 
     n = 0
@@ -642,7 +607,7 @@ def _draw_traversins_U_common(t, tr, variant, pts, profondeur, traversins):
 
 def _draw_traversins_U_side_F02(t, tr, pts, profondeur, traversins):
     if not traversins: return 0
-    F0x, F0y = pts["F0"]; F02x = pts["F02"][0]
+    F0x, F0y = pts.F0; F02x = pts.F02[0]
     depth_len = min(TRAVERSIN_LEN, max(0.0, profondeur))
 
     n = 0
@@ -668,7 +633,7 @@ def _apply_traversin_limits_L_like(pts, x_end_key, y_end_key, traversins):
     return x_end, y_end
 
 def _eval_L_like_counts(pts, size_bas, size_g, shift_bas, x_end_key="Bx", y_end_key="By", traversins=None):
-    F0x, F0y = pts["F0"]
+    F0x, F0y = pts.F0
     x_end, y_end = _apply_traversin_limits_L_like(pts, x_end_key, y_end_key, traversins)
 
     xs = F0x + (CUSHION_DEPTH if shift_bas else 0)
@@ -690,7 +655,25 @@ def _eval_L_like_counts(pts, size_bas, size_g, shift_bas, x_end_key="Bx", y_end_
         "geom": {"xs": xs, "xe": xe, "y0": y0, "ye": ye}
     }
 
+def _lengths_L_like(pts, shift_bas, x_end_key="Bx", y_end_key="By", traversins=None):
+    F0x, F0y = pts.F0
+    x_end, y_end = _apply_traversin_limits_L_like(pts, x_end_key, y_end_key, traversins)
+    xs = F0x + (CUSHION_DEPTH if shift_bas else 0)
+    y0 = F0y + (0 if shift_bas else CUSHION_DEPTH)
+    return max(0, x_end - xs), max(0, y_end - y0)
+
 def _optimize_valise_L_like(pts, rng, same, x_end_key="Bx", y_end_key="By", traversins=None):
+    lengths = [_lengths_L_like(pts, sh, x_end_key, y_end_key, traversins) for sh in _SHIFTS_BAS]
+    found = _optimize_valise_cached(lengths, rng, same, traversins)
+    if not found:
+        return None
+    score, (size_b, size_g), winners = found
+    shift_bas = _SHIFTS_BAS[winners[0]]
+    e = _eval_L_like_counts(pts, size_b, size_g, shift_bas, x_end_key=x_end_key, y_end_key=y_end_key, traversins=traversins)
+    return {"score": score, "sizes": {"bas": size_b, "gauche": size_g}, "eval": e, "shift_bas": shift_bas}
+
+def _optimize_valise_L_like_loop(pts, rng, same, x_end_key="Bx", y_end_key="By", traversins=None):
+    """Version de référence (double boucle sg × sb) — sert aux vérifs / benchmarks."""
     best = None
     r0, r1 = rng
     for size_g in range(r0, r1+1):
@@ -708,7 +691,7 @@ def _optimize_valise_L_like(pts, rng, same, x_end_key="Bx", y_end_key="By", trav
     return best
 
 def _draw_L_like_with_sizes(t, tr, pts, sizes, shift_bas, x_end_key="Bx", y_end_key="By", traversins=None):
-    F0x, F0y = pts["F0"]
+    F0x, F0y = pts.F0
     x_end, y_end = _apply_traversin_limits_L_like(pts, x_end_key, y_end_key, traversins)
 
     # bas
@@ -735,12 +718,86 @@ def _draw_L_like_with_sizes(t, tr, pts, sizes, shift_bas, x_end_key="Bx", y_end_
 
     return nb + ng, sb, sg
 
+# ----- Évaluateur vectorisé + solveur "valise" (L-like / U / U2f / U1F) -----
+# Les longueurs utiles sont calculées une fois par combinaison de décalages ; l'évaluateur
+# renvoie nb / chute / couverture pour chaque côté × taille (NumPy), et toute combinaison
+# de tailles s'en déduit par somme sur les côtés.
+# Δ ≤ 5 <=> les tailles tiennent dans une fenêtre de 6 tailles consécutives ; dans une
+# fenêtre (décalages fixés), chaque côté choisit sa taille indépendamment (min chute,
+# puis plus grande) : O(côtés × fenêtre) au lieu du produit cartésien des tailles.
+_SHIFTS_LR = ((False, False), (False, True), (True, False), (True, True))
+_SHIFTS_BAS = (False, True)
+
+def _valise_windows(rng, same):
+    """Fenêtres [a..b] à explorer : tailles identiques si same, sinon largeur 6 (Δ ≤ 5)."""
+    r0, r1 = rng
+    if same:
+        return [(s, s) for s in range(r0, r1+1)]
+    return [(a, min(a+5, r1)) for a in range(r0, max(r0, r1-5)+1)]
+
+_VALISE_WIN_IDX = {}
+
+def _valise_window_index(rng, same):
+    """Indices (fenêtres × 6) des tailles de chaque fenêtre, de la plus grande à la plus petite."""
+    key = (rng, bool(same))
+    if key not in _VALISE_WIN_IDX:
+        r0 = rng[0]
+        _VALISE_WIN_IDX[key] = np.array([[max(b - i, a) - r0 for i in range(6)]
+                                         for a, b in _valise_windows(rng, same)], dtype=np.intp)
+    return _VALISE_WIN_IDX[key]
+
+def _eval_counts_grid(lengths, rng):
+    """
+    lengths : longueurs utiles, forme (décalages × côtés).
+    Retourne (counts, waste, cover) de forme (décalages × côtés × tailles r0..r1),
+    mêmes valeurs que _waste_and_count_1d pour chaque (longueur, taille).
+    """
+    r0, r1 = rng
+    L = np.asarray(lengths)[..., None]
+    sizes = np.arange(r0, r1+1)
+    counts = (L // sizes).astype(np.int64)
+    cover = counts * sizes
+    return counts, L - cover, cover
+
+def _optimize_valise_grid(lengths, rng, same):
+    """
+    Minimise (chute, -couverture, -s_1, -s_2, ...) sur décalages × tailles (Δ ≤ 5, ou same).
+    Retourne (score, sizes, gagnants) : sizes = tuple par côté, gagnants = indices des
+    décalages atteignant ce score (ordre croissant) ; None si aucune configuration.
+    """
+    r0, r1 = rng
+    if r0 > r1:
+        return None
+    _, waste, cover = _eval_counts_grid(lengths, rng)
+    win = _valise_window_index(rng, same)
+    nw = len(win)
+    # argmin renvoie le 1er minimum -> à chute égale, la plus grande taille de la fenêtre
+    pick = win[np.arange(nw), waste[..., win].argmin(axis=-1)]          # décalages × côtés × fenêtres
+    W = np.take_along_axis(waste, pick, axis=-1).sum(axis=1)            # décalages × fenêtres
+    C = np.take_along_axis(cover, pick, axis=-1).sum(axis=1)
+    keys = [-pick[:, i, :].ravel() for i in reversed(range(pick.shape[1]))] + [-C.ravel(), W.ravel()]
+    k, w = divmod(int(np.lexsort(keys)[0]), nw)
+    sizes = tuple(int(i) + r0 for i in pick[k, :, w])
+    score = (W[k, w].item(), -C[k, w].item()) + tuple(-s for s in sizes)
+    same_score = (W == W[k, w]) & (C == C[k, w]) & (pick == pick[k, :, w][None, :, None]).all(axis=1)
+    return score, sizes, tuple(int(i) for i in np.flatnonzero(same_score.any(axis=1)))
+
+def _optimize_valise_cached(lengths, rng, same, traversins=None):
+    """_optimize_valise_grid via le cache LRU partagé (plan_cache.PLAN_CACHE) ; résultat immuable."""
+    key = plan_key([tuple(L) for L in lengths], ("valise", tuple(rng)), same, traversins)
+    return PLAN_CACHE.get_or_compute(key, lambda: _optimize_valise_grid(lengths, rng, same))
+
+def _last_shiftL_first_shiftR(winners):
+    """Règle historique U/U1F : dernier shiftL gagnant, puis 1er shiftR pour ce shiftL."""
+    sl = winners[-1][0]
+    return next(w for w in winners if w[0] == sl)
+
 # ----- U2f : évaluation / dessin -----
 def _eval_U2f_counts(pts, sb, sg, sd, shiftL, shiftR, traversins=None):
-    F0x, F0y = pts["F0"]
-    F02x = pts["F02"][0]
-    y_end_L = pts.get("By_", pts["By"])[1]
-    y_end_R = pts.get("By4_", pts["By4"])[1]
+    F0x, F0y = pts.F0
+    F02x = pts.F02[0]
+    y_end_L = pts.By_fin[1]
+    y_end_R = pts.By4_fin[1]
     if traversins:
         if "g" in traversins: y_end_L -= TRAVERSIN_THK
         if "d" in traversins: y_end_R -= TRAVERSIN_THK
@@ -763,7 +820,32 @@ def _eval_U2f_counts(pts, sb, sg, sd, shiftL, shiftR, traversins=None):
             "waste": waste, "cover": cover,
             "geom": {"xs": xs, "xe": xe, "yL0": yL0, "yR0": yR0}}
 
+def _lengths_U2f(pts, shiftL, shiftR, traversins=None):
+    F0x, F0y = pts.F0
+    F02x = pts.F02[0]
+    y_end_L = pts.By_fin[1]
+    y_end_R = pts.By4_fin[1]
+    if traversins:
+        if "g" in traversins: y_end_L -= TRAVERSIN_THK
+        if "d" in traversins: y_end_R -= TRAVERSIN_THK
+    xs = F0x + (CUSHION_DEPTH if shiftL else 0)
+    xe = F02x - (CUSHION_DEPTH if shiftR else 0)
+    yL0 = F0y + (0 if shiftL else CUSHION_DEPTH)
+    yR0 = F0y + (0 if shiftR else CUSHION_DEPTH)
+    return max(0, xe - xs), max(0, y_end_L - yL0), max(0, y_end_R - yR0)
+
 def _optimize_valise_U2f(pts, rng, same, traversins=None):
+    lengths = [_lengths_U2f(pts, sl, sr, traversins) for sl, sr in _SHIFTS_LR]
+    found = _optimize_valise_cached(lengths, rng, same, traversins)
+    if not found:
+        return None
+    score, (sb, sg, sd), winners = found
+    sl, sr = _SHIFTS_LR[winners[0]]
+    e = _eval_U2f_counts(pts, sb, sg, sd, sl, sr, traversins=traversins)
+    return {"score": score, "sizes": {"bas": sb, "gauche": sg, "droite": sd}, "eval": e, "shiftL": sl, "shiftR": sr}
+
+def _optimize_valise_U2f_loop(pts, rng, same, traversins=None):
+    """Version de référence (triple boucle sg × sb × sd) — sert aux vérifs / benchmarks."""
     best=None; r0,r1=rng
     for sg in range(r0, r1+1):
         cand_b = [sg] if same else range(r0, r1+1)
@@ -791,10 +873,10 @@ def _optimize_valise_U2f(pts, rng, same, traversins=None):
     return best
 
 def _draw_U2f_with_sizes(t, tr, pts, sizes, shiftL, shiftR, traversins=None):
-    F0x, F0y = pts["F0"]
-    F02x = pts["F02"][0]
-    y_end_L = pts.get("By_", pts["By"])[1]
-    y_end_R = pts.get("By4_", pts["By4"])[1]
+    F0x, F0y = pts.F0
+    F02x = pts.F02[0]
+    y_end_L = pts.By_fin[1]
+    y_end_R = pts.By4_fin[1]
     if traversins:
         if "g" in traversins: y_end_L -= TRAVERSIN_THK
         if "d" in traversins: y_end_R -= TRAVERSIN_THK
@@ -830,10 +912,10 @@ def _draw_U2f_with_sizes(t, tr, pts, sizes, shiftL, shiftR, traversins=None):
     return nb+ng+nd
 
 def _draw_cushions_U2f_optimized(t, tr, pts, size, traversins=None):
-    F0x, F0y = pts["F0"]
-    F02x = pts["F02"][0]
-    y_end_L = pts.get("By_", pts["By"])[1]
-    y_end_R = pts.get("By4_", pts["By4"])[1]
+    F0x, F0y = pts.F0
+    F02x = pts.F02[0]
+    y_end_L = pts.By_fin[1]
+    y_end_R = pts.By4_fin[1]
     if traversins:
         if "g" in traversins: y_end_L -= TRAVERSIN_THK
         if "d" in traversins: y_end_R -= TRAVERSIN_THK
@@ -884,8 +966,8 @@ def _draw_cushions_U2f_optimized(t, tr, pts, size, traversins=None):
 
 # ----- U1F : évaluation / dessin -----
 def _eval_U1F_counts(pts, sb, sg, sd, shiftL, shiftR, traversins=None):
-    F0x, F0y = pts["F0"]; F02x = pts["F02"][0]
-    y_end_L = pts["By_cush"][1]; y_end_R = pts["By4_cush"][1]
+    F0x, F0y = pts.F0; F02x = pts.F02[0]
+    y_end_L = pts.By_cush[1]; y_end_R = pts.By4_cush[1]
     if traversins:
         if "g" in traversins: y_end_L -= TRAVERSIN_THK
         if "d" in traversins: y_end_R -= TRAVERSIN_THK
@@ -900,7 +982,29 @@ def _eval_U1F_counts(pts, sb, sg, sd, shiftL, shiftR, traversins=None):
     waste = wb+wg+wd; cover=nb*sb+ng*sg+nd*sd
     return {"counts":{"bas":nb,"gauche":ng,"droite":nd},"waste":waste,"cover":cover}
 
+def _lengths_U1F(pts, shiftL, shiftR, traversins=None):
+    F0x, F0y = pts.F0; F02x = pts.F02[0]
+    y_end_L = pts.By_cush[1]; y_end_R = pts.By4_cush[1]
+    if traversins:
+        if "g" in traversins: y_end_L -= TRAVERSIN_THK
+        if "d" in traversins: y_end_R -= TRAVERSIN_THK
+    xs = F0x + (CUSHION_DEPTH if shiftL else 0)
+    xe = F02x - (CUSHION_DEPTH if shiftR else 0)
+    yL0 = F0y + (0 if shiftL else CUSHION_DEPTH)
+    yR0 = F0y + (0 if shiftR else CUSHION_DEPTH)
+    return max(0, xe-xs), max(0, y_end_L-yL0), max(0, y_end_R-yR0)
+
 def _optimize_valise_U1F(pts, rng, same, traversins=None):
+    lengths = [_lengths_U1F(pts, sl, sr, traversins) for sl, sr in _SHIFTS_LR]
+    found = _optimize_valise_cached(lengths, rng, same, traversins)
+    if not found:
+        return None
+    score, (sb, sg, sd), winners = found
+    shifts = _last_shiftL_first_shiftR([_SHIFTS_LR[k] for k in winners])
+    return {"score": score, "sizes": {"bas": sb, "gauche": sg, "droite": sd}, "shifts": shifts}
+
+def _optimize_valise_U1F_loop(pts, rng, same, traversins=None):
+    """Version de référence (triple boucle sg × sb × sd) — sert aux vérifs / benchmarks."""
     best=None; r0,r1=rng
     for sg in range(r0,r1+1):
         for sb in ([sg] if same else range(r0,r1+1)):
@@ -927,8 +1031,8 @@ def _optimize_valise_U1F(pts, rng, same, traversins=None):
     return best
 
 def _draw_U1F_with_sizes(t,tr,pts,sizes,shiftL,shiftR,traversins=None):
-    F0x, F0y = pts["F0"]; F02x=pts["F02"][0]
-    y_end_L = pts["By_cush"][1]; y_end_R=pts["By4_cush"][1]
+    F0x, F0y = pts.F0; F02x=pts.F02[0]
+    y_end_L = pts.By_cush[1]; y_end_R=pts.By4_cush[1]
     if traversins:
         if "g" in traversins: y_end_L -= TRAVERSIN_THK
         if "d" in traversins: y_end_R -= TRAVERSIN_THK
@@ -966,18 +1070,18 @@ def _draw_U1F_with_sizes(t,tr,pts,sizes,shiftL,shiftR,traversins=None):
 # ----- U (no fromage) : fonctions de choix et dessin coussins -----
 def _u_variant_x_end(variant, pts):
     if variant in ("v1","v4"):
-        return pts["Bx"][0]
+        return pts.Bx[0]
     else:
-        return pts["F02"][0]
+        return pts.F02[0]
 
 def _eval_U_counts(variant, pts, drawn, sb, sg, sd, shiftL, shiftR, traversins=None):
-    F0x, F0y = pts["F0"]
+    F0x, F0y = pts.F0
     x_end = _u_variant_x_end(variant, pts)
     xs = F0x + (CUSHION_DEPTH if shiftL else 0)
     xe = x_end - (CUSHION_DEPTH if shiftR else 0)
 
-    y_end_L = pts["By"][1]
-    y_end_R = pts["By4"][1]
+    y_end_L = pts.By[1]
+    y_end_R = pts.By4[1]
     if traversins:
         if "g" in traversins: y_end_L -= TRAVERSIN_THK
         if "d" in traversins: y_end_R -= TRAVERSIN_THK
@@ -992,7 +1096,32 @@ def _eval_U_counts(variant, pts, drawn, sb, sg, sd, shiftL, shiftR, traversins=N
     cover = nb*sb + ng*sg + nd*sd
     return {"counts":{"bas":nb,"gauche":ng,"droite":nd}, "waste":waste, "cover":cover}
 
+def _lengths_U(variant, pts, drawn, shiftL, shiftR, traversins=None):
+    F0x, F0y = pts.F0
+    x_end = _u_variant_x_end(variant, pts)
+    xs = F0x + (CUSHION_DEPTH if shiftL else 0)
+    xe = x_end - (CUSHION_DEPTH if shiftR else 0)
+    y_end_L = pts.By[1]
+    y_end_R = pts.By4[1]
+    if traversins:
+        if "g" in traversins: y_end_L -= TRAVERSIN_THK
+        if "d" in traversins: y_end_R -= TRAVERSIN_THK
+    yL0 = F0y + (0 if (not drawn.get("D1", False) or shiftL) else CUSHION_DEPTH)
+    has_right = drawn.get("D4", False) or drawn.get("D5", False)
+    yR0 = F0y + (0 if (not has_right or shiftR) else CUSHION_DEPTH)
+    return max(0, xe - xs), max(0, y_end_L - yL0), max(0, y_end_R - yR0)
+
 def _optimize_valise_U(variant, pts, drawn, rng, same, traversins=None):
+    lengths = [_lengths_U(variant, pts, drawn, sl, sr, traversins) for sl, sr in _SHIFTS_LR]
+    found = _optimize_valise_cached(lengths, rng, same, traversins)
+    if not found:
+        return None
+    score, (sb, sg, sd), winners = found
+    sl, sr = _last_shiftL_first_shiftR([_SHIFTS_LR[k] for k in winners])
+    return {"score": score, "sizes": {"bas": sb, "gauche": sg, "droite": sd}, "shiftL": sl, "shiftR": sr}
+
+def _optimize_valise_U_loop(variant, pts, drawn, rng, same, traversins=None):
+    """Version de référence (triple boucle sg × sb × sd) — sert aux vérifs / benchmarks."""
     best=None; r0,r1=rng
     for sg in range(r0,r1+1):
         for sb in ([sg] if same else range(r0,r1+1)):
@@ -1019,7 +1148,7 @@ def _optimize_valise_U(variant, pts, drawn, rng, same, traversins=None):
     return best
 
 def _draw_U_with_sizes(variant, t, tr, pts, sizes, drawn, shiftL, shiftR, traversins=None):
-    F0x, F0y = pts["F0"]
+    F0x, F0y = pts.F0
     x_end = _u_variant_x_end(variant, pts)
     # Bas
     xs = F0x + (CUSHION_DEPTH if shiftL else 0)
@@ -1032,7 +1161,7 @@ def _draw_U_with_sizes(variant, t, tr, pts, sizes, drawn, shiftL, shiftR, traver
         nb+=1; x+=sb
 
     # Gauche
-    y_end_L = pts["By"][1]
+    y_end_L = pts.By[1]
     if traversins and "g" in traversins: y_end_L -= TRAVERSIN_THK
     yL0 = F0y + (0 if (not drawn.get("D1", False) or shiftL) else CUSHION_DEPTH)
     sg = sizes["gauche"]; ng=0; xg=F0x; y_=yL0
@@ -1043,12 +1172,12 @@ def _draw_U_with_sizes(variant, t, tr, pts, sizes, drawn, shiftL, shiftR, traver
         ng+=1; y_+=sg
 
     # Droite
-    y_end_R = pts["By4"][1]
+    y_end_R = pts.By4[1]
     if traversins and "d" in traversins: y_end_R -= TRAVERSIN_THK
     has_right = drawn.get("D4", False) or drawn.get("D5", False)
     yR0 = F0y + (0 if (not has_right or shiftR) else CUSHION_DEPTH)
     sd = sizes["droite"]; nd=0
-    x_col = (pts["Bx"][0] if variant in ("v1","v4") else pts["F02"][0])
+    x_col = (pts.Bx[0] if variant in ("v1","v4") else pts.F02[0])
     y_=yR0
     while y_ + sd <= y_end_R + 1e-6:
         poly=[(x_col-CUSHION_DEPTH,y_),(x_col,y_),(x_col,y_+sd),(x_col-CUSHION_DEPTH,y_+sd),(x_col-CUSHION_DEPTH,y_)]
@@ -1060,19 +1189,26 @@ def _draw_U_with_sizes(variant, t, tr, pts, sizes, drawn, shiftL, shiftR, traver
 
 # ----- Simple S1 -----
 def _optimize_valise_simple(pts, rng, mer_side=None, mer_len=0, traversins=None):
-    x0 = pts["B0"][0]; x1 = pts["Bx"][0]
+    x0 = pts.B0[0]; x1 = pts.Bx[0]
     if mer_side == 'g' and mer_len>0:
-        x0 = max(x0, pts.get("B0_m", (x0,0))[0])
+        x0 = max(x0, pts.B0_fin[0])
     if mer_side == 'd' and mer_len>0:
-        x1 = min(x1, pts.get("Bx_m", (x1,0))[0])
+        x1 = min(x1, pts.Bx_fin[0])
     if traversins:
         if "g" in traversins: x0 += TRAVERSIN_THK
         if "d" in traversins: x1 -= TRAVERSIN_THK
 
+    lengths = (max(0, x1-x0), max(0, x1-(x0+CUSHION_DEPTH)))
+    key = plan_key(lengths, ("simple", tuple(rng)), False, traversins)
+    best = PLAN_CACHE.get_or_compute(key, lambda: _optimize_valise_simple_lengths(lengths, rng))
+    return dict(best) if best else best
+
+def _optimize_valise_simple_lengths(lengths, rng):
+    len0, len1 = lengths
     best=None; r0,r1=rng
     for s in range(r0, r1+1):
-        n0, w0 = _waste_and_count_1d(max(0, x1-x0), s)
-        n1, w1 = _waste_and_count_1d(max(0, x1-(x0+CUSHION_DEPTH)), s)
+        n0, w0 = _waste_and_count_1d(len0, s)
+        n1, w1 = _waste_and_count_1d(len1, s)
         if w1 < w0 or (w1==w0 and n1>n0):
             n, waste, off = n1, w1, CUSHION_DEPTH
         else:
@@ -1083,11 +1219,11 @@ def _optimize_valise_simple(pts, rng, mer_side=None, mer_len=0, traversins=None)
     return best
 
 def _draw_simple_with_size(t,tr,pts,size,mer_side=None,mer_len=0, traversins=None):
-    x0 = pts["B0"][0]; x1 = pts["Bx"][0]
+    x0 = pts.B0[0]; x1 = pts.Bx[0]
     if mer_side == 'g' and mer_len>0:
-        x0 = max(x0, pts.get("B0_m", (x0,0))[0])
+        x0 = max(x0, pts.B0_fin[0])
     if mer_side == 'd' and mer_len>0:
-        x1 = min(x1, pts.get("Bx_m", pts["Bx"])[0])
+        x1 = min(x1, pts.Bx_fin[0])
     if traversins:
         if "g" in traversins: x0 += TRAVERSIN_THK
         if "d" in traversins: x1 -= TRAVERSIN_THK
@@ -1095,7 +1231,7 @@ def _draw_simple_with_size(t,tr,pts,size,mer_side=None,mer_len=0, traversins=Non
     n0, w0 = _waste_and_count_1d(max(0,x1-x0), size)
     n1, w1 = _waste_and_count_1d(max(0,x1-(x0+CUSHION_DEPTH)), size)
     off = CUSHION_DEPTH if (w1 < w0 or (w1==w0 and n1>n0)) else 0
-    x = x0 + off; y = pts["B0"][1]; n=0
+    x = x0 + off; y = pts.B0[1]; n=0
     while x + size <= x1 + 1e-6:
         poly=[(x,y),(x+size,y),(x+size,y+CUSHION_DEPTH),(x,y+CUSHION_DEPTH),(x,y)]
         draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
@@ -1106,76 +1242,13 @@ def _draw_simple_with_size(t,tr,pts,size,mer_side=None,mer_len=0, traversins=Non
 # =====================================================================
 # =======================  LF (L avec angle fromage)  ==================
 # =====================================================================
-def compute_points_LF_variant(tx, ty, profondeur=DEPTH_STD,
-                              dossier_left=True, dossier_bas=True,
-                              acc_left=True, acc_bas=True,
-                              meridienne_side=None, meridienne_len=0):
-    A = profondeur + 20
-    prof = profondeur
-    pts = {}
-    if dossier_left and dossier_bas:
-        F0x, F0y = 10, 10
-    elif (not dossier_left) and dossier_bas:
-        F0x, F0y = 0, 10
-    elif dossier_left and (not dossier_bas):
-        F0x, F0y = 10, 0
-    else:
-        F0x, F0y = 0, 0
-
-    pts["F0"]  = (F0x, F0y)
-    pts["Fy"]  = (F0x, F0y + A)
-    pts["Fx"]  = (F0x + A, F0y)
-    pts["Fy2"] = (F0x + prof, F0y + A)
-    pts["Fx2"] = (F0x + A, F0y + prof)
-
-    top_y = ty - (ACCOUDOIR_THICK if acc_left else 0)
-    pts["By"]  = (F0x, top_y)
-    pts["By2"] = (F0x + prof, top_y)
-
-    pts["D0"]  = (0, 0)
-    pts["D0x"] = (F0x, 0)
-    pts["D0y"] = (0, F0y)
-    pts["Dy"]  = (0, F0y + A)
-    pts["Dy2"] = (0, top_y)
-
-    pts["Ay"]  = (0, ty)
-    pts["Ay2"] = (F0x + prof, ty)
-    pts["Ay_"] = (F0x, ty)
-
-    banq_stop_x = tx - (ACCOUDOIR_THICK if acc_bas else 0)
-    pts["Dx"]  = (F0x + A, 0)
-    pts["Dx2"] = (banq_stop_x, 0)
-    pts["Bx"]  = (banq_stop_x, F0y)
-    pts["Bx2"] = (banq_stop_x, F0y + prof)
-
-    pts["Ax"]  = (tx, 0)
-    pts["Ax2"] = (tx, F0y + prof)
-    pts["Ax_"] = (tx, F0y)
-
-    if meridienne_side == 'b' and meridienne_len > 0:
-        dx2_stop = min(banq_stop_x, tx - meridienne_len)
-        pts["Dx2"] = (dx2_stop, 0)
-        pts["Bx_"] = (tx - meridienne_len, F0y)
-
-    if meridienne_side == 'g' and meridienne_len > 0:
-        mer_y = max(F0y + A, top_y - meridienne_len); mer_y = min(mer_y, top_y)
-        pts["By_"] = (F0x, mer_y)
-        pts["Dy2"] = (0, min(top_y, mer_y))
-
-    if dossier_left and not dossier_bas:
-        pts["D0y"] = (0, 0)
-    if dossier_bas and not dossier_left:
-        pts["D0x"] = (0, 0)
-
-    return pts
-
 def _choose_cushion_size_auto(pts, tx, ty, meridienne_side=None, meridienne_len=0, traversins=None):
-    xF, yF = pts["F0"]
-    x_end = pts.get("Bx_", pts.get("Bx", (tx, yF)))[0]
+    xF, yF = pts.F0
+    x_end = pts.Bx_fin[0]
     if meridienne_side == 'b' and meridienne_len > 0:
         x_end = min(x_end, tx - meridienne_len)
     y_start = yF + CUSHION_DEPTH
-    y_end = pts.get("By_", pts.get("By", (xF, ty)))[1]
+    y_end = pts.By_fin[1]
     if traversins:
         if "b" in traversins: x_end -= TRAVERSIN_THK
         if "g" in traversins: y_end -= TRAVERSIN_THK
@@ -1195,9 +1268,9 @@ def draw_cousins_and_return_count(t, tr, pts, tx, ty, coussins, meridienne_side,
     else:
         size = int(coussins)
 
-    F0x, F0y = pts["F0"]
-    x_end = pts.get("Bx_", pts.get("Bx", (tx, F0y)))[0]
-    y_end = pts.get("By_", pts.get("By", (F0x, ty)))[1]
+    F0x, F0y = pts.F0
+    x_end = pts.Bx_fin[0]
+    y_end = pts.By_fin[1]
     if traversins:
         if "b" in traversins: x_end -= TRAVERSIN_THK
         if "g" in traversins: y_end -= TRAVERSIN_THK
@@ -1234,66 +1307,6 @@ def draw_cousins_and_return_count(t, tr, pts, tx, ty, coussins, meridienne_side,
 
     return count, size
 
-def build_polys_LF_variant(pts, tx, ty, profondeur=DEPTH_STD,
-                           dossier_left=True, dossier_bas=True,
-                           acc_left=True, acc_bas=True,
-                           meridienne_side=None, meridienne_len=0):
-    polys={"angle":[],"banquettes":[],"dossiers":[],"accoudoirs":[]}
-
-    angle=[pts["F0"],pts["Fx"],pts["Fx2"],pts["Fy2"],pts["Fy"],pts["F0"]]
-    polys["angle"].append(angle)
-
-    ban_g=[pts["Fy"],pts["Fy2"],pts["By2"],pts["By"],pts["Fy"]]
-    Lg=abs(pts["By"][1]-pts["Fy"][1])
-    split_g = False
-    if Lg>SPLIT_THRESHOLD:
-        split_g = True
-        mid_y=_split_mid_int(pts["Fy"][1],pts["By"][1])
-        Fy_mid=(pts["Fy"][0],mid_y); Fy2_mid=(pts["Fy2"][0],mid_y)
-        polys["banquettes"]+=[
-            [pts["Fy"],pts["Fy2"],Fy2_mid,Fy_mid,pts["Fy"]],
-            [Fy_mid,Fy2_mid,pts["By2"],pts["By"],Fy_mid]
-        ]
-    else:
-        polys["banquettes"].append(ban_g)
-
-    ban_b=[pts["Fx"],pts["Fx2"],pts["Bx2"],pts["Bx"],pts["Fx"]]
-    Lb=abs(pts["Bx"][0]-pts["Fx"][0])
-    split_b = False
-    if Lb>SPLIT_THRESHOLD:
-        split_b = True
-        mid_x=_split_mid_int(pts["Fx"][0],pts["Bx"][0])
-        Fx_mid=(mid_x,pts["Fx"][1]); Fx2_mid=(mid_x,pts["Fx2"][1])
-        polys["banquettes"]+=[
-            [pts["Fx"],pts["Fx2"],Fx2_mid,Fx_mid,pts["Fx"]],
-            [Fx_mid,Fx2_mid,pts["Bx2"],pts["Bx"],Fx_mid]
-        ]
-    else:
-        polys["banquettes"].append(ban_b)
-
-    if dossier_left:
-        dos_g_from=[pts["D0"],pts["D0x"],pts["F0"],pts["Fy"],pts["Dy"],pts["D0"]] if dossier_bas \
-            else [pts["D0y"],pts["F0"],pts["Fy"],pts["Dy"],pts["D0y"]]
-        dos_g_banc=[pts["Dy"],pts["Dy2"],pts.get("By_",pts["By"]),pts["Fy"],pts["Dy"]]
-        polys["dossiers"]+=[dos_g_from,dos_g_banc]
-    if dossier_bas:
-        dos_b_from=[pts["D0x"],pts["Dx"],pts["Fx"],pts["F0"],pts["D0x"]] if dossier_left \
-            else [pts["D0x"],pts["F0"],pts["Fx"],pts["Dx"],pts["D0x"]]
-        dos_b_banc=[pts["Dx"],pts["Dx2"],pts.get("Bx_",pts["Bx"]),pts["Fx"],pts["Dx"]]
-        polys["dossiers"]+=[dos_b_from,dos_b_banc]
-
-    if acc_left:
-        acc_g=[pts["Dy2"],pts["Ay"],pts["Ay2"],pts["By2"],pts["Dy2"]] if dossier_left \
-            else [pts["By"],pts["Ay_"],pts["Ay2"],pts["By2"],pts["By"]]
-        polys["accoudoirs"].append(acc_g)
-    if acc_bas:
-        acc_b=[pts["Dx2"],pts["Ax"],pts["Ax2"],pts["Bx2"],pts["Dx2"]] if dossier_bas \
-            else [pts["Bx"],pts["Ax_"],pts["Ax2"],pts["Bx2"],pts["Bx"]]
-        polys["accoudoirs"].append(acc_b)
-
-    polys["split_flags"]={"left":split_g,"bottom":split_b,"right":False}
-    return polys
-
 def render_LF_variant(tx, ty, profondeur=DEPTH_STD,
                       dossier_left=True, dossier_bas=True,
                       acc_left=True, acc_bas=True,
@@ -1302,18 +1315,11 @@ def render_LF_variant(tx, ty, profondeur=DEPTH_STD,
                       traversins=None,
                       couleurs=None,
                       window_title="LF — variantes"):
-    if meridienne_side == 'g' and acc_left:
-        raise ValueError("Erreur: une méridienne gauche ne peut pas coexister avec un accoudoir gauche.")
-    if meridienne_side == 'b' and acc_bas:
-        raise ValueError("Erreur: une méridienne bas ne peut pas coexister avec un accoudoir bas.")
+    pts, polys, _ = geometrie("LF", None, tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
 
     trv = _parse_traversins_spec(traversins, allowed={"g","b"})
     legend_items = _resolve_and_apply_colors(couleurs)
 
-    pts=compute_points_LF_variant(tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
-    polys=build_polys_LF_variant(pts,tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
-    _assert_banquettes_max_250(polys)
-
     screen=turtle.Screen(); screen.setup(WIN_W,WIN_H)
     screen.title(f"{window_title} — {tx}x{ty} cm — prof={profondeur} — méridienne {meridienne_side or '-'}={meridienne_len} — coussins={coussins}")
     t=turtle.Turtle(visible=False); t.speed(0); screen.tracer(False)
@@ -1334,7 +1340,7 @@ def render_LF_variant(tx, ty, profondeur=DEPTH_STD,
 
     banquette_sizes=[]
     if polys["angle"]:
-        side=int(round(pts["Fy"][1]-pts["F0"][1])); label_poly(t,tr,polys["angle"][0],f"{side}×{side} cm")
+        side=int(round(pts.Fy[1]-pts.F0[1])); label_poly(t,tr,polys["angle"][0],f"{side}×{side} cm")
     for poly in polys["banquettes"]:
         L,P=banquette_dims(poly); text=f"{L}×{P} cm"; banquette_sizes.append((L,P))
         xs=[p[0] for p in poly]; ys=[p[1] for p in poly]; bb_w=max(xs)-min(xs); bb_h=max(ys)-min(ys)
@@ -1380,116 +1386,6 @@ def render_LF_variant(tx, ty, profondeur=DEPTH_STD,
 # =====================================================================
 # ========================  U2f (2 angles fromage)  ====================
 # =====================================================================
-def compute_points_U2f(tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                       dossier_left=True, dossier_bas=True, dossier_right=True,
-                       acc_left=True, acc_bas=True, acc_right=True,
-                       meridienne_side=None, meridienne_len=0):
-    A = profondeur + 20
-    pts = {}
-    pts["D0"]=(0,0); pts["D0x"]=(10,0); pts["D0y"]=(0,10)
-    pts["F0"]=(10,10); pts["Fy"]=(10,10+A); pts["Fy2"]=(10+profondeur, 10+A)
-    pts["Fx"]=(10+A,10); pts["Fx2"]=(10+A,10+profondeur)
-
-    top_y_L = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
-    pts["Dy"]=(0,10+A); pts["Dy2"]=(0, top_y_L)
-    pts["By"]=(10, top_y_L); pts["By2"]=(10+profondeur, top_y_L)
-    pts["Ay"]=(0, ty_left); pts["Ay2"]=(10+profondeur, ty_left); pts["Ay_"]=(10, ty_left)
-
-    BxL = tx - A - 10
-    pts["Dx"]=(10+A,0); pts["Dx2"]=(BxL,0)
-    pts["Bx"]=(BxL,10); pts["Bx2"]=(BxL,10+profondeur)
-
-    F02x = tx - 10
-    pts["F02"]=(F02x,10); pts["Fy4"]=(F02x,10+A); pts["Fy3"]=(F02x - profondeur, 10+A)
-    top_y_R = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
-    pts["By3"]=(pts["Fy3"][0], top_y_R); pts["By4"]=(F02x, top_y_R)
-    pts["D02"]=(tx,0); pts["D02y"]=(tx,10); pts["Dy_r"]=(tx,10+A); pts["Dy2_r"]=(tx, top_y_R)
-    pts["Ax"]=(pts["By3"][0], tz_right); pts["Ax2"]=(tx, tz_right); pts["Ax_par"]=(tx - 10, tz_right)
-
-    if meridienne_side == 'g' and meridienne_len > 0:
-        mer_y_L = max(10 + A, ty_left - meridienne_len); mer_y_L = min(mer_y_L, top_y_L)
-        pts["By_"]=(pts["By"][0], mer_y_L); pts["By2_"]=(pts["By2"][0], mer_y_L)
-        pts["Dy2"]=(0, mer_y_L)
-    if meridienne_side == 'd' and meridienne_len > 0:
-        mer_y_R = max(10 + A, tz_right - meridienne_len); mer_y_R = min(mer_y_R, top_y_R)
-        pts["By4_"]=(pts["By4"][0], mer_y_R); pts["Dy2_r"]=(tx, mer_y_R)
-
-    pts["_ty_canvas"] = max(ty_left, tz_right)
-    return pts
-
-def build_polys_U2f(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                    dossier_left=True, dossier_bas=True, dossier_right=True,
-                    acc_left=True, acc_bas=True, acc_right=True):
-    polys = {"angles": [], "banquettes": [], "dossiers": [], "accoudoirs": []}
-
-    angle_L = [pts["F0"], pts["Fx"], pts["Fx2"], pts["Fy2"], pts["Fy"], pts["F0"]]
-    polys["angles"].append(angle_L)
-    angle_R = [pts["Bx2"], pts["Bx"], pts["F02"], pts["Fy4"], pts["Fy3"], pts["Bx2"]]
-    polys["angles"].append(angle_R)
-
-    # G
-    ban_g = [pts["Fy"], pts["Fy2"], pts["By2"], pts["By"], pts["Fy"]]
-    Lg = abs(pts["By"][1] - pts["Fy"][1])
-    split_g = False
-    if Lg > SPLIT_THRESHOLD:
-        split_g = True
-        mid_y = _split_mid_int(pts["Fy"][1], pts["By"][1])
-        Fy_mid  = (pts["Fy"][0],  mid_y); Fy2_mid = (pts["Fy2"][0], mid_y)
-        polys["banquettes"] += [[pts["Fy"],pts["Fy2"],Fy2_mid,Fy_mid,pts["Fy"]],
-                                [Fy_mid,Fy2_mid,pts["By2"],pts["By"],Fy_mid]]
-    else:
-        polys["banquettes"].append(ban_g)
-
-    # Bas
-    ban_b = [pts["Fx"], pts["Fx2"], pts["Bx2"], pts["Bx"], pts["Fx"]]
-    Lb = abs(pts["Bx"][0] - pts["Fx"][0])
-    split_b = False
-    if Lb > SPLIT_THRESHOLD:
-        split_b = True
-        mid_x = _split_mid_int(pts["Fx"][0], pts["Bx"][0])
-        Fx_mid  = (mid_x, pts["Fx"][1]); Fx2_mid = (mid_x, pts["Fx2"][1])
-        polys["banquettes"] += [[pts["Fx"],pts["Fx2"],Fx2_mid,Fx_mid,pts["Fx"]],
-                                [Fx_mid,Fx2_mid,pts["Bx2"],pts["Bx"],Fx_mid]]
-    else:
-        polys["banquettes"].append(ban_b)
-
-    # Droite
-    ban_r = [pts["Fy3"], pts["By3"], pts["By4"], pts["Fy4"], pts["Fy3"]]
-    Lr = abs(pts["By4"][1] - pts["Fy4"][1])
-    split_r = False
-    if Lr > SPLIT_THRESHOLD:
-        split_r = True
-        mid_y = _split_mid_int(pts["Fy4"][1], pts["By4"][1])
-        Fy3_mid = (pts["Fy3"][0], mid_y); Fy4_mid = (pts["Fy4"][0], mid_y)
-        polys["banquettes"] += [[pts["Fy3"],Fy3_mid,Fy4_mid,pts["Fy4"],pts["Fy3"]],
-                                [Fy3_mid,pts["By3"],pts["By4"],Fy4_mid,Fy3_mid]]
-    else:
-        polys["banquettes"].append(ban_r)
-
-    if dossier_left:
-        polys["dossiers"].append([pts["D0"], pts["D0x"], pts["F0"], pts["Fy"], pts["Dy"], pts["D0"]])
-        polys["dossiers"].append([pts["Dy"], pts["Dy2"], pts.get("By_", pts["By"]), pts["Fy"], pts["Dy"]])
-    if dossier_bas:
-        polys["dossiers"].append([pts["D0x"], pts["Dx"], pts["Fx"], pts["F0"], pts["D0x"]])
-        polys["dossiers"].append([pts["Dx"], pts["Dx2"], pts["Bx"], pts["Fx"], pts["Dx"]])
-        polys["dossiers"].append([pts["Dx2"], pts["Bx"], pts["D02y"], pts["D02"], pts["Dx2"]])
-    if dossier_right:
-        polys["dossiers"].append([pts["D02y"], pts["F02"], pts["Fy4"], pts["Dy_r"], pts["D02y"]])
-        polys["dossiers"].append([pts["Dy_r"], pts["Fy4"], pts.get("By4_", pts["By4"]), pts["Dy2_r"], pts["Dy_r"]])
-
-    if acc_left and dossier_left:
-        polys["accoudoirs"].append([pts["Dy2"], pts["Ay"], pts["Ay2"], pts["By2"], pts["Dy2"]])
-    elif acc_left and not dossier_left:
-        polys["accoudoirs"].append([pts["By"], pts["Ay_"], pts["Ay2"], pts["By2"], pts["By"]])
-
-    if acc_right and dossier_right:
-        polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax2"], pts["Dy2_r"], pts["By3"]])
-    elif acc_right and not dossier_right:
-        polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts.get("Ax_par", (tx-10, max(ty_left, tz_right))), pts["By4"], pts["By3"]])
-
-    polys["split_flags"]={"left":split_g,"bottom":split_b,"right":split_r}
-    return polys
-
 def _draw_cushions_U2f_optimized_wrapper(t, tr, pts, size, traversins=None):
     return _draw_cushions_U2f_optimized(t, tr, pts, size, traversins=traversins)
 
@@ -1501,24 +1397,15 @@ def render_U2f_variant(tx, ty_left, tz_right, profondeur=DEPTH_STD,
                        traversins=None,
                        couleurs=None,
                        window_title="U2F — variantes"):
-    if meridienne_side == 'g' and acc_left:
-        raise ValueError("Erreur: une méridienne gauche ne peut pas coexister avec un accoudoir gauche.")
-    if meridienne_side == 'd' and acc_right:
-        raise ValueError("Erreur: une méridienne droite ne peut pas coexister avec un accoudoir droit.")
+    pts, polys, _ = geometrie("U2F", None, tx, ty_left, tz_right, profondeur,
+                              dossier_left, dossier_bas, dossier_right,
+                              acc_left, acc_bas, acc_right,
+                              meridienne_side, meridienne_len)
 
     trv = _parse_traversins_spec(traversins, allowed={"g","d"})
     legend_items = _resolve_and_apply_colors(couleurs)
 
-    pts = compute_points_U2f(tx, ty_left, tz_right, profondeur,
-                             dossier_left, dossier_bas, dossier_right,
-                             acc_left, acc_bas, acc_right,
-                             meridienne_side, meridienne_len)
-    polys = build_polys_U2f(pts, tx, ty_left, tz_right, profondeur,
-                            dossier_left, dossier_bas, dossier_right,
-                            acc_left, acc_bas, acc_right)
-    _assert_banquettes_max_250(polys)
-
-    ty_canvas = pts["_ty_canvas"]
+    ty_canvas = pts._ty_canvas
     screen = turtle.Screen(); screen.setup(WIN_W, WIN_H)
     screen.title(f"{window_title} — tx={tx} / ty(left)={ty_left} / tz(right)={tz_right} — prof={profondeur}")
     t = turtle.Turtle(visible=False); t.speed(0); screen.tracer(False)
@@ -1559,9 +1446,9 @@ def render_U2f_variant(tx, ty_left, tz_right, profondeur=DEPTH_STD,
     spec = _parse_coussins_spec(coussins)
     if spec["mode"] == "auto":
         # ancien auto (65,80,90)
-        F0x, F0y = pts["F0"]; F02x = pts["F02"][0]
-        y_end_L = pts.get("By_", pts["By"])[1]
-        y_end_R = pts.get("By4_", pts["By4"])[1]
+        F0x, F0y = pts.F0; F02x = pts.F02[0]
+        y_end_L = pts.By_fin[1]
+        y_end_R = pts.By4_fin[1]
         if trv:
             if "g" in trv: y_end_L -= TRAVERSIN_THK
             if "d" in trv: y_end_R -= TRAVERSIN_THK
@@ -1617,37 +1504,11 @@ def render_U2f_variant(tx, ty_left, tz_right, profondeur=DEPTH_STD,
 # =====================================================================
 # (version validée + palette + légende U en haut-centre)
 
-def _split_banquette_if_needed_U1F(poly):
-    xs=[p[0] for p in poly]; ys=[p[1] for p in poly]
-    x0,x1=min(xs),max(xs); y0,y1=min(ys),max(ys)
-    w=x1-x0; h=y1-y0
-    if w<=SPLIT_THRESHOLD and h<=SPLIT_THRESHOLD:
-        return [poly], False
-    res=[]
-    split=True
-    if w>=h and w>SPLIT_THRESHOLD:
-        mx=_split_mid_int(x0,x1)
-        left = [(x0,y0),(mx,y0),(mx,y1),(x0,y1),(x0,y0)]
-        right=[(mx,y0),(x1,y0),(x1,y1),(mx,y1),(mx,y0)]
-        res += [left,right]
-    else:
-        my=_split_mid_int(y0,y1)
-        low =[(x0,y0),(x1,y0),(x1,my),(x0,my),(x0,y0)]
-        high=[(x0,my),(x1,my),(x1,y1),(x0,y1),(x0,my)]
-        res += [low,high]
-    return res, split
-
-def _common_offsets_u1f(profondeur, dossier_left, dossier_bas, dossier_right):
-    A = profondeur + 20
-    F0x = 10 if dossier_left else 0
-    F0y = 10 if dossier_bas  else 0
-    return A, F0x, F0y
-
 def _choose_cushion_size_auto_U1F(pts, traversins=None):
-    F0x, F0y = pts["F0"]; F02x = pts["F02"][0]
+    F0x, F0y = pts.F0; F02x = pts.F02[0]
     x_len = max(0, F02x - F0x)
-    y_end_L = pts["By_cush"][1]
-    y_end_R = pts["By4_cush"][1]
+    y_end_L = pts.By_cush[1]
+    y_end_R = pts.By4_cush[1]
     if traversins:
         if "g" in traversins: y_end_L -= TRAVERSIN_THK
         if "d" in traversins: y_end_R -= TRAVERSIN_THK
@@ -1663,8 +1524,8 @@ def _choose_cushion_size_auto_U1F(pts, traversins=None):
     return best
 
 def _draw_coussins_U1F(t, tr, pts, size, traversins=None):
-    F0x, F0y = pts["F0"]; F02x = pts["F02"][0]
-    y_end_L = pts["By_cush"][1]; y_end_R = pts["By4_cush"][1]
+    F0x, F0y = pts.F0; F02x = pts.F02[0]
+    y_end_L = pts.By_cush[1]; y_end_R = pts.By4_cush[1]
     if traversins:
         if "g" in traversins: y_end_L -= TRAVERSIN_THK
         if "d" in traversins: y_end_R -= TRAVERSIN_THK
@@ -1706,433 +1567,19 @@ def _draw_coussins_U1F(t, tr, pts, size, traversins=None):
         count+=1; y+=size
     return count
 
-def compute_points_U1F_v1(tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                          dossier_left=True, dossier_bas=True, dossier_right=True,
-                          acc_left=True, acc_right=True,
-                          meridienne_side=None, meridienne_len=0):
-    if meridienne_side == 'g' and acc_left:  raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
-    if meridienne_side == 'd' and acc_right: raise ValueError("Méridienne droite interdite avec accoudoir droit.")
-
-    A, F0x, F0y = _common_offsets_u1f(profondeur, dossier_left, dossier_bas, dossier_right)
-    pts={}
-    pts["D0"]=(0,0); pts["D0x"]=(F0x,0); pts["D0y"]=(0,F0y); pts["F0"]=(F0x,F0y)
-
-    # Gauche
-    pts["Fy"]  = (F0x, F0y + A); pts["Fy2"]=(F0x+profondeur, F0y + A)
-    pts["Fx"]  = (F0x + A, F0y); pts["Fx2"]=(F0x + A, F0y + profondeur); pts["Dx"]=(F0x + A, 0)
-
-    top_y_L_full = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
-    top_y_L_dos  = (max(F0y + A, top_y_L_full - meridienne_len) if meridienne_side=='g' else top_y_L_full)
-    pts["By"]=(F0x, top_y_L_full); pts["By2"]=(F0x+profondeur, top_y_L_full)
-    pts["Dy"]=(0, F0y + A); pts["Dy2"]=(0, top_y_L_dos)
-    pts["By_dL"]=(F0x, top_y_L_dos)   # stop dossier G avec méridienne G
-    pts["Ay"]=(0, ty_left); pts["Ay2"]=(F0x+profondeur, ty_left); pts["Ay_"]=(F0x, ty_left)
-
-    # Bas/droite
-    D02x_x = tx - (10 if (dossier_right or dossier_bas) else 0)
-    pts["D02x"]=(D02x_x,0); pts["F02"]=(D02x_x, F0y)
-    Dx2_x = D02x_x - profondeur
-    pts["Dx2"]=(Dx2_x,0); pts["Bx"]=(Dx2_x, F0y); pts["Bx2"]=(Dx2_x, F0y + profondeur)
-    top_y_R_full = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
-    top_y_R_dos  = (max(F0y + A, top_y_R_full - meridienne_len) if meridienne_side=='d' else top_y_R_full)
-    pts["By3"]=(Dx2_x, top_y_R_full); pts["By4"]=(D02x_x, top_y_R_full); pts["By4_d"]=(D02x_x, top_y_R_dos)
-    pts["D02"]=(tx,0); pts["D02y"]=(tx, F0y); pts["Dy3"]=(tx, top_y_R_dos)
-    pts["Ax"]=(Dx2_x, tz_right); pts["Ax2"]=(tx, tz_right); pts["Ax_par"]=(D02x_x, tz_right)
-
-    if not dossier_bas:
-        pts["D0y"]=(0,0); pts["D02y"]=(tx,0)
-
-    pts["By_cush"]=(pts["By"][0], min(pts["By"][1], pts["Dy2"][1]))
-    pts["By4_cush"]=(pts["By4"][0], min(pts["By4"][1], pts["By4_d"][1]))
-
-    pts["_A"]=A; pts["_ty_canvas"]=max(ty_left, tz_right)
-    pts["_draw"]={
-        "D1": bool(dossier_left), "D2": bool(dossier_left),
-        "D3": bool(dossier_bas),  "D4": bool(dossier_bas), "D5": bool(dossier_bas),
-        "D6": bool(dossier_right),
-    }
-    pts["_acc"]={"L":acc_left, "R":acc_right}
-    return pts
-
-def build_polys_U1F_v1(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                       dossier_left=True, dossier_bas=True, dossier_right=True,
-                       acc_left=True, acc_right=True):
-    polys={"angle": [], "banquettes": [], "dossiers": [], "accoudoirs": []}
-    d={"D1":dossier_left,"D2":dossier_left,"D3":dossier_bas,"D4":dossier_bas,"D5":dossier_bas,"D6":dossier_right}
-
-    polys["angle"].append([pts["F0"], pts["Fx"], pts["Fx2"], pts["Fy2"], pts["Fy"], pts["F0"]])
-
-    split_any=False
-    for ban in (
-        [pts["Fy"], pts["Fy2"], pts["By2"], pts["By"], pts["Fy"]],
-        [pts["Fx2"], pts["Fx"], pts["Bx"], pts["Bx2"], pts["Fx2"]],
-        [pts["Bx"], pts["F02"], pts["By4"], pts["By3"], pts["Bx"]],
-    ):
-        pieces, split = _split_banquette_if_needed_U1F(ban)
-        polys["banquettes"] += pieces
-        split_any = split_any or split
-
-    if d["D1"]: polys["dossiers"].append([pts["Dy"], pts["Dy2"], pts["By_dL"], pts["Fy"], pts["Dy"]])
-    if d["D2"]: polys["dossiers"].append([pts["D0x"], pts["D0"], pts["Dy"], pts["Fy"], pts["D0x"]])
-    if d["D3"]: polys["dossiers"].append([pts["D0x"], pts["Dx"], pts["Fx"], pts["F0"], pts["D0x"]])
-    if d["D4"]: polys["dossiers"].append([pts["Dx"], pts["Dx2"], pts["Bx"], pts["Fx"], pts["Dx"]])
-    if d["D5"]: polys["dossiers"].append([pts["Dx2"], pts["D02x"], pts["F02"], pts["Bx"], pts["Dx2"]])
-    if d["D6"]: polys["dossiers"].append([pts["Dy3"], pts["By4_d"], pts["D02x"], pts["D02"], pts["Dy3"]])
-
-    if acc_left:
-        if d["D1"]:
-            polys["accoudoirs"].append([pts["Ay"], pts["Ay2"], pts["By2"], pts["Dy2"], pts["Ay"]])
-        else:
-            polys["accoudoirs"].append([pts["Ay_"], pts["Ay2"], pts["By2"], pts["By"], pts["Ay_"]])
-    if acc_right:
-        if d["D6"]:
-            dy_top = pts.get("Dy3", None) or pts.get("Dy4", None)
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax2"], dy_top, pts["By3"]])
-        else:
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax_par"], pts["By4"], pts["By3"]])
-
-    polys["split_flags"]={"any":split_any}
-    return polys
-
-def compute_points_U1F_v2(tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                          dossier_left=True, dossier_bas=True, dossier_right=True,
-                          acc_left=True, acc_right=True,
-                          meridienne_side=None, meridienne_len=0):
-    if meridienne_side == 'g' and acc_left:  raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
-    if meridienne_side == 'd' and acc_right: raise ValueError("Méridienne droite interdite avec accoudoir droit.")
-
-    A, F0x, F0y = _common_offsets_u1f(profondeur, dossier_left, dossier_bas, dossier_right)
-    pts={}
-    pts["D0"]=(0,0); pts["D0x"]=(F0x,0); pts["D0y"]=(0,F0y); pts["F0"]=(F0x,F0y)
-
-    # Gauche
-    pts["Fy"]=(F0x, F0y + A); pts["Fy2"]=(F0x+profondeur, F0y + A)
-    pts["Fx"]=(F0x + A, F0y); pts["Fx2"]=(F0x + A, F0y + profondeur); pts["Dx"]=(F0x + A, 0)
-
-    top_y_L_full = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
-    top_y_L_dos  = (max(F0y + A, top_y_L_full - meridienne_len) if meridienne_side=='g' else top_y_L_full)
-    pts["By"]=(F0x, top_y_L_full); pts["By2"]=(F0x+profondeur, top_y_L_full)
-    pts["Dy"]=(0, F0y + A); pts["Dy2"]=(0, top_y_L_dos)
-    pts["By_dL"]=(F0x, top_y_L_dos)
-    pts["Ay"]=(0, ty_left); pts["Ay2"]=(F0x+profondeur, ty_left); pts["Ay_"]=(F0x, ty_left)
-
-    # Droite interne F02 (dep. dossier_right)
-    F02x = tx - (10 if dossier_right else 0)
-    pts["F02"]=(F02x, F0y)
-
-    # Bas v2
-    pts["Dx2"]=(F02x, 0); pts["Bx2"]=(F02x, F0y + profondeur)
-
-    # Colonne droite (x = F02x - profondeur)
-    col_x = F02x - profondeur
-    pts["Fy3"]=(col_x, F0y + profondeur); pts["By3"]=(col_x, tz_right - (ACCOUDOIR_THICK if acc_right else 0))
-
-    # Extrémité droite
-    top_y_R_full = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
-    top_y_R_dos  = (max(F0y + A, top_y_R_full - meridienne_len) if meridienne_side=='d' else top_y_R_full)
-    pts["By4"]=(F02x, top_y_R_full); pts["By4_d"]=(F02x, top_y_R_dos)
-    pts["D02"]=(tx,0); pts["D02y"]=(tx, F0y); pts["Dy3"]=(tx, F0y + profondeur); pts["Dy4"]=(tx, top_y_R_dos)
-    pts["Ax"]=(col_x, tz_right); pts["Ax2"]=(tx, tz_right); pts["Ax_par"]=(F02x, tz_right)
-
-    if not dossier_bas:
-        pts["D0y"]=(0,0); pts["D02y"]=(tx,0)
-
-    pts["By_cush"]=(pts["By"][0], min(pts["By"][1], pts["Dy2"][1]))
-    pts["By4_cush"]=(pts["By4"][0], min(pts["By4"][1], pts["By4_d"][1]))
-
-    pts["_A"]=A; pts["_ty_canvas"]=max(ty_left, tz_right)
-    pts["_draw"]={
-        "D1": bool(dossier_left), "D2": bool(dossier_left),
-        "D3": bool(dossier_bas),  "D4": bool(dossier_bas), "D5": bool(dossier_bas),
-        "D6": bool(dossier_right),
-    }
-    pts["_acc"]={"L":acc_left, "R":acc_right}
-    return pts
-
-def build_polys_U1F_v2(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                       dossier_left=True, dossier_bas=True, dossier_right=True,
-                       acc_left=True, acc_right=True):
-    polys={"angle": [], "banquettes": [], "dossiers": [], "accoudoirs": []}
-    d={"D1":dossier_left,"D2":dossier_left,"D3":dossier_bas,"D4":dossier_bas,"D5":dossier_bas,"D6":dossier_right}
-
-    polys["angle"].append([pts["F0"], pts["Fx"], pts["Fx2"], pts["Fy2"], pts["Fy"], pts["F0"]])
-
-    split_any=False
-    for ban in (
-        [pts["Fy"], pts["Fy2"], pts["By2"], pts["By"], pts["Fy"]],
-        [pts["Fx2"], pts["Fx"], pts["F02"], pts["Bx2"], pts["Fx2"]],
-        [pts["By3"], pts["Fy3"], pts["Bx2"], pts["By4"], pts["By3"]],
-    ):
-        pieces, split = _split_banquette_if_needed_U1F(ban)
-        polys["banquettes"] += pieces
-        split_any = split_any or split
-
-    # D1 avec By_dL
-    if d["D1"]: polys["dossiers"].append([pts["Dy"], pts["Dy2"], pts["By_dL"], pts["Fy"], pts["Dy"]])
-    if d["D2"]: polys["dossiers"].append([pts["D0x"], pts["D0"], pts["Dy"], pts["Fy"], pts["D0x"]])
-    if d["D3"]: polys["dossiers"].append([pts["D0x"], pts["Dx"], pts["Fx"], pts["F0"], pts["D0x"]])
-    if d["D4"]: polys["dossiers"].append([pts["Dx"], pts["Dx2"], pts["F02"], pts["Fx"], pts["Dx"]])
-    if d["D5"]: polys["dossiers"].append([pts["Dx2"], pts["D02"], pts["Dy3"], pts["Bx2"], pts["Dx2"]])
-    if d["D6"]: polys["dossiers"].append([pts["Dy3"], pts["Bx2"], pts["By4_d"], pts["Dy4"], pts["Dy3"]])
-
-    if acc_left:
-        if d["D1"]:
-            polys["accoudoirs"].append([pts["Ay"], pts["Ay2"], pts["By2"], pts["Dy2"], pts["Ay"]])
-        else:
-            polys["accoudoirs"].append([pts["Ay_"], pts["Ay2"], pts["By2"], pts["By"], pts["Ay_"]])
-    if acc_right:
-        if d["D6"]:
-            dy_top = pts.get("Dy4", pts.get("Dy3"))
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax2"], dy_top, pts["By3"]])
-        else:
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax_par"], pts["By4"], pts["By3"]])
-
-    polys["split_flags"]={"any":split_any}
-    return polys
-
-def compute_points_U1F_v3(tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                          dossier_left=True, dossier_bas=True, dossier_right=True,
-                          acc_left=True, acc_right=True,
-                          meridienne_side=None, meridienne_len=0):
-    if meridienne_side == 'g' and acc_left:
-        raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
-    if meridienne_side == 'd' and acc_right:
-        raise ValueError("Méridienne droite interdite avec accoudoir droit.")
-
-    A = profondeur + 20
-    F0x = 10 if dossier_left else 0
-    F0y = 10 if dossier_bas  else 0
-
-    pts = {}
-    pts["D0"]=(0,0); pts["D0x"]=(F0x,0); pts["D0y"]=(0,F0y); pts["F0"]=(F0x, F0y)
-
-    # Gauche
-    pts["Fx"]  = (F0x + profondeur, F0y)
-    pts["Fx2"] = (F0x + profondeur, F0y + profondeur)
-    pts["Dx"]  = (F0x + profondeur, 0)
-
-    top_y_L_full = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
-    top_y_L_dos  = (max(F0y + A, top_y_L_full - meridienne_len) if meridienne_side == 'g' else top_y_L_full)
-    pts["By"]=(F0x, top_y_L_full); pts["By2"]=(F0x + profondeur, top_y_L_full)
-    pts["Dy"]=(0, F0y + A); pts["Dy2"]=(0, top_y_L_dos); pts["By_dL"]=(F0x, top_y_L_dos)
-    pts["Ay"]=(0, ty_left); pts["Ay2"]=(F0x + profondeur, ty_left); pts["Ay_"]=(F0x, ty_left)
-
-    # Droite globale
-    F02x = tx - (10 if dossier_right else 0)
-    pts["F02"]=(F02x, F0y)
-    pts["D02x"]=(F02x, 0)
-
-    # Assise bas (côté angle)
-    bx_x = F02x - (profondeur + 20)
-    pts["Bx"]=(bx_x, F0y); pts["Bx2"]=(bx_x, F0y + profondeur); pts["Dx2"]=(bx_x, 0)
-
-    # Colonne droite et hautesurs
-    col_x = F02x - profondeur
-    top_y_R_full = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
-    top_y_R_dos  = (max(F0y + A, top_y_R_full - meridienne_len) if meridienne_side == 'd' else top_y_R_full)
-    pts["Fy"]  = (col_x, F0y + A)
-    pts["Fy2"] = (F02x,  F0y + A)
-    pts["By3"] = (col_x, top_y_R_full)
-    pts["By4"] = (F02x,  top_y_R_full)
-    pts["By4_d"]=(F02x,  top_y_R_dos)
-    pts["D02"]  = (tx, 0)
-    pts["D02y"] = (tx, F0y)
-    pts["Dy3"]  = (tx, top_y_R_dos)
-    pts["Dy2R"] = (tx, F0y + A)  # pour D5/D6
-
-    pts["Ax"]=(col_x, tz_right); pts["Ax2"]=(tx, tz_right); pts["Ax_par"]=(F02x, tz_right)
-
-    if not dossier_bas:
-        pts["D0y"]=(0, 0); pts["D02y"]=(tx, 0)
-
-    # Bornes coussins (arrêt si méridienne)
-    pts["By_cush"]  = (pts["By"][0],  min(pts["By"][1],  pts["Dy2"][1]))
-    pts["By4_cush"] = (pts["By4"][0], min(pts["By4"][1], pts["By4_d"][1]))
-
-    pts["_A"]=A; pts["_ty_canvas"]=max(ty_left, tz_right)
-    pts["_draw"] = {"D1":bool(dossier_left), "D2":bool(dossier_bas), "D3":bool(dossier_bas),
-                    "D4":bool(dossier_bas), "D5":bool(dossier_right), "D6":bool(dossier_right)}
-    pts["_acc"]={"L":acc_left, "R":acc_right}
-    return pts
-
-def build_polys_U1F_v3(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                       dossier_left=True, dossier_bas=True, dossier_right=True,
-                       acc_left=True, acc_right=True):
-    polys={"angle": [], "banquettes": [], "dossiers": [], "accoudoirs": []}
-    d={"D1":dossier_left,"D2":dossier_bas,"D3":dossier_bas,"D4":dossier_bas,"D5":dossier_right,"D6":dossier_right}
-
-    # Banquettes
-    split_any=False
-    ban_g = [pts["F0"], pts["By"], pts["By2"], pts["Fx"],  pts["F0"]]
-    ban_b = [pts["Fx"], pts["Bx"], pts["Bx2"], pts["Fx2"], pts["Fx"]]
-    ban_d = [pts["Fy"], pts["By3"], pts["By4"], pts["Fy2"], pts["Fy"]]
-    for ban in (ban_g, ban_b, ban_d):
-        pieces, split = _split_banquette_if_needed_U1F(ban)
-        polys["banquettes"] += pieces
-        split_any = split_any or split
-
-    # Angle fromage gauche
-    polys["angle"].append([pts["Bx"], pts["F02"], pts["Fy2"], pts["Fy"], pts["Bx2"], pts["Bx"]])
-
-    # Dossiers
-    if d["D1"]:
-        polys["dossiers"].append([pts["D0x"], pts["By_dL"], pts["Dy2"], pts["D0"],  pts["D0x"]])
-    if d["D2"]:
-        polys["dossiers"].append([pts["D0x"], pts["Dx"],   pts["Fx"],  pts["F0"],  pts["D0x"]])
-    if d["D3"]:
-        polys["dossiers"].append([pts["Dx"],  pts["Dx2"],  pts["Bx"],  pts["Fx"],  pts["Dx"]])
-    if d["D4"]:
-        polys["dossiers"].append([pts["Dx2"], (pts["F02"][0],0), pts["F02"], pts["Bx"], pts["Dx2"]])
-    if d["D5"]:
-        polys["dossiers"].append([pts["D02x"], pts["Fy2"], pts["Dy2R"], pts["D02"], pts["D02x"]])
-    if d["D6"]:
-        polys["dossiers"].append([pts["Dy2R"], pts["Fy2"], pts["By4_d"], pts["Dy3"], pts["Dy2R"]])
-
-    # Accoudoirs
-    if acc_left:
-        if d["D1"]:
-            polys["accoudoirs"].append([pts["Ay"],  pts["Ay2"],  pts["By2"],  pts["Dy2"],  pts["Ay"]])
-        else:
-            polys["accoudoirs"].append([pts["Ay_"], pts["Ay2"],  pts["By2"],  pts["By"],   pts["Ay_"]])
-    if acc_right:
-        if d["D5"] or d["D6"]:
-            dy_top = pts.get("Dy3", pts.get("Dy4"))
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax2"], dy_top, pts["By3"]])
-        else:
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax_par"], pts["By4"], pts["By3"]])
-
-    polys["split_flags"]={"any":split_any}
-    return polys
-
-def compute_points_U1F_v4(tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                          dossier_left=True, dossier_bas=True, dossier_right=True,
-                          acc_left=True, acc_right=True,
-                          meridienne_side=None, meridienne_len=0):
-    if meridienne_side == 'g' and acc_left:
-        raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
-    if meridienne_side == 'd' and acc_right:
-        raise ValueError("Méridienne droite interdite avec accoudoir droit.")
-
-    A, F0x, F0y = _common_offsets_u1f(profondeur, dossier_left, dossier_bas, dossier_right)
-    F02x = tx - (10 if dossier_right else 0)
-
-    pts={}
-    pts["D0"]=(0,0); pts["D0x"]=(F0x,0); pts["D0y"]=(0,F0y); pts["F0"]=(F0x,F0y)
-
-    # GAUCHE
-    pts["Dy"]=(0, F0y+profondeur)
-    top_y_L_full = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
-    top_y_L_dos  = top_y_L_full if meridienne_side!='g' else max(F0y+profondeur, top_y_L_full - meridienne_len)
-
-    pts["Fy"]=(F0x, F0y+profondeur); pts["Fy2"]=(F0x+profondeur, F0y+profondeur)
-    pts["By"]=(F0x, top_y_L_full);   pts["By2"]=(F0x+profondeur, top_y_L_full)
-    pts["Dy2"]=(0, top_y_L_dos)
-    pts["By_dL"]=(F0x, top_y_L_dos)
-    pts["Ay"]=(0, ty_left); pts["Ay2"]=(F0x+profondeur, ty_left); pts["Ay_"]=(F0x, ty_left)
-
-    # BAS + angle droite
-    pts["Fx"]=(F0x+profondeur, F0y); pts["Fx2"]=(F0x+profondeur, F0y+profondeur)
-    bx_x = F02x - (profondeur+20)
-    pts["Bx"]=(bx_x, F0y); pts["Bx2"]=(bx_x, F0y+profondeur); pts["Dx"]=(bx_x, 0)
-
-    # DROITE
-    col_x = F02x - profondeur
-    top_y_R_full = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
-    top_y_R_dos  = top_y_R_full if meridienne_side!='d' else max(F0y + (profondeur+20), top_y_R_full - meridienne_len)
-
-    pts["Fy3"]=(col_x, F0y + (profondeur+20)); pts["Fy4"]=(F02x, F0y + (profondeur+20))
-    pts["By3"]=(col_x, top_y_R_full); pts["By4"]=(F02x, top_y_R_full); pts["By4_d"]=(F02x, top_y_R_dos)
-    pts["Ax"]=(col_x, tz_right); pts["Ax2"]=(tx, tz_right); pts["Ax_par"]=(F02x, tz_right)
-
-    pts["D02x"]=(F02x, 0); pts["F02"]=(F02x, F0y)
-    pts["D02"]=(tx, 0); pts["D02y"]=(tx, F0y)
-    pts["Dy3"]=(tx, F0y + (profondeur+20)); pts["Dy4"]=(tx, top_y_R_dos)
-
-    if not dossier_bas:
-        pts["D0y"]=(0,0); pts["D02y"]=(tx,0)
-
-    pts["By_cush"]  = (pts["By"][0],  min(pts["By"][1],  top_y_L_dos))
-    pts["By4_cush"] = (pts["By4"][0], min(pts["By4"][1], top_y_R_dos))
-
-    pts["_A"]=profondeur+20; pts["_ty_canvas"]=max(ty_left, tz_right)
-    pts["_draw"]={
-        "D1": bool(dossier_left), "D2": bool(dossier_left),
-        "D3": bool(dossier_bas),  "D4": bool(dossier_bas),
-        "D5": bool(dossier_right),"D6": bool(dossier_right),
-    }
-    pts["_acc"]={"L":acc_left, "R":acc_right}
-    return pts
-
-def build_polys_U1F_v4(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                       dossier_left=True, dossier_bas=True, dossier_right=True,
-                       acc_left=True, acc_right=True):
-    polys={"angle": [], "banquettes": [], "dossiers": [], "accoudoirs": []}
-    d=pts["_draw"]
-
-    split_any=False
-    for ban in (
-        [pts["Fy"], pts["By"], pts["By2"], pts["Fy2"], pts["Fy"]],
-        [pts["F0"], pts["Bx"], pts["Bx2"], pts["Fy"],  pts["F0"]],
-        [pts["Fy4"], pts["By4"], pts["By3"], pts["Fy3"], pts["Fy4"]],
-    ):
-        pieces, split = _split_banquette_if_needed_U1F(ban)
-        polys["banquettes"] += pieces
-        split_any = split_any or split
-
-    polys["angle"].append([pts["Bx"], pts["F02"], pts["Fy4"], pts["Fy3"], pts["Bx2"], pts["Bx"]])
-
-    if d["D1"]:
-        polys["dossiers"].append([pts["Dy"], pts["Dy2"], pts["By_dL"], pts["Fy"], pts["Dy"]])
-    if d["D2"]:
-        polys["dossiers"].append([pts["D0x"], pts["D0"], pts["Dy"], pts["Fy"], pts["D0x"]])
-    if d["D3"]:
-        polys["dossiers"].append([pts["F0"], pts["Bx"], pts["Dx"], pts["D0x"], pts["F0"]])
-    if d["D4"]:
-        polys["dossiers"].append([pts["Dx"], pts["D02x"], pts["F02"], pts["Bx"], pts["Dx"]])
-    if d["D5"]:
-        polys["dossiers"].append([pts["D02x"], pts["Fy4"], pts["Dy3"], pts["D02"], pts["D02x"]])
-    if d["D6"]:
-        polys["dossiers"].append([pts["Dy3"], pts["Fy4"], pts["By4_d"], pts["Dy4"], pts["Dy3"]])
-
-    if acc_left:
-        if d["D1"]:
-            polys["accoudoirs"].append([pts["Ay"], pts["Ay2"], pts["By2"], pts["Dy2"], pts["Ay"]])
-        else:
-            polys["accoudoirs"].append([pts["Ay_"], pts["Ay2"], pts["By2"], pts["By"], pts["Ay_"]])
-
-    if acc_right:
-        has_right = (d["D5"] or d["D6"])
-        if has_right:
-            dy_top = pts.get("Dy4", pts.get("Dy3"))
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax2"], dy_top, pts["By3"]])
-        else:
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax_par"], pts["By4"], pts["By3"]])
-
-    polys["split_flags"]={"any":split_any}
-    return polys
-
 # --- rendu commun + wrappers (U1F) ---
 def _render_common_U1F(variant, tx, ty, tz, profondeur,
                        dossier_left, dossier_bas, dossier_right,
                        acc_left, acc_right,
                        meridienne_side, meridienne_len,
                        coussins, traversins, couleurs, window_title):
-    comp = {"v1":compute_points_U1F_v1, "v2":compute_points_U1F_v2,
-            "v3":compute_points_U1F_v3, "v4":compute_points_U1F_v4}[variant]
-    build= {"v1":build_polys_U1F_v1,   "v2":build_polys_U1F_v2,
-            "v3":build_polys_U1F_v3,   "v4":build_polys_U1F_v4}[variant]
-
     trv = _parse_traversins_spec(traversins, allowed={"g","d"})
     legend_items = _resolve_and_apply_colors(couleurs)
 
-    pts = comp(tx, ty, tz, profondeur,
-               dossier_left, dossier_bas, dossier_right,
-               acc_left, acc_right,
-               meridienne_side, meridienne_len)
-    polys = build(pts, tx, ty, tz, profondeur,
-                  dossier_left, dossier_bas, dossier_right,
-                  acc_left, acc_right)
-    _assert_banquettes_max_250(polys)
+    pts, polys, _ = geometrie("U1F", variant, tx, ty, tz, profondeur,
+                              dossier_left, dossier_bas, dossier_right,
+                              acc_left, acc_right,
+                              meridienne_side, meridienne_len)
 
     ty_canvas = max(ty, tz)
     screen = turtle.Screen(); screen.setup(WIN_W, WIN_H)
@@ -2157,7 +1604,7 @@ def _render_common_U1F(variant, tx, ty, tz, profondeur,
     draw_double_arrow_vertical_cm(t, tr,  tx+25,0, tz,   f"{tz} cm")
     draw_double_arrow_horizontal_cm(t, tr, -25, 0, tx,   f"{tx} cm")
 
-    A = pts["_A"]
+    A = pts._A
     if polys["angle"]:
         label_poly(t, tr, polys["angle"][0], f"{A}×{A} cm")
     banquette_sizes=[]
@@ -2233,207 +1680,10 @@ def render_U1F_v4(*args, **kwargs):
 # =====================================================================
 # ======================  L (no fromage) v1 + v2  =====================
 # =====================================================================
-def compute_points_LNF_v2(tx, ty, profondeur=DEPTH_STD,
-                          dossier_left=True, dossier_bas=True,
-                          acc_left=True, acc_bas=True,
-                          meridienne_side=None, meridienne_len=0):
-    prof = profondeur; pts = {}
-    if dossier_left and dossier_bas:         F0x, F0y = 10, 10; D0x0=(10,0); D0y0=(0,10)
-    elif (not dossier_left) and dossier_bas: F0x, F0y = 0, 10;  D0x0=(0,0);  D0y0=(0,10)
-    elif dossier_left and (not dossier_bas): F0x, F0y = 10, 0;  D0x0=(10,0); D0y0=(0,0)
-    else:                                    F0x, F0y = 0, 0;   D0x0=(0,0);  D0y0=(0,0)
-
-    pts["D0"]=(0,0); pts["D0x"]=D0x0; pts["D0y"]=D0y0; pts["F0"]=(F0x,F0y)
-
-    top_y = ty - (ACCOUDOIR_THICK if acc_left else 0)
-    pts["Dy"]  =(0, F0y+prof); pts["Dy2"]=(0, top_y); pts["Ay"]=(0, ty)
-    pts["Fy"]  =(F0x, F0y+prof); pts["By"]=(F0x, top_y)
-    pts["Ay2"] =(F0x+prof, ty); pts["By2"]=(F0x+prof, top_y); pts["Ay_par"]=(F0x, ty)
-
-    stop_x = tx - (ACCOUDOIR_THICK if acc_bas else 0)
-    pts["Dx"]=(stop_x,0); pts["Bx"]=(stop_x,F0y); pts["Bx2"]=(stop_x,F0y+prof)
-    pts["Ax"]=(tx,0); pts["Ax2"]=(tx,F0y+prof); pts["Ax_par"]=(tx,F0y)
-
-    if meridienne_side=='g' and meridienne_len>0:
-        mer_y=max(pts["Fy"][1], top_y - meridienne_len); mer_y=min(mer_y, top_y)
-        pts["By_mer"]=(pts["By"][0],mer_y); pts["By2_mer"]=(pts["By2"][0],mer_y); pts["Dy2"]=(0,mer_y)
-    if meridienne_side=='b' and meridienne_len>0:
-        mer_x=min(stop_x, tx - meridienne_len)
-        pts["Bx_mer"]=(mer_x, pts["Bx"][1]); pts["Bx2_mer"]=(mer_x, pts["Bx2"][1]); pts["Dx_mer"]=(mer_x,0)
-
-    pts["_tx"], pts["_ty"] = tx, ty
-    return pts
-
-def build_polys_LNF_v2(pts, tx, ty, profondeur=DEPTH_STD,
-                       dossier_left=True, dossier_bas=True,
-                       acc_left=True, acc_bas=True,
-                       meridienne_side=None, meridienne_len=0):
-    polys={"banquettes":[],"dossiers":[],"accoudoirs":[]}
-
-    Fy=(pts["Fy"][0], pts["Fy"][1]); Fy2=(pts["Fy"][0]+profondeur, pts["Fy"][1])
-    By=pts.get("By"); By2=pts.get("By2")
-    ban_g=[Fy, By, By2, Fy2, Fy]
-    split_left=False; mid_y_left=None
-    Lg = abs(By2[1] - Fy2[1])
-    if Lg > SPLIT_THRESHOLD:
-        split_left=True; mid_y_left=_split_mid_int(Fy2[1], By2[1])
-        low  = [(Fy[0],Fy[1]),(Fy2[0],Fy2[1]),(Fy2[0],mid_y_left),(Fy[0],mid_y_left),(Fy[0],Fy[1])]
-        high = [(Fy[0],mid_y_left),(Fy2[0],mid_y_left),(By2[0],By2[1]),(By[0],By[1]),(Fy[0],mid_y_left)]
-        polys["banquettes"] += [low, high]
-    else:
-        polys["banquettes"].append(ban_g)
-
-    F0=pts["F0"]; Bx=pts["Bx"]; Bx2=pts["Bx2"]
-    ban_b=[F0, Bx, Bx2, pts["Fy"], F0]
-    split_bas=False; mid_x_bas=None
-    Lb = abs(Bx2[0] - pts["Fy"][0])
-    if Lb > SPLIT_THRESHOLD:
-        split_bas=True; mid_x_bas=_split_mid_int(pts["Fy"][0], Bx2[0])
-        left  = [(F0[0],F0[1]),(mid_x_bas,F0[1]),(mid_x_bas,pts["Fy"][1]),(pts["Fy"][0],pts["Fy"][1]),(F0[0],F0[1])]
-        right = [(mid_x_bas,F0[1]),(Bx[0],Bx[1]),(Bx2[0],Bx2[1]),(mid_x_bas,pts["Fy"][1]),(mid_x_bas,F0[1])]
-        polys["banquettes"] += [left, right]
-    else:
-        polys["banquettes"].append(ban_b)
-
-    if dossier_left:
-        if split_left:
-            F0x=pts["F0"][0]; y0=pts["Dy"][1]; yTop=pts.get("By_mer", pts["By"])[1]
-            d1b=[(0,y0),(F0x,y0),(F0x,mid_y_left),(0,mid_y_left),(0,y0)]
-            d1h=[(0,mid_y_left),(F0x,mid_y_left),(F0x,yTop),(0,yTop),(0,mid_y_left)]
-            polys["dossiers"] += [d1b, d1h]
-        else:
-            By_use = pts.get("By_mer", pts["By"])
-            polys["dossiers"].append([pts["Dy2"], By_use, pts["Fy"], pts["Dy"], pts["Dy2"]])
-    if dossier_left:
-        polys["dossiers"].append([pts["D0x"], pts["D0"], pts["Dy"], pts["Fy"], pts["D0x"]])
-    if dossier_bas:
-        Bx_use = pts.get("Bx_mer", pts["Bx"]); Dx_use = pts.get("Dx_mer", pts["Dx"])
-        if split_bas:
-            yTop=pts["F0"][1]
-            d3g=[(mid_x_bas,0),(pts["D0x"][0],0),(pts["D0x"][0],yTop),(mid_x_bas,yTop),(mid_x_bas,0)]
-            d3d=[(Dx_use[0],0),(mid_x_bas,0),(mid_x_bas,yTop),(Bx_use[0],yTop),(Dx_use[0],0)]
-            polys["dossiers"] += [d3g, d3d]
-        else:
-            polys["dossiers"].append([Dx_use, pts["D0x"], pts["F0"], Bx_use, Dx_use])
-
-    if acc_left:
-        if dossier_left:
-            polys["accoudoirs"].append([pts["Ay"], pts["Ay2"], pts["By2"], pts["Dy2"], pts["Ay"]])
-        else:
-            polys["accoudoirs"].append([pts["By"], pts["Ay_par"], pts["Ay2"], pts["By2"], pts["By"]])
-    if acc_bas:
-        if dossier_bas:
-            polys["accoudoirs"].append([pts["Dx"], pts["Ax"], pts["Ax2"], pts["Bx2"], pts["Dx"]])
-        else:
-            polys["accoudoirs"].append([pts["Bx"], pts["Ax_par"], pts["Ax2"], pts["Bx2"], pts["Bx"]])
-
-    polys["split_flags"]={"left":split_left,"bottom":split_bas}
-    return polys
-
-def compute_points_LNF_v1(tx, ty, profondeur=DEPTH_STD,
-                          dossier_left=True, dossier_bas=True,
-                          acc_left=True, acc_bas=True,
-                          meridienne_side=None, meridienne_len=0):
-    prof=profondeur; pts={}
-    if dossier_left and dossier_bas:         F0x,F0y=10,10; D0x0=(10,0); D0y0=(0,10)
-    elif (not dossier_left) and dossier_bas: F0x,F0y=0,10;  D0x0=(0,0);  D0y0=(0,10)
-    elif dossier_left and (not dossier_bas): F0x,F0y=10,0;  D0x0=(10,0); D0y0=(0,0)
-    else:                                    F0x,F0y=0,0;   D0x0=(0,0);  D0y0=(0,0)
-
-    pts["D0"]=(0,0); pts["D0x"]=D0x0; pts["D0y"]=D0y0; pts["F0"]=(F0x,F0y)
-    top_y = ty - (ACCOUDOIR_THICK if acc_left else 0)
-    pts["Dy2"]=(0, top_y); pts["Ay"] =(0, ty); pts["By"] =(F0x, top_y)
-    pts["Ay2"]=(F0x+prof, ty); pts["By2"]=(F0x+prof, top_y)
-
-    stop_x = tx - (ACCOUDOIR_THICK if acc_bas else 0)
-    pts["Dy"] =(0, F0y+prof)
-    pts["Fx"] =(F0x+prof, F0y); pts["Fx2"]=(F0x+prof, F0y+prof)
-    pts["Bx"] =(stop_x, F0y);   pts["Bx2"]=(stop_x, F0y+prof)
-    pts["Dx"] =(F0x+prof, 0);   pts["DxR"]=(stop_x, 0)
-    pts["Ax"] =(tx, 0); pts["Ax2"]=(tx, F0y+prof)
-    pts["Ay_par"]=(F0x, ty); pts["Ax_par"]=(tx, F0y)
-
-    if meridienne_side=='g' and meridienne_len>0:
-        mer_y=max(F0y, top_y - meridienne_len); mer_y=min(mer_y, top_y)
-        pts["By_mer"]=(pts["By"][0],mer_y); pts["By2_mer"]=(pts["By2"][0],mer_y); pts["Dy2"]=(0,mer_y)
-    if meridienne_side=='b' and meridienne_len>0:
-        mer_x=min(stop_x, tx - meridienne_len)
-        pts["Bx_mer"]=(mer_x, pts["Bx"][1]); pts["Bx2_mer"]=(mer_x, pts["Bx2"][1]); pts["DxR_mer"]=(mer_x,0)
-    pts["_tx"], pts["_ty"]=tx,ty
-    return pts
-
-def build_polys_LNF_v1(pts, tx, ty, profondeur=DEPTH_STD,
-                       dossier_left=True, dossier_bas=True,
-                       acc_left=True, acc_bas=True,
-                       meridienne_side=None, meridienne_len=0):
-    polys={"banquettes":[], "dossiers":[], "accoudoirs":[]}
-
-    F0=pts["F0"]; Fx=pts["Fx"]; By=pts.get("By"); By2=pts.get("By2")
-    ban_g=[F0, By, By2, Fx, F0]
-    split_left=False; mid_y_left=None
-    top_y = (pts.get("By2_mer", By2))[1]; base_y = F0[1]
-    Lg = abs(top_y - base_y)
-    if Lg > SPLIT_THRESHOLD:
-        split_left=True; mid_y_left=_split_mid_int(base_y, top_y)
-        lower=[(F0[0],base_y),(Fx[0],base_y),(Fx[0],mid_y_left),(F0[0],mid_y_left),(F0[0],base_y)]
-        upper=[(F0[0],mid_y_left),(Fx[0],mid_y_left),(By2[0],top_y),(By[0],top_y),(F0[0],mid_y_left)]
-        polys["banquettes"] += [lower, upper]
-    else:
-        polys["banquettes"].append(ban_g)
-
-    Bx=pts["Bx"]; Bx2=pts["Bx2"]; Fx2=pts["Fx2"]
-    ban_b=[pts["Fx"], Bx, Bx2, Fx2, pts["Fx"]]
-    split_bas=False; mid_x_bas=None
-    Lb = abs(Bx2[0] - pts["Fx"][0])
-    if Lb > SPLIT_THRESHOLD:
-        split_bas=True; mid_x_bas=_split_mid_int(pts["Fx"][0], Bx2[0])
-        left =[ (pts["Fx"][0], pts["Fx"][1]), (mid_x_bas, pts["Fx"][1]),
-                (mid_x_bas, Fx2[1]), (Fx2[0], Fx2[1]), (pts["Fx"][0], pts["Fx"][1]) ]
-        right=[ (mid_x_bas, pts["Fx"][1]), (Bx[0],Bx[1]), (Bx2[0],Bx2[1]),
-                (mid_x_bas, Fx2[1]), (mid_x_bas, pts["Fx"][1]) ]
-        polys["banquettes"] += [left, right]
-    else:
-        polys["banquettes"].append(ban_b)
-
-    if dossier_left:
-        By_use = pts.get("By_mer", pts["By"])
-        if split_left:
-            x0=0; x1=pts["D0x"][0]; y_base=0; y_top=By_use[1]; y_mid=mid_y_left
-            d1_bas=[(x0,y_base),(x1,y_base),(x1,y_mid),(x0,y_mid),(x0,y_base)]
-            d1_haut=[(x0,y_mid),(x1,y_mid),(x1,y_top),(x0,y_top),(x0,y_mid)]
-            polys["dossiers"] += [d1_bas, d1_haut]
-        else:
-            polys["dossiers"].append([pts["D0"], pts["Dy2"], By_use, pts["D0x"], pts["D0"]])
-    if dossier_left:
-        polys["dossiers"].append([pts["D0x"], pts["Dx"], pts["Fx"], pts["F0"], pts["D0x"]])
-    if dossier_bas:
-        DxR_use = pts.get("DxR_mer", pts["DxR"]); Bx_use = pts.get("Bx_mer", pts["Bx"])
-        if split_bas:
-            yTop=pts["F0"][1]
-            d3_g=[(mid_x_bas,0),(pts["Dx"][0],0),(pts["Dx"][0],yTop),(mid_x_bas,yTop),(mid_x_bas,0)]
-            d3_d=[(DxR_use[0],0),(mid_x_bas,0),(mid_x_bas,yTop),(Bx_use[0],yTop),(DxR_use[0],0)]
-            polys["dossiers"] += [d3_g, d3_d]
-        else:
-            polys["dossiers"].append([pts["Dx"], DxR_use, Bx_use, pts["Fx"], pts["Dx"]])
-
-    if acc_left:
-        if dossier_left:
-            polys["accoudoirs"].append([pts["Ay"], pts["Ay2"], pts["By2"], pts["Dy2"], pts["Ay"]])
-        else:
-            polys["accoudoirs"].append([pts["Ay_par"], pts["Ay2"], pts["By2"], pts["By"], pts["Ay_par"]])
-    if acc_bas:
-        if dossier_bas:
-            polys["accoudoirs"].append([pts["DxR"], pts["Ax"], pts["Ax2"], pts["Bx2"], pts["DxR"]])
-        else:
-            polys["accoudoirs"].append([pts["Bx"], pts["Ax_par"], pts["Ax2"], pts["Bx2"], pts["Bx"]])
-
-    polys["split_flags"]={"left":split_left,"bottom":split_bas}
-    return polys
-
 def _choose_cushion_size_auto_L(pts, traversins=None):
-    F0x, F0y = pts["F0"]
-    x_end = pts.get("Bx_mer", pts.get("Bx", (F0x, 0)))[0]
-    y_end = pts.get("By_mer", pts.get("By", (F0x, F0y)))[1]
+    F0x, F0y = pts.F0
+    x_end = pts.Bx_fin[0]
+    y_end = pts.By_fin[1]
     if traversins:
         if "b" in traversins: x_end -= TRAVERSIN_THK
         if "g" in traversins: y_end -= TRAVERSIN_THK
@@ -2453,9 +1703,9 @@ def draw_coussins_L_optimized(t, tr, pts, coussins, traversins=None):
     else:
         size = int(coussins)
 
-    F0x, F0y = pts["F0"]
-    x_end = pts.get("Bx_mer", pts["Bx"])[0]
-    y_end = pts.get("By_mer", pts["By"])[1]
+    F0x, F0y = pts.F0
+    x_end = pts.Bx_fin[0]
+    y_end = pts.By_fin[1]
     if traversins:
         if "b" in traversins: x_end -= TRAVERSIN_THK
         if "g" in traversins: y_end -= TRAVERSIN_THK
@@ -2496,8 +1746,6 @@ def draw_coussins_L_optimized(t, tr, pts, coussins, traversins=None):
 def _render_common_L(tx, ty, pts, polys, coussins, window_title,
                      profondeur, dossier_left, dossier_bas, meridienne_side, meridienne_len,
                      traversins=None, couleurs=None):
-    _assert_banquettes_max_250(polys)
-
     trv = _parse_traversins_spec(traversins, allowed={"g","b"})
     legend_items = _resolve_and_apply_colors(couleurs)
 
@@ -2570,14 +1818,7 @@ def render_LNF_v1(tx, ty, profondeur=DEPTH_STD,
                   traversins=None,
                   couleurs=None,
                   window_title="LNF v1 — pivot gauche"):
-    if meridienne_side=='g':
-        if acc_left: raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
-        if not dossier_left: raise ValueError("Méridienne gauche impossible sans dossier gauche.")
-    if meridienne_side=='b':
-        if acc_bas: raise ValueError("Méridienne bas interdite avec accoudoir bas.")
-        if not dossier_bas: raise ValueError("Méridienne bas impossible sans dossier bas.")
-    pts = compute_points_LNF_v1(tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
-    polys = build_polys_LNF_v1(pts,tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
+    pts, polys, _ = geometrie("LNF", "v1", tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
     _render_common_L(tx,ty,pts,polys,coussins,window_title,profondeur,dossier_left,dossier_bas,meridienne_side,meridienne_len,traversins=traversins, couleurs=couleurs)
 
 def render_LNF_v2(tx, ty, profondeur=DEPTH_STD,
@@ -2588,36 +1829,9 @@ def render_LNF_v2(tx, ty, profondeur=DEPTH_STD,
                   traversins=None,
                   couleurs=None,
                   window_title="LNF v2 — pivot bas"):
-    if meridienne_side=='g':
-        if acc_left: raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
-        if not dossier_left: raise ValueError("Méridienne gauche impossible sans dossier gauche.")
-    if meridienne_side=='b':
-        if acc_bas: raise ValueError("Méridienne bas interdite avec accoudoir bas.")
-        if not dossier_bas: raise ValueError("Méridienne bas impossible sans dossier bas.")
-    pts = compute_points_LNF_v2(tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
-    polys = build_polys_LNF_v2(pts,tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
+    pts, polys, _ = geometrie("LNF", "v2", tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
     _render_common_L(tx,ty,pts,polys,coussins,window_title,profondeur,dossier_left,dossier_bas,meridienne_side,meridienne_len,traversins=traversins, couleurs=couleurs)
 
-def _dry_polys_for_variant(tx, ty, profondeur,
-                           dossier_left, dossier_bas,
-                           acc_left, acc_bas,
-                           meridienne_side, meridienne_len,
-                           variant):
-    if meridienne_side == 'g':
-        if acc_left:        raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
-        if not dossier_left:raise ValueError("Méridienne gauche impossible sans dossier gauche.")
-    if meridienne_side == 'b':
-        if acc_bas:         raise ValueError("Méridienne bas interdite avec accoudoir bas.")
-        if not dossier_bas: raise ValueError("Méridienne bas impossible sans dossier bas.")
-
-    if variant == "v1":
-        pts = compute_points_LNF_v1(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas, meridienne_side, meridienne_len)
-        polys = build_polys_LNF_v1(pts, tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas, meridienne_side, meridienne_len)
-    else:
-        pts = compute_points_LNF_v2(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas, meridienne_side, meridienne_len)
-        polys = build_polys_LNF_v2(pts, tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas, meridienne_side, meridienne_len)
-    return pts, polys
-
 def render_LNF(tx, ty, profondeur=DEPTH_STD,
                dossier_left=True, dossier_bas=True,
                acc_left=True, acc_bas=True,
@@ -2639,40 +1853,9 @@ def render_LNF(tx, ty, profondeur=DEPTH_STD,
                           window_title=window_title)
         return
 
-    nb_ban_v1 = float("inf")
-    nb_ban_v2 = float("inf")
-    polys1 = polys2 = None
-    try:
-        _pts1, _polys1 = _dry_polys_for_variant(tx, ty, profondeur,
-                                               dossier_left, dossier_bas,
-                                               acc_left, acc_bas,
-                                               meridienne_side, meridienne_len,
-                                               "v1")
-        nb_ban_v1 = len(_polys1["banquettes"]); polys1=_polys1
-    except ValueError:
-        pass
-    try:
-        _pts2, _polys2 = _dry_polys_for_variant(tx, ty, profondeur,
-                                               dossier_left, dossier_bas,
-                                               acc_left, acc_bas,
-                                               meridienne_side, meridienne_len,
-                                               "v2")
-        nb_ban_v2 = len(_polys2["banquettes"]); polys2=_polys2
-    except ValueError:
-        pass
-
-    # choix : moins de banquettes ; tie-break = moins de scissions
-    def scissions(polys):
-        if not polys: return 999
-        base_groups = 2  # L = gauche + bas
-        return max(0, len(polys["banquettes"]) - base_groups)
-    if nb_ban_v1 < nb_ban_v2: chosen = "v1"
-    elif nb_ban_v2 < nb_ban_v1: chosen = "v2"
-    else:
-        if scissions(polys1) < scissions(polys2): chosen="v1"
-        elif scissions(polys2) < scissions(polys1): chosen="v2"
-        else: chosen = "v1" if tx >= ty else "v2"
-
+    # choix : moins de banquettes (scissions prédites par les cotes) ; égalité -> v1 si tx >= ty
+    chosen = _predict_variant_LNF(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas,
+                                  meridienne_side, meridienne_len)
     if chosen == "v2":
         render_LNF_v2(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas,
                       meridienne_side, meridienne_len, coussins, traversins=traversins, couleurs=couleurs,
@@ -2686,497 +1869,16 @@ def render_LNF(tx, ty, profondeur=DEPTH_STD,
 # =====================  U (no fromage) — v1..v4  =====================
 # =====================================================================
 
-def compute_points_U_v1(tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                        dossier_left=True, dossier_bas=True, dossier_right=True,
-                        acc_left=True, acc_bas=True, acc_right=True):
-    prof = profondeur; pts={}
-    F0x = 10 if dossier_left else 0
-    F0y = 10 if dossier_bas  else 0
-    pts["D0"]=(0,0); pts["D0x"]=(F0x,0); pts["D0y"]=(0,F0y); pts["F0"]=(F0x,F0y)
-
-    # gauche
-    pts["Dy"]  = (0, F0y+prof)
-    top_y_L = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
-    pts["Dy2"] = (0, top_y_L)
-    pts["Ay"]  = (0, ty_left); pts["Ay2"] = (F0x+prof, ty_left); pts["Ay_"]=(F0x, ty_left)
-
-    pts["Fy"]  = (F0x,      F0y+prof)
-    pts["Fy2"] = (F0x+prof, F0y+prof)
-    pts["By"]  = (F0x,      top_y_L)
-    pts["By2"] = (F0x+prof, top_y_L)
-
-    # droite (branche au-dessus du bas)
-    D02x_x = tx - (10 if (dossier_right or dossier_bas) else 0)
-    pts["Dx"]  = (F0x+prof, 0)
-    pts["Bx"]  = (D02x_x, F0y); pts["Bx2"]=(D02x_x, F0y+prof)
-
-    top_y_R   = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
-    x_left_R  = D02x_x - prof
-    pts["Fy3"] = (x_left_R, F0y+prof); pts["By3"]=(x_left_R, top_y_R); pts["By4"]=(D02x_x, top_y_R)
-
-    pts["D02x"]=(D02x_x,0); pts["D02"]=(tx,0); pts["D02y"]=(tx,F0y); pts["Dy3"]=(tx, top_y_R)
-    pts["Ax"]=(x_left_R, tz_right); pts["Ax2"]=(tx, tz_right); pts["Ax_par"]=(D02x_x, tz_right)
-
-    pts["_ty_canvas"]=max(ty_left, tz_right)
-    return pts
-
-def build_polys_U_v1(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                     dossier_left=True, dossier_bas=True, dossier_right=True,
-                     acc_left=True, acc_bas=True, acc_right=True):
-    polys={"banquettes":[],"dossiers":[],"accoudoirs":[]}
-
-    draw = {
-        "D1": bool(dossier_left),
-        "D2": bool(dossier_left or dossier_bas),
-        "D3": bool(dossier_bas),
-        "D4": bool(dossier_right),              # v1 : uniquement dossier_droit
-        "D5": bool(dossier_right),
-    }
-
-    F0=pts["F0"]; Fy=pts["Fy"]; Fy2=pts["Fy2"]; By=pts["By"]; By2=pts["By2"]
-    Bx=pts["Bx"]; Bx2=pts["Bx2"]; Fy3=pts["Fy3"]; By3=pts["By3"]; By4=pts["By4"]
-
-    # banquettes
-    split_left=split_bottom=split_right=False
-    ban_g=[Fy,By,By2,Fy2,Fy]
-    Lg=abs(By[1]-Fy[1])
-    if Lg>SPLIT_THRESHOLD:
-        split_left=True
-        mid_y=_split_mid_int(Fy[1],By[1])
-        g_low=[(Fy[0],Fy[1]),(Fy2[0],Fy[1]),(Fy2[0],mid_y),(Fy[0],mid_y),(Fy[0],Fy[1])]
-        g_up=[(Fy[0],mid_y),(By[0],By[1]),(By2[0],By2[1]),(Fy2[0],mid_y),(Fy[0],mid_y)]
-        polys["banquettes"]+=[g_low,g_up]
-    else:
-        polys["banquettes"].append(ban_g)
-
-    ban_b=[F0,Bx,Bx2,Fy,F0]
-    Lb=abs(Bx[0]-F0[0])
-    if Lb>SPLIT_THRESHOLD:
-        split_bottom=True
-        mid_x=_split_mid_int(F0[0],Bx[0])
-        b_left=[(F0[0],F0[1]),(mid_x,F0[1]),(mid_x,Fy[1]),(Fy[0],Fy[1]),(F0[0],F0[1])]
-        b_right=[(mid_x,F0[1]),(Bx[0],Bx[1]),(Bx2[0],Bx2[1]),(mid_x,Fy[1]),(mid_x,F0[1])]
-        polys["banquettes"]+=[b_left,b_right]
-    else:
-        polys["banquettes"].append(ban_b)
-
-    ban_r=[By3,By4,Bx2,Fy3,By3]
-    Lr=abs(By4[1]-Fy3[1])
-    if Lr>SPLIT_THRESHOLD:
-        split_right=True
-        mid_y=_split_mid_int(Fy3[1],By4[1])
-        r_low=[(Fy3[0],Fy3[1]),(Bx2[0],Fy3[1]),(Bx2[0],mid_y),(Fy3[0],mid_y),(Fy3[0],Fy3[1])]
-        r_up=[(Fy3[0],mid_y),(By3[0],By3[1]),(By4[0],By4[1]),(Bx2[0],mid_y),(Fy3[0],mid_y)]
-        polys["banquettes"]+=[r_low,r_up]
-    else:
-        polys["banquettes"].append(ban_r)
-
-    # dossiers (groupes par côtés)
-    groups = _dossiers_groups_U("v1", pts, tx, profondeur, draw)
-    _append_groups_to_polys_U(polys, groups)
-
-    # Accoudoirs U v1
-    if acc_left:
-        if draw["D1"]:
-            polys["accoudoirs"].append([pts["Ay"], pts["Ay2"], pts["By2"], pts["Dy2"], pts["Ay"]])
-        else:
-            polys["accoudoirs"].append([pts["Ay_"], pts["Ay2"], pts["By2"], pts["By"], pts["Ay_"]])
-    if acc_right:
-        if draw["D5"]:
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax2"], pts["Dy3"], pts["By3"]])
-        else:
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax_par"], pts["By4"], pts["By3"]])
-
-    polys["split_flags"]={"left":split_left,"bottom":split_bottom,"right":split_right}
-    return polys, draw
-
-def compute_points_U_v2(tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                        dossier_left=True, dossier_bas=True, dossier_right=True,
-                        acc_left=True, acc_bas=True, acc_right=True):
-    prof = profondeur; pts={}
-    F0x = 10 if dossier_left else 0
-    F0y = 10 if dossier_bas  else 0
-    pts["D0"]=(0,0); pts["D0x"]=(F0x,0); pts["D0y"]=(0,F0y); pts["F0"]=(F0x,F0y)
-
-    # gauche (Fy au ras du bas)
-    top_y_L = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
-    pts["Dy2"]=(0, top_y_L)
-    pts["Ay"]=(0, ty_left); pts["Ay2"]=(F0x+prof, ty_left); pts["Ay_"]=(F0x, ty_left)
-    pts["Fy"]=(F0x, F0y); pts["Fy2"]=(F0x+prof, F0y)
-    pts["Fx"]=(F0x+prof, F0y); pts["Fx2"]=(F0x+prof, F0y+prof)
-    pts["By"]=(F0x, top_y_L); pts["By2"]=(F0x+prof, top_y_L)
-
-    # bas jusqu'à Dx2
-    D02x_x = tx - (10 if (dossier_right or dossier_bas) else 0)
-    Dx2_x  = D02x_x - prof
-    pts["Dx"]=(F0x+prof,0); pts["Dx2"]=(Dx2_x,0)
-    pts["Bx"]=(Dx2_x, F0y); pts["Bx2"]=(Dx2_x, F0y+prof)
-
-    # droite (à DROITE du bas)
-    top_y_R = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
-    pts["F02"]=(D02x_x, F0y); pts["By4"]=(D02x_x, top_y_R); pts["By3"]=(Dx2_x,   top_y_R)
-    pts["D02x"]=(D02x_x,0); pts["D02"]=(tx,0); pts["D02y"]=(tx,F0y); pts["Dy3"]=(tx,top_y_R)
-    pts["Ax"]=(Dx2_x, tz_right); pts["Ax2"]=(tx,tz_right); pts["Ax_par"]=(D02x_x,tz_right)
-
-    pts["_ty_canvas"]=max(ty_left, tz_right)
-    return pts
-
-def build_polys_U_v2(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                     dossier_left=True, dossier_bas=True, dossier_right=True,
-                     acc_left=True, acc_bas=True, acc_right=True):
-    polys={"banquettes":[],"dossiers":[],"accoudoirs":[]}
-
-    draw = {
-        "D1": bool(dossier_left),
-        "D2": bool(dossier_left or dossier_bas),
-        "D3": bool(dossier_bas),
-        "D4": bool(dossier_right or dossier_bas),
-        "D5": bool(dossier_right),
-    }
-
-    F0=pts["F0"]; Fy=pts["Fy"]; Fx=pts["Fx"]; Fx2=pts["Fx2"]; By=pts["By"]; By2=pts["By2"]
-    Bx=pts["Bx"]; Bx2=pts["Bx2"]; By3=pts["By3"]; By4=pts["By4"]; F02=pts["F02"]
-
-    split_left=split_bottom=split_right=False
-
-    # banquettes
-    ban_g=[F0,By,By2,Fx,F0]
-    Lg=abs(By[1]-F0[1])
-    if Lg>SPLIT_THRESHOLD:
-        split_left=True
-        mid_y=_split_mid_int(F0[1],By[1])
-        g_low=[(F0[0],F0[1]),(Fx[0],F0[1]),(Fx[0],mid_y),(F0[0],mid_y),(F0[0],F0[1])]
-        g_up=[(F0[0],mid_y),(By[0],By[1]),(By2[0],By2[1]),(Fx[0],mid_y),(F0[0],mid_y)]
-        polys["banquettes"]+=[g_low,g_up]
-    else:
-        polys["banquettes"].append(ban_g)
-
-    ban_b=[Fx,Bx,Bx2,Fx2,Fx]
-    Lb=abs(Bx2[0]-Fx2[0])
-    if Lb>SPLIT_THRESHOLD:
-        split_bottom=True
-        mid_x=_split_mid_int(Fx2[0],Bx2[0])
-        b_left=[(Fx[0],Fx[1]),(mid_x,Fx[1]),(mid_x,Fx2[1]),(Fx2[0],Fx2[1]),(Fx[0],Fx[1])]
-        b_right=[(mid_x,Fx[1]),(Bx[0],Bx[1]),(Bx2[0],Bx2[1]),(mid_x,Fx2[1]),(mid_x,Fx[1])]
-        polys["banquettes"]+=[b_left,b_right]
-    else:
-        polys["banquettes"].append(ban_b)
-
-    ban_r=[F02,By4,By3,Bx,F02]
-    Lr=abs(By3[1]-F02[1])
-    if Lr>SPLIT_THRESHOLD:
-        split_right=True
-        mid_y=_split_mid_int(F02[1],By3[1])
-        r_low=[(Bx[0],mid_y),(Bx[0],F02[1]),(F02[0],F02[1]),(F02[0],mid_y),(Bx[0],mid_y)]
-        r_up=[(Bx[0],mid_y),(By3[0],By3[1]),(By4[0],By4[1]),(F02[0],mid_y),(Bx[0],mid_y)]
-        polys["banquettes"]+=[r_low,r_up]
-    else:
-        polys["banquettes"].append(ban_r)
-
-    # dossiers
-    groups = _dossiers_groups_U("v2", pts, tx, profondeur, draw)
-    _append_groups_to_polys_U(polys, groups)
-
-    # Accoudoirs U v2
-    if acc_left:
-        if draw["D1"]:
-            polys["accoudoirs"].append([pts["Ay"], pts["Ay2"], pts["By2"], pts["Dy2"], pts["Ay"]])
-        else:
-            polys["accoudoirs"].append([pts["Ay_"], pts["Ay2"], pts["By2"], pts["By"], pts["Ay_"]])
-    if acc_right:
-        if draw["D5"]:
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax2"], pts["Dy3"], pts["By3"]])
-        else:
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax_par"], pts["By4"], pts["By3"]])
-
-    polys["split_flags"]={"left":split_left,"bottom":split_bottom,"right":split_right}
-    return polys, draw
-
-def compute_points_U_v3(tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                        dossier_left=True, dossier_bas=True, dossier_right=True,
-                        acc_left=True, acc_bas=True, acc_right=True):
-    prof = profondeur; pts={}
-    F0x = 10 if dossier_left else 0
-    F0y = 10 if dossier_bas  else 0
-    pts["D0"]=(0,0); pts["D0x"]=(F0x,0); pts["D0y"]=(0,F0y); pts["F0"]=(F0x,F0y)
-
-    # gauche (comme v1)
-    pts["Dy"]=(0, F0y+prof)
-    top_y_L=ty_left-(ACCOUDOIR_THICK if acc_left else 0)
-    pts["Dy2"]=(0, top_y_L)
-    pts["Ay"]=(0, ty_left); pts["Ay2"]=(F0x+prof, ty_left); pts["Ay_"]=(F0x, ty_left)
-    pts["Fy"]=(F0x, F0y+prof); pts["Fy2"]=(F0x+prof, F0y+prof)
-    pts["By"]=(F0x, top_y_L); pts["By2"]=(F0x+prof, top_y_L)
-
-    # bas jusqu'à Bx (= D02x - prof)
-    D02x_x = tx - (10 if (dossier_right or dossier_bas) else 0)
-    Bx_x   = D02x_x - prof
-    pts["Dx"]=(F0x+prof,0)
-    pts["Bx"]=(Bx_x, F0y); pts["Bx2"]=(Bx_x, F0y+prof)
-
-    # droite (à DROITE du bas)
-    top_y_R=tz_right-(ACCOUDOIR_THICK if acc_right else 0)
-    pts["By3"]=(Bx_x,   top_y_R); pts["F02"]=(D02x_x, F0y); pts["By4"]=(D02x_x, top_y_R)
-    pts["D02x"]=(D02x_x,0); pts["D02"]=(tx,0); pts["D02y"]=(tx,F0y); pts["Dy3"]=(tx, top_y_R)
-    pts["Ax"]=(Bx_x, tz_right); pts["Ax2"]=(tx, tz_right); pts["Ax_par"]=(D02x_x, tz_right)
-
-    pts["_ty_canvas"]=max(ty_left,tz_right)
-    return pts
-
-def build_polys_U_v3(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                     dossier_left=True, dossier_bas=True, dossier_right=True,
-                     acc_left=True, acc_bas=True, acc_right=True):
-    polys={"banquettes":[],"dossiers":[],"accoudoirs":[]}
-
-    draw = {
-        "D1": bool(dossier_left),
-        "D2": bool(dossier_left or dossier_bas),
-        "D3": bool(dossier_bas),
-        "D4": bool(dossier_right or dossier_bas),
-        "D5": bool(dossier_right),
-    }
-
-    F0=pts["F0"]; Fy=pts["Fy"]; Fy2=pts["Fy2"]; By=pts["By"]; By2=pts["By2"]
-    Bx=pts["Bx"]; Bx2=pts["Bx2"]; By3=pts["By3"]; By4=pts["By4"]; F02=pts["F02"]
-
-    split_left=split_bottom=split_right=False
-    # banquettes
-    ban_g=[Fy,By,By2,Fy2,Fy]
-    Lg=abs(By[1]-Fy[1])
-    if Lg>SPLIT_THRESHOLD:
-        split_left=True
-        mid_y=_split_mid_int(Fy[1],By[1])
-        g_low=[(Fy[0],Fy[1]),(Fy2[0],Fy[1]),(Fy2[0],mid_y),(Fy[0],mid_y),(Fy[0],Fy[1])]
-        g_up=[(Fy[0],mid_y),(By[0],By[1]),(By2[0],By2[1]),(Fy2[0],mid_y),(Fy[0],mid_y)]
-        polys["banquettes"]+=[g_low,g_up]
-    else:
-        polys["banquettes"].append(ban_g)
-
-    ban_b=[F0,Bx,Bx2,Fy,F0]
-    Lb=abs(Bx[0]-F0[0])
-    if Lb>SPLIT_THRESHOLD:
-        split_bottom=True
-        mid_x=_split_mid_int(F0[0],Bx[0])
-        b_left=[(F0[0],F0[1]),(mid_x,F0[1]),(mid_x,Fy[1]),(Fy[0],Fy[1]),(F0[0],F0[1])]
-        b_right=[(mid_x,F0[1]),(Bx[0],Bx[1]),(Bx2[0],Bx2[1]),(mid_x,Fy[1]),(mid_x,F0[1])]
-        polys["banquettes"]+=[b_left,b_right]
-    else:
-        polys["banquettes"].append(ban_b)
-
-    # droite : By3 - By4 - F02 - Bx - By3
-    ban_r=[By3,By4,F02,Bx,By3]
-    Lr=abs(By3[1]-F02[1])
-    if Lr>SPLIT_THRESHOLD:
-        split_right=True
-        mid_y=_split_mid_int(F02[1],By3[1])
-        r_low=[(Bx[0],F02[1]),(F02[0],F02[1]),(F02[0],mid_y),(Bx[0],mid_y),(Bx[0],F02[1])]
-        r_up=[(Bx[0],mid_y),(By3[0],By3[1]),(By4[0],By4[1]),(F02[0],mid_y),(Bx[0],mid_y)]
-        polys["banquettes"]+=[r_low,r_up]
-    else:
-        polys["banquettes"].append(ban_r)
-
-    # dossiers
-    groups = _dossiers_groups_U("v3", pts, tx, profondeur, draw)
-    _append_groups_to_polys_U(polys, groups)
-
-    # Accoudoirs U v3
-    if acc_left:
-        if draw["D1"]:
-            polys["accoudoirs"].append([pts["Ay"], pts["Ay2"], pts["By2"], pts["Dy2"], pts["Ay"]])
-        else:
-            polys["accoudoirs"].append([pts["Ay_"], pts["Ay2"], pts["By2"], pts["By"], pts["Ay_"]])
-    if acc_right:
-        if draw["D5"]:
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax2"], pts["Dy3"], pts["By3"]])
-        else:
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax_par"], pts["By4"], pts["By3"]])
-
-    polys["split_flags"]={"left":split_left,"bottom":split_bottom,"right":split_right}
-    return polys, draw
-
-def compute_points_U_v4(tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                        dossier_left=True, dossier_bas=True, dossier_right=True,
-                        acc_left=True, acc_bas=True, acc_right=True):
-    prof = profondeur; pts = {}
-    F0x = 10 if dossier_left else 0
-    F0y = 10 if dossier_bas  else 0
-    pts["D0"]  = (0, 0); pts["D0x"] = (F0x, 0); pts["D0y"] = (0, F0y); pts["F0"]  = (F0x, F0y)
-
-    # Montant gauche
-    top_y_L = ty_left - (ACCOUDOIR_THICK if acc_left else 0)
-    pts["By"]  = (F0x, top_y_L); pts["Fx"]=(F0x+profondeur, F0y); pts["Fx2"]=(F0x+profondeur, F0y+prof); pts["By2"]=(F0x+profondeur, top_y_L)
-    pts["Dy2"] = (0, top_y_L);  pts["Ay"]=(0, ty_left); pts["Ay2"]=(F0x+profondeur, ty_left); pts["Ay_"]=(F0x, ty_left)
-
-    # Limite droite
-    D02x_x = tx - (10 if (dossier_right or dossier_bas) else 0)
-    pts["Dx"]=(F0x+profondeur,0); pts["Bx"]=(D02x_x, F0y); pts["Bx2"]=(D02x_x, F0y+prof)
-
-    # Branche droite (au-dessus)
-    top_y_R   = tz_right - (ACCOUDOIR_THICK if acc_right else 0)
-    x_left_R  = D02x_x - prof
-    pts["Fy3"]=(x_left_R, F0y+prof); pts["By3"]=(x_left_R, top_y_R); pts["By4"]=(D02x_x, top_y_R)
-
-    pts["D02x"]=(D02x_x, 0); pts["D02"]=(tx, 0); pts["D02y"]=(tx, F0y); pts["Dy3"]=(tx, top_y_R)
-    pts["Ax"]=(x_left_R, tz_right); pts["Ax2"]=(tx, tz_right); pts["Ax_par"]=(D02x_x, tz_right)
-
-    pts["_ty_canvas"]=max(ty_left, tz_right)
-    return pts
-
-def build_polys_U_v4(pts, tx, ty_left, tz_right, profondeur=DEPTH_STD,
-                     dossier_left=True, dossier_bas=True, dossier_right=True,
-                     acc_left=True, acc_bas=True, acc_right=True):
-    polys = {"banquettes": [], "dossiers": [], "accoudoirs": []}
-
-    draw = {
-        "D1": bool(dossier_left),
-        "D2": bool(dossier_left or dossier_bas),
-        "D3": bool(dossier_bas),
-        "D4": bool(dossier_right or dossier_bas),
-        "D5": bool(dossier_right),
-    }
-
-    F0=pts["F0"]; Fx=pts["Fx"]; Fx2=pts["Fx2"]; By=pts["By"]; By2=pts["By2"]
-    Bx=pts["Bx"]; Bx2=pts["Bx2"]; Fy3=pts["Fy3"]; By3=pts["By3"]; By4=pts["By4"]
-
-    split_left=split_bottom=split_right=False
-
-    # banquettes
-    ban_g = [F0, By, By2, Fx, F0]
-    Lg = abs(By[1] - F0[1])
-    if Lg > SPLIT_THRESHOLD:
-        split_left=True
-        mid_y = _split_mid_int(F0[1], By[1])
-        g_low  = [(F0[0],F0[1]), (Fx[0],F0[1]), (Fx[0],mid_y), (F0[0],mid_y), (F0[0],F0[1])]
-        g_high = [(F0[0],mid_y), (By[0],By[1]), (By2[0],By2[1]), (Fx[0],mid_y), (F0[0],mid_y)]
-        polys["banquettes"] += [g_low, g_high]
-    else:
-        polys["banquettes"].append(ban_g)
-
-    ban_b = [Fx, Bx, Bx2, Fx2, Fx]
-    Lb = abs(Bx2[0] - Fx2[0])
-    if Lb > SPLIT_THRESHOLD:
-        split_bottom=True
-        mid_x = _split_mid_int(Fx2[0], Bx2[0])
-        b_left  = [(Fx[0],Fx[1]), (mid_x,Fx[1]), (mid_x,Fx2[1]), (Fx2[0],Fx2[1]), (Fx[0],Fx[1])]
-        b_right = [(mid_x,Fx[1]), (Bx[0],Bx[1]), (Bx2[0],Bx2[1]), (mid_x,Fx2[1]), (mid_x,Fx[1])]
-        polys["banquettes"] += [b_left, b_right]
-    else:
-        polys["banquettes"].append(ban_b)
-
-    ban_r = [Fy3, By3, By4, Bx2, Fy3]
-    Lr = abs(By3[1] - Fy3[1])
-    if Lr > SPLIT_THRESHOLD:
-        split_right=True
-        mid_y = _split_mid_int(Fy3[1], By3[1])
-        r_low  = [(Fy3[0],Fy3[1]), (Bx2[0],Fy3[1]), (Bx2[0],mid_y), (Fy3[0],mid_y), (Fy3[0],Fy3[1])]
-        r_high = [(Fy3[0],mid_y), (By3[0],By3[1]), (By4[0],By4[1]), (Bx2[0],mid_y), (Fy3[0],mid_y)]
-        polys["banquettes"] += [r_low, r_high]
-    else:
-        polys["banquettes"].append(ban_r)
-
-    # dossiers
-    groups = _dossiers_groups_U("v4", pts, tx, profondeur, draw)
-    _append_groups_to_polys_U(polys, groups)
-
-    # Accoudoirs U v4
-    if acc_left:
-        if draw["D1"]:
-            polys["accoudoirs"].append([pts["Ay"], pts["Ay2"], pts["By2"], pts["Dy2"], pts["Ay"]])
-        else:
-            polys["accoudoirs"].append([pts["Ay_"], pts["Ay2"], pts["By2"], pts["By"], pts["Ay_"]])
-    if acc_right:
-        if draw["D5"]:
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax2"], pts["Dy3"], pts["By3"]])
-        else:
-            polys["accoudoirs"].append([pts["By3"], pts["Ax"], pts["Ax_par"], pts["By4"], pts["By3"]])
-
-    polys["split_flags"]={"left":split_left,"bottom":split_bottom,"right":split_right}
-    return polys, draw
-
-# ---------- Dossiers par côtés (U) ----------
-def _dossiers_groups_U(variant, pts, tx, profondeur, draw):
-    groups = {"left": {"D1":[], "D2":[]},
-              "bottom":{"D3":[]},
-              "right":{"D4":[], "D5":[]}}
-    F0x, F0y = pts["F0"]
-
-    if variant == "v1":
-        if draw["D1"]:
-            groups["left"]["D1"].append([pts["Dy2"], pts["By"], pts["Fy"], pts["Dy"], pts["Dy2"]])
-        if draw["D2"]:
-            groups["left"]["D2"].append([pts["D0x"], pts["D0"], pts["Dy"], pts["Fy"], pts["D0x"]])
-        if draw["D3"]:
-            groups["bottom"]["D3"].append([pts["D02x"], pts["D0x"], pts["F0"], pts["Bx"], pts["D02x"]])
-        if draw["D4"]:
-            groups["right"]["D4"].append([pts["D02x"], pts["D02"], pts["Dy3"], pts["Bx2"], pts["D02x"]])
-        if draw["D5"]:
-            x0 = pts["D02x"][0]; y1 = F0y + profondeur; y_top = pts["By4"][1]
-            groups["right"]["D5"].append(_rectU(x0, y1, tx, y_top))
-
-    elif variant == "v2":
-        if draw["D1"]:
-            groups["left"]["D1"].append([pts["D0x"], pts["By"], pts["Dy2"], pts["D0"], pts["D0x"]])
-        if draw["D2"]:
-            groups["left"]["D2"].append([pts["D0x"], pts["Dx"], pts["Fx"], pts["F0"], pts["D0x"]])
-        if draw["D3"]:
-            groups["bottom"]["D3"].append([pts["Dx"], pts["Dx2"], pts["Bx"], pts["Fx"], pts["Dx"]])
-        if draw["D4"]:
-            groups["right"]["D4"].append([pts["Dx2"], pts["D02x"], pts["F02"], pts["Bx"], pts["Dx2"]])
-        if draw["D5"]:
-            groups["right"]["D5"].append([pts["D02x"], pts["D02"], pts["Dy3"], pts["By4"], pts["D02x"]])
-
-    elif variant == "v3":
-        if draw["D1"]:
-            groups["left"]["D1"].append([pts["Dy"], pts["Fy"], pts["By"], pts["Dy2"], pts["Dy"]])
-        if draw["D2"]:
-            groups["left"]["D2"].append([pts["D0x"], pts["D0"], pts["Dy"], pts["Fy"], pts["D0x"]])
-        if draw["D3"]:
-            xL = F0x; xR = pts["Bx"][0]; y0 = 0; y1 = F0y
-            groups["bottom"]["D3"].append(_rectU(xL, y0, xR, y1))
-        if draw["D4"]:
-            bx0 = pts["Bx"][0]
-            groups["right"]["D4"].append([
-                pts["Dx"], pts["D02x"], pts["F02"], pts["Bx"], (bx0, 0), pts["Dx"]
-            ])
-        if draw["D5"]:
-            groups["right"]["D5"].append([pts["Dy3"], pts["By4"], pts["D02x"], pts["D02"], pts["Dy3"]])
-
-    else:  # v4
-        if draw["D1"]:
-            groups["left"]["D1"].append([pts["D0x"], pts["By"], pts["Dy2"], pts["D0"], pts["D0x"]])
-        if draw["D2"]:
-            groups["left"]["D2"].append([pts["D0x"], pts["Dx"], pts["Fx"], pts["F0"], pts["D0x"]])
-        if draw["D3"]:
-            groups["bottom"]["D3"].append([pts["Dx"], pts["D02x"], pts["Bx"], pts["Fx"], pts["Dx"]])
-        F02x = pts["D02x"][0]; y0 = F0y; y1 = y0 + profondeur
-        if draw["D4"]:
-            groups["right"]["D4"] += [
-                _rectU(F02x, 0,  tx, y0),
-                _rectU(F02x, y0, tx, y1),
-            ]
-        if draw["D5"]:
-            y_top = pts["By4"][1]
-            groups["right"]["D5"].append(_rectU(F02x, y1, tx, y_top))
-    return groups
-
-def _append_groups_to_polys_U(polys, groups):
-    order = {"left":["D1","D2"], "bottom":["D3"], "right":["D4","D5"]}
-    for side in ("left","bottom","right"):
-        for d in order[side]:
-            for poly in groups[side].get(d, []):
-                polys["dossiers"].append(poly)
-    polys["dossiers_by_side"] = groups  # info
-
 # === AUTO optimisé pour U (taille + orientation) ===
 def _best_orientation_score_U(variant, pts, drawn, size, traversins=None):
-    F0x, F0y = pts["F0"]
+    F0x, F0y = pts.F0
     x_end = _u_variant_x_end(variant, pts)
 
     def cnt_h(x0, x1): return int(max(0, x1-x0)//size)
     def cnt_v(y0, y1): return int(max(0, y1-y0)//size)
 
-    y_end_L = pts["By"][1]
-    y_end_R = pts["By4"][1]
+    y_end_L = pts.By[1]
+    y_end_R = pts.By4[1]
     if traversins:
         if "g" in traversins: y_end_L -= TRAVERSIN_THK
         if "d" in traversins: y_end_R -= TRAVERSIN_THK
@@ -3205,9 +1907,9 @@ def _choose_cushion_size_auto_U(variant, pts, drawn, traversins=None):
 
 def _draw_cushions_variant_U(t, tr, variant, pts, size, drawn, traversins=None):
     (score_tuple, xs, xe, yL0, yR0) = _best_orientation_score_U(variant, pts, drawn, size, traversins=traversins)
-    F0x, F0y = pts["F0"]
-    x_col = pts["Bx"][0] if variant in ("v1","v4") else pts["F02"][0]
-    y_end_L = pts["By"][1]; y_end_R = pts["By4"][1]
+    F0x, F0y = pts.F0
+    x_col = pts.Bx[0] if variant in ("v1","v4") else pts.F02[0]
+    y_end_L = pts.By[1]; y_end_R = pts.By4[1]
     if traversins:
         if "g" in traversins: y_end_L -= TRAVERSIN_THK
         if "d" in traversins: y_end_R -= TRAVERSIN_THK
@@ -3239,22 +1941,35 @@ def _draw_cushions_variant_U(t, tr, variant, pts, size, drawn, traversins=None):
 
     return count
 
+# Accoudoirs du rendu turtle : hauteur selon le dossier latéral dessiné (D1 / D5).
+# Liste propre au rendu, les polygones mémoïsés du noyau ne sont pas modifiés.
+def _accoudoirs_U(pts, drawn, acc_left, acc_right):
+    accoudoirs = []
+    if acc_left:
+        if drawn["D1"]:
+            accoudoirs.append([pts.Ay, pts.Ay2, pts.By2, pts.Dy2, pts.Ay])
+        else:
+            accoudoirs.append([pts.Ay_, pts.Ay2, pts.By2, pts.By, pts.Ay_])
+    if acc_right:
+        if drawn["D5"]:
+            accoudoirs.append([pts.By3, pts.Ax, pts.Ax2, pts.Dy3, pts.By3])
+        else:
+            accoudoirs.append([pts.By3, pts.Ax, pts.Ax_par, pts.By4, pts.By3])
+    return accoudoirs
+
 def _render_common_U(variant, tx, ty_left, tz_right,
                      profondeur, dossier_left, dossier_bas, dossier_right,
                      acc_left, acc_bas, acc_right, coussins, window_title,
-                     compute_fn, build_fn, traversins=None, couleurs=None):
-    pts = compute_fn(tx, ty_left, tz_right, profondeur,
-                     dossier_left, dossier_bas, dossier_right,
-                     acc_left, acc_bas, acc_right)
-    polys, drawn = build_fn(pts, tx, ty_left, tz_right, profondeur,
-                            dossier_left, dossier_bas, dossier_right,
-                            acc_left, acc_bas, acc_right)
-    _assert_banquettes_max_250(polys)
+                     traversins=None, couleurs=None):
+    pts, polys, drawn = geometrie("U", variant, tx, ty_left, tz_right, profondeur,
+                                  dossier_left, dossier_bas, dossier_right,
+                                  acc_left, acc_bas, acc_right)
+    accoudoirs = _accoudoirs_U(pts, drawn, acc_left, acc_right)
 
     trv = _parse_traversins_spec(traversins, allowed={"g","d"})
     legend_items = _resolve_and_apply_colors(couleurs)
 
-    ty_canvas = pts["_ty_canvas"]
+    ty_canvas = pts._ty_canvas
     screen = turtle.Screen(); screen.setup(WIN_W, WIN_H)
     screen.title(f"{window_title} — {variant} — tx={tx} / ty(left)={ty_left} / tz(right)={tz_right} — prof={profondeur}")
     t = turtle.Turtle(visible=False); t.speed(0); screen.tracer(False)
@@ -3266,7 +1981,7 @@ def _render_common_U(variant, tx, ty_left, tz_right,
         if _poly_has_area(p): draw_polygon_cm(t, tr, p, fill=COLOR_DOSSIER)
     for p in polys["banquettes"]:
         draw_polygon_cm(t, tr, p, fill=COLOR_ASSISE)
-    for p in polys["accoudoirs"]:
+    for p in accoudoirs:
         draw_polygon_cm(t, tr, p, fill=COLOR_ACC)
 
     # Traversins + comptage
@@ -3292,7 +2007,7 @@ def _render_common_U(variant, tx, ty_left, tz_right,
     # Labels dossiers / accoudoirs
     for p in polys["dossiers"]:
         if _poly_has_area(p): label_poly(t, tr, p, "10")
-    for p in polys["accoudoirs"]:
+    for p in accoudoirs:
         if _poly_has_area(p): label_poly(t, tr, p, "15")
 
     # ===== COUSSINS =====
@@ -3328,7 +2043,7 @@ def _render_common_U(variant, tx, ty_left, tz_right,
     print(f"=== Rapport canapé U (variant {variant}) ===")
     print(f"Dimensions : tx={tx} / ty(left)={ty_left} / tz(right)={tz_right} — prof={profondeur}")
     print(f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}")
-    print(f"Dossiers : {len(polys['dossiers'])} (+{add_split} via scission) | Accoudoirs : {len(polys['accoudoirs'])}")
+    print(f"Dossiers : {len(polys['dossiers'])} (+{add_split} via scission) | Accoudoirs : {len(accoudoirs)}")
     print(f"Banquettes d’angle : 0")
     print(f"Traversins : {n_traversins} × 70x30")
     print(f"Coussins : {total_line}")
@@ -3341,7 +2056,7 @@ def render_U_v1(tx, ty_left, tz_right, profondeur=DEPTH_STD,
     _render_common_U("v1", tx, ty_left, tz_right, profondeur,
                      dossier_left, dossier_bas, dossier_right,
                      acc_left, acc_bas, acc_right, coussins, window_title,
-                     compute_points_U_v1, build_polys_U_v1, traversins=traversins, couleurs=couleurs)
+                     traversins=traversins, couleurs=couleurs)
 
 def render_U_v2(tx, ty_left, tz_right, profondeur=DEPTH_STD,
                 dossier_left=True, dossier_bas=True, dossier_right=True,
@@ -3350,7 +2065,7 @@ def render_U_v2(tx, ty_left, tz_right, profondeur=DEPTH_STD,
     _render_common_U("v2", tx, ty_left, tz_right, profondeur,
                      dossier_left, dossier_bas, dossier_right,
                      acc_left, acc_bas, acc_right, coussins, window_title,
-                     compute_points_U_v2, build_polys_U_v2, traversins=traversins, couleurs=couleurs)
+                     traversins=traversins, couleurs=couleurs)
 
 def render_U_v3(tx, ty_left, tz_right, profondeur=DEPTH_STD,
                 dossier_left=True, dossier_bas=True, dossier_right=True,
@@ -3359,7 +2074,7 @@ def render_U_v3(tx, ty_left, tz_right, profondeur=DEPTH_STD,
     _render_common_U("v3", tx, ty_left, tz_right, profondeur,
                      dossier_left, dossier_bas, dossier_right,
                      acc_left, acc_bas, acc_right, coussins, window_title,
-                     compute_points_U_v3, build_polys_U_v3, traversins=traversins, couleurs=couleurs)
+                     traversins=traversins, couleurs=couleurs)
 
 def render_U_v4(tx, ty_left, tz_right, profondeur=DEPTH_STD,
                 dossier_left=True, dossier_bas=True, dossier_right=True,
@@ -3368,25 +2083,7 @@ def render_U_v4(tx, ty_left, tz_right, profondeur=DEPTH_STD,
     _render_common_U("v4", tx, ty_left, tz_right, profondeur,
                      dossier_left, dossier_bas, dossier_right,
                      acc_left, acc_bas, acc_right, coussins, window_title,
-                     compute_points_U_v4, build_polys_U_v4, traversins=traversins, couleurs=couleurs)
-
-# ---------- AUTO sélection U ----------
-def _metrics_U(variant, tx, ty_left, tz_right, profondeur,
-               dossier_left, dossier_bas, dossier_right,
-               acc_left, acc_bas, acc_right):
-    comp = {"v1":compute_points_U_v1, "v2":compute_points_U_v2,
-            "v3":compute_points_U_v3, "v4":compute_points_U_v4}[variant]
-    build= {"v1":build_polys_U_v1,   "v2":build_polys_U_v2,
-            "v3":build_polys_U_v3,   "v4":build_polys_U_v4}[variant]
-    pts = comp(tx, ty_left, tz_right, profondeur,
-               dossier_left, dossier_bas, dossier_right,
-               acc_left, acc_bas, acc_right)
-    polys, _ = build(pts, tx, ty_left, tz_right, profondeur,
-                     dossier_left, dossier_bas, dossier_right,
-                     acc_left, acc_bas, acc_right)
-    nb_banquettes = len(polys["banquettes"])
-    scissions = max(0, nb_banquettes - 3)  # U = 3 groupes (G,B,D)
-    return nb_banquettes, scissions
+                     traversins=traversins, couleurs=couleurs)
 
 def render_U(tx, ty_left, tz_right,
              profondeur=DEPTH_STD,
@@ -3406,23 +2103,10 @@ def render_U(tx, ty_left, tz_right,
             coussins, window_title=f"{window_title} [{v}]", traversins=traversins, couleurs=couleurs
         )
 
-    # auto
-    variants = ["v1","v2","v3","v4"]
-    metrics = {vv:_metrics_U(vv, tx, ty_left, tz_right, profondeur,
-                             dossier_left, dossier_bas, dossier_right,
-                             acc_left, acc_bas, acc_right)
-               for vv in variants}
-    # critère 1 : moins de banquettes
-    min_b = min(m[0] for m in metrics.values())
-    tied = [vv for vv,(b,s) in metrics.items() if b==min_b]
-    if len(tied) > 1:
-        # tie-break : moins de scissions
-        min_s = min(metrics[vv][1] for vv in tied)
-        tied = [vv for vv in tied if metrics[vv][1]==min_s]
-    # tie-break final (stabilité)
-    for pref in ["v2","v1","v3","v4"]:
-        if pref in tied:
-            choice=pref; break
+    # auto : moins de banquettes (scissions prédites par les cotes) ; égalité -> v2, v1, v3, v4
+    choice = _predict_variant_U(tx, ty_left, tz_right, profondeur,
+                                dossier_left, dossier_bas, dossier_right,
+                                acc_left, acc_bas, acc_right)
 
     return render_U(tx, ty_left, tz_right,
                     profondeur, dossier_left, dossier_bas, dossier_right,
@@ -3434,83 +2118,6 @@ def render_U(tx, ty_left, tz_right,
 # ===================  SIMPLE droit (S1)  =============================
 # =====================================================================
 
-def compute_points_simple_S1(tx,
-                             profondeur=DEPTH_STD,
-                             dossier=True,
-                             acc_left=True, acc_right=True,
-                             meridienne_side=None, meridienne_len=0):
-    if meridienne_side == 'g' and acc_left:
-        raise ValueError("Méridienne gauche interdite avec accoudoir gauche.")
-    if meridienne_side == 'd' and acc_right:
-        raise ValueError("Méridienne droite interdite avec accoudoir droit.")
-
-    xL_in = ACCOUDOIR_THICK if acc_left  else 0
-    xR_in = tx - (ACCOUDOIR_THICK if acc_right else 0)
-    y_base = DOSSIER_THICK if dossier else 0
-
-    pts = {}
-    pts["Ay"]  = (0, 0);          pts["Ay2"] = (0, profondeur)
-    pts["Ax"]  = (tx, 0);         pts["Ax2"] = (tx, profondeur)
-    pts["B0"]  = (xL_in, y_base); pts["By"]  = (xL_in, profondeur)
-    pts["Bx"]  = (xR_in, y_base); pts["Bx2"] = (xR_in, profondeur)
-    pts["D0"]  = (xL_in, 0);      pts["Dx"]  = (xR_in, 0)
-
-    if meridienne_side == 'g' and meridienne_len > 0:
-        start_x = min(max(xL_in + meridienne_len, xL_in), xR_in)
-        pts["D0_m"] = (start_x, 0); pts["B0_m"] = (start_x, y_base)
-    if meridienne_side == 'd' and meridienne_len > 0:
-        end_x = max(min(xR_in - meridienne_len, xR_in), xL_in)
-        pts["Dx_m"] = (end_x, 0); pts["Bx_m"] = (end_x, y_base)
-
-    pts["_tx"] = tx; pts["_prof"] = profondeur
-    return pts
-
-def build_polys_simple_S1(pts, dossier=True, acc_left=True, acc_right=True,
-                          meridienne_side=None, meridienne_len=0):
-    polys = {"banquettes": [], "dossiers": [], "accoudoirs": []}
-    # --- Ajout pour scission de dossier si banquette scindée ---
-    mid_x = None
-
-    ban = [pts["By"], pts["B0"], pts["Bx"], pts["Bx2"], pts["By"]]
-    L = abs(pts["Bx"][0] - pts["B0"][0])
-    split = False
-    if L > SPLIT_THRESHOLD:
-        split = True
-        mid_x = _split_mid_int(pts["B0"][0], pts["Bx"][0])
-        left  = [pts["By"], pts["B0"], (mid_x, pts["B0"][1]), (mid_x, pts["By"][1]), pts["By"]]
-        right = [(mid_x, pts["By"][1]), (mid_x, pts["B0"][1]), pts["Bx"], pts["Bx2"], (mid_x, pts["By"][1])]
-        polys["banquettes"] += [left, right]
-    else:
-        polys["banquettes"].append(ban)
-
-    if dossier:
-        x0, x1 = pts["D0"][0], pts["Dx"][0]
-        if meridienne_side == 'g' and meridienne_len > 0: x0 = pts["D0_m"][0]
-        if meridienne_side == 'd' and meridienne_len > 0: x1 = pts["Dx_m"][0]
-        if x1 > x0 + 1e-6:
-            # Si banquette scindée et mid_x tombe dans le segment → scinder le dossier aussi
-            if (mid_x is not None) and (x0 < mid_x < x1):
-                left_dossier  = [(x0,0), (mid_x,0), (mid_x,DOSSIER_THICK), (x0,DOSSIER_THICK), (x0,0)]
-                right_dossier = [(mid_x,0), (x1,0), (x1,DOSSIER_THICK), (mid_x,DOSSIER_THICK), (mid_x,0)]
-                polys["dossiers"] += [left_dossier, right_dossier]
-            else:
-                # sinon, un seul dossier
-                polys["dossiers"].append([(x0,0),(x1,0),(x1,DOSSIER_THICK),(x0,DOSSIER_THICK),(x0,0)])
-
-    if acc_left:
-        if dossier:
-            polys["accoudoirs"].append([pts["Ay"], pts["Ay2"], pts["By"], pts["D0"], pts["Ay"]])
-        else:
-            polys["accoudoirs"].append([pts["Ay"], pts["Ay2"], pts["By"], pts["B0"], pts["Ay"]])
-    if acc_right:
-        if dossier:
-            polys["accoudoirs"].append([pts["Bx2"], pts["Dx"], pts["Ax"], pts["Ax2"], pts["Bx2"]])
-        else:
-            polys["accoudoirs"].append([pts["Bx2"], pts["Ax2"], pts["Ax"], pts["Bx"], pts["Bx2"]])
-
-    polys["split_flags"]={"center":split}
-    return polys
-
 def _choose_cushion_size_auto_simple_S1(x0, x1):
     usable = max(0, x1 - x0)
     best, best_score = 65, (1e9, -1)
@@ -3524,11 +2131,11 @@ def _choose_cushion_size_auto_simple_S1(x0, x1):
 def _draw_coussins_simple_S1(t, tr, pts, size,
                              meridienne_side=None, meridienne_len=0,
                              traversins=None):
-    x0 = pts["B0"][0]; x1 = pts["Bx"][0]
+    x0 = pts.B0[0]; x1 = pts.Bx[0]
     if meridienne_side == 'g' and meridienne_len > 0:
-        x0 = max(x0, pts.get("B0_m", (x0, 0))[0])
+        x0 = max(x0, pts.B0_fin[0])
     if meridienne_side == 'd' and meridienne_len > 0:
-        x1 = min(x1, pts.get("Bx_m", pts["Bx"])[0])
+        x1 = min(x1, pts.Bx_fin[0])
     if traversins:
         if "g" in traversins: x0 += TRAVERSIN_THK
         if "d" in traversins: x1 -= TRAVERSIN_THK
@@ -3538,7 +2145,7 @@ def _draw_coussins_simple_S1(t, tr, pts, size,
         return int(max(0, xe - xs) // size)
     off = CUSHION_DEPTH if count(CUSHION_DEPTH) > count(0) else 0
 
-    y = pts["B0"][1]
+    y = pts.B0[1]
     x = x0 + off; n = 0
     while x + size <= x1 + 1e-6:
         poly = [(x, y), (x+size, y), (x+size, y+CUSHION_DEPTH), (x, y+CUSHION_DEPTH), (x, y)]
@@ -3547,6 +2154,19 @@ def _draw_coussins_simple_S1(t, tr, pts, size,
         x += size; n += 1
     return n
 
+# Dossier scindé au droit de la scission de banquette (rendu turtle) ;
+# liste propre au rendu, les polygones mémoïsés du noyau ne sont pas modifiés.
+def _dossiers_simple_S1(pts, polys):
+    dossiers = polys["dossiers"]
+    if not (dossiers and polys["split_flags"]["center"]):
+        return dossiers
+    mid_x = _split_mid_int(pts.B0[0], pts.Bx[0])
+    (x0, _), (x1, _) = dossiers[0][0], dossiers[0][1]
+    if not x0 < mid_x < x1:
+        return dossiers
+    return [[(x0,0), (mid_x,0), (mid_x,DOSSIER_THICK), (x0,DOSSIER_THICK), (x0,0)],
+            [(mid_x,0), (x1,0), (x1,DOSSIER_THICK), (mid_x,DOSSIER_THICK), (mid_x,0)]]
+
 def render_Simple1(tx,
                    profondeur=DEPTH_STD,
                    dossier=True,
@@ -3556,11 +2176,9 @@ def render_Simple1(tx,
                    traversins=None,
                    couleurs=None,
                    window_title="Canapé simple 1"):
-    pts   = compute_points_simple_S1(tx, profondeur, dossier, acc_left, acc_right,
-                                     meridienne_side, meridienne_len)
-    polys = build_polys_simple_S1(pts, dossier, acc_left, acc_right,
-                                  meridienne_side, meridienne_len)
-    _assert_banquettes_max_250(polys)
+    pts, polys, _ = geometrie("S1", None, tx, profondeur, dossier, acc_left, acc_right,
+                              meridienne_side, meridienne_len)
+    dossiers = _dossiers_simple_S1(pts, polys)
 
     trv = _parse_traversins_spec(traversins, allowed={"g","d"})
     legend_items = _resolve_and_apply_colors(couleurs)
@@ -3572,7 +2190,7 @@ def render_Simple1(tx,
 
     # (Quadrillage et repères supprimés)
 
-    for p in polys["dossiers"]:
+    for p in dossiers:
         if _poly_has_area(p):  draw_polygon_cm(t, tr, p, fill=COLOR_DOSSIER)
     for p in polys["banquettes"]:
         draw_polygon_cm(t, tr, p, fill=COLOR_ASSISE)
@@ -3595,7 +2213,7 @@ def render_Simple1(tx,
             label_poly_offset_cm(t, tr, poly, text, dx_cm=CUSHION_DEPTH+10, dy_cm=0.0)
         else:
             label_poly(t, tr, poly, text)
-    for p in polys["dossiers"]:
+    for p in dossiers:
         if _poly_has_area(p): label_poly(t, tr, p, "10")
     for p in polys["accoudoirs"]:
         if _poly_has_area(p): label_poly(t, tr, p, "15")
@@ -3603,8 +2221,8 @@ def render_Simple1(tx,
     # ===== COUSSINS =====
     spec = _parse_coussins_spec(coussins)
     if spec["mode"] == "auto":
-        x0 = pts.get("B0_m", pts["B0"])[0] if meridienne_side == 'g' else pts["B0"][0]
-        x1 = pts.get("Bx_m", pts["Bx"])[0] if meridienne_side == 'd' else pts["Bx"][0]
+        x0 = pts.B0_fin[0] if meridienne_side == 'g' else pts.B0[0]
+        x1 = pts.Bx_fin[0] if meridienne_side == 'd' else pts.Bx[0]
         if trv:
             if "g" in trv: x0 += TRAVERSIN_THK
             if "d" in trv: x1 -= TRAVERSIN_THK
@@ -3631,7 +2249,7 @@ def render_Simple1(tx,
     print("=== Rapport Canapé simple 1 ===")
     print(f"Dimensions : {tx}×{profondeur} cm")
     print(f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}")
-    print(f"Dossiers   : {len(polys['dossiers'])} (+{add_split} via scission)  |  Accoudoirs : {len(polys['accoudoirs'])}")
+    print(f"Dossiers   : {len(dossiers)} (+{add_split} via scission)  |  Accoudoirs : {len(polys['accoudoirs'])}")
     print(f"Banquettes d’angle : 0")
     print(f"Traversins : {n_traversins} × 70x30")
     print(f"Coussins   : {total_line}")
@@ -3655,7 +2273,6 @@ def render_Simple1(tx,
 # variantes, dossiers, accoudoirs, méridienne, traversins, modes coussins, scissions…
 
 
-
 def TEST_01_U_V2_base():
 
     render_U(
@@ -3673,7 +2290,6 @@ def TEST_01_U_V2_base():
     )
 
 
-
 def TEST_02_U_V4_traversins_both_80():
 
     render_U(
@@ -3691,7 +2307,6 @@ def TEST_02_U_V4_traversins_both_80():
     )
 
 
-
 def TEST_03_U_auto_variant_g():
 
     render_U(
@@ -3703,8 +2318,6 @@ def TEST_03_U_auto_variant_g():
     )
 
 
-
-
 def TEST_04_U_V3_sans_dossier_droit_p():
 
     render_U(
@@ -3719,7 +2332,6 @@ def TEST_04_U_V3_sans_dossier_droit_p():
     )
 
 
-
 def TEST_05_S1_traversins_both_auto():
 
     render_Simple1(
@@ -3737,7 +2349,6 @@ def TEST_05_S1_traversins_both_auto():
     )
 
 
-
 def TEST_06_S1_mer_droite_120_no_accR_90_TRg():
 
     render_Simple1(
@@ -3755,7 +2366,6 @@ def TEST_06_S1_mer_droite_120_no_accR_90_TRg():
     )
 
 
-
 def TEST_07_LNF_v1_mer_gauche_100_no_accL_p_TRg():
 
     render_LNF_v1(
@@ -3768,7 +2378,6 @@ def TEST_07_LNF_v1_mer_gauche_100_no_accL_p_TRg():
     )
 
 
-
 def TEST_08_LNF_v2_mer_bas_120_no_accB_gs_TRb():
 
     render_LF_variant(
@@ -3782,7 +2391,6 @@ def TEST_08_LNF_v2_mer_bas_120_no_accB_gs_TRb():
     )
 
 
-
 def TEST_09_LNF_v1_grand_split_valise_TRgb():
 
     render_LNF_v2(
@@ -3802,7 +2410,6 @@ def TEST_09_LNF_v1_grand_split_valise_TRgb():
     )
 
 
-
 def TEST_10_LNF_v2_compact_75():
 
     render_LNF_v2(
@@ -3822,7 +2429,6 @@ def TEST_10_LNF_v2_compact_75():
     )
 
 
-
 def TEST_11_LF_mer_bas_100_no_accB_auto_TRgb():
 
     render_LF_variant(
@@ -3842,7 +2448,6 @@ def TEST_11_LF_mer_bas_100_no_accB_auto_TRgb():
     )
 
 
-
 def TEST_12_LF_p_same_TRg():
 
     render_LF_variant(
@@ -3862,7 +2467,6 @@ def TEST_12_LF_p_same_TRg():
     )
 
 
-
 def TEST_13_U1F_v2_mer_g_120_no_accL_s_TRd():
 
     render_U1F_v2(
@@ -3882,7 +2486,6 @@ def TEST_13_U1F_v2_mer_g_120_no_accL_s_TRd():
     )
 
 
-
 def TEST_14_U1F_v4_mer_d_90_no_accR_65_TRg():
 
     render_U1F_v4(
@@ -3902,7 +2505,6 @@ def TEST_14_U1F_v4_mer_d_90_no_accR_65_TRg():
     )
 
 
-
 def TEST_15_U1F_v3_TR_both_g():
 
     render_U1F_v3(
@@ -3922,7 +2524,6 @@ def TEST_15_U1F_v3_TR_both_g():
     )
 
 
-
 def TEST_16_U1F_v1_p_same():
 
     render_U1F_v1(
@@ -3942,7 +2543,6 @@ def TEST_16_U1F_v1_p_same():
     )
 
 
-
 def TEST_17_U2F_valise_TR_both():
 
     render_U2f_variant(
@@ -3962,7 +2562,6 @@ def TEST_17_U2F_valise_TR_both():
     )
 
 
-
 def TEST_18_U2F_mer_d_120_no_accR_80_TRg():
 
     render_U2f_variant(
@@ -3982,7 +2581,6 @@ def TEST_18_U2F_mer_d_120_no_accR_80_TRg():
     )
 
 
-
 def TEST_19_U_V2_grand_TRg_90():
 
     render_U(
@@ -4000,7 +2598,6 @@ def TEST_19_U_V2_grand_TRg_90():
     )
 
 
-
 def TEST_20_U_V1_left_only_TRg_auto():
 
     render_U(
@@ -4018,7 +2615,6 @@ def TEST_20_U_V1_left_only_TRg_auto():
     )
 
 
-
 # =========================
 
 # ===== EXÉCUTION =========
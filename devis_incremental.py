@@ -0,0 +1,113 @@
+"""
+Moteur de devis incrémental pour l'application Streamlit
+
+Garde la dernière configuration, sa figure, sa disposition de coussins et son devis,
+puis ne refait que ce que les paramètres modifiés touchent :
+  - schéma (géométrie, variante, coussins) : seulement si une cote, une option de forme
+    ou le type de coussins change ; les côtés dont la longueur n'a pas bougé gardent
+    leur taille de coussins tant que l'écart global ≤ 5 cm reste tenable
+  - devis : seulement les lignes dépendant des paramètres modifiés
+"""
+
+from canapematplot import fermer_figure, plan_precedent
+from pricing import calculer_prix_total, calculer_prix_incremental
+from sofa_layout import layout as sofa_layout
+
+# Paramètres du schéma (ceux de generer_schema_canape, type_coussins -> coussins)
+PARAMS_SCHEMA = (
+    'type_canape', 'tx', 'ty', 'tz', 'profondeur',
+    'acc_left', 'acc_right', 'acc_bas',
+    'dossier_left', 'dossier_bas', 'dossier_right',
+    'meridienne_side', 'meridienne_len', 'type_coussins'
+)
+
+# Paramètres du devis (ceux de calculer_prix_total, hors nb_coussins_assise)
+PARAMS_PRIX = (
+    'type_canape', 'tx', 'ty', 'tz', 'profondeur', 'type_coussins',
+    'type_mousse', 'epaisseur', 'acc_left', 'acc_right', 'acc_bas',
+    'dossier_left', 'dossier_bas', 'dossier_right',
+    'nb_coussins_deco', 'nb_traversins_supp', 'has_surmatelas', 'has_meridienne'
+)
+
+
+class DevisIncremental:
+    """
+    Un moteur par session (st.session_state) : generer_schema est la fonction
+    de l'appli qui renvoie (figure, disposition des coussins). Le moteur garde
+    la seule figure vivante et la ferme dès qu'un nouveau schéma la remplace.
+    """
+
+    def __init__(self, generer_schema):
+        self.generer_schema = generer_schema
+        self.config = None
+        self.config_schema = None
+        self.fig = None
+        self.layout = None
+        self.prix = None
+
+    def changements(self, config, reference=None):
+        """
+        Noms des paramètres dont la valeur diffère de la configuration de référence
+        """
+        reference = self.config if reference is None else reference
+        if reference is None:
+            return set(config)
+        return {k for k in set(config) | set(reference) if config.get(k) != reference.get(k)}
+
+    def _refaire_schema(self, config):
+        precedent = None
+        if self.config_schema is not None \
+                and config['type_canape'] == self.config_schema['type_canape'] \
+                and config['type_coussins'] == self.config_schema['type_coussins']:
+            precedent = self.layout
+        params = {k: config[k] for k in PARAMS_SCHEMA if k != 'type_coussins'}
+        with plan_precedent(precedent, config['type_coussins']):
+            fig, layout = self.generer_schema(coussins=config['type_coussins'], **params)
+        if self.fig is not None and self.fig is not fig:
+            fermer_figure(self.fig)
+        self.fig, self.layout = fig, layout
+        self.config_schema = {k: config[k] for k in PARAMS_SCHEMA}
+
+    def mettre_a_jour(self, config, schema=True):
+        """
+        Met à jour schéma (si schema=True) et devis pour la nouvelle configuration.
+        Avec schema=False (devis PDF), la disposition des coussins est celle du schéma
+        si sa configuration n'a pas changé, sinon celle de la géométrie pure (sans figure).
+
+        Returns:
+            dict : fig, layout, prix, changements, schema_recalcule, lignes_recalculees
+        """
+        changes = self.changements(config)
+        schema_change = self.config_schema is None or bool(self.changements(
+            {k: config[k] for k in PARAMS_SCHEMA}, self.config_schema))
+
+        schema_recalcule = False
+        if schema and schema_change:
+            self._refaire_schema(config)
+            schema_recalcule = True
+            schema_change = False
+
+        layout = self.layout
+        if schema_change:
+            try:
+                layout = sofa_layout(config).cushions
+            except ValueError:
+                layout = None
+        nb_coussins = layout.count if layout is not None else None
+        params = {k: config[k] for k in PARAMS_PRIX}
+        if self.prix is None:
+            self.prix = calculer_prix_total(nb_coussins_assise=nb_coussins, **params)
+            lignes = list(self.prix['details'])
+        else:
+            self.prix, lignes = calculer_prix_incremental(
+                self.prix, changes, nb_coussins_assise=nb_coussins, **params)
+        self.config = dict(config)
+
+        return {
+            'fig': self.fig if not schema_change else None,
+            'layout': layout,
+            'prix': self.prix,
+            'changements': changes,
+            'schema_recalcule': schema_recalcule,
+            'lignes_recalculees': lignes,
+        }
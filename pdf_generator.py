@@ -115,6 +115,13 @@ def generer_pdf_devis(config, prix_details):
     
     config_data.append(['Profondeur:', f"{config['dimensions']['profondeur']} cm"])
     
+    # Coussins d'assise (disposition calculée lors de la génération du schéma)
+    coussins = config.get('coussins')
+    if coussins:
+        detail = ", ".join(f"{cote} {nb}×{coussins['tailles'][cote]} cm"
+                           for cote, nb in coussins['par_cote'].items() if nb)
+        config_data.append(['Coussins d\'assise:', f"{coussins['total']} ({detail})" if detail else f"{coussins['total']}"])
+    
     table_config = Table(config_data, colWidths=[6*cm, 7*cm])
     table_config.setStyle(TableStyle([
         ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
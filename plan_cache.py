@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Cache LRU des plans de coussins, partagé par tout le processus
+(planificateur de canape_geometrie pour l'appli web et sofa_layout, optimiseurs
+valise de canapefullv14 pour les outils turtle / batch).
+
+Clé canonique : (longueurs arrondies, mode, same, traversins, taille fixe).
+Taille max réglable (variable d'environnement CANAPE_PLAN_CACHE_SIZE ou resize()) ;
+0 = cache désactivé. Compteurs hits / misses / evictions consultables via stats().
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAXSIZE = 4096
+
+
+def _round_len(L):
+    """Longueur canonique : entier si possible, sinon flottant arrondi (bruit numérique)."""
+    if type(L) is int:                  # cas courant (cm entiers) : tel quel
+        return L
+    if isinstance(L, (tuple, list)):
+        return tuple(_round_len(x) for x in L)
+    f = float(L)
+    return int(f) if f.is_integer() else round(f, 6)
+
+
+def plan_key(lengths, mode, same=False, traversins=None, size_fixed=None):
+    """
+    Construit la clé de cache.
+      - lengths : itérable de longueurs (ou de tuples (côté, longueur) / tuples de longueurs)
+      - mode : mode coussins (str, tuple...) — doit identifier la plage de tailles
+      - traversins : None / set / str — normalisé en tuple trié
+      - size_fixed : taille imposée (mode fixed), None sinon
+    """
+    lens = []
+    for L in lengths:
+        if type(L) is tuple and L and type(L[0]) is str:
+            x = L[1]
+            lens.append(L if type(x) is int else (L[0], _round_len(x)))
+        else:
+            lens.append(_round_len(L))
+    if not traversins:
+        trv = ()
+    elif isinstance(traversins, str):
+        trv = tuple(sorted(p.strip().lower() for p in traversins.replace(";", ",").split(",") if p.strip()))
+    else:
+        trv = tuple(sorted(str(x).strip().lower() for x in traversins))
+    return (tuple(lens), mode, bool(same), trv, size_fixed)
+
+
+class PlanCache:
+    """Cache LRU thread-safe (Streamlit exécute les sessions dans des threads)."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = max(0, int(maxsize))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key, compute):
+        """Renvoie la valeur en cache, sinon compute() (mémorisée si le cache est actif)."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+        value = compute()
+        if self.maxsize:
+            with self._lock:
+                self._data[key] = value
+                self._data.move_to_end(key)
+                self._evict()
+        return value
+
+    def _evict(self):
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize):
+        """Change la taille max (0 = désactivé) ; évince immédiatement l'excédent."""
+        with self._lock:
+            self.maxsize = max(0, int(maxsize))
+            self._evict()
+
+    def clear(self, reset_stats=True):
+        with self._lock:
+            self._data.clear()
+            if reset_stats:
+                self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
+
+    def __len__(self):
+        return len(self._data)
+
+
+# Instance unique du processus (importée par les deux modules de rendu)
+PLAN_CACHE = PlanCache(int(os.environ.get("CANAPE_PLAN_CACHE_SIZE", DEFAULT_MAXSIZE)))
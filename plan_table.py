@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+Table précalculée des plans de coussins (planificateur de canape_geometrie).
+
+Domaine couvert : 1 à 3 branches, longueurs 0..600 cm par pas de 5 cm
+(dimensions au pas de 10, profondeur au pas de 5, épaisseurs 10/15 cm),
+modes valise / p / g, avec ou sans "same" (:s).
+
+Construction hors-ligne (~20 s, ~43 Mo) :
+    python plan_table.py build [chemin.npy]
+
+Au chargement, le fichier est ouvert en mémoire projetée (np.load(..., mmap_mode="r")) :
+tous les processus partagent la même copie dans le cache de pages. Une requête
+hors domaine (ou sans fichier) renvoie None -> le planificateur calcule en direct.
+Chemin : variable CANAPE_PLAN_TABLE, sinon plan_table.npy à côté de ce module.
+
+Signature (fichier voisin <chemin>.sig, écrit par build) : empreinte du format et des
+réponses du planificateur en direct sur des requêtes témoins. Une table construite par
+un autre planificateur (limite de Δ, pondération du score, fenêtres d'ancrage...) ou
+sans signature est refusée au chargement -> calcul en direct.
+"""
+
+import hashlib
+import os
+import sys
+import time
+
+import numpy as np
+
+L_STEP = 5
+L_MAX = 600
+M = L_MAX // L_STEP + 1                 # longueurs indexées 0, 5, ..., 600
+
+# (mode de score, same) ; "s" et tout mode neutre utilisent la ligne "valise"
+KINDS = (("valise", False), ("p", False), ("g", False),
+         ("valise", True), ("p", True), ("g", True))
+INTERVALS = {"valise": (60, 100), "p": (60, 74), "g": (76, 100)}
+
+# Enregistrement : tailles des 3 branches (uint8) + code de plan
+CODE_SAME = 254                         # taille uniforme (same)
+CODE_FALLBACK = 255                     # repli uniforme (aucune ancre valide)
+REC = 4
+
+DEFAULT_PATH = os.environ.get(
+    "CANAPE_PLAN_TABLE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "plan_table.npy"))
+
+
+def _offsets():
+    """Ligne de départ de chaque bloc (nb de branches n, type k)."""
+    offs = {}; row = 0
+    for n in (1, 2, 3):
+        for k in range(len(KINDS)):
+            offs[(n, k)] = row
+            row += M ** n
+    return offs, row
+
+_OFFSETS, N_ROWS = _offsets()
+
+
+def _kind_index(mode, same):
+    base = mode if mode in ("p", "g") else "valise"
+    return KINDS.index((base, bool(same)))
+
+
+def signature():
+    """
+    Empreinte (hex) du format de la table et du planificateur en direct : réponses de
+    canape_geometrie._plan_sizes_for_branches_table sur des requêtes témoins fixes du domaine.
+    """
+    import random
+    import canape_geometrie as geo
+    h = hashlib.sha256(repr((L_STEP, L_MAX, KINDS, INTERVALS, REC, CODE_SAME, CODE_FALLBACK)).encode())
+    rnd = random.Random(0)
+    sides = ("bas", "gauche", "droite")
+    for n in (1, 2, 3):
+        for mode, same in KINDS:
+            for _ in range(20):
+                lengths = {sides[i]: L_STEP * rnd.randint(0, M - 1) for i in range(n)}
+                h.update(repr(geo._plan_sizes_for_branches_table(lengths, mode, same=same)).encode())
+    return h.hexdigest()
+
+_SIGNATURE = None   # signature du planificateur courant (calculée au 1er chargement)
+
+def _signature_courante():
+    global _SIGNATURE
+    if _SIGNATURE is None:
+        _SIGNATURE = signature()
+    return _SIGNATURE
+
+
+# ---------------------------------------------------------------------------
+# Lecture
+# ---------------------------------------------------------------------------
+_TABLE = None
+_TABLE_PATH = None   # chemin déjà tenté (table absente mémorisée aussi)
+
+def load(path=None):
+    """Ouvre (mmap) la table ; None si absente, invalide ou d'un autre planificateur (signature)."""
+    global _TABLE, _TABLE_PATH
+    path = path or DEFAULT_PATH
+    if _TABLE_PATH == path:
+        return _TABLE
+    try:
+        table = np.load(path, mmap_mode="r")
+        with open(path + ".sig") as f:
+            sig = f.read().strip()
+    except (OSError, ValueError):
+        table = None
+    if table is not None and (table.shape != (N_ROWS, REC) or sig != _signature_courante()):
+        table = None
+    _TABLE, _TABLE_PATH = table, path
+    return table
+
+
+def lookup(lengths_by_side, mode, same=False, table=None):
+    """
+    Plan (sizes_by_side, meta) identique à canape_geometrie._plan_sizes_for_branches,
+    ou None si la requête sort du domaine de la table (-> calcul en direct).
+    """
+    if mode in ("auto", "fixed"):
+        return None
+    sides = list(lengths_by_side.keys())
+    if not 1 <= len(sides) <= 3:
+        return None
+    idx = []
+    for s in sides:
+        L = max(0, int(round(lengths_by_side[s])))
+        if L > L_MAX or L % L_STEP:
+            return None
+        idx.append(L // L_STEP)
+    table = load() if table is None else table
+    if table is None:
+        return None
+
+    k = _kind_index(mode, same)
+    flat = 0
+    for i in idx:
+        flat = flat * M + i
+    rec = table[_OFFSETS[(len(sides), k)] + flat].tolist()
+
+    lo, hi = INTERVALS[KINDS[k][0]]
+    sizes = rec[:len(sides)]
+    code = rec[3]
+    if code == CODE_SAME:
+        meta = {"delta":0, "mode":(mode+":s" if mode!="s" else "s"), "uniform":True, "set":f"[{lo}..{hi}]"}
+    elif code == CODE_FALLBACK:
+        meta = {"delta":0, "mode":mode+" (fallback uniform)", "uniform":True, "set":f"[{lo}..{hi}]"}
+    else:
+        meta = {"delta":max(sizes)-min(sizes), "mode":mode, "uniform":False, "set":f"[{lo}..{hi}] anchor={lo + code}"}
+    return dict(zip(sides, sizes)), meta
+
+
+# ---------------------------------------------------------------------------
+# Construction hors-ligne
+# ---------------------------------------------------------------------------
+def _build_block(n, mode, same, Ls):
+    """Enregistrements (M**n, REC) pour n branches, avec les mêmes règles que le planificateur."""
+    import canape_geometrie as geo
+
+    lo, hi = INTERVALS[mode]
+    out = np.zeros((M ** n, REC), dtype=np.uint8)
+    waste_t, count_t = geo._plan_tables(Ls)                       # (M, 41)
+    if same:
+        # _choose_uniform_size_from_set : min chute totale, puis s plus grand
+        w = waste_t[:, lo - geo.COUSSIN_MIN:hi - geo.COUSSIN_MIN + 1][:, ::-1].astype(np.int16)  # tailles décroissantes
+        tot = w
+        for _ in range(n - 1):
+            tot = tot[..., None, :] + w.reshape((1,) * (tot.ndim - 1) + w.shape)
+        s = hi - tot.reshape(-1, w.shape[1]).argmin(axis=1)
+        out[:, :n] = s[:, None]
+        out[:, 3] = CODE_SAME
+        return out
+
+    sz, wa, co = geo._plan_anchor_tables(waste_t, count_t, lo, hi)   # (M, ancres)
+    # la 1re branche est découpée en tranches pour borner la mémoire (n = 3)
+    block = M ** (n - 1)
+    for i0 in range(M):
+        grids = []
+        for t in (sz, wa, co):
+            axes = [t[i0].reshape((1,) * (n - 1) + (-1,))]
+            for d in range(n - 1):
+                shape = [1] * (n - 1) + [-1]; shape[d] = M
+                axes.append(t.reshape(shape))
+            grids.append(np.stack(np.broadcast_arrays(*axes)).reshape(n, block, -1))  # (branches, lot, ancres)
+        score, delta = geo._plan_anchor_scores(*grids, mode)
+        j = score.argmin(axis=-1)
+        if (np.take_along_axis(delta, j[:, None], axis=-1) > 5).any():
+            raise RuntimeError("repli uniforme non tabulé")  # impossible : fenêtre ±2 => Δ ≤ 4
+        rows = slice(i0 * block, (i0 + 1) * block)
+        out[rows, :n] = np.take_along_axis(grids[0], j[None, :, None], axis=-1)[..., 0].T
+        out[rows, 3] = j
+    return out
+
+
+def build(path=None, verbose=True):
+    """Énumère tout le domaine et écrit la table (.npy)."""
+    path = path or DEFAULT_PATH
+    Ls = np.arange(0, L_MAX + 1, L_STEP)
+    table = np.lib.format.open_memmap(path + ".tmp", mode="w+", dtype=np.uint8, shape=(N_ROWS, REC))
+    t0 = time.perf_counter()
+    for n in (1, 2, 3):
+        for k, (mode, same) in enumerate(KINDS):
+            off = _OFFSETS[(n, k)]
+            table[off:off + M ** n] = _build_block(n, mode, same, Ls)
+            if verbose:
+                print(f"  {n} branche(s) — {mode}{':s' if same else ''} : {M ** n} plans "
+                      f"({time.perf_counter() - t0:.1f} s)")
+    table.flush(); del table
+    with open(path + ".sig.tmp", "w") as f:
+        f.write(signature() + "\n")
+    os.replace(path + ".tmp", path)
+    os.replace(path + ".sig.tmp", path + ".sig")
+    global _TABLE, _TABLE_PATH
+    _TABLE = _TABLE_PATH = None
+    if verbose:
+        print(f"Table écrite : {path} ({os.path.getsize(path) / 1e6:.1f} Mo)")
+    return path
+
+
+def verify(path=None, samples=20000, seed=0):
+    """Compare la table au planificateur en direct sur un échantillon aléatoire du domaine."""
+    import random
+    import canape_geometrie as geo
+    table = load(path)
+    if table is None:
+        raise FileNotFoundError(path or DEFAULT_PATH)
+    rnd = random.Random(seed)
+    sides = ("bas", "gauche", "droite")
+    modes = (("valise", False), ("p", False), ("g", False), ("s", True),
+             ("valise", True), ("p", True), ("g", True))
+    bad = 0
+    for _ in range(samples):
+        n = rnd.randint(1, 3)
+        lengths = {sides[i]: L_STEP * rnd.randint(0, M - 1) for i in range(n)}
+        mode, same = rnd.choice(modes)
+        if lookup(lengths, mode, same, table=table) != geo._plan_sizes_for_branches_table(lengths, mode, same=same):
+            bad += 1
+    return samples - bad, samples
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "build"
+    target = sys.argv[2] if len(sys.argv) > 2 else None
+    if cmd == "build":
+        build(target)
+        ok, tot = verify(target)
+        print(f"Vérification : {ok}/{tot} plans identiques au calcul direct")
+    elif cmd == "verify":
+        ok, tot = verify(target)
+        print(f"Vérification : {ok}/{tot} plans identiques au calcul direct")
+        sys.exit(0 if ok == tot else 1)
+    else:
+        print("Usage : python plan_table.py [build|verify] [chemin.npy]")
+        sys.exit(2)
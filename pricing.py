@@ -62,61 +62,76 @@ def calculer_surface_mousse(type_canape, tx, ty, tz, profondeur, epaisseur):
     return round(volume, 3)
 
 
-def calculer_prix_total(type_canape, tx, ty, tz, profondeur, type_coussins, 
-                       type_mousse, epaisseur, acc_left, acc_right, acc_bas,
-                       dossier_left, dossier_bas, dossier_right,
-                       nb_coussins_deco, nb_traversins_supp, 
-                       has_surmatelas, has_meridienne):
+# Lignes du devis (ordre d'affichage) et paramètres dont chacune dépend
+DEPENDANCES_LIGNES = {
+    'Tissu': ('type_canape', 'tx', 'ty', 'tz', 'profondeur'),
+    'Mousse': ('type_canape', 'tx', 'ty', 'tz', 'profondeur', 'type_mousse', 'epaisseur'),
+    'Structure et Fabrication': ('type_canape',),
+    'Accoudoirs': ('acc_left', 'acc_right', 'acc_bas'),
+    'Dossiers': ('dossier_left', 'dossier_bas', 'dossier_right'),
+    'Coussins décoratifs': ('nb_coussins_deco',),
+    'Traversins': ('nb_traversins_supp',),
+    'Surmatelas': ('has_surmatelas',),
+    'Méridienne': ('has_meridienne',),
+}
+
+# Métrés du devis (surface de tissu, volume de mousse) et paramètres dont chacun dépend
+DEPENDANCES_METRES = {
+    'surface_tissu_m2': ('type_canape', 'tx', 'ty', 'tz', 'profondeur'),
+    'volume_mousse_m3': ('type_canape', 'tx', 'ty', 'tz', 'profondeur', 'epaisseur'),
+}
+
+
+def _calculer_metre(metre, p):
     """
-    Calcule le prix total du canapé avec détails
+    Métré du devis (m² de tissu, m³ de mousse)
     """
-    details = {}
-    
-    # 1. Tissu
-    surface_tissu = calculer_surface_tissu(type_canape, tx, ty, tz, profondeur)
-    prix_tissu = surface_tissu * PRIX_TISSU_M2
-    details['Tissu'] = round(prix_tissu, 2)
-    
-    # 2. Mousse
-    volume_mousse = calculer_surface_mousse(type_canape, tx, ty, tz, profondeur, epaisseur)
-    prix_mousse = volume_mousse * PRIX_MOUSSE[type_mousse] * 1000  # Convertir en prix/m³
-    details['Mousse'] = round(prix_mousse, 2)
-    
-    # 3. Structure et main d'œuvre
-    complexite = 1.0
-    if "L" in type_canape:
-        complexite = 1.3
-    elif "U" in type_canape:
-        complexite = 1.6
-    
-    prix_structure = PRIX_MAIN_OEUVRE_BASE * complexite
-    details['Structure et Fabrication'] = round(prix_structure, 2)
-    
-    # 4. Accoudoirs
-    nb_accoudoirs = sum([acc_left, acc_right, acc_bas])
-    if nb_accoudoirs > 0:
-        details['Accoudoirs'] = nb_accoudoirs * PRIX_ACCOUDOIR
-    
-    # 5. Dossiers
-    nb_dossiers = sum([dossier_left, dossier_bas, dossier_right])
-    if nb_dossiers > 0:
-        details['Dossiers'] = nb_dossiers * PRIX_DOSSIER
-    
-    # 6. Coussins déco
-    if nb_coussins_deco > 0:
-        details['Coussins décoratifs'] = nb_coussins_deco * PRIX_COUSSIN_DECO
-    
-    # 7. Traversins
-    if nb_traversins_supp > 0:
-        details['Traversins'] = nb_traversins_supp * PRIX_TRAVERSIN
-    
-    # 8. Surmatelas
-    if has_surmatelas:
-        details['Surmatelas'] = PRIX_SURMATELAS
-    
-    # 9. Méridienne
-    if has_meridienne:
-        details['Méridienne'] = PRIX_MERIDIENNE
+    if metre == 'surface_tissu_m2':
+        return calculer_surface_tissu(p['type_canape'], p['tx'], p['ty'], p['tz'], p['profondeur'])
+    if metre == 'volume_mousse_m3':
+        return calculer_surface_mousse(p['type_canape'], p['tx'], p['ty'], p['tz'],
+                                       p['profondeur'], p['epaisseur'])
+    raise ValueError(f"Métré de devis inconnu : {metre}")
+
+
+def _calculer_ligne(ligne, p, metres):
+    """
+    Prix d'une ligne du devis (None si la ligne n'apparaît pas)
+    metres : métrés à jour (DEPENDANCES_METRES) pour les lignes Tissu et Mousse
+    """
+    if ligne == 'Tissu':
+        return round(metres['surface_tissu_m2'] * PRIX_TISSU_M2, 2)
+    if ligne == 'Mousse':
+        return round(metres['volume_mousse_m3'] * PRIX_MOUSSE[p['type_mousse']] * 1000, 2)  # Convertir en prix/m³
+    if ligne == 'Structure et Fabrication':
+        complexite = 1.0
+        if "L" in p['type_canape']:
+            complexite = 1.3
+        elif "U" in p['type_canape']:
+            complexite = 1.6
+        return round(PRIX_MAIN_OEUVRE_BASE * complexite, 2)
+    if ligne == 'Accoudoirs':
+        nb_accoudoirs = sum([p['acc_left'], p['acc_right'], p['acc_bas']])
+        return nb_accoudoirs * PRIX_ACCOUDOIR if nb_accoudoirs > 0 else None
+    if ligne == 'Dossiers':
+        nb_dossiers = sum([p['dossier_left'], p['dossier_bas'], p['dossier_right']])
+        return nb_dossiers * PRIX_DOSSIER if nb_dossiers > 0 else None
+    if ligne == 'Coussins décoratifs':
+        return p['nb_coussins_deco'] * PRIX_COUSSIN_DECO if p['nb_coussins_deco'] > 0 else None
+    if ligne == 'Traversins':
+        return p['nb_traversins_supp'] * PRIX_TRAVERSIN if p['nb_traversins_supp'] > 0 else None
+    if ligne == 'Surmatelas':
+        return PRIX_SURMATELAS if p['has_surmatelas'] else None
+    if ligne == 'Méridienne':
+        return PRIX_MERIDIENNE if p['has_meridienne'] else None
+    raise ValueError(f"Ligne de devis inconnue : {ligne}")
+
+
+def _assembler_devis(lignes, metres, p):
+    """
+    Détails dans l'ordre du devis + totaux
+    """
+    details = {ligne: lignes[ligne] for ligne in DEPENDANCES_LIGNES if lignes.get(ligne) is not None}
     
     # Calculs finaux
     sous_total = sum(details.values())
@@ -128,6 +143,45 @@ def calculer_prix_total(type_canape, tx, ty, tz, profondeur, type_coussins,
         'sous_total': round(sous_total, 2),
         'tva': tva,
         'total_ttc': total_ttc,
-        'surface_tissu_m2': surface_tissu,
-        'volume_mousse_m3': volume_mousse
+        'surface_tissu_m2': metres['surface_tissu_m2'],
+        'volume_mousse_m3': metres['volume_mousse_m3'],
+        'nb_coussins_assise': p.get('nb_coussins_assise')
     }
+
+
+def calculer_prix_total(type_canape, tx, ty, tz, profondeur, type_coussins, 
+                       type_mousse, epaisseur, acc_left, acc_right, acc_bas,
+                       dossier_left, dossier_bas, dossier_right,
+                       nb_coussins_deco, nb_traversins_supp, 
+                       has_surmatelas, has_meridienne, nb_coussins_assise=None):
+    """
+    Calcule le prix total du canapé avec détails
+    nb_coussins_assise : nombre lu dans la disposition des coussins du schéma (informatif)
+    """
+    p = dict(locals())
+    metres = {metre: _calculer_metre(metre, p) for metre in DEPENDANCES_METRES}
+    lignes = {ligne: _calculer_ligne(ligne, p, metres) for ligne in DEPENDANCES_LIGNES}
+    return _assembler_devis(lignes, metres, p)
+
+
+def calculer_prix_incremental(precedent, changements, **params):
+    """
+    Recalcule uniquement les lignes et métrés du devis dont un paramètre a changé
+    (les autres sont repris du résultat précédent)
+    
+    Args:
+        precedent: résultat précédent de calculer_prix_total / calculer_prix_incremental
+        changements: noms des paramètres modifiés depuis ce résultat
+        params: mêmes paramètres nommés que calculer_prix_total
+    
+    Returns:
+        (devis, lignes recalculées)
+    """
+    changements = set(changements)
+    metres = {metre: (_calculer_metre(metre, params) if changements.intersection(deps) else precedent[metre])
+              for metre, deps in DEPENDANCES_METRES.items()}
+    lignes = dict(precedent['details'])
+    recalculees = [ligne for ligne, deps in DEPENDANCES_LIGNES.items() if changements.intersection(deps)]
+    for ligne in recalculees:
+        lignes[ligne] = _calculer_ligne(ligne, params, metres)
+    return _assembler_devis(lignes, metres, params), recalculees
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# soak_apercu.py
+# Endurance de l'aperçu : enchaîne N aperçus comme l'appli (DevisIncremental + rendu
+# canapematplot.rendre_figure + encodage PNG comme st.pyplot) sur des configurations
+# aléatoires du formulaire, puis vérifie :
+#   - registre pyplot vide (plt.get_fignums() == []) : aucune figure orpheline
+#   - mémoire résidente stable : RSS finale - RSS à mi-parcours ≤ tolérance
+#     (la 1re moitié remplit les caches LRU bornés : géométries, plans, grilles, layouts)
+#   - figures abandonnées sans fermer_figure : collectées et oubliées par FIGURE_POOL
+#
+# Usage : python soak_apercu.py [--n 10000] [--dpi 100] [--tolerance 20] [--seed 0]
+# Code retour 1 si une figure reste ouverte, retenue par la réserve ou si la RSS dérive.
+
+import argparse
+import gc
+import io
+import random
+import resource
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from canapematplot import FIGURE_POOL, rendre_figure
+from devis_incremental import PARAMS_SCHEMA, DevisIncremental
+from validation import valider
+
+TYPES = ("Simple (S)", "L - Sans Angle", "L - Avec Angle (LF)",
+         "U - Sans Angle", "U - 1 Angle (U1F)", "U - 2 Angles (U2F)")
+COUSSINS = ("auto", "65", "80", "90", "valise", "p", "g")
+ABANDONS = 50
+
+
+def rss_mo():
+    """RSS courante (Linux, /proc), sinon pic RSS."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize() / 1e6
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def config_aleatoire(rnd):
+    """Configuration du formulaire (mêmes bornes et pas que app.py)."""
+    type_canape = rnd.choice(TYPES)
+    simple = "Simple" in type_canape
+    L = "L" in type_canape
+    meridienne_side = rnd.choice((None, None, "g", "d", "b"))
+    return {
+        'type_canape': type_canape,
+        'tx': rnd.randrange(100, 601, 10),
+        'ty': None if simple else rnd.randrange(100, 601, 10),
+        'tz': None if simple or L else rnd.randrange(100, 601, 10),
+        'profondeur': rnd.randrange(50, 121, 5),
+        'acc_left': rnd.random() < 0.7, 'acc_right': rnd.random() < 0.7,
+        'acc_bas': (rnd.random() < 0.7) if not simple else False,
+        'dossier_left': (rnd.random() < 0.8) if not simple else False,
+        'dossier_bas': rnd.random() < 0.8,
+        'dossier_right': (rnd.random() < 0.8) if "U" in type_canape else False,
+        'meridienne_side': meridienne_side,
+        'meridienne_len': rnd.randrange(30, 201, 10) if meridienne_side else 0,
+        'type_coussins': rnd.choice(COUSSINS), 'type_mousse': "D25", 'epaisseur': 25,
+        'nb_coussins_deco': 0, 'nb_traversins_supp': 0,
+        'has_surmatelas': False, 'has_meridienne': meridienne_side is not None,
+    }
+
+
+def generer_schema(coussins="auto", **params):
+    """Même rendu que app.generer_schema_canape (sans streamlit)."""
+    return rendre_figure(dict(params, coussins=coussins))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Endurance de l'aperçu (fuite de figures / mémoire)")
+    ap.add_argument("--n", type=int, default=10000, help="nombre d'aperçus")
+    ap.add_argument("--dpi", type=int, default=100, help="dpi de l'encodage PNG")
+    ap.add_argument("--tolerance", type=float, default=20.0, help="dérive RSS admise (Mo)")
+    ap.add_argument("--seed", type=int, default=0)
+    a = ap.parse_args(argv)
+
+    rnd = random.Random(a.seed)
+    moteur = DevisIncremental(generer_schema)
+    echauffement = max(1, a.n // 2)
+    rss0 = None
+    t0 = time.perf_counter()
+    i = 0
+    while i < a.n:
+        config = config_aleatoire(rnd)
+        if valider(config):
+            continue
+        fig = moteur.mettre_a_jour(config)['fig']
+        fig.savefig(io.BytesIO(), format="png", dpi=a.dpi, bbox_inches="tight")
+        i += 1
+        if i == echauffement:
+            rss0 = rss_mo()
+        if i % 1000 == 0 or i == a.n:
+            print(f"  {i:6d} aperçus — RSS {rss_mo():7.1f} Mo — figures pyplot {len(plt.get_fignums())} "
+                  f"({time.perf_counter() - t0:.0f} s)")
+
+    derive = rss_mo() - rss0
+    figures = plt.get_fignums()
+    print(f"Dérive RSS après échauffement ({echauffement} aperçus) : {derive:+.1f} Mo "
+          f"(tolérance {a.tolerance} Mo) ; figures pyplot ouvertes : {len(figures)}")
+
+    # Figures abandonnées par l'appelant (exception, oubli) : la réserve ne doit pas les retenir
+    sorties = FIGURE_POOL.stats()["sorties"]
+    abandons = 0
+    while abandons < ABANDONS:
+        config = config_aleatoire(rnd)
+        if valider(config):
+            continue
+        fig, _ = generer_schema(coussins=config['type_coussins'],
+                                **{k: config[k] for k in PARAMS_SCHEMA if k != 'type_coussins'})
+        del fig
+        abandons += 1
+    gc.collect()
+    retenues = FIGURE_POOL.stats()["sorties"] - sorties
+    print(f"Figures abandonnées sans fermer_figure : {ABANDONS}, encore retenues par FIGURE_POOL : {retenues}")
+    ok = not figures and derive <= a.tolerance and retenues == 0
+    print("OK" if ok else "ÉCHEC")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
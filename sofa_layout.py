@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""
+Couche géométrie pure : layout(config) -> SofaLayout, sans matplotlib.
+
+Un SofaLayout regroupe tout ce que les render_* calculent avant de dessiner :
+points, polygones par catégorie, scissions, dossiers dessinés (U), variante retenue
+et disposition des coussins (CushionLayout). Les règles (contrôles, choix de
+variante auto, planificateur) sont celles du noyau canape_geometrie, partagé
+avec les deux rendus (mêmes géométries mémoïsées, GEOM_CACHE).
+
+Mémoïsé par une clé canonique de configuration (LRU, plan_cache.PlanCache) :
+devis, PDF, aperçu et traitements batch partagent le même objet immuable.
+Taille max via CANAPE_LAYOUT_CACHE_SIZE (0 = désactivé).
+
+geometrie_lot(forme, variante, **cotes) : mêmes constructeurs évalués sur des tableaux
+de cotes (catalogue, tarifs), sommets empilés et masque de validité.
+"""
+
+import os
+from collections import namedtuple
+from types import MappingProxyType
+
+import numpy as np
+
+import canape_geometrie as geo
+from plan_cache import PlanCache
+
+FORMES = ("S1", "LNF", "LF", "U", "U1F", "U2F")
+VARIANTES = {"LNF": ("auto", "v1", "v2"), "U": ("auto", "v1", "v2", "v3", "v4"),
+             "U1F": ("auto", "v1", "v2", "v3", "v4")}
+VARIANTE_DEFAUT = {"LNF": "auto", "U": "auto", "U1F": "auto"}
+
+# Paramètres pris en compte par forme (les autres sont ignorés dans la clé)
+PARAMS = {
+    "S1":  ("tx", "profondeur", "dossier_bas", "acc_left", "acc_right", "meridienne_side", "meridienne_len"),
+    "LNF": ("tx", "ty", "profondeur", "dossier_left", "dossier_bas", "acc_left", "acc_bas",
+            "meridienne_side", "meridienne_len"),
+    "LF":  ("tx", "ty", "profondeur", "dossier_left", "dossier_bas", "acc_left", "acc_bas",
+            "meridienne_side", "meridienne_len"),
+    "U":   ("tx", "ty", "tz", "profondeur", "dossier_left", "dossier_bas", "dossier_right",
+            "acc_left", "acc_bas", "acc_right"),
+    "U1F": ("tx", "ty", "tz", "profondeur", "dossier_left", "dossier_bas", "dossier_right",
+            "acc_left", "acc_right", "meridienne_side", "meridienne_len"),
+    "U2F": ("tx", "ty", "tz", "profondeur", "dossier_left", "dossier_bas", "dossier_right",
+            "acc_left", "acc_bas", "acc_right", "meridienne_side", "meridienne_len"),
+}
+_DIMENSIONS = ("tx", "ty", "tz", "profondeur", "meridienne_len")
+
+LAYOUT_CACHE = PlanCache(int(os.environ.get("CANAPE_LAYOUT_CACHE_SIZE", 256)))
+
+
+class SofaLayout(namedtuple("SofaLayout", "key forme variant pts polys split_flags drawn cushions")):
+    """
+    Géométrie complète d'un canapé (immuable, partagée via le cache) :
+      - pts : points nommés (cm, canape_geometrie.Points partagé) ; polys : catégorie -> tuple de polygones
+      - split_flags : scissions par côté ; drawn : dossiers dessinés (U, sinon vide)
+      - cushions : CushionLayout (coussins d'assise)
+    """
+    __slots__ = ()
+
+    @property
+    def banquettes(self):
+        """Dimensions (L, P) de chaque banquette."""
+        store = geo.PolyStore.from_polys(self.polys, ("banquettes",))
+        return [tuple(d) for d in store.dims().tolist()]
+
+    def summary(self):
+        """Résumé sérialisable (devis, PDF, traitements batch)."""
+        return {"forme": self.forme, "variante": self.variant,
+                "banquettes": self.banquettes,
+                "dossiers": len(self.polys.get("dossiers", ())),
+                "accoudoirs": len(self.polys.get("accoudoirs", ())),
+                "angles": len(self.polys.get("angles", ())),
+                "coussins": self.cushions.summary()}
+
+
+def forme_canape(type_canape):
+    """Code de forme depuis un code (S1, LNF...) ou un libellé de l'appli ("U - 1 Angle (U1F)"...)."""
+    t = str(type_canape).strip()
+    if t.upper() in FORMES:
+        return t.upper()
+    if "Simple" in t:
+        return "S1"
+    if "L - Sans Angle" in t:
+        return "LNF"
+    if "L - Avec Angle" in t:
+        return "LF"
+    if "U - Sans Angle" in t:
+        return "U"
+    if "U - 1 Angle" in t:
+        return "U1F"
+    if "U - 2 Angles" in t:
+        return "U2F"
+    raise ValueError(f"Type de canapé inconnu : {type_canape}")
+
+
+def config_key(config):
+    """
+    Clé canonique : (forme, variante, paramètres utiles normalisés, coussins normalisés).
+    Accepte les clés de l'appli (type_canape, type_coussins) ou courtes (forme, coussins).
+    Paramètres absents : défauts des render_* (_DEFAUTS_LOT, comme geometrie_lot).
+    """
+    forme = forme_canape(config.get("forme") or config.get("type_canape"))
+    variant = str(config.get("variant") or VARIANTE_DEFAUT.get(forme, "")).lower()
+    if forme in VARIANTES and variant not in VARIANTES[forme]:
+        raise ValueError(f"Variante {variant} inconnue pour {forme} (choix : {', '.join(VARIANTES[forme])})")
+    valeurs = []
+    for k in PARAMS[forme]:
+        v = config.get(k)
+        if v is None:                   # absent : défaut des render_* (profondeur 70, options True)
+            v = _DEFAUTS_LOT.get(k)
+        if k in _DIMENSIONS:
+            v = geo._cm_ints(v)
+        elif k == "meridienne_side":
+            v = v or None
+        else:
+            v = bool(v)
+        valeurs.append(v)
+    p = dict(zip(PARAMS[forme], valeurs))
+    if "meridienne_side" in p and p["meridienne_side"] is None:
+        p["meridienne_len"] = 0
+    coussins = config.get("coussins", config.get("type_coussins", "auto"))
+    mode, same, size_fixed, _tag = geo._norm_coussins_spec(coussins)
+    return (forme, variant, tuple(p.items()), (mode, same, size_fixed))
+
+
+# ---------------------------------------------------------------------------
+# Géométrie par forme (mêmes étapes et contrôles que les render_*)
+# ---------------------------------------------------------------------------
+def _args(forme, p):
+    """Arguments positionnels des constructeurs (ordre de PARAMS)."""
+    return tuple(p[k] for k in PARAMS[forme])
+
+def _geometrie(forme, variant, p, controle_250=True):
+    """(pts, polys, drawn) d'une variante explicite, sans cache (cotes scalaires ou lots)."""
+    return geo._construire_geometrie(forme, variant, _args(forme, p), controle_250)
+
+def _geom_S1(p, coussins):
+    pts, polys, _ = geo.geometrie("S1", None, *_args("S1", p))
+    return None, pts, polys, {}, geo._cushion_layout_S1(pts, coussins, p["meridienne_side"], p["meridienne_len"])
+
+def _geom_LNF(p, variant, coussins):
+    args = _args("LNF", p)
+    if variant == "auto":
+        # render_LNF : variante prédite par les cotes, géométrie du gagnant uniquement
+        variant = geo._predict_variant_LNF(*args)
+    pts, polys, _ = geo.geometrie("LNF", variant, *args)
+    return variant, pts, polys, {}, geo._cushion_layout_L(pts, coussins)
+
+def _geom_LF(p, coussins):
+    pts, polys, _ = geo.geometrie("LF", None, *_args("LF", p))
+    return None, pts, polys, {}, geo._cushion_layout_LF(pts, p["tx"], p["ty"], coussins,
+                                                         p["meridienne_side"], p["meridienne_len"])
+
+def _geom_U(p, variant, coussins):
+    args = _args("U", p)
+    if variant == "auto":
+        # render_U : variante prédite par les cotes, géométrie du gagnant uniquement
+        variant = geo._predict_variant_U(*args)
+    pts, polys, drawn = geo.geometrie("U", variant, *args)
+    return variant, pts, polys, drawn, geo._cushion_layout_U(variant, pts, drawn, coussins)
+
+def _geom_U1F(p, variant, coussins):
+    args = _args("U1F", p)
+    if variant == "auto":
+        # render_U1F : géométries mémoïsées, disposition des coussins du gagnant réutilisée
+        variant, (pts, polys), cushions = geo._choose_variant_U1F(*args, coussins)
+        return variant, pts, polys, {}, cushions
+    pts, polys, _ = geo.geometrie("U1F", variant, *args)
+    return variant, pts, polys, {}, geo._cushion_layout_U1F(pts, coussins)
+
+def _geom_U2F(p, coussins):
+    pts, polys, _ = geo.geometrie("U2F", None, *_args("U2F", p))
+    return None, pts, polys, {}, geo._cushion_layout_U2f(pts, coussins)
+
+def _figer_polys(polys):
+    return MappingProxyType({cat: tuple(tuple(tuple(pt) for pt in poly) for poly in lst)
+                             for cat, lst in polys.items() if cat != "split_flags"})
+
+def _construire(key, coussins):
+    forme, variant, params, _ = key
+    p = dict(params)
+    if forme == "S1":
+        variant, pts, polys, drawn, cushions = _geom_S1(p, coussins)
+    elif forme == "LNF":
+        variant, pts, polys, drawn, cushions = _geom_LNF(p, variant, coussins)
+    elif forme == "LF":
+        variant, pts, polys, drawn, cushions = _geom_LF(p, coussins)
+    elif forme == "U":
+        variant, pts, polys, drawn, cushions = _geom_U(p, variant, coussins)
+    elif forme == "U1F":
+        variant, pts, polys, drawn, cushions = _geom_U1F(p, variant, coussins)
+    else:
+        variant, pts, polys, drawn, cushions = _geom_U2F(p, coussins)
+    return SofaLayout(key, forme, variant, pts, _figer_polys(polys),
+                      MappingProxyType(dict(polys.get("split_flags", {}))),
+                      MappingProxyType(dict(drawn)), cushions)
+
+
+def layout(config):
+    """
+    Géométrie + coussins pour une configuration (dict), sans figure.
+    Lève ValueError comme les render_* (banquette > 250, méridienne incompatible...).
+    Hors cache si un plan précédent est actif (plan_precedent : tailles « collantes »).
+    """
+    key = config_key(config)
+    coussins = config.get("coussins", config.get("type_coussins", "auto"))
+    if getattr(geo._PLAN_CONTEXT, "precedent", None) is not None:
+        return _construire(key, coussins)
+    return LAYOUT_CACHE.get_or_compute(key, lambda: _construire(key, coussins))
+
+
+# ---------------------------------------------------------------------------
+# Évaluation par lots (catalogue, grilles tarifaires)
+# ---------------------------------------------------------------------------
+class _Divergence(Exception):
+    def __init__(self, mask):
+        super().__init__("condition différente selon les configurations du lot")
+        self.mask = mask
+
+
+class _Lot(np.ndarray):
+    """
+    Cotes d'un lot : les constructeurs scalaires s'exécutent tels quels sur ces tableaux.
+    Un test (if, max, min...) doit donner la même réponse pour tout le lot, sinon
+    _Divergence(masque) : le lot est scindé et chaque moitié réévaluée.
+    """
+    def __bool__(self):
+        vals = np.asarray(self, dtype=bool)
+        if vals.all():
+            return True
+        if not vals.any():
+            return False
+        raise _Divergence(vals)
+
+
+LotGeometrie = namedtuple("LotGeometrie", "forme variant valid erreurs pts polys")
+
+_DEFAUTS_LOT = {"profondeur": geo.DEPTH_STD, "meridienne_len": 0, "meridienne_side": None,
+                "dossier_left": True, "dossier_bas": True, "dossier_right": True,
+                "acc_left": True, "acc_bas": True, "acc_right": True}
+
+
+def geometrie_lot(forme, variant=None, **params):
+    """
+    Géométrie d'une forme / variante pour un lot de configurations.
+    Cotes (tx, ty, tz, profondeur, meridienne_len) : scalaires ou tableaux NumPy de même
+    longueur ; options (dossiers, accoudoirs, meridienne_side) communes au lot.
+    Variante explicite (pas d'auto : le choix dépend des cotes de chaque configuration).
+
+    Chaque groupe de configurations qui suit les mêmes branches (scissions, méridienne
+    bornée...) est évalué en une seule passe des constructeurs. Renvoie un LotGeometrie :
+      - valid   : (n,) True si la configuration est réalisable
+      - erreurs : (n,) message de la ValueError (None si réalisable)
+      - pts     : nom -> (n, 2) ; polys : catégorie -> (n, P, V, 2)
+        (NaN pour les configurations invalides, polygones absents et sommets de bourrage)
+    """
+    forme = forme_canape(forme)
+    variant = str(variant or VARIANTE_DEFAUT.get(forme, "")).lower() or None
+    if forme in VARIANTES and variant not in VARIANTES[forme][1:]:
+        raise ValueError(f"Variante explicite requise pour {forme} (choix : {', '.join(VARIANTES[forme][1:])})")
+    dims = {k: np.asarray(params.get(k, _DEFAUTS_LOT.get(k, 0))) for k in PARAMS[forme] if k in _DIMENSIONS}
+    n = max((v.size for v in dims.values() if v.ndim), default=1)
+    dims = {k: np.broadcast_to(v, (n,)) for k, v in dims.items()}
+    options = {k: params.get(k, _DEFAUTS_LOT.get(k)) for k in PARAMS[forme] if k not in _DIMENSIONS}
+    if "meridienne_side" in options:
+        options["meridienne_side"] = options["meridienne_side"] or None
+
+    erreurs = np.full(n, None, dtype=object)
+    entiers = np.ones(n, dtype=bool)
+    for k, v in dims.items():
+        bad = np.asarray(v, dtype=float) % 1 != 0
+        for i in np.flatnonzero(bad & entiers):
+            erreurs[i] = f"Cote {v[i]} cm : les dimensions doivent être des cm entiers."
+        entiers &= ~bad
+    dims = {k: np.asarray(v, dtype=float).astype(np.int64) for k, v in dims.items()}
+
+    groupes = []
+    pile = [np.flatnonzero(entiers)]
+    while pile:
+        idx = pile.pop()
+        if not idx.size:
+            continue
+        p = dict(options)
+        p.update({k: v[idx].view(_Lot) for k, v in dims.items()})
+        try:
+            # limite de 250 cm contrôlée ensuite sur tout le groupe (sans scinder le lot)
+            pts, polys, _ = _geometrie(forme, variant, p, controle_250=False)
+        except _Divergence as d:
+            pile += [idx[d.mask], idx[~d.mask]]
+            continue
+        except ValueError:
+            _erreurs_scalaires(forme, variant, options, dims, idx, erreurs)
+            continue
+        trop = np.zeros(idx.size, dtype=bool)
+        for poly in polys.get("banquettes", ()):
+            xy = np.array(np.broadcast_arrays(*(c for pt in poly for c in pt)), dtype=np.int64).reshape(len(poly), 2, -1)
+            ext = xy.max(axis=0) - xy.min(axis=0)
+            trop |= ext.max(axis=0) > geo.MAX_BANQUETTE
+        if trop.any():
+            _erreurs_scalaires(forme, variant, options, dims, idx[trop], erreurs)
+        groupes.append((idx[~trop], ~trop, pts, polys))
+    return _empiler(forme, variant, n, erreurs, groupes)
+
+
+def _erreurs_scalaires(forme, variant, options, dims, idx, erreurs):
+    """Message de chaque configuration invalide (les cotes figurent dans le texte) : reprise en scalaire."""
+    p = dict(options)
+    for i in idx.tolist():
+        p.update({k: int(v[i]) for k, v in dims.items()})
+        try:
+            _geometrie(forme, variant, p)
+        except ValueError as e:
+            erreurs[i] = str(e)
+
+def _empiler(forme, variant, n, erreurs, groupes):
+    def col(c, sel):
+        # coordonnée du groupe (tableau ou constante) restreinte aux configurations retenues
+        return np.asarray(c)[sel] if np.ndim(c) else c
+
+    pts = {}
+    for idx, sel, g_pts, _ in groupes:
+        for nom, pt in g_pts.items():
+            if isinstance(pt, tuple) and len(pt) == 2:
+                out = pts.setdefault(nom, np.full((n, 2), np.nan))
+                out[idx, 0] = col(pt[0], sel); out[idx, 1] = col(pt[1], sel)
+
+    polys = {}
+    for cat in geo.POLY_CATEGORIES:
+        formes_cat = [len(g[cat]) for _, _, _, g in groupes if cat in g]
+        if not formes_cat:
+            continue
+        P = max(formes_cat)
+        V = max((len(poly) for _, _, _, g in groupes for poly in g.get(cat, ())), default=0)
+        out = polys[cat] = np.full((n, P, V, 2), np.nan)
+        for idx, sel, _, g in groupes:
+            for j, poly in enumerate(g.get(cat, ())):
+                for k, (x, y) in enumerate(poly):
+                    out[idx, j, k, 0] = col(x, sel); out[idx, j, k, 1] = col(y, sel)
+
+    valid = np.array([e is None for e in erreurs], dtype=bool)
+    return LotGeometrie(forme, variant, valid, erreurs,
+                        MappingProxyType(pts), MappingProxyType(polys))
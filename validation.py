@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+Validation instantanée d'une configuration (formulaire de l'appli), sans géométrie.
+
+valider(config) -> tuple d'Erreur, vide si le canapé est réalisable. Mêmes contrôles
+et mêmes messages que les constructeurs du noyau (canape_geometrie) et sofa_layout.layout,
+dans le même ordre : la première erreur est celle que lèverait le rendu.
+  - cotes en cm entiers, méridienne compatible avec accoudoirs / dossiers
+  - banquettes ≤ 250 cm après scission, taille de coussins fixe dans [60..100]
+
+Seules les longueurs de banquettes sont calculées (quelques entiers par variante),
+sans points, polygones ni matplotlib : ~10-40 µs au 1er appel d'une configuration.
+Verdict mémoïsé par valeurs brutes du formulaire (LRU, plan_cache.PlanCache) : ~3 µs
+pour une configuration déjà vue (réaffichages Streamlit). Taille max via
+CANAPE_VALIDATION_CACHE_SIZE (0 = désactivé).
+Accepte les clés de l'appli (type_canape, type_coussins) ou courtes (forme, coussins).
+"""
+
+import os
+from collections import namedtuple
+
+import canape_geometrie as geo
+from plan_cache import PlanCache
+from sofa_layout import PARAMS, VARIANTES, VARIANTE_DEFAUT, _DEFAUTS_LOT, _DIMENSIONS, forme_canape
+
+# code : "forme", "variante", "cote", "meridienne", "banquette" ou "coussins"
+# champs : paramètres de la configuration concernés (pour signaler les widgets)
+Erreur = namedtuple("Erreur", "code champs message")
+
+_ACC = geo.ACCOUDOIR_THICK
+
+VALIDATION_CACHE = PlanCache(int(os.environ.get("CANAPE_VALIDATION_CACHE_SIZE", 4096)))
+# Paramètres de toutes les formes (clé du cache : valeurs brutes, sans normalisation)
+_CLES = tuple(dict.fromkeys(k for params in PARAMS.values() for k in params))
+# Par forme : (position dans _CLES, paramètre, nature, défaut) ; nature 0 cote, 1 méridienne, 2 option
+_CHAMPS = {forme: tuple((_CLES.index(k), k, 0 if k in _DIMENSIONS else 1 if k == "meridienne_side" else 2,
+                         _DEFAUTS_LOT.get(k)) for k in params)
+           for forme, params in PARAMS.items()}
+
+# Méridienne : (côté, option interdite / requise, message), dans l'ordre des constructeurs
+_MER_ACC = {
+    "S1":  (("g", "acc_left", "Méridienne gauche interdite avec accoudoir gauche."),
+            ("d", "acc_right", "Méridienne droite interdite avec accoudoir droit.")),
+    "LF":  (("g", "acc_left", "Erreur: une méridienne gauche ne peut pas coexister avec un accoudoir gauche."),
+            ("b", "acc_bas", "Erreur: une méridienne bas ne peut pas coexister avec un accoudoir bas.")),
+    "U1F": (("g", "acc_left", "Méridienne gauche interdite avec accoudoir gauche."),
+            ("d", "acc_right", "Méridienne droite interdite avec accoudoir droit.")),
+    "U2F": (("g", "acc_left", "Erreur: une méridienne gauche ne peut pas coexister avec un accoudoir gauche."),
+            ("d", "acc_right", "Erreur: une méridienne droite ne peut pas coexister avec un accoudoir droit.")),
+}
+_MER_LNF = (("g", "acc_left", "dossier_left", "Méridienne gauche interdite avec accoudoir gauche.",
+             "Méridienne gauche impossible sans dossier gauche."),
+            ("b", "acc_bas", "dossier_bas", "Méridienne bas interdite avec accoudoir bas.",
+             "Méridienne bas impossible sans dossier bas."))
+
+
+def _entier(v):
+    """Cote en cm entier (règle de _cm_ints), None si refusée."""
+    try:
+        iv = int(v or 0)
+    except (TypeError, ValueError):
+        return None
+    return iv if iv == (v or 0) else None
+
+
+def _erreurs_meridienne(forme, p):
+    side = p.get("meridienne_side")
+    if forme == "LNF":
+        out = []
+        for s, acc, dossier, msg_acc, msg_dossier in _MER_LNF:
+            if side == s and p[acc]:
+                out.append(Erreur("meridienne", ("meridienne_side", acc), msg_acc))
+            if side == s and not p[dossier]:
+                out.append(Erreur("meridienne", ("meridienne_side", dossier), msg_dossier))
+        return out
+    return [Erreur("meridienne", ("meridienne_side", acc), msg)
+            for s, acc, msg in _MER_ACC.get(forme, ()) if side == s and p[acc]]
+
+
+# ---------------------------------------------------------------------------
+# Banquettes : (côté, longueur testée pour la scission, longueur si non scindée, profondeur)
+# ---------------------------------------------------------------------------
+def _banquettes_S1(p):
+    xL = _ACC if p["acc_left"] else 0
+    xR = p["tx"] - (_ACC if p["acc_right"] else 0)
+    L = abs(xR - xL)
+    return [("bas", L, L, abs(p["profondeur"] - (geo.DOSSIER_THICK if p["dossier_bas"] else 0)))]
+
+def _banquettes_LF(p):
+    prof = p["profondeur"]; A = prof + 20
+    F0x = 10 if p["dossier_left"] else 0
+    F0y = 10 if p["dossier_bas"] else 0
+    g = abs(p["ty"] - (_ACC if p["acc_left"] else 0) - (F0y + A))
+    b = abs(p["tx"] - (_ACC if p["acc_bas"] else 0) - (F0x + A))
+    return [("gauche", g, g, prof), ("bas", b, b, prof)]
+
+def _banquettes_LNF(p, variant):
+    prof = p["profondeur"]
+    F0x = 10 if p["dossier_left"] else 0
+    F0y = 10 if p["dossier_bas"] else 0
+    top_y  = p["ty"] - (_ACC if p["acc_left"] else 0)
+    stop_x = p["tx"] - (_ACC if p["acc_bas"] else 0)
+    if variant == "v2":
+        g = abs(top_y - F0y - prof); b = abs(stop_x - F0x)
+        return [("gauche", g, g, prof), ("bas", b, b, prof)]
+    # v1 : la méridienne gauche raccourcit la banquette gauche une fois scindée seulement
+    top_v1 = top_y
+    if p["meridienne_side"] == 'g' and p["meridienne_len"] > 0:
+        top_v1 = min(max(F0y, top_y - p["meridienne_len"]), top_y)
+    b = abs(stop_x - F0x - prof)
+    return [("gauche", abs(top_v1 - F0y), abs(top_y - F0y), prof), ("bas", b, b, prof)]
+
+def _banquettes_U(p, variant):
+    prof = p["profondeur"]
+    F0x = 10 if p["dossier_left"] else 0
+    F0y = 10 if p["dossier_bas"] else 0
+    D02x_x = p["tx"] - (10 if (p["dossier_right"] or p["dossier_bas"]) else 0)
+    yL = p["ty"] - (_ACC if p["acc_left"] else 0) - F0y
+    yR = p["tz"] - (_ACC if p["acc_right"] else 0) - F0y
+    # (gauche, bas, droite) : mêmes longueurs que _splits_U
+    g, b, d = {"v1": (yL - prof, D02x_x - F0x,            yR - prof),
+               "v2": (yL,        D02x_x - 2*prof - F0x,   yR),
+               "v3": (yL - prof, D02x_x - prof - F0x,     yR),
+               "v4": (yL,        D02x_x - prof - F0x,     yR - prof)}[variant]
+    return [(s, abs(L), abs(L), prof) for s, L in (("gauche", g), ("bas", b), ("droite", d))]
+
+def _banquettes_U1F(p, variant):
+    prof = p["profondeur"]; A = prof + 20
+    F0x = 10 if p["dossier_left"] else 0
+    F0y = 10 if p["dossier_bas"] else 0
+    topL = p["ty"] - (_ACC if p["acc_left"] else 0)
+    topR = p["tz"] - (_ACC if p["acc_right"] else 0)
+    F02x = p["tx"] - (10 if p["dossier_right"] else 0)
+    bx = F02x - A
+    if variant == "v1":
+        D02x_x = p["tx"] - (10 if (p["dossier_right"] or p["dossier_bas"]) else 0)
+        g, b, d = topL - (F0y + A), D02x_x - prof - (F0x + A), topR - F0y
+    elif variant == "v2":
+        g, b, d = topL - (F0y + A), F02x - (F0x + A), topR - (F0y + prof)
+    elif variant == "v3":
+        g, b, d = topL - F0y, bx - (F0x + prof), topR - (F0y + A)
+    else:
+        g, b, d = topL - (F0y + prof), bx - F0x, topR - (F0y + A)
+    # scission selon le plus grand côté du rectangle (_split_banquette_if_needed_U1F)
+    out = []
+    for s, L in (("gauche", abs(g)), ("bas", abs(b)), ("droite", abs(d))):
+        L, P = max(L, prof), min(L, prof)
+        out.append((s, L, L, P))
+    return out
+
+def _banquettes(forme, variant, p):
+    if forme == "S1":
+        return _banquettes_S1(p)
+    if forme == "LF":
+        return _banquettes_LF(p)
+    if forme == "LNF":
+        return _banquettes_LNF(p, variant)
+    if forme == "U":
+        return _banquettes_U(p, variant)
+    if forme == "U1F":
+        return _banquettes_U1F(p, variant)
+    # U2F : F0 = (10, 10) quelles que soient les options
+    prof = p["profondeur"]; A = prof + 20
+    g = abs(p["ty"] - (_ACC if p["acc_left"] else 0) - (10 + A))
+    b = abs(p["tx"] - 2*A - 20)
+    d = abs(p["tz"] - (_ACC if p["acc_right"] else 0) - (10 + A))
+    return [("gauche", g, g, prof), ("bas", b, b, prof), ("droite", d, d, prof)]
+
+
+_CHAMPS_COTE = {"gauche": ("ty", "profondeur"), "bas": ("tx", "profondeur"),
+                "droite": ("tz", "profondeur")}
+
+def _erreurs_banquettes(forme, variant, p):
+    """Banquettes > 250 cm une fois scindées (au plus une scission, en deux moitiés entières)."""
+    out = []
+    for side, L, pleine, prof in _banquettes(forme, variant, p):
+        morceaux = (L // 2, L - L // 2) if L > geo.SPLIT_THRESHOLD else (pleine,)
+        for m in morceaux:
+            Lm, Pm = max(m, prof), min(m, prof)
+            if Lm > geo.MAX_BANQUETTE:
+                out.append(Erreur("banquette", _CHAMPS_COTE[side],
+                                  f"Banquette de {Lm}×{Pm} cm > {geo.MAX_BANQUETTE} cm — "
+                                  f"scission supplémentaire nécessaire."))
+    return out
+
+
+def _variante_auto(forme, p):
+    args = tuple(p[k] for k in PARAMS[forme])
+    if forme == "LNF":
+        return geo._predict_variant_LNF(*args)
+    return geo._predict_variant_U(*args)
+
+
+def valider(config):
+    """
+    Erreurs de la configuration (tuple d'Erreur, vide si réalisable), sans rien construire.
+    Variante auto : celle du prédicteur (LNF, U) ; U1F réalisable si une variante l'est
+    (sinon erreurs de v1, comme _choose_variant_U1F).
+    """
+    get = config.get
+    key = (get("forme") or get("type_canape"), get("variant"),
+           get("coussins", get("type_coussins", "auto")), tuple(map(get, _CLES)))
+    try:
+        hash(key)
+    except TypeError:               # valeur non hachable : contrôle direct
+        return _valider(*key)
+    return VALIDATION_CACHE.get_or_compute(key, lambda: _valider(*key))
+
+
+def _valider(type_canape, variant, coussins, valeurs):
+    try:
+        forme = forme_canape(type_canape)
+    except ValueError as e:
+        return (Erreur("forme", ("type_canape",), str(e)),)
+    variant = str(variant or VARIANTE_DEFAUT.get(forme, "")).lower()
+    if forme in VARIANTES and variant not in VARIANTES[forme]:
+        return (Erreur("variante", ("variant",),
+                       f"Variante {variant} inconnue pour {forme} (choix : {', '.join(VARIANTES[forme])})"),)
+
+    p = {}; erreurs = []
+    for i, k, nature, defaut in _CHAMPS[forme]:
+        v = valeurs[i]
+        if v is None:
+            v = defaut
+        if nature == 0:
+            iv = v if type(v) is int else _entier(v)
+            if iv is None:
+                erreurs.append(Erreur("cote", (k,), f"Cote {v} cm : les dimensions doivent être des cm entiers."))
+            v = iv
+        elif nature == 1:
+            v = v or None
+        else:
+            v = bool(v)
+        p[k] = v
+    if erreurs:
+        return tuple(erreurs)
+    if p.get("meridienne_side") is None and "meridienne_len" in p:
+        p["meridienne_len"] = 0
+
+    erreurs = _erreurs_meridienne(forme, p)
+    if not erreurs:
+        if variant == "auto" and forme == "U1F":
+            erreurs = _erreurs_banquettes(forme, "v1", p)
+            if erreurs and any(not _erreurs_banquettes(forme, v, p) for v in VARIANTES["U1F"][2:]):
+                erreurs = []
+        else:
+            if variant == "auto":
+                variant = _variante_auto(forme, p)
+            erreurs = _erreurs_banquettes(forme, variant or None, p)
+    if erreurs:
+        return tuple(erreurs)
+
+    mode, _same, size_fixed, _tag = geo._norm_coussins_spec(coussins)
+    if mode == "fixed" and not (60 <= int(size_fixed) <= 100):
+        return (Erreur("coussins", ("type_coussins",), "Taille coussins fixe hors bornes [60..100]."),)
+    return ()
+
+
+def est_valide(config):
+    return not valider(config)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# verif_layout.py
+# Clé canonique de sofa_layout : une configuration courte (cotes seules) doit désigner
+# le même canapé que la configuration explicite avec les défauts des render_*
+# (profondeur 70, dossiers et accoudoirs True, sans méridienne) :
+#   - même config_key, donc même SofaLayout (LAYOUT_CACHE)
+#   - mêmes points, polygones et coussins que la configuration explicite
+#   - même verdict de validation.valider
+# et une option explicitement à False reste False.
+#
+# Usage : python verif_layout.py
+
+import sys
+
+import canape_geometrie as geo
+from sofa_layout import PARAMS, _DIMENSIONS, config_key, layout
+from validation import valider
+
+COTES = {"S1": {"tx": 300}, "LNF": {"tx": 300, "ty": 250}, "LF": {"tx": 300, "ty": 250},
+         "U": {"tx": 400, "ty": 250, "tz": 250}, "U1F": {"tx": 400, "ty": 250, "tz": 250},
+         "U2F": {"tx": 400, "ty": 250, "tz": 250}}
+
+
+def explicite(forme, cotes):
+    """Configuration complète avec les défauts des render_*."""
+    config = {"forme": forme, **cotes}
+    for k in PARAMS[forme]:
+        if k == "profondeur":
+            config[k] = geo.DEPTH_STD
+        elif k == "meridienne_side":
+            config[k] = None
+        elif k == "meridienne_len":
+            config[k] = 0
+        elif k not in _DIMENSIONS:
+            config[k] = True
+    return config
+
+
+def main():
+    ecarts = []
+    for forme, cotes in COTES.items():
+        avant = len(ecarts)
+        court, complet = {"forme": forme, **cotes}, explicite(forme, cotes)
+        if config_key(court) != config_key(complet):
+            ecarts.append((forme, "config_key", config_key(court), config_key(complet)))
+        a, b = layout(court), layout(complet)
+        if a is not b or a.pts != b.pts or a.cushions != b.cushions:
+            ecarts.append((forme, "layout"))
+        if valider(court) != valider(complet):
+            ecarts.append((forme, "valider", valider(court), valider(complet)))
+        sans_acc = dict(court, acc_left=False)
+        if dict(config_key(sans_acc)[2])["acc_left"] is not False:
+            ecarts.append((forme, "acc_left=False perdu"))
+        print(f"{forme:4s} : {'OK' if len(ecarts) == avant else 'ÉCART'}")
+    for e in ecarts:
+        print("   ", e)
+    print("OK" if not ecarts else f"ÉCHEC ({len(ecarts)} écart(s))")
+    return 1 if ecarts else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
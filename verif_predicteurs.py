@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# verif_predicteurs.py
+# Validation exhaustive des prédicteurs analytiques de variante (canape_geometrie) :
+#   - U   : _splits_U / _predict_variant_U      contre build_polys_U_v1..v4
+#   - LNF : _splits_LNF / _predict_variant_LNF  contre build_polys_LNF_v1/v2
+#
+# Pour chaque configuration de la grille et chaque variante, le nombre de banquettes
+# construites doit valoir base + scissions prédites (U : 3, LNF : 2), et la variante
+# prédite doit être celle de l'ancienne sélection sur polygones (moins de banquettes,
+# puis ordre v2, v1, v3, v4 pour U ; v1 si tx >= ty pour LNF).
+#
+# Grille par défaut = domaine du formulaire de l'appli : cotes 100..600 cm au pas de 10,
+# profondeur 50..120 au pas de 5, toutes les options (dossiers, accoudoirs) et, pour LNF,
+# méridienne gauche / bas de 30 à 200 cm (combinaisons infaisables ignorées).
+# Grille complète : plusieurs heures pour U sur un seul cœur ; --pas 50 pour un contrôle rapide.
+#
+# Usage : python verif_predicteurs.py [--formes U,LNF] [--pas 10] [--pas-profondeur 5]
+
+import argparse
+import itertools
+import sys
+import time
+
+import canape_geometrie as geo
+
+DIM_MIN, DIM_MAX = 100, 600
+PROF_MIN, PROF_MAX = 50, 120
+MER_MIN, MER_MAX = 30, 200
+EXEMPLES_MAX = 5
+BOOLS = (True, False)
+
+
+def _ref_variant_U(nb):
+    """Ancienne règle : moins de banquettes, égalité -> v2, v1, v3, v4."""
+    return min(("v2", "v1", "v3", "v4"), key=nb.__getitem__)
+
+def _ref_variant_LNF(nb, tx, ty):
+    if nb["v1"] != nb["v2"]:
+        return "v1" if nb["v1"] < nb["v2"] else "v2"
+    return "v1" if tx >= ty else "v2"
+
+
+def verif_U(dims, profs):
+    """Renvoie (nb de configurations, écarts)."""
+    n = 0; ecarts = []
+    for tx, ty, tz in itertools.product(dims, repeat=3):
+        for prof, flags in itertools.product(profs, itertools.product(BOOLS, repeat=6)):
+            args = (tx, ty, tz, prof) + flags
+            n += 1
+            splits = geo._splits_U(*args)
+            nb = {}
+            for v in ("v1", "v2", "v3", "v4"):
+                polys, _ = geo._BUILD_U[v](geo._COMPUTE_U[v](*args), *args)
+                nb[v] = len(polys["banquettes"])
+                if nb[v] != 3 + splits[v]:
+                    ecarts.append(("U", v, args, nb[v], 3 + splits[v]))
+            if geo._predict_variant_U(*args) != _ref_variant_U(nb):
+                ecarts.append(("U", "auto", args, _ref_variant_U(nb), geo._predict_variant_U(*args)))
+    return n, ecarts
+
+
+def _meridiennes(dossier_left, dossier_bas, acc_left, acc_bas, mers):
+    """Méridiennes faisables pour ces options (mêmes contrôles que render_LNF)."""
+    yield None, 0
+    if dossier_left and not acc_left:
+        for L in mers:
+            yield "g", L
+    if dossier_bas and not acc_bas:
+        for L in mers:
+            yield "b", L
+
+def verif_LNF(dims, profs, mers):
+    n = 0; ecarts = []
+    for tx, ty in itertools.product(dims, repeat=2):
+        for prof, (dl, db, al, ab) in itertools.product(profs, itertools.product(BOOLS, repeat=4)):
+            for side, L in _meridiennes(dl, db, al, ab, mers):
+                args = (tx, ty, prof, dl, db, al, ab, side, L)
+                n += 1
+                splits = dict(zip(("v1", "v2"), geo._splits_LNF(*args)))
+                nb = {}
+                for v in ("v1", "v2"):
+                    _, polys = geo._dry_polys_for_variant(*args, v)
+                    nb[v] = len(polys["banquettes"])
+                    if nb[v] != 2 + splits[v]:
+                        ecarts.append(("LNF", v, args, nb[v], 2 + splits[v]))
+                if geo._predict_variant_LNF(*args) != _ref_variant_LNF(nb, tx, ty):
+                    ecarts.append(("LNF", "auto", args, _ref_variant_LNF(nb, tx, ty), geo._predict_variant_LNF(*args)))
+    return n, ecarts
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Validation des prédicteurs de variante U / LNF")
+    ap.add_argument("--formes", default="U,LNF")
+    ap.add_argument("--pas", type=int, default=10, help="pas des cotes tx / ty / tz (cm)")
+    ap.add_argument("--pas-profondeur", type=int, default=5)
+    ap.add_argument("--pas-meridienne", type=int, default=10)
+    a = ap.parse_args(argv)
+
+    dims = range(DIM_MIN, DIM_MAX + 1, a.pas)
+    profs = range(PROF_MIN, PROF_MAX + 1, a.pas_profondeur)
+    mers = range(MER_MIN, MER_MAX + 1, a.pas_meridienne)
+    total = 0
+    for forme in a.formes.split(","):
+        t0 = time.perf_counter()
+        if forme == "U":
+            n, ecarts = verif_U(dims, profs)
+        elif forme == "LNF":
+            n, ecarts = verif_LNF(dims, profs, mers)
+        else:
+            ap.error(f"forme inconnue : {forme}")
+        total += len(ecarts)
+        print(f"{forme:4s} : {n} configurations, {len(ecarts)} écart(s) ({time.perf_counter() - t0:.0f} s)")
+        for e in ecarts[:EXEMPLES_MAX]:
+            print("   ", e)
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())